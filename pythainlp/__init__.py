@@ -38,6 +38,36 @@ thai_characters = "".join(
 )
 
 
+__all__ = [
+    "Doc",
+    "Pipeline",
+    "Tokenizer",
+    "collate",
+    "correct",
+    "pos_tag",
+    "romanize",
+    "sent_tokenize",
+    "soundex",
+    "spell",
+    "subword_tokenize",
+    "thai_above_vowels",
+    "thai_below_vowels",
+    "thai_characters",
+    "thai_consonants",
+    "thai_digits",
+    "thai_follow_vowels",
+    "thai_lead_vowels",
+    "thai_letters",
+    "thai_punctuations",
+    "thai_signs",
+    "thai_strftime",
+    "thai_symbols",
+    "thai_tonemarks",
+    "thai_vowels",
+    "transliterate",
+    "word_tokenize",
+]
+
 from pythainlp.soundex import soundex
 from pythainlp.spell import correct, spell
 from pythainlp.tag import pos_tag
@@ -49,3 +79,6 @@ from pythainlp.tokenize import (
 )
 from pythainlp.transliterate import romanize, transliterate
 from pythainlp.util import collate, thai_strftime
+
+# imports the modules above, so it is imported last
+from pythainlp.pipeline import Doc, Pipeline
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2016-2024 PyThaiNLP Project
+# SPDX-License-Identifier: Apache-2.0
+"""
+Asynchronous (asyncio) API
+"""
+
+__all__ = [
+    "NER",
+    "Translate",
+    "batcher_stats",
+    "correct",
+    "get_executor",
+    "pos_tag",
+    "pronunciate",
+    "romanize",
+    "sent_tokenize",
+    "set_executor",
+    "shutdown",
+    "word_tokenize",
+]
+
+from pythainlp.aio.core import (
+    NER,
+    Translate,
+    batcher_stats,
+    correct,
+    get_executor,
+    pos_tag,
+    pronunciate,
+    romanize,
+    sent_tokenize,
+    set_executor,
+    shutdown,
+    word_tokenize,
+)
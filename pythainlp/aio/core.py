@@ -0,0 +1,425 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2016-2024 PyThaiNLP Project
+# SPDX-License-Identifier: Apache-2.0
+"""
+Asynchronous (asyncio) API
+
+Functions run on an executor, a thread pool by default, so they do not
+block the event loop. Calls of model-backed engines that are awaited
+concurrently are grouped by a :class:`MicroBatcher` into one call of
+their batch function.
+"""
+import asyncio
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Dict, List, Tuple, Union
+
+from pythainlp.tokenize import (
+    DEFAULT_SENT_TOKENIZE_ENGINE,
+    DEFAULT_WORD_TOKENIZE_ENGINE,
+)
+from pythainlp.tools.batching import MicroBatcher
+from pythainlp.transliterate.core import DEFAULT_ROMANIZE_ENGINE
+
+DEFAULT_MAX_BATCH_SIZE = 32
+DEFAULT_MAX_WAIT = 0.005
+
+_executor = None
+_own_executor = False
+_batchers = {}
+_lock = threading.Lock()
+
+
+def get_executor() -> Executor:
+    """
+    Get the executor that runs the functions of :mod:`pythainlp.aio`.
+
+    A thread pool is created on first use,
+    unless an executor is set by :func:`set_executor`.
+
+    :return: the executor
+    :rtype: concurrent.futures.Executor
+    """
+    global _executor, _own_executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(thread_name_prefix="pythainlp")
+            _own_executor = True
+        return _executor
+
+
+def set_executor(executor: Executor) -> None:
+    """
+    Set the executor that runs the functions of :mod:`pythainlp.aio`,
+    e.g. a :class:`concurrent.futures.ProcessPoolExecutor`
+    for CPU-bound engines such as *newmm*.
+
+    The executor is not shut down by :func:`shutdown`.
+    The thread pool created by :func:`get_executor`, if any, is.
+
+    :param concurrent.futures.Executor executor: executor
+
+    :Example:
+    ::
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        from pythainlp import aio
+
+        aio.set_executor(ProcessPoolExecutor(max_workers=4))
+    """
+    global _executor, _own_executor
+    with _lock:
+        old, own = _executor, _own_executor
+        _executor = executor
+        _own_executor = False
+    if old is not None and own:
+        old.shutdown(wait=False)
+
+
+def shutdown() -> None:
+    """
+    Stop the batchers, and shut down the thread pool
+    created by :func:`get_executor`.
+    """
+    global _executor, _own_executor
+    with _lock:
+        batchers = list(_batchers.values())
+        _batchers.clear()
+        executor, own = _executor, _own_executor
+        if own:
+            _executor = None
+            _own_executor = False
+    for batcher in batchers:
+        batcher.close()
+    if executor is not None and own:
+        executor.shutdown()
+
+
+async def _run(func: Callable, *args, **kwargs):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_executor(), partial(func, *args, **kwargs)
+    )
+
+
+def _get_batcher(key: Tuple, func: Callable[[list], list]) -> MicroBatcher:
+    # a batcher of a batch function, which runs on the executor
+    with _lock:
+        if key not in _batchers:
+            _batchers[key] = MicroBatcher(
+                lambda items: get_executor().submit(func, items).result(),
+                max_batch_size=DEFAULT_MAX_BATCH_SIZE,
+                max_wait=DEFAULT_MAX_WAIT,
+            )
+        return _batchers[key]
+
+
+def batcher_stats() -> Dict[str, Dict[str, Union[int, float]]]:
+    """
+    Statistics of the batchers of :func:`romanize` and
+    :func:`pronunciate`, see :meth:`MicroBatcher.stats`.
+
+    :return: a dictionary of function and engine to its statistics
+    :rtype: dict[str, dict]
+    """
+    with _lock:
+        batchers = dict(_batchers)
+    return {
+        "/".join(key): batcher.stats() for key, batcher in batchers.items()
+    }
+
+
+async def word_tokenize(
+    text: str,
+    engine: str = DEFAULT_WORD_TOKENIZE_ENGINE,
+    keep_whitespace: bool = True,
+) -> List[str]:
+    """
+    Asynchronous :func:`pythainlp.tokenize.word_tokenize`.
+
+    :Example:
+    ::
+
+        import asyncio
+
+        from pythainlp import aio
+
+        asyncio.run(aio.word_tokenize("ฉันรักภาษาไทย"))
+        # output: ['ฉัน', 'รัก', 'ภาษาไทย']
+    """
+    from pythainlp.tokenize import word_tokenize as _word_tokenize
+
+    return await _run(
+        _word_tokenize, text, engine=engine, keep_whitespace=keep_whitespace
+    )
+
+
+async def sent_tokenize(
+    text: str,
+    engine: str = DEFAULT_SENT_TOKENIZE_ENGINE,
+    keep_whitespace: bool = True,
+) -> List[str]:
+    """Asynchronous :func:`pythainlp.tokenize.sent_tokenize`."""
+    from pythainlp.tokenize import sent_tokenize as _sent_tokenize
+
+    return await _run(
+        _sent_tokenize, text, engine=engine, keep_whitespace=keep_whitespace
+    )
+
+
+async def pos_tag(
+    words: List[str], engine: str = "perceptron", corpus: str = "orchid"
+) -> List[Tuple[str, str]]:
+    """Asynchronous :func:`pythainlp.tag.pos_tag`."""
+    from pythainlp.tag import pos_tag as _pos_tag
+
+    return await _run(_pos_tag, words, engine=engine, corpus=corpus)
+
+
+async def correct(word: str, engine: str = "pn") -> str:
+    """Asynchronous :func:`pythainlp.spell.correct`."""
+    from pythainlp.spell import correct as _correct
+
+    return await _run(_correct, word, engine=engine)
+
+
+def _romanize_many(engine: str, texts: List[str]) -> List[str]:
+    from pythainlp.transliterate import romanize_many
+
+    return romanize_many(texts, engine=engine)
+
+
+def _pronunciate_many(words: List[str]) -> List[str]:
+    from pythainlp.transliterate.w2p import pronunciate_many
+
+    return pronunciate_many(words)
+
+
+async def romanize(text: str, engine: str = DEFAULT_ROMANIZE_ENGINE) -> str:
+    """
+    Asynchronous :func:`pythainlp.transliterate.romanize`.
+
+    Concurrent calls with the same engine are romanized together by
+    :func:`pythainlp.transliterate.romanize_many`, e.g. in one batch
+    of the *thai2rom_onnx* model.
+
+    :Example:
+    ::
+
+        import asyncio
+
+        from pythainlp import aio
+
+        async def main():
+            return await asyncio.gather(
+                aio.romanize("แมว"), aio.romanize("หมา")
+            )
+
+        asyncio.run(main())
+        # output: ['maeo', 'ma']
+    """
+    batcher = _get_batcher(
+        ("romanize", engine), partial(_romanize_many, engine)
+    )
+    return await asyncio.wrap_future(batcher.submit(text))
+
+
+async def pronunciate(word: str) -> str:
+    """
+    Asynchronous :func:`pythainlp.transliterate.pronunciate`
+    with the *w2p* engine.
+
+    Concurrent calls are predicted together in one batch of the model,
+    see :func:`pythainlp.transliterate.w2p.pronunciate_many`.
+    """
+    batcher = _get_batcher(("pronunciate", "w2p"), _pronunciate_many)
+    return await asyncio.wrap_future(batcher.submit(word))
+
+
+class NER:
+    """
+    Asynchronous :class:`pythainlp.tag.NER`.
+
+    The model is loaded on first use, off the event loop. Texts of
+    concurrent calls are tagged together, in one batch of the model,
+    by :meth:`pythainlp.tag.NER.tag_batch`.
+
+    :param str engine: named-entity recognizer engine
+    :param str corpus: corpus
+    :param int max_batch_size: maximum number of texts in a batch
+    :param float max_wait: maximum time, in seconds, that a call waits
+                           for other calls to join its batch
+
+    :Example:
+    ::
+
+        import asyncio
+
+        from pythainlp import aio
+
+        ner = aio.NER("thainer")
+
+        async def main():
+            return await asyncio.gather(
+                ner.tag("ไปเชียงใหม่"), ner.tag("อยู่กรุงเทพ")
+            )
+
+        asyncio.run(main())
+    """
+
+    def __init__(
+        self,
+        engine: str = "thainer-v2",
+        corpus: str = "thainer",
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait: float = DEFAULT_MAX_WAIT,
+    ) -> None:
+        self.engine = engine
+        self.corpus = corpus
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._ner = None
+        self._batchers = {}
+        self._lock = threading.Lock()
+
+    def _get_ner(self):
+        # called by the worker threads of the batchers
+        with self._lock:
+            if self._ner is None:
+                from pythainlp.tag import NER as _NER
+
+                self._ner = _NER(engine=self.engine, corpus=self.corpus)
+            return self._ner
+
+    def _tag_batch(self, pos: bool, tag: bool, texts: List[str]) -> list:
+        return self._get_ner().tag_batch(
+            texts, pos=pos, tag=tag, batch_size=len(texts)
+        )
+
+    def _get_batcher(self, pos: bool, tag: bool) -> MicroBatcher:
+        with self._lock:
+            if (pos, tag) not in self._batchers:
+                self._batchers[(pos, tag)] = MicroBatcher(
+                    partial(self._tag_batch, pos, tag),
+                    max_batch_size=self.max_batch_size,
+                    max_wait=self.max_wait,
+                )
+            return self._batchers[(pos, tag)]
+
+    async def tag(
+        self, text: str, pos: bool = False, tag: bool = False
+    ) -> Union[List[Tuple[str, str]], List[Tuple[str, str, str]], str]:
+        """
+        Tag named entities of a text, see :meth:`pythainlp.tag.NER.tag`.
+
+        :param str text: text
+        :param bool pos: output with POS tags
+        :param bool tag: output HTML-like tags
+        """
+        batcher = self._get_batcher(pos, tag)
+        return await asyncio.wrap_future(batcher.submit(text))
+
+    def stats(self) -> Dict[str, Dict[str, Union[int, float]]]:
+        """
+        Statistics of the batchers, see :meth:`MicroBatcher.stats`.
+
+        :return: a dictionary of options (pos, tag) to their statistics
+        :rtype: dict[str, dict]
+        """
+        with self._lock:
+            batchers = dict(self._batchers)
+        return {
+            f"pos={pos}, tag={tag}": batcher.stats()
+            for (pos, tag), batcher in batchers.items()
+        }
+
+    def close(self) -> None:
+        """Stop the batchers."""
+        with self._lock:
+            batchers = list(self._batchers.values())
+            self._batchers.clear()
+        for batcher in batchers:
+            batcher.close()
+
+
+class Translate:
+    """
+    Asynchronous :class:`pythainlp.translate.Translate`.
+
+    The model is loaded on first use, off the event loop. Texts of
+    concurrent calls are translated together, in one batch of the
+    model, by :meth:`pythainlp.translate.Translate.translate_batch`.
+
+    :param str src_lang: source language
+    :param str target_lang: target language
+    :param str engine: machine translation engine
+    :param bool use_gpu: load model using GPU
+    :param int max_batch_size: maximum number of texts in a batch
+    :param float max_wait: maximum time, in seconds, that a call waits
+                           for other calls to join its batch
+
+    :Example:
+    ::
+
+        import asyncio
+
+        from pythainlp import aio
+
+        th2en = aio.Translate("th", "en")
+
+        asyncio.run(th2en.translate("ฉันรักแมว"))
+        # output: I love cat.
+    """
+
+    def __init__(
+        self,
+        src_lang: str,
+        target_lang: str,
+        engine: str = "default",
+        use_gpu: bool = False,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait: float = DEFAULT_MAX_WAIT,
+    ) -> None:
+        self.src_lang = src_lang
+        self.target_lang = target_lang
+        self.engine = engine
+        self.use_gpu = use_gpu
+        self._model = None
+        self._batcher = MicroBatcher(
+            self._translate_batch,
+            max_batch_size=max_batch_size,
+            max_wait=max_wait,
+        )
+
+    def _translate_batch(self, texts: List[str]) -> List[str]:
+        # the batcher has one worker thread, which loads the model
+        if self._model is None:
+            from pythainlp.translate import Translate as _Translate
+
+            self._model = _Translate(
+                self.src_lang,
+                self.target_lang,
+                engine=self.engine,
+                use_gpu=self.use_gpu,
+            )
+        return self._model.translate_batch(texts)
+
+    async def translate(self, text: str) -> str:
+        """
+        Translate a text, see :meth:`pythainlp.translate.Translate.translate`.
+
+        :param str text: input text in source language
+        :return: translated text in target language
+        :rtype: str
+        """
+        return await asyncio.wrap_future(self._batcher.submit(text))
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        """Statistics of the batcher, see :meth:`MicroBatcher.stats`."""
+        return self._batcher.stats()
+
+    def close(self) -> None:
+        """Stop the batcher."""
+        self._batcher.close()
@@ -7,25 +7,39 @@ import itertools
 
 class Word2VecAug:
     def __init__(
-        self, model: str, tokenize: object, type: str = "file"
+        self,
+        model: str,
+        tokenize: object,
+        type: str = "file",
+        approximate: bool = False,
     ) -> None:
         """
         :param str model: path of model
         :param object tokenize: tokenize function
         :param str type: model type (file, binary)
+        :param bool approximate: find synonyms with approximate
+                                 nearest-neighbour search
+                                 (see :class:`pythainlp.word_vector.IVFIndex`)
+
+        Models of type *file* and *binary* are loaded with
+        :func:`pythainlp.word_vector.load_keyedvectors`, so their vectors
+        are memory-mapped and shared between processes.
         """
-        import gensim.models.keyedvectors as word2vec
+        from pythainlp.word_vector import load_keyedvectors
 
         self.tokenizer = tokenize
         if type == "file":
-            self.model = word2vec.KeyedVectors.load_word2vec_format(model)
+            self.model = load_keyedvectors(model, binary=False)
         elif type == "binary":
-            self.model = word2vec.KeyedVectors.load_word2vec_format(
-                model, binary=True, unicode_errors="ignore"
-            )
+            self.model = load_keyedvectors(model, binary=True)
         else:
             self.model = model
         self.dict_wv = list(self.model.key_to_index.keys())
+        self.index = None
+        if approximate:
+            from pythainlp.word_vector import IVFIndex
+
+            self.index = IVFIndex(self.model.vectors)
 
     def modify_sent(self, sent: str, p: float = 0.7) -> List[List[str]]:
         """
@@ -33,10 +47,19 @@ class Word2VecAug:
         :param float p: probability
         :rtype: List[List[str]]
         """
+        from pythainlp.word_vector.ivf import most_similar_batch
+
+        # query all distinct in-vocabulary words at once
+        words = list(
+            dict.fromkeys(i for i in sent if i in self.model.key_to_index)
+        )
+        similar = dict(
+            zip(words, most_similar_batch(self.model, words, index=self.index))
+        )
         list_sent_new = []
         for i in sent:
-            if i in self.dict_wv:
-                w = [j for j, v in self.model.most_similar(i) if v >= p]
+            if i in similar:
+                w = [j for j, v in similar[i] if v >= p]
                 if w == []:
                     list_sent_new.append([i])
                 else:
@@ -15,8 +15,13 @@ class LTW2VAug:
     `github.com/PyThaiNLP/large-thaiword2vec <https://github.com/PyThaiNLP/large-thaiword2vec>`_
     """
 
-    def __init__(self):
+    def __init__(self, approximate: bool = False):
+        """
+        :param bool approximate: find synonyms with approximate
+                                 nearest-neighbour search
+        """
         self.ltw2v_wv = get_corpus_path("ltw2v")
+        self.approximate = approximate
         self.load_w2v()
 
     def tokenizer(self, text: str) -> List[str]:
@@ -30,7 +35,12 @@ class LTW2VAug:
         """
         Load LTW2V's word2vec model
         """
-        self.aug = Word2VecAug(self.ltw2v_wv, self.tokenizer, type="binary")
+        self.aug = Word2VecAug(
+            self.ltw2v_wv,
+            self.tokenizer,
+            type="binary",
+            approximate=self.approximate,
+        )
 
     def augment(
         self, sentence: str, n_sent: int = 1, p: float = 0.7
@@ -4,7 +4,7 @@
 from typing import List, Tuple
 from pythainlp.augment.word2vec.core import Word2VecAug
 from pythainlp.corpus import get_corpus_path
-from pythainlp.tokenize import THAI2FIT_TOKENIZER
+from pythainlp.tokenize import _get_thai2fit_tokenizer
 
 
 class Thai2fitAug:
@@ -15,8 +15,13 @@ class Thai2fitAug:
     `github.com/cstorm125/thai2fit <https://github.com/cstorm125/thai2fit>`_
     """
 
-    def __init__(self):
+    def __init__(self, approximate: bool = False):
+        """
+        :param bool approximate: find synonyms with approximate
+                                 nearest-neighbour search
+        """
         self.thai2fit_wv = get_corpus_path("thai2fit_wv")
+        self.approximate = approximate
         self.load_w2v()
 
     def tokenizer(self, text: str) -> List[str]:
@@ -24,13 +29,18 @@ class Thai2fitAug:
         :param str text: Thai text
         :rtype: List[str]
         """
-        return THAI2FIT_TOKENIZER.word_tokenize(text)
+        return _get_thai2fit_tokenizer().word_tokenize(text)
 
     def load_w2v(self):
         """
         Load Thai2Fit's word2vec model
         """
-        self.aug = Word2VecAug(self.thai2fit_wv, self.tokenizer, type="binary")
+        self.aug = Word2VecAug(
+            self.thai2fit_wv,
+            self.tokenizer,
+            type="binary",
+            approximate=self.approximate,
+        )
 
     def augment(
         self, sentence: str, n_sent: int = 1, p: float = 0.7
@@ -5,6 +5,7 @@
 Performance benchmarking.
 """
 
-__all__ = ["benchmark"]
+__all__ = ["benchmark", "speed_benchmark"]
 
+from pythainlp.benchmarks.speed import speed_benchmark
 from pythainlp.benchmarks.word_tokenization import benchmark
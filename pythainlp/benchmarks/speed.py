@@ -0,0 +1,389 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2016-2024 PyThaiNLP Project
+# SPDX-License-Identifier: Apache-2.0
+"""
+Speed benchmark of the tokenizers
+
+Every engine of :func:`pythainlp.tokenize.word_tokenize`,
+:func:`pythainlp.tokenize.subword_tokenize`,
+:func:`pythainlp.tokenize.syllable_tokenize`, and
+:func:`pythainlp.tokenize.sent_tokenize` that can be loaded is timed
+on bundled text samples of several lengths. The results can be saved
+as JSON, and compared with the results of an earlier run.
+"""
+import json
+import multiprocessing
+import platform
+import queue
+import subprocess
+import sys
+import time
+from typing import Dict, Iterable, List, Union
+
+TASKS = {
+    "word": (
+        "word_tokenize",
+        [
+            "newmm",
+            "newmm-safe",
+            "longest",
+            "mm",
+            "icu",
+            "nlpo3",
+            "attacut",
+            "deepcut",
+            "nercut",
+            "sefr_cut",
+            "oskut",
+            "tltk",
+        ],
+    ),
+    "subword": (
+        "subword_tokenize",
+        ["tcc", "tcc_p", "etcc", "dict", "ssg", "han_solo", "wangchanberta"],
+    ),
+    "syllable": ("syllable_tokenize", ["han_solo", "dict", "ssg", "tltk"]),
+    "sent": (
+        "sent_tokenize",
+        ["crfcut", "whitespace", "whitespace+newline", "thaisum", "tltk"],
+    ),
+}
+
+# written for this benchmark, about 1,000 characters
+_SAMPLE_TEXT = (
+    "ภาษาไทยเป็นภาษาที่มีระดับเสียงของคำแน่นอนหรือวรรณยุกต์เช่นเดียวกับภาษาจีน "
+    "และออกเสียงแยกคำต่อคำ การเขียนภาษาไทยไม่เว้นวรรคระหว่างคำ "
+    "แต่เว้นวรรคเมื่อจบประโยคหรือวลี ทำให้การตัดคำเป็นงานพื้นฐานที่สำคัญ"
+    "ของการประมวลผลภาษาธรรมชาติสำหรับภาษาไทย "
+    "เมื่อวันที่ 15 กันยายน 2561 เวลา 14:49 น. นักวิจัยจากมหาวิทยาลัยเชียงใหม่"
+    "ได้นำเสนอผลงานการวิเคราะห์ข้อความจากสื่อสังคมออนไลน์จำนวนกว่า 1,200,000 ข้อความ "
+    "พบว่าผู้ใช้งานนิยมพิมพ์คำทับศัพท์ภาษาอังกฤษ เช่น คอมพิวเตอร์ อินเทอร์เน็ต "
+    "และแอปพลิเคชัน ปะปนกับคำไทยแท้ รวมทั้งใช้ตัวเลขไทยและตัวเลขอารบิกสลับกัน "
+    "ผู้เข้าร่วมการประชุมเห็นตรงกันว่าควรพัฒนาคลังข้อมูลที่ครอบคลุมภาษาพูด"
+    "และภาษาถิ่นให้มากขึ้น เพื่อให้ระบบแปลภาษา ระบบถามตอบ "
+    "และระบบค้นหาข้อมูลทำงานได้แม่นยำยิ่งขึ้น "
+    "ตลาดน้ำดำเนินสะดวกเป็นแหล่งท่องเที่ยวที่มีชื่อเสียงของจังหวัดราชบุรี "
+    "นักท่องเที่ยวสามารถนั่งเรือชมวิถีชีวิตริมคลอง ซื้อผลไม้ ขนมไทย "
+    "และอาหารพื้นบ้านจากแม่ค้าที่พายเรือมาขายตั้งแต่เช้าตรู่ "
+    "ร้านก๋วยเตี๋ยวเรือเจ้าเก่าขายชามละ 40 บาท มีทั้งเส้นเล็ก เส้นใหญ่ และบะหมี่ "
+    "ช่วงวันหยุดยาวมีผู้คนเดินทางมาเที่ยวเป็นจำนวนมาก "
+    "เจ้าหน้าที่จึงขอความร่วมมือให้ทุกคนรักษาความสะอาดและทิ้งขยะให้ถูกที่"
+)
+
+_UNSPACED_TEXT = "".join(_SAMPLE_TEXT.split())
+
+SAMPLES = {
+    "short": "วันนี้กินข้าวยัง ไปดูหนังกันไหม 555",
+    "1kb": _SAMPLE_TEXT[:1000],
+    "100kb": (_UNSPACED_TEXT * (100000 // len(_UNSPACED_TEXT) + 1))[:100000],
+}
+
+DEFAULT_MIN_TIME = 1.0
+DEFAULT_MAX_RUNS = 1000
+DEFAULT_TIMEOUT = 300.0
+
+
+def _percentile(values: List[float], q: float) -> float:
+    # nearest-rank percentile of sorted values
+    rank = min(len(values) - 1, max(0, int(round(q * len(values))) - 1))
+    return values[rank]
+
+
+def _peak_rss_mb() -> Union[float, None]:
+    try:
+        import resource
+    except ImportError:
+        # not available on Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    if sys.platform == "darwin":
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+
+def _time_runs(func, text: str, min_time: float, max_runs: int) -> Dict:
+    latencies = []
+    total = 0.0
+    # at least 3 runs, except for texts that take longer than min_time
+    while len(latencies) < max_runs and (
+        total < min_time or len(latencies) < 3
+    ):
+        start = time.perf_counter()
+        func(text)
+        latency = time.perf_counter() - start
+        latencies.append(latency)
+        total += latency
+        if latency > min_time:
+            break
+    latencies.sort()
+    return {
+        "runs": len(latencies),
+        "chars_per_sec": len(text) * len(latencies) / total if total else 0.0,
+        "latency_p50_ms": _percentile(latencies, 0.50) * 1000,
+        "latency_p99_ms": _percentile(latencies, 0.99) * 1000,
+    }
+
+
+def _bench_engine(
+    task: str,
+    engine: str,
+    samples: List[str],
+    min_time: float,
+    max_runs: int,
+) -> Dict:
+    # run in a new process when isolated, to measure the cold start
+    # and the peak memory of this engine only
+    import pythainlp.tokenize as tokenize
+
+    tokenize_func = getattr(tokenize, TASKS[task][0])
+
+    def func(text):
+        return tokenize_func(text, engine=engine)
+
+    result = {"task": task, "engine": engine}
+    try:
+        start = time.perf_counter()
+        func(SAMPLES["short"])
+        result["cold_start_s"] = time.perf_counter() - start
+    except Exception as e:
+        # the engine, or a package that it needs, is not installed
+        result["status"] = "error"
+        result["error"] = f"{type(e).__name__}: {e}"
+        return result
+    result["status"] = "ok"
+    result["samples"] = {}
+    for name in samples:
+        text = SAMPLES[name]
+        stats = _time_runs(func, text, min_time, max_runs)
+        result["samples"][name] = dict(chars=len(text), **stats)
+    result["peak_rss_mb"] = _peak_rss_mb()
+    return result
+
+
+def _import_time() -> Union[float, None]:
+    # time to import pythainlp.tokenize in a new interpreter,
+    # which loads the dictionaries
+    code = (
+        "import time\n"
+        "start = time.perf_counter()\n"
+        "import pythainlp.tokenize\n"
+        "print(time.perf_counter() - start)\n"
+    )
+    try:
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            check=True,
+            text=True,
+            timeout=DEFAULT_TIMEOUT,
+        ).stdout
+        return float(output.strip())
+    except (OSError, ValueError, subprocess.SubprocessError):
+        return None
+
+
+def _bench_worker(results, args) -> None:
+    try:
+        results.put(_bench_engine(*args))
+    except BaseException as e:
+        results.put({"status": "error", "error": f"{type(e).__name__}: {e}"})
+
+
+def _bench_isolated(args, timeout: float) -> Dict:
+    # a new process for the engine, which is killed at the timeout
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    process = context.Process(target=_bench_worker, args=(results, args))
+    process.start()
+    try:
+        result = results.get(timeout=timeout)
+    except queue.Empty:
+        process.terminate()
+        result = {
+            "status": "timeout",
+            "error": f"Not finished in {timeout} seconds.",
+        }
+    process.join()
+    result.update(task=args[0], engine=args[1])
+    return result
+
+
+def speed_benchmark(
+    tasks: Union[Iterable[str], None] = None,
+    engines: Union[Iterable[str], None] = None,
+    samples: Union[Iterable[str], None] = None,
+    min_time: float = DEFAULT_MIN_TIME,
+    max_runs: int = DEFAULT_MAX_RUNS,
+    isolate: bool = True,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> Dict:
+    """
+    Time the tokenizer engines on the text samples.
+
+    For each sample (*short*, a chat message; *1kb*, 1,000 characters
+    of text; and *100kb*, 100,000 characters without spaces), an engine
+    is called repeatedly for at least `min_time` seconds, and at least
+    3 times, or for one call if it takes longer than `min_time`.
+
+    Engines that cannot be loaded, e.g. because a package is not
+    installed, are reported with *status* "error", and engines that
+    do not finish within `timeout` with *status* "timeout".
+
+    :param Iterable[str] tasks: *word*, *subword*, *syllable*,
+                                and/or *sent* (default: all)
+    :param Iterable[str] engines: engines to time (default: all engines
+                                  of the tasks)
+    :param Iterable[str] samples: *short*, *1kb*, and/or *100kb*
+                                  (default: all)
+    :param float min_time: minimum time, in seconds, to time an engine
+                           on a sample
+    :param int max_runs: maximum number of calls on a sample
+    :param bool isolate: time each engine in a new process, so that the
+                         import time, the cold start (first call, which
+                         loads the engine), and the peak memory (RSS)
+                         are of the engine alone
+    :param float timeout: maximum time, in seconds, for an engine
+                          on all samples (only if `isolate` is `True`)
+    :return: a dictionary of the environment, *import_time_s* (time to
+             import :mod:`pythainlp.tokenize` in a new interpreter),
+             and *results*, a list of a dictionary for each task and
+             engine: *status*, *cold_start_s*, *peak_rss_mb*, and
+             *samples* (*chars*, *runs*, *chars_per_sec*,
+             *latency_p50_ms*, and *latency_p99_ms* of each sample)
+    :rtype: dict
+
+    :Example:
+    ::
+
+        from pythainlp.benchmarks.speed import speed_benchmark
+
+        report = speed_benchmark(tasks=["word"], engines=["newmm"])
+        report["results"][0]["samples"]["1kb"]
+        # output: {'chars': 1000, 'runs': 1543, 'chars_per_sec': ...,
+        #          'latency_p50_ms': ..., 'latency_p99_ms': ...}
+    """
+    from pythainlp import __version__
+
+    tasks = list(tasks) if tasks else list(TASKS)
+    samples = list(samples) if samples else list(SAMPLES)
+    for task in tasks:
+        if task not in TASKS:
+            raise ValueError(
+                f"Task '{task}' is not supported. "
+                f"It must be one of {list(TASKS)}."
+            )
+    for name in samples:
+        if name not in SAMPLES:
+            raise ValueError(
+                f"Sample '{name}' is not supported. "
+                f"It must be one of {list(SAMPLES)}."
+            )
+
+    results = []
+    for task in tasks:
+        task_engines = TASKS[task][1]
+        if engines:
+            task_engines = [e for e in engines if e in task_engines]
+        for engine in task_engines:
+            args = (task, engine, samples, min_time, max_runs)
+            if isolate:
+                result = _bench_isolated(args, timeout)
+            else:
+                result = _bench_engine(*args)
+            results.append(result)
+
+    return {
+        "pythainlp": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "isolate": isolate,
+        "import_time_s": _import_time(),
+        "results": results,
+    }
+
+
+def compare(report: Dict, baseline: Dict, threshold: float = 0.1) -> List[Dict]:
+    """
+    Compare the speed in a report with a baseline report,
+    both from :func:`speed_benchmark`.
+
+    :param dict report: report
+    :param dict baseline: baseline report, e.g. of an earlier version
+    :param float threshold: relative change of the speed (chars/sec)
+                            that is a regression or an improvement,
+                            e.g. 0.1 for 10%
+    :return: a dictionary for each task, engine, and sample in both
+             reports, with *chars_per_sec*, *baseline_chars_per_sec*,
+             *change* (relative), and *status*: "regression",
+             "improvement", or "same"
+    :rtype: list[dict]
+
+    :Example:
+    ::
+
+        import json
+
+        from pythainlp.benchmarks.speed import compare, speed_benchmark
+
+        with open("baseline.json", encoding="utf-8") as f:
+            baseline = json.load(f)
+
+        report = speed_benchmark(tasks=["word"])
+        [r for r in compare(report, baseline) if r["status"] == "regression"]
+    """
+    base = {}
+    for result in baseline.get("results", []):
+        for name, stats in result.get("samples", {}).items():
+            base[(result["task"], result["engine"], name)] = stats
+
+    rows = []
+    for result in report.get("results", []):
+        for name, stats in result.get("samples", {}).items():
+            key = (result["task"], result["engine"], name)
+            if key not in base or not base[key]["chars_per_sec"]:
+                continue
+            old = base[key]["chars_per_sec"]
+            new = stats["chars_per_sec"]
+            change = (new - old) / old
+            if change < -threshold:
+                status = "regression"
+            elif change > threshold:
+                status = "improvement"
+            else:
+                status = "same"
+            rows.append(
+                {
+                    "task": key[0],
+                    "engine": key[1],
+                    "sample": key[2],
+                    "chars_per_sec": new,
+                    "baseline_chars_per_sec": old,
+                    "change": change,
+                    "status": status,
+                }
+            )
+    return rows
+
+
+def save_report(report: Dict, path: str) -> None:
+    """
+    Save a report of :func:`speed_benchmark` as JSON.
+
+    :param dict report: report
+    :param str path: path of the JSON file
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+def load_report(path: str) -> Dict:
+    """
+    Load a report saved by :func:`save_report`.
+
+    :param str path: path of the JSON file
+    :return: report
+    :rtype: dict
+    """
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
@@ -2,9 +2,15 @@
 # SPDX-FileCopyrightText: 2016-2024 PyThaiNLP Project
 # SPDX-License-Identifier: Apache-2.0
 
+import json
 import re
+import shutil
 import sys
-from typing import List, Tuple
+import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate, zip_longest
+from typing import Dict, Iterable, Iterator, List, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -25,6 +31,19 @@ TAG_RX = re.compile(r"<\/?[A-Z]+>")
 # regex for removing trailing separators, i.e.  a|dog| -> a|dog
 TAILING_SEP_RX = re.compile("{sep}$".format(sep=re.escape(SEPARATOR)))
 
+WHITESPACE_RX = re.compile(r"\s+")
+
+# counts of each sample, summed over the samples by evaluate()
+COUNT_COLUMNS = (
+    "char_level:tp",
+    "char_level:fp",
+    "char_level:tn",
+    "char_level:fn",
+    "word_level:correctly_tokenised_words",
+    "word_level:total_words_in_sample",
+    "word_level:total_words_in_ref_sample",
+)
+
 
 def _f1(precision: float, recall: float) -> float:
     """
@@ -111,6 +130,168 @@ Pair (i=%d)
     return pd.DataFrame(results)
 
 
+def _evaluate_chunk(
+    pairs: List[Tuple[int, str, str]], details: bool
+) -> Tuple[List[int], List[Dict]]:
+    # counts of a chunk of (index, ref_sample, sample),
+    # and the metrics of each sample if details is True
+    counts = [0] * len(COUNT_COLUMNS)
+    samples = []
+    for i, r, s in pairs:
+        try:
+            r, s = preprocessing(r), preprocessing(s)
+            if not (r and s):
+                continue
+            stats = _flatten_result(compute_stats(r, s))
+        except Exception as e:
+            raise ValueError(
+                f"Cannot evaluate the pair (i={i}): {e!r}\n"
+                f"--- label\n{r}\n--- sample\n{s}"
+            ) from e
+        for j, column in enumerate(COUNT_COLUMNS):
+            counts[j] += stats[column]
+        if details:
+            samples.append({"metrics": stats, "expected": r, "actual": s})
+    return counts, samples
+
+
+def _chunks(
+    ref_samples: Iterable[str], samples: Iterable[str], chunk_size: int
+) -> Iterator[List[Tuple[int, str, str]]]:
+    chunk = []
+    missing = object()
+    pairs = zip_longest(ref_samples, samples, fillvalue=missing)
+    for i, (r, s) in enumerate(pairs):
+        if r is missing or s is missing:
+            raise ValueError(
+                "Reference samples and samples do not have "
+                "the same number of samples."
+            )
+        chunk.append((i, r, s))
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _map_chunks(
+    chunks: Iterator[list], details: bool, jobs: int
+) -> Iterator[Tuple[List[int], List[Dict]]]:
+    # results in the order of the chunks, with at most 2 * jobs
+    # chunks in memory
+    if jobs <= 1:
+        for chunk in chunks:
+            yield _evaluate_chunk(chunk, details)
+        return
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(_evaluate_chunk, chunk, details))
+            if len(pending) >= 2 * jobs:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _summarize(counts: List[int]) -> Dict[str, float]:
+    statistics = {
+        column: float(count) for column, count in zip(COUNT_COLUMNS, counts)
+    }
+
+    def ratio(a: float, b: float) -> float:
+        return a / b if b else 0.0
+
+    statistics["char_level:precision"] = ratio(
+        statistics["char_level:tp"],
+        statistics["char_level:tp"] + statistics["char_level:fp"],
+    )
+    statistics["char_level:recall"] = ratio(
+        statistics["char_level:tp"],
+        statistics["char_level:tp"] + statistics["char_level:fn"],
+    )
+    statistics["word_level:precision"] = ratio(
+        statistics["word_level:correctly_tokenised_words"],
+        statistics["word_level:total_words_in_sample"],
+    )
+    statistics["word_level:recall"] = ratio(
+        statistics["word_level:correctly_tokenised_words"],
+        statistics["word_level:total_words_in_ref_sample"],
+    )
+    return statistics
+
+
+def evaluate(
+    ref_samples: Iterable[str],
+    samples: Iterable[str],
+    chunk_size: int = 1000,
+    jobs: int = 1,
+    details_file: Union[str, None] = None,
+) -> Dict[str, float]:
+    """
+    Evaluate samples against the ground truth, in bounded memory.
+
+    Unlike :func:`benchmark`, the samples are read from iterables,
+    e.g. open files, and evaluated in chunks, and only the sums of
+    the counts are kept, so that large test sets can be evaluated.
+    The metrics of each sample are those of :func:`compute_stats`.
+
+    :param Iterable[str] ref_samples: ground truth for samples
+    :param Iterable[str] samples: samples that we want to evaluate
+    :param int chunk_size: number of samples in a chunk
+    :param int jobs: number of worker processes that evaluate chunks
+    :param str details_file: path of a JSON file to save the metrics
+                             of each sample to, written as the samples
+                             are evaluated
+
+    :return: sums of the counts, and character- and word-level
+             precision and recall
+    :rtype: dict[str, float]
+
+    :Example:
+    ::
+
+        from pythainlp.benchmarks.word_tokenization import evaluate
+
+        with open("test.txt", encoding="utf-8") as ref:
+            with open("input.txt", encoding="utf-8") as sample:
+                evaluate(ref, sample, jobs=4)
+        # output: {'char_level:tp': 4.0, ..., 'word_level:recall': 0.6}
+    """
+    chunks = _chunks(ref_samples, samples, chunk_size)
+    details = details_file is not None
+    counts = [0] * len(COUNT_COLUMNS)
+    n_samples = 0
+
+    tmp = None
+    if details:
+        # the samples are kept in a temporary file,
+        # as the metrics, written first, are known at the end
+        tmp = tempfile.TemporaryFile(mode="w+", encoding="utf-8")
+    try:
+        for chunk_counts, chunk_samples in _map_chunks(chunks, details, jobs):
+            counts = [a + b for a, b in zip(counts, chunk_counts)]
+            for sample in chunk_samples:
+                sample["id"] = n_samples
+                n_samples += 1
+                if n_samples > 1:
+                    tmp.write(", ")
+                json.dump(sample, tmp, ensure_ascii=False)
+        statistics = _summarize(counts)
+        if details:
+            tmp.seek(0)
+            with open(details_file, "w", encoding="utf-8") as f:
+                f.write('{"metrics": ')
+                json.dump(statistics, f, ensure_ascii=False)
+                f.write(', "samples": [')
+                shutil.copyfileobj(tmp, f)
+                f.write("]}")
+    finally:
+        if tmp is not None:
+            tmp.close()
+    return statistics
+
+
 def preprocessing(txt: str, remove_space: bool = True) -> str:
     """
     Clean up text before performing evaluation.
@@ -121,18 +302,24 @@ def preprocessing(txt: str, remove_space: bool = True) -> str:
     :return: preprocessed text
     :rtype: str
     """
-    txt = re.sub(SURROUNDING_SEPS_RX, "", txt)
+    # each pattern is applied only if the text can match it,
+    # as most samples do not
+    if SEPARATOR in txt[-3:]:
+        txt = SURROUNDING_SEPS_RX.sub("", txt)
 
     if remove_space:
-        txt = re.sub(r"\s+", "", txt)
+        txt = WHITESPACE_RX.sub("", txt)
 
-    txt = re.sub(MULTIPLE_SEPS_RX, SEPARATOR, txt)
+    if SEPARATOR + SEPARATOR in txt:
+        txt = MULTIPLE_SEPS_RX.sub(SEPARATOR, txt)
 
-    txt = re.sub(TAG_RX, "", txt)
+    if "<" in txt:
+        txt = TAG_RX.sub("", txt)
 
-    txt = re.sub(TAILING_SEP_RX, "", txt).strip()
+    if SEPARATOR in txt[-2:]:
+        txt = TAILING_SEP_RX.sub("", txt)
 
-    return txt
+    return txt.strip()
 
 
 def compute_stats(ref_sample: str, raw_sample: str) -> dict:
@@ -155,33 +342,32 @@ def compute_stats(ref_sample: str, raw_sample: str) -> dict:
     :return: metrics at character- and word-level and indicators of correctly tokenized words
     :rtype: dict[str, float | str]
     """
-    ref_sample = _binary_representation(ref_sample)
-    sample = _binary_representation(raw_sample)
+    ref_length, ref_starts = _word_starts(ref_sample)
+    length, starts = _word_starts(raw_sample)
 
-    # Compute character-level statistics
-    c_pos_pred, c_neg_pred = np.argwhere(sample == 1), np.argwhere(sample == 0)
+    # Compute character-level statistics,
+    # on the characters that are in both samples
+    n_chars = min(length, ref_length)
+    ref_start_set = set(ref_starts)
 
-    c_pos_pred = c_pos_pred[c_pos_pred < ref_sample.shape[0]]
-    c_neg_pred = c_neg_pred[c_neg_pred < ref_sample.shape[0]]
-
-    c_tp = np.sum(ref_sample[c_pos_pred] == 1)
-    c_fp = np.sum(ref_sample[c_pos_pred] == 0)
-
-    c_tn = np.sum(ref_sample[c_neg_pred] == 0)
-    c_fn = np.sum(ref_sample[c_neg_pred] == 1)
+    c_pos_pred = [i for i in starts if i < n_chars]
+    c_tp = sum(1 for i in c_pos_pred if i in ref_start_set)
+    c_fp = len(c_pos_pred) - c_tp
+    c_fn = sum(1 for i in ref_starts if i < n_chars) - c_tp
+    c_tn = n_chars - c_tp - c_fp - c_fn
 
     # Compute word-level statistics
 
     # Find correctly tokenized words in the reference sample
-    word_boundaries = _find_word_boundaries(ref_sample)
+    word_boundaries = list(zip(ref_starts, ref_starts[1:] + [ref_length]))
 
     # Find correctly tokenized words in the sample
-    ss_boundaries = _find_word_boundaries(sample)
+    ss_boundaries = list(zip(starts, starts[1:] + [length]))
     tokenization_indicators = _find_words_correctly_tokenised(
         word_boundaries, ss_boundaries
     )
 
-    correctly_tokenised_words = np.sum(tokenization_indicators)
+    correctly_tokenised_words = sum(tokenization_indicators)
 
     tokenization_indicators = list(
         map(str, tokenization_indicators)
@@ -196,8 +382,8 @@ def compute_stats(ref_sample: str, raw_sample: str) -> dict:
         },
         "word_level": {
             "correctly_tokenised_words": correctly_tokenised_words,
-            "total_words_in_sample": np.sum(sample),
-            "total_words_in_ref_sample": np.sum(ref_sample),
+            "total_words_in_sample": len(starts),
+            "total_words_in_ref_sample": len(ref_starts),
         },
         "global": {
             "tokenisation_indicators": "".join(tokenization_indicators)
@@ -205,6 +391,26 @@ def compute_stats(ref_sample: str, raw_sample: str) -> dict:
     }
 
 
+def _word_starts(txt: str) -> Tuple[int, List[int]]:
+    """
+    Find the starting location of each word.
+
+    Same as the locations of 1 in :func:`_binary_representation`,
+    without building an array of the characters.
+
+    :param str txt: input text, words separated by `SEPARATOR`
+
+    :return: length of the text without separators,
+             and sorted starting locations of the words
+    :rtype: tuple[int, list[int]]
+    """
+    # empty words, of repeated separators, do not start a word
+    ends = list(accumulate(len(word) for word in txt.split(SEPARATOR) if word))
+    if not ends:
+        return 0, [0]
+    return ends[-1], [0] + ends[:-1]
+
+
 def _binary_representation(txt: str, verbose: bool = False):
     """
     Transform text into {0, 1} sequence.
@@ -267,7 +473,7 @@ def _find_words_correctly_tokenised(
     :return: binary sequence where 1 indicates the corresponding word is tokenized correctly
     :rtype: tuple[int]
     """
-    ref_b = dict(zip(ref_boundaries, [1] * len(ref_boundaries)))
+    ref_b = set(ref_boundaries)
 
-    labels = tuple(map(lambda x: ref_b.get(x, 0), predicted_boundaries))
+    labels = tuple(1 if x in ref_b else 0 for x in predicted_boundaries)
     return labels
@@ -3,10 +3,82 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import gzip
-from typing import List, Tuple
+import os
+import zlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Callable, List, Tuple
 import numpy as np
 
 
+def _gzip_size(data: bytes, level: int) -> int:
+    return len(gzip.compress(data, compresslevel=level))
+
+
+def _zlib_size(data: bytes, level: int) -> int:
+    return len(zlib.compress(data, level))
+
+
+def _zstd_size(data: bytes, level: int) -> int:
+    import zstandard
+
+    return len(zstandard.ZstdCompressor(level=level).compress(data))
+
+
+def _lz4_size(data: bytes, level: int) -> int:
+    import lz4.frame
+
+    return len(lz4.frame.compress(data, compression_level=level))
+
+
+# copying a primed compressor costs about as much as priming one with
+# 2 KB, so shorter training samples are primed again for each text
+_PRIME_MIN_SIZE = 2048
+
+
+def _zlib_dict_size(primed, zdict: bytes, data: bytes, level: int) -> int:
+    # size of data compressed by a compressor primed with zdict, i.e. the
+    # extra size of data after zdict; primed is a compressor already
+    # primed with zdict, copied so it can be used again, or None
+    if primed is None:
+        compressor = zlib.compressobj(level, zdict=zdict)
+    else:
+        compressor = primed.copy()
+    return len(compressor.compress(data) + compressor.flush())
+
+
+_COMPRESSORS = {
+    "gzip": _gzip_size,
+    "zlib": _zlib_size,
+    "zlib_dict": _zlib_size,
+    "zstd": _zstd_size,
+    "lz4": _lz4_size,
+}
+
+
+def _get_compressor(compressor: str) -> Callable[[bytes, int], int]:
+    if compressor not in _COMPRESSORS:
+        raise ValueError(
+            f"""Compressor '{compressor}' is not supported.
+            It must be one of {list(_COMPRESSORS)}."""
+        )
+    if compressor == "zstd":
+        try:
+            import zstandard  # noqa: F401
+        except ImportError:
+            raise ImportError(
+                "Not found zstandard! Please install zstandard by pip install zstandard"
+            )
+    elif compressor == "lz4":
+        try:
+            import lz4.frame  # noqa: F401
+        except ImportError:
+            raise ImportError(
+                "Not found lz4! Please install lz4 by pip install lz4"
+            )
+    return _COMPRESSORS[compressor]
+
+
 class GzipModel:
     """
     This class is a re-implementation of
@@ -14,19 +86,95 @@ class GzipModel:
     (Jiang et al., Findings 2023)
 
     :param list training_data: list [(text_sample,label)]
+    :param str compressor: compressor used to compute the normalized
+                           compression distance
+    :param int level: compression level, default is 9 for *gzip* and
+                      *zlib*, and the default level of *zstd* and *lz4*
+
+    **Options for compressor**
+        * *gzip* (default) - gzip, as in the paper
+        * *zlib* - zlib (deflate, without the gzip header)
+        * *zlib_dict* - zlib, the compressed size of a text after a \
+            training sample is computed by a compressor primed with \
+            the training sample as its dictionary, instead of \
+            compressing the two texts joined together (the compressor \
+            of a training sample of 2 KB or more is primed once, and \
+            copied for each text)
+        * *zstd* - Zstandard (requires `zstandard`)
+        * *lz4* - LZ4 (requires `lz4`)
     """
 
-    def __init__(self, training_data: List[Tuple[str, str]]):
+    def __init__(
+        self,
+        training_data: List[Tuple[str, str]],
+        compressor: str = "gzip",
+        level: int = None,
+    ):
+        self.compressor = compressor
+        self._size = _get_compressor(compressor)
+        if level is None:
+            level = {"zstd": 3, "lz4": 0}.get(compressor, 9)
+        self.level = level
         self.training_data = np.array(training_data)
+        self.texts = [text.encode("utf-8") for text, _ in training_data]
+        self.labels = np.array([label for _, label in training_data])
         self.Cx2_list = self.train()
+        self._primed = self._prime()
+
+    def _prime(self) -> list:
+        # one compressor per training sample, primed with the sample as
+        # its dictionary, and copied for each text to predict
+        if self.compressor != "zlib_dict":
+            return []
+        return [
+            zlib.compressobj(self.level, zdict=x2)
+            if len(x2) >= _PRIME_MIN_SIZE
+            else None
+            for x2 in self.texts
+        ]
 
-    def train(self):
-        Cx2_list = []
-        for i in range(len(self.training_data)):
-            Cx2_list.append(
-                len(gzip.compress(self.training_data[i][0].encode("utf-8")))
+    def __getstate__(self) -> dict:
+        # compressors cannot be pickled, prime them again in processes
+        state = self.__dict__.copy()
+        del state["_primed"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._primed = self._prime()
+
+    def train(self) -> np.ndarray:
+        """
+        Compute the compressed length of every training sample.
+
+        :return: array of compressed lengths
+        :rtype: numpy.ndarray
+        """
+        return np.array(
+            [self._size(x2, self.level) for x2 in self.texts], dtype=np.int64
+        )
+
+    def _distances(self, x1: str) -> np.ndarray:
+        # normalized compression distance from x1 to every training sample
+        x1 = x1.encode("utf-8")
+        Cx1 = self._size(x1, self.level)
+        if self.compressor == "zlib_dict":
+            Cx1x2 = self.Cx2_list + np.array(
+                [
+                    _zlib_dict_size(primed, x2, x1, self.level)
+                    for primed, x2 in zip(self._primed, self.texts)
+                ],
+                dtype=np.int64,
             )
-        return Cx2_list
+        else:
+            Cx1x2 = np.array(
+                [self._size(x1 + x2, self.level) for x2 in self.texts],
+                dtype=np.int64,
+            )
+
+        return (Cx1x2 - np.minimum(Cx1, self.Cx2_list)) / np.maximum(
+            Cx1, self.Cx2_list
+        )
 
     def predict(self, x1: str, k: int = 1) -> str:
         """
@@ -55,20 +203,61 @@ class GzipModel:
                 print(model.predict("ฉันดีใจ", k=1))
                 # output: Positive
         """
-        Cx1 = len(gzip.compress(x1.encode("utf-8")))
-        disance_from_x1 = []
-        for i in range(len(self.Cx2_list)):
-            x2 = self.training_data[i][0]
-            Cx2 = self.Cx2_list[i]
-            x1x2 = "".join([x1, x2])
-            Cx1x2 = len(gzip.compress(x1x2.encode("utf-8")))
-            # normalized compression distance
-            ncd = (Cx1x2 - min(Cx1, Cx2)) / max(Cx1, Cx2)
-            disance_from_x1.append(ncd)
-
-        sorted_idx = np.argsort(np.array(disance_from_x1))
-        top_k_class = self.training_data[sorted_idx[:k], 1]
-        _, counts = np.unique(top_k_class, return_counts=True)
-        predict_class = top_k_class[counts.argmax()]
-
-        return predict_class
+        sorted_idx = np.argsort(self._distances(x1), kind="stable")
+        top_k_class = self.labels[sorted_idx[:k]]
+        classes, counts = np.unique(top_k_class, return_counts=True)
+        predict_class = classes[counts.argmax()]
+
+        return str(predict_class)
+
+    def _predict_chunk(self, texts: List[str], k: int) -> List[str]:
+        return [self.predict(x1, k=k) for x1 in texts]
+
+    def predict_many(
+        self,
+        texts: List[str],
+        k: int = 1,
+        n_jobs: int = 1,
+        prefer: str = "threads",
+    ) -> List[str]:
+        """
+        Predict labels for many texts, in parallel.
+
+        :param list texts: the texts that we want to predict labels for
+        :param int k: k
+        :param int n_jobs: number of workers, -1 to use all CPUs
+        :param str prefer: *threads* (default) or *processes*.
+                           Compressors release the GIL while compressing,
+                           but processes scale better for short texts,
+                           where Python overhead dominates.
+        :return: list of labels, in the order of `texts`
+        :rtype: list[str]
+
+        :Example:
+        ::
+
+                from pythainlp.classify import GzipModel
+
+                model = GzipModel(training_data, compressor="zlib")
+                model.predict_many(["ฉันดีใจ", "ขับรถแย่"], k=1, n_jobs=4)
+                # output: ['Positive', 'Negative']
+        """
+        if prefer not in ("threads", "processes"):
+            raise ValueError(
+                f"prefer must be 'threads' or 'processes', not '{prefer}'."
+            )
+        if n_jobs < 0:
+            n_jobs = os.cpu_count() or 1
+        if n_jobs <= 1 or len(texts) <= 1:
+            return self._predict_chunk(texts, k)
+
+        # one chunk per worker, so the model is sent to each process once
+        size = -(-len(texts) // n_jobs)
+        chunks = [texts[i : i + size] for i in range(0, len(texts), size)]
+        if prefer == "processes":
+            executor = ProcessPoolExecutor(max_workers=n_jobs)
+        else:
+            executor = ThreadPoolExecutor(max_workers=n_jobs)
+        with executor:
+            results = executor.map(partial(self._predict_chunk, k=k), chunks)
+            return [label for chunk in results for label in chunk]
@@ -2,13 +2,20 @@
 # SPDX-FileCopyrightText: 2016-2024 PyThaiNLP Project
 # SPDX-License-Identifier: Apache-2.0
 """Command line helpers."""
+import json
+import os
 import sys
-from argparse import ArgumentParser
+from argparse import ArgumentParser, Namespace
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Iterable, Iterator, List
 
-from pythainlp.cli import data, soundex, tag, tokenize, benchmark
+from pythainlp.cli import data, soundex, tag, tokenize, benchmark, serve
 
 # a command should start with a verb when possible
-COMMANDS = sorted(["data", "soundex", "tag", "tokenize", "benchmark"])
+COMMANDS = sorted(
+    ["data", "soundex", "tag", "tokenize", "benchmark", "serve"]
+)
 
 CLI_NAME = "thainlp"
 
@@ -23,3 +30,139 @@ def exit_if_empty(command: str, parser: ArgumentParser) -> None:
     if not command:
         parser.print_help()
         sys.exit(0)
+
+
+def add_io_arguments(parser: ArgumentParser) -> None:
+    """
+    Add the arguments of bulk mode: process a file or stdin
+    line by line, instead of one text from the command line.
+    """
+    parser.add_argument(
+        "-i",
+        "--input",
+        dest="input",
+        type=str,
+        help="input file, one text per line, - for stdin",
+        default=None,
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        dest="output",
+        type=str,
+        help="output file, one result per line. default: stdout",
+        default=None,
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        dest="format",
+        type=str,
+        choices=["text", "jsonl"],
+        help="output format of bulk mode. default: text",
+        default="text",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        dest="jobs",
+        type=int,
+        help="number of worker processes, -1 to use all CPUs. default: 1",
+        default=1,
+    )
+    parser.add_argument(
+        "-b",
+        "--batch-size",
+        dest="batch_size",
+        type=int,
+        help="number of lines sent to a worker at a time. default: 256",
+        default=256,
+    )
+
+
+def _run_batch(func: Callable, texts: List[str]) -> list:
+    return [func(text) for text in texts]
+
+
+def _batched(lines: Iterable[str], batch_size: int) -> Iterator[List[str]]:
+    batch = []
+    for line in lines:
+        batch.append(line.rstrip("\r\n"))
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def map_lines(
+    func: Callable,
+    lines: Iterable[str],
+    jobs: int = 1,
+    batch_size: int = 256,
+) -> Iterator:
+    """
+    Apply a function to lines, in batches, in parallel processes
+    if `jobs` > 1, and yield the results in the order of the lines.
+
+    Lines are read lazily, and only a few batches per worker are in
+    flight at a time, so the input can be larger than the memory.
+    Each worker process loads the dictionaries and models once.
+    `func` must be picklable, e.g. a module-level function or
+    a :func:`functools.partial` of one.
+    """
+    if jobs < 0:
+        jobs = os.cpu_count() or 1
+    batches = _batched(lines, max(batch_size, 1))
+    if jobs <= 1:
+        for batch in batches:
+            yield from _run_batch(func, batch)
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        pending = deque()
+        for batch in batches:
+            pending.append(executor.submit(_run_batch, func, batch))
+            if len(pending) >= 2 * jobs:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def run_bulk(
+    args: Namespace,
+    func: Callable,
+    to_text: Callable[[Any], str],
+) -> None:
+    """
+    Process the input of bulk mode (see :func:`add_io_arguments`)
+    with `func` and write one result per line, formatted by `to_text`
+    or as JSON if the format is *jsonl*.
+    """
+    if args.input == "-":
+        infile = sys.stdin
+    else:
+        infile = open(args.input, encoding="utf-8")
+    if args.output:
+        outfile = open(args.output, "w", encoding="utf-8")
+    else:
+        outfile = sys.stdout
+    try:
+        results = map_lines(func, infile, args.jobs, args.batch_size)
+        for result in results:
+            if args.format == "jsonl":
+                line = json.dumps(result, ensure_ascii=False)
+            else:
+                line = to_text(result)
+            outfile.write(line + "\n")
+        outfile.flush()
+    except BrokenPipeError:
+        # the reader of stdout exited early, e.g. thainlp ... | head
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        sys.exit(1)
+    finally:
+        if infile is not sys.stdin:
+            infile.close()
+        if outfile is not sys.stdout:
+            outfile.close()
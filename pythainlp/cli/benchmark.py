@@ -4,37 +4,35 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import argparse
-import json
 import os
+import sys
 
 import yaml
 from pythainlp import cli
 from pythainlp.benchmarks import word_tokenization
 
 
-def _read_file(path):
-    with open(path, "r", encoding="utf-8") as f:
-        lines = map(lambda r: r.strip(), f.readlines())
-    return list(lines)
-
-
 class App:
     def __init__(self, argv):
         parser = argparse.ArgumentParser(
             prog="benchmark",
             description=(
                 "Benchmark for various tasks;\n"
-                "currently, we have only for word tokenization."
+                "currently, we have for the accuracy of word tokenization,\n"
+                "and for the speed of the tokenizers."
             ),
             usage=(
                 "thainlp benchmark [task] [task-options]\n\n"
                 "tasks:\n\n"
-                "word-tokenization      benchmark word tokenization\n\n"
+                "word-tokenization      benchmark word tokenization\n"
+                "speed                  benchmark speed of the tokenizers\n\n"
                 "--"
             ),
         )
 
-        parser.add_argument("task", type=str, help="[word-tokenization]")
+        parser.add_argument(
+            "task", type=str, help="[word-tokenization|speed]"
+        )
 
         args = parser.parse_args(argv[2:3])
         cli.exit_if_empty(args.task, parser)
@@ -43,6 +41,8 @@ class App:
         task_argv = argv[3:]
         if task == "word-tokenization":
             WordTokenizationBenchmark(task, task_argv)
+        elif task == "speed":
+            SpeedBenchmark(task, task_argv)
 
 
 class WordTokenizationBenchmark:
@@ -71,54 +71,58 @@ class WordTokenizationBenchmark:
             ),
         )
 
-        args = parser.parse_args(argv)
-
-        actual = _read_file(args.input_file)
-        expected = _read_file(args.test_file)
-
-        assert len(actual) == len(
-            expected
-        ), "Input and test files do not have the same number of samples"
-
-        print(
-            "Benchmarking %s against %s with %d samples in total"
-            % (args.input_file, args.test_file, len(actual))
+        parser.add_argument(
+            "-j",
+            "--jobs",
+            type=int,
+            help="number of worker processes. default: 1",
+            default=1,
         )
 
-        df_raw = word_tokenization.benchmark(expected, actual)
-
-        columns = [
-            "char_level:tp",
-            "char_level:fp",
-            "char_level:tn",
-            "char_level:fn",
-            "word_level:correctly_tokenised_words",
-            "word_level:total_words_in_sample",
-            "word_level:total_words_in_ref_sample",
-        ]
-
-        statistics = {}
-
-        for c in columns:
-            statistics[c] = float(df_raw[c].sum())
-
-        statistics["char_level:precision"] = statistics["char_level:tp"] / (
-            statistics["char_level:tp"] + statistics["char_level:fp"]
+        parser.add_argument(
+            "--chunk-size",
+            dest="chunk_size",
+            type=int,
+            help="number of samples evaluated at a time. default: 1000",
+            default=1000,
         )
 
-        statistics["char_level:recall"] = statistics["char_level:tp"] / (
-            statistics["char_level:tp"] + statistics["char_level:fn"]
-        )
+        args = parser.parse_args(argv)
 
-        statistics["word_level:precision"] = (
-            statistics["word_level:correctly_tokenised_words"]
-            / statistics["word_level:total_words_in_sample"]
+        print(
+            "Benchmarking %s against %s" % (args.input_file, args.test_file)
         )
 
-        statistics["word_level:recall"] = (
-            statistics["word_level:correctly_tokenised_words"]
-            / statistics["word_level:total_words_in_ref_sample"]
-        )
+        details_path = None
+        if args.save_details:
+            dir_name = os.path.dirname(args.input_file)
+            file_name = args.input_file.split("/")[-1].split(".")[0]
+            details_path = "%s/eval-details-%s.json" % (dir_name, file_name)
+
+        n_samples = 0
+
+        def count(lines):
+            nonlocal n_samples
+            for line in lines:
+                n_samples += 1
+                yield line.strip()
+
+        # the files are read line by line, not loaded into memory
+        with open(args.input_file, "r", encoding="utf-8") as actual, open(
+            args.test_file, "r", encoding="utf-8"
+        ) as expected:
+            try:
+                statistics = word_tokenization.evaluate(
+                    (line.strip() for line in expected),
+                    count(actual),
+                    chunk_size=args.chunk_size,
+                    jobs=args.jobs,
+                    details_file=details_path,
+                )
+            except ValueError as e:
+                sys.exit(f"Error: {e}")
+
+        print("%d samples in total" % n_samples)
 
         print("============== Benchmark Result ==============")
 
@@ -139,29 +143,145 @@ class WordTokenizationBenchmark:
             print(f"{c:>40s} {v:.4f}")
 
         if args.save_details:
-            dir_name = os.path.dirname(args.input_file)
-            file_name = args.input_file.split("/")[-1].split(".")[0]
-
             res_path = "%s/eval-%s.yml" % (dir_name, file_name)
             print("Evaluation result is saved to %s" % res_path)
 
             with open(res_path, "w", encoding="utf-8") as outfile:
                 yaml.dump(statistics, outfile, default_flow_style=False)
 
-            res_path = "%s/eval-details-%s.json" % (dir_name, file_name)
-            print("Details of comparisons is saved to %s" % res_path)
+            print("Details of comparisons is saved to %s" % details_path)
+
+
+def _split(value):
+    return [v for v in value.split(",") if v] if value else None
+
+
+class SpeedBenchmark:
+    def __init__(self, name, argv):
+        from pythainlp.benchmarks import speed
+
+        parser = argparse.ArgumentParser(**cli.make_usage("benchmark " + name))
 
-            with open(res_path, "w", encoding="utf-8") as f:
-                samples = []
-                for i, r in enumerate(df_raw.to_dict("records")):
-                    expected, actual = r["expected"], r["actual"]
-                    del r["expected"]
-                    del r["actual"]
+        parser.add_argument(
+            "--tasks",
+            type=str,
+            help=(
+                "comma-separated tasks: "
+                f"{','.join(speed.TASKS)} (default: all)"
+            ),
+            default=None,
+        )
+        parser.add_argument(
+            "--engines",
+            type=str,
+            help="comma-separated engines (default: all of the tasks)",
+            default=None,
+        )
+        parser.add_argument(
+            "--samples",
+            type=str,
+            help=(
+                "comma-separated samples: "
+                f"{','.join(speed.SAMPLES)} (default: all)"
+            ),
+            default=None,
+        )
+        parser.add_argument(
+            "--min-time",
+            dest="min_time",
+            type=float,
+            help=(
+                "minimum time, in seconds, on each sample. "
+                f"default: {speed.DEFAULT_MIN_TIME}"
+            ),
+            default=speed.DEFAULT_MIN_TIME,
+        )
+        parser.add_argument(
+            "--timeout",
+            type=float,
+            help=(
+                "maximum time, in seconds, for an engine. "
+                f"default: {speed.DEFAULT_TIMEOUT}"
+            ),
+            default=speed.DEFAULT_TIMEOUT,
+        )
+        parser.add_argument(
+            "--no-isolate",
+            dest="isolate",
+            action="store_false",
+            help="time every engine in this process (no cold start, RSS)",
+        )
+        parser.add_argument(
+            "-o",
+            "--output",
+            type=str,
+            help="save the results to a JSON file",
+            default=None,
+        )
+        parser.add_argument(
+            "--baseline",
+            type=str,
+            help=(
+                "JSON file of earlier results to compare with; "
+                "exit with status 1 if an engine is slower"
+            ),
+            default=None,
+        )
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            help="relative change of chars/sec to report. default: 0.1",
+            default=0.1,
+        )
 
-                    samples.append(
-                        {"metrics": r, "expected": expected, "actual": actual, "id": i}
-                    )
+        args = parser.parse_args(argv)
 
-                details = {"metrics": statistics, "samples": samples}
+        report = speed.speed_benchmark(
+            tasks=_split(args.tasks),
+            engines=_split(args.engines),
+            samples=_split(args.samples),
+            min_time=args.min_time,
+            isolate=args.isolate,
+            timeout=args.timeout,
+        )
 
-                json.dump(details, f, ensure_ascii=False)
+        print("============== Speed Benchmark Result ==============")
+        if report["import_time_s"] is not None:
+            print(f"import time: {report['import_time_s']:.3f} s")
+        print(
+            f"{'task':<10s}{'engine':<20s}{'sample':<8s}{'chars/s':>14s}"
+            f"{'p50 ms':>11s}{'p99 ms':>11s}{'cold s':>9s}{'RSS MB':>9s}"
+        )
+        for result in report["results"]:
+            head = f"{result['task']:<10s}{result['engine']:<20s}"
+            if result["status"] != "ok":
+                print(f"{head}{result['status']}: {result['error']}")
+                continue
+            cold = result.get("cold_start_s") or 0.0
+            rss = result.get("peak_rss_mb") or 0.0
+            for sample, stats in result["samples"].items():
+                print(
+                    f"{head}{sample:<8s}{stats['chars_per_sec']:>14,.0f}"
+                    f"{stats['latency_p50_ms']:>11.3f}"
+                    f"{stats['latency_p99_ms']:>11.3f}"
+                    f"{cold:>9.3f}{rss:>9.1f}"
+                )
+
+        if args.output:
+            speed.save_report(report, args.output)
+            print(f"Results are saved to {args.output}")
+
+        if args.baseline:
+            rows = speed.compare(
+                report,
+                speed.load_report(args.baseline),
+                threshold=args.threshold,
+            )
+            print(f"============== Compared with {args.baseline} ==============")
+            for row in rows:
+                print(
+                    f"{row['task']:<10s}{row['engine']:<20s}"
+                    f"{row['sample']:<8s}{row['change']:>+9.1%}  {row['status']}"
+                )
+            if any(row["status"] == "regression" for row in rows):
+                sys.exit(1)
@@ -5,6 +5,7 @@
 Command line for PyThaiNLP's dataset/corpus management.
 """
 import argparse
+import sys
 
 from pythainlp import corpus
 from pythainlp.tools import get_pythainlp_data_path
@@ -20,11 +21,15 @@ class App:
                 "subcommands:\n\n"
                 "catalog                show list of available datasets\n"
                 "info <dataset_name>    show information about the dataset\n"
-                "get <dataset_name>     download the dataset\n"
+                "get <dataset_name>...  download the datasets\n"
                 "rm <dataset_name>      remove the dataset\n"
+                "pack <dataset_name>... -o <bundle.tar>\n"
+                "                       pack datasets into an offline bundle\n"
+                "install <bundle.tar>   install datasets from a bundle\n"
                 "path                   show full path to data directory\n\n"
                 "Example:\n\n"
-                "thainlp data get thai2fit_wv\n\n"
+                "thainlp data get thai2fit_wv\n"
+                "thainlp data get thainer crfcut thai2fit_wv --jobs 4\n\n"
                 "Current data path:\n\n"
                 f"{get_pythainlp_data_path()}\n\n"
                 "To change PyThaiNLP data path, set the operating system's\n"
@@ -37,7 +42,15 @@ class App:
         parser.add_argument(
             "subcommand",
             type=str,
-            choices=["catalog", "info", "get", "rm", "path"],
+            choices=[
+                "catalog",
+                "info",
+                "get",
+                "rm",
+                "pack",
+                "install",
+                "path",
+            ],
             help="action on dataset/corpus",
         )
         args = parser.parse_args(argv[2:3])
@@ -45,19 +58,44 @@ class App:
 
     def get(self, argv):
         parser = argparse.ArgumentParser(
-            description="Download a dataset",
-            usage="thainlp data get <dataset_name>",
+            description="Download datasets",
+            usage="thainlp data get <dataset_name> [<dataset_name> ...] "
+            "[--jobs <n>] [--force]",
         )
         parser.add_argument(
-            "dataset_name",
+            "dataset_names",
             type=str,
+            nargs="+",
             help="dataset/corpus's name",
         )
+        parser.add_argument(
+            "-j",
+            "--jobs",
+            type=int,
+            help="number of concurrent downloads. default: 4",
+            default=4,
+        )
+        parser.add_argument(
+            "-f",
+            "--force",
+            action="store_true",
+            help="download again, even if the dataset already exists",
+        )
         args = parser.parse_args(argv[3:])
-        if corpus.download(args.dataset_name):
-            print("Downloaded successfully.")
-        else:
-            print("Not found.")
+        if len(args.dataset_names) == 1:
+            if corpus.download(args.dataset_names[0], force=args.force):
+                print("Downloaded successfully.")
+            else:
+                print("Not found.")
+            return
+        results = corpus.download_many(
+            args.dataset_names, force=args.force, jobs=args.jobs
+        )
+        for name, downloaded in results.items():
+            if downloaded:
+                print(f"{name}: Downloaded successfully.")
+            else:
+                print(f"{name}: Not found.")
 
     def rm(self, argv):
         parser = argparse.ArgumentParser(
@@ -75,6 +113,67 @@ class App:
         else:
             print("Not found.")
 
+    def pack(self, argv):
+        parser = argparse.ArgumentParser(
+            description="Pack datasets into a bundle for offline hosts",
+            usage="thainlp data pack <dataset_name> [<dataset_name> ...] "
+            "-o <bundle.tar>",
+        )
+        parser.add_argument(
+            "dataset_names",
+            type=str,
+            nargs="+",
+            help="dataset/corpus's name",
+        )
+        parser.add_argument(
+            "-o",
+            "--output",
+            type=str,
+            help="path of the bundle",
+            required=True,
+        )
+        args = parser.parse_args(argv[3:])
+        from pythainlp.corpus.bundle import pack
+
+        try:
+            names = pack(args.dataset_names, args.output)
+        except ValueError as e:
+            print(e)
+            sys.exit(1)
+        print(f"Packed {', '.join(names) or 'nothing'} into {args.output}")
+
+    def install(self, argv):
+        parser = argparse.ArgumentParser(
+            description="Install datasets from a bundle",
+            usage="thainlp data install <bundle.tar> [<dataset_name> ...] "
+            "[--force]",
+        )
+        parser.add_argument(
+            "bundle",
+            type=str,
+            help="path of the bundle",
+        )
+        parser.add_argument(
+            "dataset_names",
+            type=str,
+            nargs="*",
+            help="dataset/corpus's name (default: all datasets in the bundle)",
+        )
+        parser.add_argument(
+            "-f",
+            "--force",
+            action="store_true",
+            help="install again, even if the dataset already exists",
+        )
+        args = parser.parse_args(argv[3:])
+        from pythainlp.corpus.bundle import install
+
+        try:
+            install(args.bundle, args.dataset_names or None, force=args.force)
+        except (OSError, ValueError) as e:
+            print(e)
+            sys.exit(1)
+
     def info(self, argv):
         parser = argparse.ArgumentParser(
             description="Print information about a dataset",
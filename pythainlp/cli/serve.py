@@ -0,0 +1,440 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2016-2024 PyThaiNLP Project
+# SPDX-License-Identifier: Apache-2.0
+"""
+Command line for PyThaiNLP's resident server.
+
+The server keeps the engines loaded and answers tokenize, tag, NER,
+and romanize requests over HTTP, on localhost or on a Unix socket.
+Concurrent requests are micro-batched into the batch APIs.
+"""
+import argparse
+import json
+import os
+import socketserver
+import stat
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Tuple, Union
+
+from pythainlp.tools.batching import MicroBatcher
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8000
+DEFAULT_MAX_BATCH_SIZE = 32
+DEFAULT_MAX_WAIT_MS = 5.0
+
+# task: (input key of one item, input key of many items, options)
+_TASKS = {
+    "tokenize": (
+        "text",
+        "texts",
+        {"engine": "newmm", "keep_whitespace": True},
+    ),
+    "tag": (
+        "words",
+        "sentences",
+        {"engine": "perceptron", "corpus": "orchid"},
+    ),
+    "ner": ("text", "texts", {"engine": "thainer", "corpus": "thainer"}),
+    "romanize": ("text", "texts", {"engine": "royin"}),
+}
+
+# task: {option: allowed values}, checked before a batcher is created,
+# so requests cannot create a batcher (and its thread) for any value
+_CHOICES = {
+    "tokenize": {
+        "engine": {
+            "attacut",
+            "deepcut",
+            "icu",
+            "longest",
+            "mm",
+            "multi_cut",
+            "nercut",
+            "newmm",
+            "newmm-safe",
+            "nlpo3",
+            "onecut",
+            "oskut",
+            "sefr_cut",
+            "tltk",
+        },
+        "keep_whitespace": {True, False},
+    },
+    "tag": {
+        "engine": {"perceptron", "tltk", "unigram"},
+        "corpus": {
+            "blackboard",
+            "blackboard_ud",
+            "orchid",
+            "orchid_ud",
+            "pud",
+        },
+    },
+    "ner": {
+        "engine": {
+            "phayathaibert",
+            "phayathaibert-onnx",
+            "thainer",
+            "thainer-v2",
+            "thainer-v2-onnx",
+            "tltk",
+            "wangchanberta",
+            "wangchanberta-onnx",
+        },
+        "corpus": {"thainer", "thainer-v2"},
+    },
+    "romanize": {
+        "engine": {"lookup", "royin", "thai2rom", "thai2rom_onnx", "tltk"},
+    },
+}
+
+
+def _tokenize(texts: List[str], engine: str, keep_whitespace: bool) -> list:
+    from pythainlp.tokenize import word_tokenize
+
+    return [
+        word_tokenize(text, engine=engine, keep_whitespace=keep_whitespace)
+        for text in texts
+    ]
+
+
+def _tag(sentences: List[List[str]], engine: str, corpus: str) -> list:
+    from pythainlp.tag import pos_tag_sents
+
+    return pos_tag_sents(sentences, engine=engine, corpus=corpus)
+
+
+def _romanize(texts: List[str], engine: str) -> list:
+    from pythainlp.transliterate import romanize_many
+
+    return romanize_many(texts, engine=engine)
+
+
+class BatchingService:
+    """
+    Engines of the server, with a :class:`MicroBatcher` for each task
+    and set of options, created on first use.
+
+    :param int max_batch_size: maximum number of items in a batch
+    :param float max_wait: maximum time, in seconds, that a request
+                           waits for other requests to join its batch
+    """
+
+    def __init__(
+        self,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait: float = DEFAULT_MAX_WAIT_MS / 1000,
+    ) -> None:
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._batchers = {}
+        self._ners = {}
+        self._lock = threading.Lock()
+        self._ner_lock = threading.Lock()
+        self._started = time.time()
+
+    def _ner(self, texts: List[str], engine: str, corpus: str) -> list:
+        with self._ner_lock:
+            if (engine, corpus) not in self._ners:
+                from pythainlp.tag import NER
+
+                self._ners[(engine, corpus)] = NER(
+                    engine=engine, corpus=corpus
+                )
+            ner = self._ners[(engine, corpus)]
+        return ner.tag_batch(texts, batch_size=len(texts))
+
+    def _get_batcher(self, task: str, options: Tuple) -> MicroBatcher:
+        key = (task, options)
+        with self._lock:
+            if key not in self._batchers:
+                func = {
+                    "tokenize": _tokenize,
+                    "tag": _tag,
+                    "ner": self._ner,
+                    "romanize": _romanize,
+                }[task]
+                kwargs = dict(options)
+                self._batchers[key] = MicroBatcher(
+                    lambda items: func(items, **kwargs),
+                    max_batch_size=self.max_batch_size,
+                    max_wait=self.max_wait,
+                )
+            return self._batchers[key]
+
+    def handle(self, task: str, request: Dict) -> Dict:
+        """
+        Process a request.
+
+        A request has one item (`text`, or `words` for *tag*) or many
+        items (`texts`, or `sentences` for *tag*), and options of the
+        task, e.g. `engine`. Each item is batched with the items of
+        other requests.
+
+        :raises ValueError: if a field is unknown or missing, or an
+                            option is not one of the supported values
+
+        :param str task: *tokenize*, *tag*, *ner*, or *romanize*
+        :param dict request: request
+        :return: `{"result": ...}` for one item,
+                 or `{"results": [...]}` for many items
+        :rtype: dict
+        """
+        if task not in _TASKS:
+            raise KeyError(task)
+        one_key, many_key, defaults = _TASKS[task]
+        unknown = set(request) - {one_key, many_key} - set(defaults)
+        if unknown:
+            raise ValueError(f"Unknown fields: {sorted(unknown)}")
+        options = tuple(
+            (name, request.get(name, default))
+            for name, default in defaults.items()
+        )
+        for name, value in options:
+            choices = _CHOICES[task][name]
+            if not isinstance(value, (str, bool)) or value not in choices:
+                raise ValueError(
+                    f"Unknown {name} of {task}: {value!r}, "
+                    f"must be one of {sorted(choices)}"
+                )
+        batcher = self._get_batcher(task, options)
+        if one_key in request:
+            return {"result": batcher(request[one_key])}
+        if many_key in request:
+            futures = [batcher.submit(item) for item in request[many_key]]
+            return {"results": [future.result() for future in futures]}
+        raise ValueError(f"Missing field: '{one_key}' or '{many_key}'")
+
+    def stats(self) -> Dict[str, Union[float, Dict]]:
+        """
+        Statistics of the server and of each task.
+
+        :return: *uptime* in seconds, and statistics of each task and set
+                 of options (see :meth:`MicroBatcher.stats`)
+        :rtype: dict
+        """
+        with self._lock:
+            batchers = dict(self._batchers)
+        tasks = {}
+        for (task, options), batcher in batchers.items():
+            args = ", ".join(f"{k}={v}" for k, v in options)
+            tasks[f"{task}({args})"] = batcher.stats()
+        return {"uptime": time.time() - self._started, "tasks": tasks}
+
+    def close(self) -> None:
+        """Stop the batchers."""
+        with self._lock:
+            batchers = list(self._batchers.values())
+        for batcher in batchers:
+            batcher.close()
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    def _send(self, status: int, data: Dict) -> None:
+        body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        if self.path == "/stats":
+            self._send(200, self.server.service.stats())
+        elif self.path == "/health":
+            self._send(200, {"status": "ok"})
+        else:
+            self._send(404, {"error": f"Not found: {self.path}"})
+
+    def do_POST(self) -> None:
+        task = self.path.strip("/")
+        if task not in _TASKS:
+            self._send(404, {"error": f"Not found: {self.path}"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length) or b"{}")
+            if not isinstance(request, dict):
+                raise ValueError("Request must be a JSON object.")
+            response = self.server.service.handle(task, request)
+        except ValueError as e:
+            self._send(400, {"error": str(e)})
+        except Exception as e:
+            self._send(500, {"error": f"{type(e).__name__}: {e}"})
+        else:
+            self._send(200, response)
+
+    def address_string(self) -> str:
+        # client_address of a Unix socket is not a (host, port) pair
+        if isinstance(self.client_address, tuple):
+            return super().address_string()
+        return "unix"
+
+    def log_message(self, format, *args) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # the default backlog (5) resets concurrent connections
+    request_queue_size = 128
+
+
+class _UnixHTTPServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+def make_server(
+    service: BatchingService,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    unix_socket: str = None,
+    verbose: bool = False,
+):
+    """
+    Create an HTTP server of a :class:`BatchingService`,
+    on `host`:`port`, or on `unix_socket` if it is given.
+
+    The server has these endpoints, with JSON bodies:
+
+    * POST /tokenize, /tag, /ner, /romanize -
+      see :meth:`BatchingService.handle`
+    * GET /stats - see :meth:`BatchingService.stats`
+    * GET /health
+
+    :return: server, call its `serve_forever()` method to start it
+    :rtype: socketserver.BaseServer
+    """
+    if unix_socket:
+        if not hasattr(socketserver, "ThreadingUnixStreamServer"):
+            raise ValueError("Unix sockets are not supported on this system.")
+        if os.path.lexists(unix_socket):
+            # remove a socket left by an earlier server, never a file
+            if not stat.S_ISSOCK(os.lstat(unix_socket).st_mode):
+                raise ValueError(f"Not a Unix socket: {unix_socket}")
+            os.remove(unix_socket)
+        server = _UnixHTTPServer(unix_socket, _RequestHandler)
+    else:
+        server = _HTTPServer((host, port), _RequestHandler)
+    server.service = service
+    server.verbose = verbose
+    return server
+
+
+class App:
+    def __init__(self, argv):
+        parser = argparse.ArgumentParser(
+            prog="serve",
+            description=(
+                "Keep the engines loaded and serve requests over HTTP, "
+                "batching concurrent requests."
+            ),
+            usage=(
+                "thainlp serve [--host <host>] [--port <port>] "
+                "[--unix-socket <path>]\n"
+                "              [--max-batch-size <n>] [--max-wait-ms <ms>] "
+                "[--preload] [--verbose]\n\n"
+                "endpoints:\n\n"
+                'POST /tokenize    {"text": "...", "engine": "newmm"}\n'
+                'POST /tag         {"words": [...], "engine": "perceptron", '
+                '"corpus": "orchid"}\n'
+                'POST /ner         {"text": "...", "engine": "thainer"}\n'
+                'POST /romanize    {"text": "...", "engine": "royin"}\n'
+                "GET  /stats       latency and throughput of each task\n"
+                "GET  /health\n\n"
+                'Use "texts" (or "sentences" for /tag) for many items.\n\n'
+                "Example:\n\n"
+                "thainlp serve --unix-socket /tmp/thainlp.sock --preload\n"
+                "curl --unix-socket /tmp/thainlp.sock "
+                "http://localhost/tokenize -d '{\"text\": \"สวัสดีครับ\"}'\n\n"
+                "--"
+            ),
+        )
+        parser.add_argument(
+            "--host",
+            type=str,
+            help=f"default: {DEFAULT_HOST}",
+            default=DEFAULT_HOST,
+        )
+        parser.add_argument(
+            "--port",
+            type=int,
+            help=f"default: {DEFAULT_PORT}",
+            default=DEFAULT_PORT,
+        )
+        parser.add_argument(
+            "--unix-socket",
+            dest="unix_socket",
+            type=str,
+            help="serve on a Unix socket, instead of host and port",
+            default=None,
+        )
+        parser.add_argument(
+            "--max-batch-size",
+            dest="max_batch_size",
+            type=int,
+            help=f"default: {DEFAULT_MAX_BATCH_SIZE}",
+            default=DEFAULT_MAX_BATCH_SIZE,
+        )
+        parser.add_argument(
+            "--max-wait-ms",
+            dest="max_wait_ms",
+            type=float,
+            help=(
+                "time that a request waits for other requests to join "
+                f"its batch. default: {DEFAULT_MAX_WAIT_MS}"
+            ),
+            default=DEFAULT_MAX_WAIT_MS,
+        )
+        parser.add_argument(
+            "--preload",
+            action="store_true",
+            help="load the default engines of every task before serving",
+        )
+        parser.add_argument(
+            "--verbose",
+            action="store_true",
+            help="log every request",
+        )
+
+        args = parser.parse_args(argv[2:])
+
+        service = BatchingService(
+            max_batch_size=args.max_batch_size,
+            max_wait=args.max_wait_ms / 1000,
+        )
+        if args.preload:
+            for task, (one_key, _, _) in _TASKS.items():
+                item = ["ทดสอบ"] if one_key == "words" else "ทดสอบ"
+                try:
+                    service.handle(task, {one_key: item})
+                except Exception as e:
+                    print(f"Cannot load {task}: {e}", file=sys.stderr)
+
+        server = make_server(
+            service,
+            host=args.host,
+            port=args.port,
+            unix_socket=args.unix_socket,
+            verbose=args.verbose,
+        )
+        if args.unix_socket:
+            print(f"Serving on unix:{args.unix_socket}")
+        else:
+            print(f"Serving on http://{args.host}:{server.server_address[1]}")
+        sys.stdout.flush()
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            service.close()
+            if args.unix_socket and os.path.exists(args.unix_socket):
+                os.remove(args.unix_socket)
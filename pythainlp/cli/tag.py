@@ -5,17 +5,23 @@
 Command line for PyThaiNLP's taggers.
 """
 import argparse
+from functools import partial
 
 from pythainlp import cli
 from pythainlp.tag import pos_tag
 
 
+def _tag_line(line: str, separator: str, run) -> list:
+    return run(line.split(separator))
+
+
 class SubAppBase:
     def __init__(self, name, argv):
         parser = argparse.ArgumentParser(**cli.make_usage("tag " + name))
         parser.add_argument(
             "text",
             type=str,
+            nargs="?",
             help="input text",
         )
         parser.add_argument(
@@ -26,10 +32,22 @@ class SubAppBase:
             help=f"Token separator for input text. default: {self.separator}",
             default=self.separator,
         )
+        cli.add_io_arguments(parser)
 
         args = parser.parse_args(argv)
         self.args = args
 
+        if args.input:
+            cli.run_bulk(
+                args,
+                partial(_tag_line, separator=args.separator, run=self.run),
+                lambda result: args.separator.join(
+                    f"{word}/{tag}" for word, tag in result
+                ),
+            )
+            return
+
+        cli.exit_if_empty(args.text, parser)
         tokens = args.text.split(args.separator)
         result = self.run(tokens)
 
@@ -51,14 +69,19 @@ class App:
             prog="tag",
             description="Annotate a text with linguistic information",
             usage=(
-                'thainlp tag <tag_type> [--sep "<separator>"] "<text>"\n\n'
+                'thainlp tag <tag_type> [--sep "<separator>"] "<text>"\n'
+                'thainlp tag <tag_type> [--sep "<separator>"] '
+                "--input <file> [--output <file>] [--format text|jsonl] "
+                "[--jobs <n>] [--batch-size <n>]\n\n"
                 "tag_type:\n\n"
                 "pos                part-of-speech\n\n"
                 "<separator> and <text> should be inside double quotes.\n"
                 "<text> should be a tokenized text, "
                 "with tokens separated by <separator>.\n\n"
                 "Example:\n\n"
-                'thainlp tag pos -s " " "แรงดึงดูด เก็บ หัว คุณ ลง"\n\n'
+                'thainlp tag pos -s " " "แรงดึงดูด เก็บ หัว คุณ ลง"\n'
+                'thainlp tag pos -s " " -i tokenized.txt -o tagged.jsonl '
+                "-f jsonl -j 4\n\n"
                 "--"
             ),
         )
@@ -6,6 +6,7 @@ Command line for PyThaiNLP's tokenizers.
 """
 
 import argparse
+from functools import partial
 
 from pythainlp import cli
 from pythainlp.tokenize import (
@@ -61,16 +62,26 @@ class SubAppBase:
             action="store_false",
         )
         parser.set_defaults(keep_whitespace=True)
+        cli.add_io_arguments(parser)
 
         args = parser.parse_args(argv)
         self.args = args
 
-        cli.exit_if_empty(args.text, parser)
-        result = self.run(
-            args.text,
+        run = partial(
+            self.run,
             engine=args.algorithm,
             keep_whitespace=args.keep_whitespace,
         )
+        if args.input:
+            cli.run_bulk(
+                args,
+                run,
+                lambda result: args.separator.join(result) + args.separator,
+            )
+            return
+
+        cli.exit_if_empty(args.text, parser)
+        result = run(args.text)
         print(args.separator.join(result) + args.separator)
 
 
@@ -119,10 +130,17 @@ class App:
                 "--algo or -a <algorithm>   tokenization algorithm\n"
                 "                           (see API doc for more info)\n"
                 "--keep-whitespace or -w    keep whitespaces in output\n"
-                "                           (default)\n\n"
+                "                           (default)\n"
+                "--input or -i <file>       tokenize each line of a file\n"
+                "                           (- for stdin), instead of <text>\n"
+                "--output or -o <file>      output file (default is stdout)\n"
+                "--format or -f <format>    text (default) or jsonl\n"
+                "--jobs or -j <n>           number of worker processes\n"
+                "--batch-size or -b <n>     lines sent to a worker at a time\n\n"
                 "<separator> and <text> should be inside double quotes.\n\n"
                 "Example:\n\n"
-                'thainlp tokenize word -s "|" "ใต้แสงนีออนเปลี่ยวเหงา"\n\n'
+                'thainlp tokenize word -s "|" "ใต้แสงนีออนเปลี่ยวเหงา"\n'
+                "cat corpus.txt | thainlp tokenize word -i - -j 4 -f jsonl\n\n"
                 "--"
             ),
         )
@@ -9,11 +9,14 @@ Including download manager.
 """
 
 __all__ = [
+    "clear_derived",
     "corpus_db_path",
     "corpus_db_url",
     "corpus_path",
     "countries",
+    "derived_resources",
     "download",
+    "download_many",
     "find_synonyms",
     "get_corpus",
     "get_corpus_as_is",
@@ -21,10 +24,12 @@ __all__ = [
     "get_corpus_db_detail",
     "get_corpus_default_db",
     "get_corpus_path",
+    "get_derived",
     "get_path_folder_corpus",
     "path_pythainlp_corpus",
     "provinces",
     "remove",
+    "resolve_paths",
     "thai_dict",
     "thai_family_names",
     "thai_female_names",
@@ -90,6 +95,7 @@ def corpus_db_path() -> str:
 
 from pythainlp.corpus.core import (
     download,
+    download_many,
     get_corpus,
     get_corpus_as_is,
     get_corpus_db,
@@ -99,6 +105,7 @@ from pythainlp.corpus.core import (
     get_path_folder_corpus,
     path_pythainlp_corpus,
     remove,
+    resolve_paths,
 )  # these imports must come before other pythainlp.corpus.* imports
 from pythainlp.corpus.common import (
     countries,
@@ -117,6 +124,11 @@ from pythainlp.corpus.common import (
     thai_words,
     thai_wsd_dict,
 )
+from pythainlp.corpus.derived import (
+    clear_derived,
+    derived_resources,
+    get_derived,
+)
 from pythainlp.corpus.icu import thai_icu_words
 from pythainlp.corpus.volubilis import thai_volubilis_words
 from pythainlp.corpus.wikipedia import thai_wikipedia_titles
@@ -0,0 +1,513 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2016-2024 PyThaiNLP Project
+# SPDX-License-Identifier: Apache-2.0
+"""
+Offline bundles of corpora and models.
+
+A bundle is an uncompressed tar file of downloaded corpora, for hosts
+without internet access. Its last member, *pythainlp-bundle.json*, is an
+index of the corpora, with the catalog details of each corpus and the
+offset, size, and MD5 hash of each of its files, so that a file can be
+read from the bundle, memory-mapped, without extracting it.
+
+Use :func:`pack` on a host with internet access, then :func:`install`
+on the offline hosts, or list the bundles in the environment variable
+:envvar:`PYTHAINLP_BUNDLE` to install corpora from them on demand,
+instead of downloading them.
+
+In read-only mode (:envvar:`PYTHAINLP_READ_MODE` is 1), the data
+directory is not written to: a corpus found in a bundle of
+:envvar:`PYTHAINLP_BUNDLE` is extracted, once per process, to a
+temporary directory that is removed when the process exits. To read a
+corpus without copying it, use :meth:`CorpusBundle.open` or
+:meth:`CorpusBundle.memoryview`.
+"""
+import atexit
+import hashlib
+import io
+import json
+import mmap
+import os
+import posixpath
+import shutil
+import tarfile
+import tempfile
+import threading
+from typing import List, Union
+
+from pythainlp import __version__
+from pythainlp.corpus.core import (
+    _CHUNK_SIZE,
+    _hash_file,
+    _register_corpus,
+    get_corpus_db_detail,
+    resolve_paths,
+)
+from pythainlp.tools import get_pythainlp_data_path
+from pythainlp.tools.path import _set_shared_mode
+
+_CHECK_MODE = os.getenv("PYTHAINLP_READ_MODE")
+_INDEX_NAME = "pythainlp-bundle.json"
+_FORMAT_VERSION = 1
+
+# read-only mode: (bundle, corpus name, version): path of the extracted corpus
+_extracted = {}
+_extracted_lock = threading.Lock()
+_tmp_dir = None
+
+
+def _check_member_name(member_name: str) -> str:
+    # member names are relative paths in the data directory
+    norm = posixpath.normpath(member_name)
+    if (
+        not member_name
+        or posixpath.isabs(norm)
+        or norm == ".."
+        or norm.startswith("../")
+        or "\\" in member_name
+    ):
+        raise ValueError(f"Invalid file name in bundle: {member_name}")
+    return norm
+
+
+class _MemberIO(io.RawIOBase):
+    """Read-only binary file of a memoryview, without copying it."""
+
+    def __init__(self, view: memoryview) -> None:
+        super().__init__()
+        self._view = view
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        data = self._view[self._pos : self._pos + len(b)]
+        n = len(data)
+        b[:n] = data
+        self._pos += n
+        return n
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+        if offset < 0:
+            raise ValueError("negative seek position")
+        self._pos = offset
+        return offset
+
+    def tell(self) -> int:
+        return self._pos
+
+    def close(self) -> None:
+        self._view.release()
+        super().close()
+
+
+class CorpusBundle:
+    """
+    Read corpora from a bundle, without extracting them.
+
+    The bundle is memory-mapped, files are read directly from it.
+
+    :param str path: path to the bundle
+
+    :Example:
+    ::
+
+        from pythainlp.corpus.bundle import CorpusBundle
+
+        with CorpusBundle("bundle.tar") as bundle:
+            print(bundle.names())
+            # output: ['crfcut', 'thainer']
+
+            with bundle.open("crfcut") as f:
+                header = f.read(16)
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        try:
+            with tarfile.open(path, "r:") as tar:
+                member = tar.getmember(_INDEX_NAME)
+                index = json.load(tar.extractfile(member))
+        except (tarfile.TarError, KeyError, ValueError):
+            raise ValueError(
+                f"{path} is not an uncompressed PyThaiNLP bundle."
+            ) from None
+        if index.get("format_version", 0) > _FORMAT_VERSION:
+            raise ValueError(
+                f"{path} needs a newer version of PyThaiNLP"
+                f" (bundle format {index['format_version']})."
+            )
+        self.index = index
+        self._file = open(path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def names(self) -> List[str]:
+        """
+        Names of the corpora in the bundle.
+
+        :rtype: list[str]
+        """
+        return sorted(self.index["corpora"])
+
+    def detail(self, name: str) -> dict:
+        """
+        Details about a corpus in the bundle, as in the local catalog
+        (see :func:`pythainlp.corpus.get_corpus_db_detail`), or an empty
+        dictionary if the corpus is not in the bundle.
+
+        :param str name: corpus name
+        :rtype: dict
+        """
+        corpus = self.index["corpora"].get(name)
+        if not corpus:
+            return {}
+        return {
+            "name": name,
+            "version": corpus["version"],
+            "filename": corpus["filename"],
+            "is_folder": corpus["is_folder"],
+            "foldername": corpus["foldername"],
+        }
+
+    def files(self, name: str) -> List[str]:
+        """
+        Files of a corpus, relative to the data directory.
+
+        :param str name: corpus name
+        :rtype: list[str]
+        """
+        if name not in self.index["corpora"]:
+            raise KeyError(f"Corpus not in bundle: {name}")
+        return list(self.index["corpora"][name]["files"])
+
+    def _member(self, name: str, filename: Union[str, None]) -> dict:
+        files = self.index["corpora"][name]["files"]
+        if filename is None:
+            if len(files) != 1:
+                raise ValueError(
+                    f"Corpus {name} has {len(files)} files, give a filename."
+                )
+            filename = next(iter(files))
+        return files[filename]
+
+    def memoryview(
+        self, name: str, filename: Union[str, None] = None
+    ) -> memoryview:
+        """
+        Content of a file of a corpus, without copying it.
+
+        :param str name: corpus name
+        :param str filename: file of the corpus (see :meth:`files`),
+                             needed if the corpus is a folder
+        :return: read-only view of the memory-mapped bundle, release it
+                 (or use it in a `with` block) before closing the bundle
+        :rtype: memoryview
+        """
+        member = self._member(name, filename)
+        start = member["offset"]
+        return memoryview(self._mmap)[start : start + member["size"]]
+
+    def open(self, name: str, filename: Union[str, None] = None):
+        """
+        Open a file of a corpus for reading, in binary mode.
+
+        :param str name: corpus name
+        :param str filename: file of the corpus (see :meth:`files`),
+                             needed if the corpus is a folder
+        :return: binary file object, close it before closing the bundle
+        :rtype: io.BufferedReader
+        """
+        return io.BufferedReader(_MemberIO(self.memoryview(name, filename)))
+
+    def extract(self, name: str, path: str) -> None:
+        """
+        Extract the files of a corpus to a directory.
+
+        Each file is written to a temporary file, checked against its
+        hash, and renamed, so that a partly extracted file is never seen.
+
+        :param str name: corpus name
+        :param str path: directory
+        """
+        for filename, member in self.index["corpora"][name]["files"].items():
+            dst = os.path.join(path, *_check_member_name(filename).split("/"))
+            os.makedirs(os.path.dirname(dst), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(dst))
+            try:
+                hasher = hashlib.md5()
+                with os.fdopen(fd, "wb") as f, self.memoryview(
+                    name, filename
+                ) as view:
+                    for i in range(0, len(view), _CHUNK_SIZE):
+                        with view[i : i + _CHUNK_SIZE] as chunk:
+                            hasher.update(chunk)
+                            f.write(chunk)
+                if hasher.hexdigest() != member["md5"]:
+                    raise ValueError(
+                        f"Hash does not match expected: {filename}"
+                    )
+                _set_shared_mode(tmp_path, dst)
+                os.replace(tmp_path, dst)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+
+    def close(self) -> None:
+        """Close the bundle."""
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> "CorpusBundle":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def pack(names: List[str], output: str) -> List[str]:
+    """
+    Pack downloaded corpora into a bundle, for hosts without internet
+    access.
+
+    Corpora that are not downloaded yet are downloaded first.
+    Corpora that are included in PyThaiNLP are not packed.
+
+    :param list[str] names: corpus names
+    :param str output: path of the bundle (tar file)
+    :return: names of the packed corpora
+    :rtype: list[str]
+
+    :Example:
+    ::
+
+        from pythainlp.corpus.bundle import pack
+
+        pack(["crfcut", "thai2fit_wv"], "bundle.tar")
+        # output: ['crfcut', 'thai2fit_wv']
+    """
+    paths = resolve_paths(names, download_missing=True)
+    missing = [name for name, path in paths.items() if path is None]
+    if missing:
+        raise ValueError(f"Corpus not found: {', '.join(missing)}")
+
+    data_path = get_pythainlp_data_path()
+    corpora = {}
+    for name, path in paths.items():
+        detail = get_corpus_db_detail(name)
+        if not detail:
+            print(f"- {name} is included in PyThaiNLP, skipped.")
+            continue
+        if detail.get("is_folder"):
+            files = [
+                os.path.join(root, file)
+                for root, dirs, dir_files in os.walk(path)
+                for file in dir_files
+            ]
+        else:
+            files = [path]
+        corpora[name] = {
+            "version": detail["version"],
+            "filename": detail["filename"],
+            "is_folder": bool(detail.get("is_folder")),
+            "foldername": detail.get("foldername"),
+            "files": {
+                os.path.relpath(file, data_path).replace(os.sep, "/"): file
+                for file in sorted(files)
+            },
+        }
+
+    # write to a temporary file and rename it,
+    # so an interrupted pack never leaves a partial bundle
+    output = os.path.abspath(output)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(output))
+    os.close(fd)
+    try:
+        with tarfile.open(tmp_path, "w", format=tarfile.PAX_FORMAT) as tar:
+            for corpus in corpora.values():
+                for member_name, file in corpus["files"].items():
+                    hasher = hashlib.md5()
+                    size = _hash_file(file, hasher)
+                    info = tar.gettarinfo(file, arcname=member_name)
+                    info.uid = info.gid = 0
+                    info.uname = info.gname = ""
+                    with open(file, "rb") as f:
+                        tar.addfile(info, f)
+                    # data ends at the current offset, padded to a block
+                    blocks = -(-size // tarfile.BLOCKSIZE)
+                    corpus["files"][member_name] = {
+                        "offset": tar.offset - blocks * tarfile.BLOCKSIZE,
+                        "size": size,
+                        "md5": hasher.hexdigest(),
+                    }
+            index = json.dumps(
+                {
+                    "format_version": _FORMAT_VERSION,
+                    "pythainlp_version": __version__,
+                    "corpora": corpora,
+                },
+                ensure_ascii=False,
+                indent=1,
+            ).encode("utf-8")
+            info = tarfile.TarInfo(_INDEX_NAME)
+            info.size = len(index)
+            tar.addfile(info, io.BytesIO(index))
+        _set_shared_mode(tmp_path, output)
+        os.replace(tmp_path, output)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    return list(corpora)
+
+
+def install(
+    bundle: str, names: Union[List[str], None] = None, force: bool = False
+) -> List[str]:
+    """
+    Install corpora from a bundle into the data directory
+    (:envvar:`PYTHAINLP_DATA_DIR`), without internet access.
+
+    :param str bundle: path to the bundle
+    :param list[str] names: corpora to install (default: all corpora
+                            in the bundle)
+    :param bool force: install again a corpus of the same version
+    :return: names of the installed corpora
+    :rtype: list[str]
+
+    :Example:
+    ::
+
+        from pythainlp.corpus.bundle import install
+
+        install("bundle.tar")
+        # output:
+        # Corpus: crfcut
+        # - Installing: crfcut 0.1
+        # Corpus: thai2fit_wv
+        # - Installing: thai2fit_wv 0.1
+        # ['crfcut', 'thai2fit_wv']
+    """
+    if _CHECK_MODE == "1":
+        print("PyThaiNLP is read-only mode. It can't install corpus.")
+        return []
+
+    installed = []
+    with CorpusBundle(bundle) as corpus_bundle:
+        if names is None:
+            names = corpus_bundle.names()
+        for name in names:
+            detail = corpus_bundle.detail(name)
+            if not detail:
+                print("Corpus not found in bundle:", name)
+                continue
+            print("Corpus:", name)
+            local = get_corpus_db_detail(name)
+            if local.get("version") == detail["version"] and not force:
+                print("- Already up to date.")
+                continue
+            print(f"- Installing: {name} {detail['version']}")
+            corpus_bundle.extract(name, get_pythainlp_data_path())
+            _register_corpus(
+                name,
+                detail["version"],
+                detail["filename"],
+                detail["is_folder"],
+                detail["foldername"],
+            )
+            installed.append(name)
+
+    return installed
+
+
+def _bundle_paths() -> List[str]:
+    return [
+        path
+        for path in os.getenv("PYTHAINLP_BUNDLE", "").split(os.pathsep)
+        if path
+    ]
+
+
+def _find_in_bundles(name: str, version: str = "") -> Union[str, None]:
+    # first bundle listed in PYTHAINLP_BUNDLE that has the corpus
+    for path in _bundle_paths():
+        if not os.path.isfile(path):
+            continue
+        with CorpusBundle(path) as corpus_bundle:
+            detail = corpus_bundle.detail(name)
+        if detail and (not version or detail["version"] == version):
+            return path
+
+    return None
+
+
+def _get_tmp_dir() -> str:
+    # one temporary directory per process, for read-only mode
+    global _tmp_dir
+    if _tmp_dir is None:
+        _tmp_dir = tempfile.mkdtemp(prefix="pythainlp-bundle-")
+        atexit.register(shutil.rmtree, _tmp_dir, ignore_errors=True)
+    return _tmp_dir
+
+
+def path_from_bundles(name: str, version: str = "") -> Union[str, None]:
+    """
+    Get the path of a corpus from the first bundle listed in
+    :envvar:`PYTHAINLP_BUNDLE` that has it, without writing to the data
+    directory, for read-only mode.
+
+    The corpus is extracted, once per process, to a temporary directory
+    that is removed when the process exits.
+
+    :param str name: corpus name
+    :param str version: version of the corpus (default: any version)
+    :return: path to the corpus file, or folder, or **None** if no
+             bundle has the corpus
+    :rtype: str
+    """
+    bundle = _find_in_bundles(name, version)
+    if bundle is None:
+        return None
+    key = (os.path.abspath(bundle), name, version)
+    with _extracted_lock:
+        if key not in _extracted:
+            tmp_dir = tempfile.mkdtemp(dir=_get_tmp_dir())
+            with CorpusBundle(bundle) as corpus_bundle:
+                detail = corpus_bundle.detail(name)
+                corpus_bundle.extract(name, tmp_dir)
+            _extracted[key] = os.path.join(
+                tmp_dir,
+                detail["foldername"]
+                if detail["is_folder"]
+                else detail["filename"],
+            )
+        return _extracted[key]
+
+
+def install_from_bundles(name: str, version: str = "") -> bool:
+    """
+    Install a corpus from the first bundle listed in
+    :envvar:`PYTHAINLP_BUNDLE` that has it.
+
+    :param str name: corpus name
+    :param str version: version of the corpus (default: any version)
+    :return: **True** if the corpus is installed
+    :rtype: bool
+    """
+    if _CHECK_MODE == "1":
+        # the data directory is read-only, see path_from_bundles()
+        return False
+    path = _find_in_bundles(name, version)
+    if path is None:
+        return False
+
+    return name in install(path, [name], force=True)
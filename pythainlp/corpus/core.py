@@ -4,16 +4,33 @@
 """
 Corpus related functions.
 """
-import os
-from typing import Union
 import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Tuple, Union
 
 from pythainlp.corpus import corpus_db_path, corpus_db_url, corpus_path
 from pythainlp.tools import get_full_data_path
+from pythainlp.tools.path import _set_shared_mode
 from pythainlp import __version__
 
 
 _CHECK_MODE = os.getenv("PYTHAINLP_READ_MODE")
+_CHUNK_SIZE = 64 * 1024  # 64 KiB
+_TIMEOUT = 60  # seconds, to connect or between two chunks
+# path of a lock file -> lock between the threads of this process
+_file_thread_locks = {}
+_FILE_THREAD_LOCKS_LOCK = threading.Lock()
+
+_CUSTOMIZE: Dict[str, str] = {
+    # "the corpus name":"path"
+}
+
+# path of a catalog -> (mtime, size, and inode of the file, index)
+_catalog_cache = {}
+_CATALOG_LOCK = threading.Lock()
 
 
 def get_corpus_db(url: str):
@@ -35,6 +52,35 @@ def get_corpus_db(url: str):
     return corpus_db
 
 
+def _load_catalog(path: str, build: Callable[[dict], Any]) -> Any:
+    """
+    Load a JSON catalog and build an index of it with `build`.
+
+    The index is cached until the file is modified or replaced.
+    """
+    st = os.stat(path)
+    signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+    with _CATALOG_LOCK:
+        cached = _catalog_cache.get(path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+    with open(path, "r", encoding="utf-8-sig") as f:
+        index = build(json.load(f))
+    with _CATALOG_LOCK:
+        _catalog_cache[path] = (signature, index)
+    return index
+
+
+def _index_local_db(local_db: dict) -> Tuple[dict, dict]:
+    # name -> first corpus of the name, (name, version) -> corpus
+    by_name = {}
+    by_version = {}
+    for corpus in local_db["_default"].values():
+        by_name.setdefault(corpus["name"], corpus)
+        by_version.setdefault((corpus["name"], corpus["version"]), corpus)
+    return by_name, by_version
+
+
 def get_corpus_db_detail(name: str, version: str = '') -> dict:
     """
     Get details about a corpus, using information from local catalog.
@@ -43,19 +89,13 @@ def get_corpus_db_detail(name: str, version: str = '') -> dict:
     :return: details about corpus
     :rtype: dict
     """
-    with open(corpus_db_path(), "r", encoding="utf-8-sig") as f:
-        local_db = json.load(f)
-
+    by_name, by_version = _load_catalog(corpus_db_path(), _index_local_db)
     if not version:
-        for corpus in local_db["_default"].values():
-            if corpus["name"] == name:
-                return corpus
+        corpus = by_name.get(name)
     else:
-        for corpus in local_db["_default"].values():
-            if corpus["name"] == name and corpus["version"] == version:
-                return corpus
+        corpus = by_version.get((name, version))
 
-    return {}
+    return dict(corpus) if corpus else {}
 
 
 def path_pythainlp_corpus(filename: str) -> str:
@@ -189,12 +229,12 @@ def get_corpus_default_db(name: str, version: str = '') -> Union[str, None]:
     If you want to edit default_db.json, \
         you can edit pythainlp/corpus/default_db.json
     """
-    default_db_path = path_pythainlp_corpus("default_db.json")
-    with open(default_db_path, encoding="utf-8-sig") as fh:
-        corpus_db = json.load(fh)
+    corpus_db = _load_catalog(
+        path_pythainlp_corpus("default_db.json"), lambda db: db
+    )
 
-    if name in list(corpus_db.keys()):
-        if version in list(corpus_db[name]["versions"].keys()):
+    if name in corpus_db:
+        if version in corpus_db[name]["versions"]:
             return path_pythainlp_corpus(
                 corpus_db[name]["versions"][version]["filename"]
             )
@@ -250,73 +290,185 @@ def get_corpus_path(
         print(get_corpus_path('wiki_lm_lstm'))
         # output: /root/pythainlp-data/thwiki_model_lstm.pth
     """
-    from typing import Dict
+    path = _resolve_path(name, version)
+    if path is None and _CHECK_MODE == "1":
+        from pythainlp.corpus.bundle import path_from_bundles
+
+        # read-only, use a copy from an offline bundle, if one has the corpus
+        path = path_from_bundles(name, version)
+    if path is None:
+        from pythainlp.corpus.bundle import install_from_bundles
+
+        # install from an offline bundle, if one has the corpus
+        if not install_from_bundles(name, version):
+            download(name, version=version, force=force)
+        path = _resolve_path(name, version)
+
+    return path
 
-    _CUSTOMIZE: Dict[str, str] = {
-        # "the corpus name":"path"
-    }
-    if name in list(_CUSTOMIZE):
+
+def _resolve_path(name: str, version: str = '') -> Union[str, None]:
+    """
+    Get the path of a corpus that exists on the device, see
+    :func:`get_corpus_path`.
+    """
+    if name in _CUSTOMIZE:
         return _CUSTOMIZE[name]
 
     default_path = get_corpus_default_db(name=name, version=version)
     if default_path is not None:
         return default_path
 
-    # check if the corpus is in local catalog, download it if not
     corpus_db_detail = get_corpus_db_detail(name, version=version)
-
-    if not corpus_db_detail or not corpus_db_detail.get("filename"):
-        download(name, version=version, force=force)
-        corpus_db_detail = get_corpus_db_detail(name, version=version)
-
     if corpus_db_detail and corpus_db_detail.get("filename"):
         # corpus is in the local catalog, get full path to the file
         if corpus_db_detail.get("is_folder"):
             path = get_full_data_path(corpus_db_detail.get("foldername"))
         else:
             path = get_full_data_path(corpus_db_detail.get("filename"))
-        # check if the corpus file actually exists, download it if not
-        if not os.path.exists(path):
-            download(name, version=version, force=force)
+        # check if the corpus file actually exists
         if os.path.exists(path):
             return path
 
     return None
 
 
-def _download(url: str, dst: str) -> int:
+def resolve_paths(
+    names: List[str], download_missing: bool = False, jobs: int = 4
+) -> Dict[str, Union[str, None]]:
+    """
+    Get the paths of many corpora at once.
+
+    Unlike :func:`get_corpus_path`, a corpus that does not exist on the
+    device is not downloaded, unless `download_missing` is **True**;
+    then the missing corpora are downloaded concurrently with
+    :func:`download_many`.
+
+    :param list[str] names: corpus names
+    :param bool download_missing: download the corpora that do not
+                                  exist on the device
+    :param int jobs: number of concurrent downloads
+    :return: a dictionary of corpus name to path, or **None** if the
+             corpus doesn't exist on the device
+    :rtype: dict[str, Union[str, None]]
+
+    :Example:
+    ::
+
+        from pythainlp.corpus import resolve_paths
+
+        resolve_paths(["thainer", "ttc", "wiki_lm_lstm"])
+        # output:
+        # {'thainer': '/usr/local/lib/python3.8/dist-packages/pythainlp/
+        #              corpus/thainer_crf_1_5_0.model',
+        #  'ttc': '/root/pythainlp-data/ttc_freq.txt',
+        #  'wiki_lm_lstm': None}
+    """
+    paths = {name: _resolve_path(name) for name in names}
+    missing = [name for name, path in paths.items() if path is None]
+    if download_missing and missing and _CHECK_MODE != "1":
+        download_many(missing, jobs=jobs)
+        for name in missing:
+            paths[name] = _resolve_path(name)
+
+    return paths
+
+
+def _hash_file(path: str, hasher) -> int:
+    """
+    Update a hash object with the content of a file, read in chunks.
+
+    @param: path file
+    @param: hasher hash object, e.g. hashlib.md5()
+    @return: size of the file, in bytes
+    """
+    size = 0
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            hasher.update(chunk)
+            size += len(chunk)
+    return size
+
+
+def _download(url: str, dst: str, md5: str = "") -> int:
     """
     Download helper.
 
+    The file is written to `dst`.part, and renamed to `dst` once it is
+    complete and its hash matches. A .part file left by an interrupted
+    download is resumed with an HTTP range request, if the server
+    supports it. The MD5 hash is computed while downloading.
+    The whole download holds a lock on `dst`.part.lock, so threads and
+    processes that download the same file do not write to the same
+    .part file at the same time.
+
     @param: URL for downloading file
     @param: dst place to put the file into
+    @param: md5 expected file hash (MD5), not checked if empty or "-"
+    @return: size of the file, in bytes, or -1 if it is unknown
     """
-    _CHUNK_SIZE = 64 * 1024  # 64 KiB
+    import hashlib
 
     import requests
-    from urllib.request import urlopen
 
-    file_size = int(urlopen(url).info().get("Content-Length", -1))
-    r = requests.get(url, stream=True)
-    with open(get_full_data_path(dst), "wb") as f:
-        pbar = None
-        try:
-            from tqdm.auto import tqdm
+    path = get_full_data_path(dst)
+    part_path = path + ".part"
+    # one download of a file at a time, also between processes
+    with _file_lock(part_path + ".lock"):
+        offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+        r = requests.get(url, headers=headers, stream=True, timeout=_TIMEOUT)
+        resumed = offset > 0 and r.status_code == 206
+        if resumed:
+            content_range = r.headers.get("Content-Range", "")
+            resumed = content_range.startswith(f"bytes {offset}-")
+        if offset and not resumed and r.status_code != 200:
+            # e.g. 416 Range Not Satisfiable, download the whole file again
+            r.close()
+            r = requests.get(url, stream=True, timeout=_TIMEOUT)
+
+        with r:
+            r.raise_for_status()
+            hasher = hashlib.md5()
+            if resumed:
+                _hash_file(part_path, hasher)
+            else:
+                offset = 0
+            content_length = r.headers.get("Content-Length")
+            file_size = offset + int(content_length) if content_length else -1
 
-            pbar = tqdm(total=int(r.headers["Content-Length"]))
-        except ImportError:
             pbar = None
+            try:
+                from tqdm.auto import tqdm
+
+                pbar = tqdm(
+                    total=file_size if file_size >= 0 else None,
+                    initial=offset,
+                    unit="B",
+                    unit_scale=True,
+                    desc=dst,
+                )
+            except ImportError:
+                pbar = None
+
+            with open(part_path, "ab" if resumed else "wb") as f:
+                for chunk in r.iter_content(chunk_size=_CHUNK_SIZE):
+                    if chunk:
+                        f.write(chunk)
+                        hasher.update(chunk)
+                        if pbar:
+                            pbar.update(len(chunk))
+            if pbar:
+                pbar.close()
+            else:
+                print("Done.")
 
-        for chunk in r.iter_content(chunk_size=_CHUNK_SIZE):
-            if chunk:
-                f.write(chunk)
-                if pbar:
-                    pbar.update(len(chunk))
-        if pbar:
-            pbar.close()
-        else:
-            print("Done.")
-    return file_size
+        if md5 and md5 != "-" and md5 != hasher.hexdigest():
+            os.remove(part_path)
+            raise Exception("Hash does not match expected.")
+        os.replace(part_path, path)
+        return file_size
 
 
 def _check_hash(dst: str, md5: str) -> None:
@@ -329,12 +481,84 @@ def _check_hash(dst: str, md5: str) -> None:
     if md5 and md5 != "-":
         import hashlib
 
-        with open(get_full_data_path(dst), "rb") as f:
-            content = f.read()
-            file_md5 = hashlib.md5(content).hexdigest()
+        hasher = hashlib.md5()
+        _hash_file(get_full_data_path(dst), hasher)
+        if md5 != hasher.hexdigest():
+            raise Exception("Hash does not match expected.")
+
+
+@contextmanager
+def _file_lock(lock_path: str) -> Iterator[None]:
+    """
+    Hold an exclusive lock on a lock file, between the threads of this
+    process and between processes. The lock file is created if needed
+    and kept afterwards.
+
+    @param: lock_path path of the lock file
+    """
+    with _FILE_THREAD_LOCKS_LOCK:
+        thread_lock = _file_thread_locks.setdefault(
+            lock_path, threading.Lock()
+        )
+    with thread_lock:
+        with open(lock_path, "a+b") as f:
+            if os.name == "nt":
+                import msvcrt
+
+                while True:
+                    try:
+                        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                        break
+                    except OSError:  # still locked after 10 seconds
+                        pass
+                try:
+                    yield
+                finally:
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                import fcntl
+
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+@contextmanager
+def _corpus_db_lock() -> Iterator[None]:
+    """
+    Lock the local corpus catalog, so that threads and processes
+    that download or remove corpora at the same time do not overwrite
+    each other's changes.
+    """
+    with _file_lock(corpus_db_path() + ".lock"):
+        yield
+
+
+def _read_corpus_db() -> dict:
+    with open(corpus_db_path(), "r", encoding="utf-8-sig") as f:
+        return json.load(f)
 
-            if md5 != file_md5:
-                raise Exception("Hash does not match expected.")
+
+def _write_corpus_db(db: dict) -> None:
+    # write to a temporary file and rename it,
+    # so other processes never read a partial catalog
+    path = corpus_db_path()
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(db, f, ensure_ascii=False)
+        _set_shared_mode(tmp_path, path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    finally:
+        with _CATALOG_LOCK:
+            _catalog_cache.pop(path, None)
 
 
 def _version2int(v: str) -> int:
@@ -443,12 +667,76 @@ def download(
         print(f"Cannot download corpus catalog from: {url}")
         return False
 
+    return _download_corpus(name, corpus_db.json(), force, version)
+
+
+def download_many(
+    names: List[str], force: bool = False, url: str = '', jobs: int = 4
+) -> Dict[str, bool]:
+    """
+    Download many corpora at the same time.
+
+    The corpus catalog is downloaded once, and up to `jobs` corpora
+    are downloaded concurrently. Like :func:`download`, an interrupted
+    download is resumed where it stopped the next time.
+
+    :param list[str] names: corpus names
+    :param bool force: force downloading
+    :param str url: URL of the corpus catalog
+    :param int jobs: number of concurrent downloads
+    :return: a dictionary of corpus name to **True** if the corpus is
+             found and successfully downloaded, **False** otherwise
+    :rtype: dict[str, bool]
+
+    :Example:
+    ::
+
+        from pythainlp.corpus import download_many
+
+        download_many(["thainer", "wangchanberta_wordcut", "crfcut"])
+        # output:
+        # {'thainer': True, 'wangchanberta_wordcut': True, 'crfcut': True}
+    """
+    names = list(dict.fromkeys(names))
+    if _CHECK_MODE == "1":
+        print("PyThaiNLP is read-only mode. It can't download.")
+        return {name: False for name in names}
+    if jobs < 1:
+        raise ValueError("jobs must be at least 1.")
+    if not url:
+        url = corpus_db_url()
+
+    corpus_db = get_corpus_db(url)
+    if not corpus_db:
+        print(f"Cannot download corpus catalog from: {url}")
+        return {name: False for name in names}
     corpus_db = corpus_db.json()
 
+    def _get(name: str) -> bool:
+        try:
+            return _download_corpus(name, corpus_db, force, "")
+        except Exception as e:
+            print(f"Cannot download {name}: {e}")
+            return False
+
+    if jobs == 1 or len(names) <= 1:
+        return {name: _get(name) for name in names}
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(jobs, len(names))) as executor:
+        return dict(zip(names, executor.map(_get, names)))
+
+
+def _download_corpus(
+    name: str, corpus_db: dict, force: bool, version: str
+) -> bool:
+    """
+    Download a corpus of a remote catalog, see :func:`download`.
+    """
     # check if corpus is available
     if name in corpus_db:
-        with open(corpus_db_path(), "r", encoding="utf-8-sig") as f:
-            local_db = json.load(f)
+        local_db = _read_corpus_db()
 
         corpus = corpus_db[name]
         print("Corpus:", name)
@@ -480,9 +768,6 @@ def download(
             _download(
                 corpus_versions["download_url"],
                 file_name,
-            )
-            _check_hash(
-                file_name,
                 corpus_versions["md5"],
             )
 
@@ -508,28 +793,7 @@ def download(
                 with zipfile.ZipFile(get_full_data_path(file_name), "r") as zip:
                     zip.extractall(path=get_full_data_path(foldername))
 
-            if found:
-                local_db["_default"][found]["version"] = version
-                local_db["_default"][found]["filename"] = file_name
-                local_db["_default"][found]["is_folder"] = is_folder
-                local_db["_default"][found]["foldername"] = foldername
-            else:
-                # This awkward behavior is for backward-compatibility with
-                # database files generated previously using TinyDB
-                if local_db["_default"]:
-                    corpus_no = max((int(no) for no in local_db["_default"])) + 1
-                else:
-                    corpus_no = 1
-                local_db["_default"][str(corpus_no)] = {
-                    "name": name,
-                    "version": version,
-                    "filename": file_name,
-                    "is_folder": is_folder,
-                    "foldername": foldername,
-                }
-
-            with open(corpus_db_path(), "w", encoding="utf-8") as f:
-                json.dump(local_db, f, ensure_ascii=False)
+            _register_corpus(name, version, file_name, is_folder, foldername)
         # Check if versions match or if the corpus is found in local database
         # but a re-download is not forced
         else:
@@ -550,6 +814,47 @@ def download(
     return False
 
 
+def _register_corpus(
+    name: str,
+    version: str,
+    file_name: str,
+    is_folder: bool,
+    foldername: Union[str, None],
+) -> None:
+    """
+    Add a corpus to the local catalog, or update it.
+    """
+    with _corpus_db_lock():
+        # read the catalog again, other processes may have
+        # changed it during the download
+        local_db = _read_corpus_db()
+        found = ""
+        for i, item in local_db["_default"].items():
+            if item["name"] == name:
+                found = i
+                break
+        if found:
+            local_db["_default"][found]["version"] = version
+            local_db["_default"][found]["filename"] = file_name
+            local_db["_default"][found]["is_folder"] = is_folder
+            local_db["_default"][found]["foldername"] = foldername
+        else:
+            # This awkward behavior is for backward-compatibility with
+            # database files generated previously using TinyDB
+            if local_db["_default"]:
+                corpus_no = max((int(no) for no in local_db["_default"])) + 1
+            else:
+                corpus_no = 1
+            local_db["_default"][str(corpus_no)] = {
+                "name": name,
+                "version": version,
+                "filename": file_name,
+                "is_folder": is_folder,
+                "foldername": foldername,
+            }
+        _write_corpus_db(local_db)
+
+
 def remove(name: str) -> bool:
     """
     Remove corpus
@@ -578,8 +883,7 @@ def remove(name: str) -> bool:
     if _CHECK_MODE == "1":
         print("PyThaiNLP is read-only mode. It can't remove corpus.")
         return False
-    with open(corpus_db_path(), "r", encoding="utf-8-sig") as f:
-        db = json.load(f)
+    db = _read_corpus_db()
     data = [corpus for corpus in db["_default"].values() if corpus["name"] == name]
 
     if data:
@@ -587,15 +891,19 @@ def remove(name: str) -> bool:
         if data[0].get("is_folder"):
             import shutil
 
-            os.remove(get_full_data_path(data[0].get("filename")))
+            # the archive is not kept by corpora installed from a bundle
+            archive = get_full_data_path(data[0].get("filename"))
+            if os.path.exists(archive):
+                os.remove(archive)
             shutil.rmtree(path, ignore_errors=True)
         else:
             os.remove(path)
-        for i, corpus in db["_default"].copy().items():
-            if corpus["name"] == name:
-                del db["_default"][i]
-        with open(corpus_db_path(), "w", encoding="utf-8") as f:
-            json.dump(db, f, ensure_ascii=False)
+        with _corpus_db_lock():
+            db = _read_corpus_db()
+            for i, corpus in db["_default"].copy().items():
+                if corpus["name"] == name:
+                    del db["_default"][i]
+            _write_corpus_db(db)
         return True
 
     return False
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2016-2024 PyThaiNLP Project
+# SPDX-License-Identifier: Apache-2.0
+"""
+Shared cache of resources derived from corpora.
+
+A resource derived from a corpus, e.g. the :class:`pythainlp.util.Trie`
+of :func:`pythainlp.corpus.thai_words` used by the dictionary-based
+tokenizers, is built once, on first use, and shared by every module
+that asks for the same corpus and transform.
+"""
+import threading
+from typing import Any, Callable, List, Tuple, Union
+
+# (corpus, transform): resource
+_resources = {}
+# a reentrant lock, as a resource may be built from another resource
+_lock = threading.RLock()
+
+
+def get_derived(corpus: str, transform: str, build: Callable[[], Any]) -> Any:
+    """
+    Get a resource derived from a corpus, building it on first use.
+
+    The resource is cached by its corpus and transform, so every caller
+    that uses the same names gets the same object. Treat it as
+    read-only.
+
+    :param str corpus: name of the source corpus, e.g. *thai_words*
+    :param str transform: name of the transform, e.g. *trie*
+    :param Callable build: function without arguments that builds the
+                           resource, called only if it is not cached
+    :return: the resource
+
+    :Example:
+    ::
+
+        from pythainlp.corpus import get_derived, thai_words
+        from pythainlp.util import Trie
+
+        trie = get_derived("thai_words", "trie", lambda: Trie(thai_words()))
+        trie is get_derived("thai_words", "trie", lambda: None)
+        # output: True
+    """
+    key = (corpus, transform)
+    try:
+        return _resources[key]
+    except KeyError:
+        pass
+    with _lock:
+        if key not in _resources:
+            _resources[key] = build()
+        return _resources[key]
+
+
+def clear_derived(corpus: Union[str, None] = None) -> None:
+    """
+    Remove cached resources, so they are built again on next use.
+
+    Modules that already hold a resource keep using it.
+
+    :param str corpus: remove only the resources derived from this
+                       corpus (default: all resources)
+    """
+    with _lock:
+        for key in list(_resources):
+            if corpus is None or key[0] == corpus:
+                del _resources[key]
+
+
+def derived_resources() -> List[Tuple[str, str]]:
+    """
+    Resources that are built and cached.
+
+    :return: (corpus, transform) of each cached resource
+    :rtype: list[tuple[str, str]]
+    """
+    with _lock:
+        return list(_resources)
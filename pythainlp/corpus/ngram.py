@@ -0,0 +1,488 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2016-2024 PyThaiNLP Project
+# SPDX-License-Identifier: Apache-2.0
+"""
+Compact n-gram frequency store
+
+N-gram counts are kept in sorted NumPy arrays of integer word IDs.
+A store is converted once from the text frequency files of a corpus,
+saved in the PyThaiNLP data directory, and memory-mapped when loaded.
+"""
+
+__all__ = [
+    "NgramStore",
+    "get_ngram_store",
+]
+
+import json
+import os
+import shutil
+from typing import Dict, List, Tuple, Union
+
+import numpy as np
+
+from pythainlp import __version__
+from pythainlp.tools import get_full_data_path
+
+_CHECK_MODE = os.getenv("PYTHAINLP_READ_MODE")
+_STORE_DIRNAME = "ngram_store"
+_META_FILENAME = "meta.json"
+_VOCAB_FILENAME = "vocab.json"
+_SOURCES_FILENAME = "sources.json"
+
+_MAX_KEY = np.iinfo(np.int64).max
+
+# loaded stores, keyed by (corpus name, order)
+_STORES: Dict[Tuple[str, int], "NgramStore"] = {}
+
+
+def _tnc_freqs(order: int) -> List[dict]:
+    from pythainlp.corpus import tnc
+
+    freqs = [
+        tnc.unigram_word_freqs,
+        tnc.bigram_word_freqs,
+        tnc.trigram_word_freqs,
+    ]
+    return [f() for f in freqs[:order]]
+
+
+def _ttc_freqs(order: int) -> List[dict]:
+    from pythainlp.corpus import ttc
+
+    return [ttc.unigram_word_freqs()]
+
+
+def _oscar_freqs(order: int) -> List[dict]:
+    from pythainlp.corpus import oscar
+
+    return [oscar.unigram_word_freqs()]
+
+
+def _tnc_paths(order: int) -> List[Union[str, None]]:
+    from pythainlp.corpus import path_pythainlp_corpus, resolve_paths, tnc
+
+    names = [tnc._BIGRAM, tnc._TRIGRAM][: order - 1]
+    paths = resolve_paths(names)
+    return [path_pythainlp_corpus(tnc._FILENAME)] + [
+        paths[name] for name in names
+    ]
+
+
+def _ttc_paths(order: int) -> List[Union[str, None]]:
+    from pythainlp.corpus import path_pythainlp_corpus, ttc
+
+    return [path_pythainlp_corpus(ttc._FILENAME)]
+
+
+def _oscar_paths(order: int) -> List[Union[str, None]]:
+    from pythainlp.corpus import oscar, resolve_paths
+
+    return [resolve_paths([oscar._FILENAME])[oscar._FILENAME]]
+
+
+# corpus name -> (function returning n-gram counts by order,
+#                 function returning paths of the source files by order,
+#                 max order)
+_SOURCES = {
+    "tnc": (_tnc_freqs, _tnc_paths, 3),
+    "ttc": (_ttc_freqs, _ttc_paths, 1),
+    "oscar": (_oscar_freqs, _oscar_paths, 1),
+}
+
+
+def _signature(paths: List[Union[str, None]]) -> List[list]:
+    # a store is rebuilt if any of its source files is changed or moved
+    signature = []
+    for path in paths:
+        if path is None or not os.path.exists(path):
+            signature.append([path, None, None])
+            continue
+        stat = os.stat(path)
+        signature.append(
+            [os.path.abspath(path), stat.st_size, stat.st_mtime_ns]
+        )
+    return signature
+
+
+class NgramStore:
+    """
+    N-gram frequency store.
+
+    Words are mapped to integer IDs. Unigram counts are an array indexed
+    by word ID. N-grams of a higher order are encoded as one integer key
+    (the word IDs as digits in base `vocabulary size`), kept in a sorted
+    array alongside an array of their counts, so a lookup is a binary
+    search and all continuations of a context are a contiguous range.
+
+    Use :func:`get_ngram_store` to get the store of a corpus, or
+    :meth:`from_counts` to create one from n-gram counts.
+
+    :param list words: vocabulary, the index of a word is its ID
+    :param numpy.ndarray unigram_counts: count of each word, by ID
+    :param dict keys: sorted n-gram keys of each order (2 and up)
+    :param dict counts: n-gram counts of each order, in the order of `keys`
+    """
+
+    def __init__(
+        self,
+        words: List[str],
+        unigram_counts: np.ndarray,
+        keys: Dict[int, np.ndarray] = None,
+        counts: Dict[int, np.ndarray] = None,
+    ) -> None:
+        self.words = words
+        self._ids = {word: i for i, word in enumerate(words)}
+        self._base = max(len(words), 1)
+        self._unigram_counts = unigram_counts
+        self._keys = keys or {}
+        self._counts = counts or {}
+        self.order = max([1] + list(self._keys))
+        self.total = int(unigram_counts.sum())
+
+    @classmethod
+    def from_counts(cls, freqs: List[dict]) -> "NgramStore":
+        """
+        Create a store from n-gram counts.
+
+        :param list freqs: n-gram counts of each order, starting from
+                           unigram, for example `[{"ผม": 10},
+                           {("ผม", "กิน"): 2}]`. Unigrams can be keyed
+                           by a word or by a tuple of one word.
+        :return: n-gram store
+        :rtype: NgramStore
+        """
+        unigrams = {
+            (word if isinstance(word, str) else word[0]): count
+            for word, count in freqs[0].items()
+        }
+        vocab = set(unigrams)
+        for ngram_freqs in freqs[1:]:
+            for ngram in ngram_freqs:
+                vocab.update(ngram)
+        words = sorted(vocab)
+        ids = {word: i for i, word in enumerate(words)}
+        base = max(len(words), 1)
+        if base ** len(freqs) > _MAX_KEY:
+            raise ValueError(
+                f"Vocabulary of {len(words)} words is too large "
+                f"for {len(freqs)}-grams"
+            )
+
+        unigram_counts = np.zeros(len(words), dtype=np.int64)
+        for word, count in unigrams.items():
+            unigram_counts[ids[word]] = count
+
+        keys = {}
+        counts = {}
+        for order, ngram_freqs in enumerate(freqs[1:], start=2):
+            order_keys = np.fromiter(
+                (
+                    _encode([ids[word] for word in ngram], base)
+                    for ngram in ngram_freqs
+                ),
+                dtype=np.int64,
+                count=len(ngram_freqs),
+            )
+            order_counts = np.fromiter(
+                ngram_freqs.values(), dtype=np.int64, count=len(ngram_freqs)
+            )
+            sort = np.argsort(order_keys, kind="stable")
+            keys[order] = order_keys[sort]
+            counts[order] = order_counts[sort]
+
+        return cls(words, unigram_counts, keys, counts)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "NgramStore":
+        """
+        Load a store saved by :meth:`save`.
+
+        :param str path: directory of the store
+        :param bool mmap: memory-map the arrays instead of reading them
+        :return: n-gram store
+        :rtype: NgramStore
+        """
+        mmap_mode = "r" if mmap else None
+        with open(os.path.join(path, _META_FILENAME), encoding="utf-8") as f:
+            order = json.load(f)["order"]
+        with open(os.path.join(path, _VOCAB_FILENAME), encoding="utf-8") as f:
+            words = json.load(f)
+
+        unigram_counts = np.load(os.path.join(path, "1.npy"), mmap_mode)
+        keys = {}
+        counts = {}
+        for i in range(2, order + 1):
+            keys[i] = np.load(os.path.join(path, f"{i}_keys.npy"), mmap_mode)
+            counts[i] = np.load(
+                os.path.join(path, f"{i}_counts.npy"), mmap_mode
+            )
+
+        return cls(words, unigram_counts, keys, counts)
+
+    def save(self, path: str) -> None:
+        """
+        Save the store to a directory.
+
+        :param str path: directory of the store, created if needed
+        """
+        os.makedirs(path, exist_ok=True)
+        vocab_path = os.path.join(path, _VOCAB_FILENAME)
+        with open(vocab_path, "w", encoding="utf-8") as f:
+            json.dump(self.words, f, ensure_ascii=False)
+        np.save(os.path.join(path, "1.npy"), self._unigram_counts)
+        for i in self._keys:
+            np.save(os.path.join(path, f"{i}_keys.npy"), self._keys[i])
+            np.save(os.path.join(path, f"{i}_counts.npy"), self._counts[i])
+        meta_path = os.path.join(path, _META_FILENAME)
+        with open(meta_path, "w", encoding="utf-8") as f:
+            json.dump({"order": self.order, "version": __version__}, f)
+
+    def _word_ids(self, words: Tuple[str, ...]) -> Union[List[int], None]:
+        ids = [self._ids.get(word) for word in words]
+        if None in ids:
+            return None
+        return ids
+
+    def _range(self, context: Tuple[str, ...]) -> Tuple[int, int]:
+        # range of the n-grams starting with context, in the arrays of
+        # order len(context) + 1
+        ids = self._word_ids(context)
+        order = len(context) + 1
+        if ids is None or order not in self._keys:
+            return 0, 0
+        prefix = _encode(ids, self._base) * self._base
+        keys = self._keys[order]
+        start, end = np.searchsorted(
+            keys, [prefix, prefix + self._base], side="left"
+        )
+        return int(start), int(end)
+
+    def count(self, *words: str) -> int:
+        """
+        Get the count of an n-gram.
+
+        :param str words: words of the n-gram
+        :return: count of the n-gram, 0 if not found
+        :rtype: int
+        """
+        if not words:
+            return self.total
+        ids = self._word_ids(words)
+        if ids is None:
+            return 0
+        if len(ids) == 1:
+            return int(self._unigram_counts[ids[0]])
+
+        start, end = self._range(words[:-1])
+        if start == end:
+            return 0
+        key = _encode(ids, self._base)
+        keys = self._keys[len(words)]
+        i = start + int(np.searchsorted(keys[start:end], key))
+        if i < end and keys[i] == key:
+            return int(self._counts[len(words)][i])
+        return 0
+
+    def prob(self, *words: str) -> float:
+        """
+        Get the probability of the last word given the words before it,
+        that is, count of the n-gram divided by count of its context
+        (for a unigram, its count divided by the total count).
+
+        :param str words: words of the n-gram
+        :return: conditional probability, 0.0 if the context is not found
+        :rtype: float
+        """
+        context_count = self.count(*words[:-1])
+        if not context_count:
+            return 0.0
+        return self.count(*words) / context_count
+
+    def continuations(self, *context: str) -> List[Tuple[str, int]]:
+        """
+        Get words following a context, with the counts of the n-grams.
+
+        :param str context: words of the context
+        :return: list of (word, count), sorted by descending count
+        :rtype: list[tuple[str, int]]
+
+        :Example:
+        ::
+
+            from pythainlp.corpus.ngram import get_ngram_store
+
+            store = get_ngram_store("tnc", order=2)
+            store.continuations("กิน")[:3]
+            # output: the three most frequent words after 'กิน',
+            # with their bigram counts
+        """
+        start, end = self._range(context)
+        if start == end:
+            return []
+        order = len(context) + 1
+        ids = self._keys[order][start:end] % self._base
+        counts = self._counts[order][start:end]
+        sort = np.argsort(-counts, kind="stable")
+        return [(self.words[ids[i]], int(counts[i])) for i in sort]
+
+    def ngram_count(self, order: int) -> int:
+        """
+        Get the number of distinct n-grams of an order.
+
+        :param int order: order of n-grams
+        :rtype: int
+        """
+        if order == 1:
+            return len(self.words)
+        return len(self._keys.get(order, ()))
+
+    def ngram(self, order: int, i: int) -> Tuple[str, ...]:
+        """
+        Get the i-th n-gram of an order (n-grams are sorted by word ID).
+
+        :param int order: order of n-grams
+        :param int i: index of the n-gram
+        :rtype: tuple[str, ...]
+        """
+        if order == 1:
+            return (self.words[i],)
+        key = int(self._keys[order][i])
+        ids = []
+        for _ in range(order):
+            key, word_id = divmod(key, self._base)
+            ids.append(word_id)
+        return tuple(self.words[j] for j in reversed(ids))
+
+    def ngram_freqs(
+        self, order: int
+    ) -> Dict[Union[str, Tuple[str, ...]], int]:
+        """
+        Get the counts of all n-grams of an order.
+
+        :param int order: order of n-grams
+        :return: dictionary of n-gram (a word, for unigrams) to count
+        :rtype: dict
+        """
+        if order == 1:
+            return dict(self.word_freqs())
+        if order not in self._keys:
+            return {}
+        rest = self._keys[order]
+        columns = []
+        for _ in range(order):
+            rest, word_ids = np.divmod(rest, self._base)
+            columns.append(word_ids.tolist())
+        words = self.words
+        return {
+            tuple(words[i] for i in ids): count
+            for ids, count in zip(
+                zip(*reversed(columns)), self._counts[order].tolist()
+            )
+        }
+
+    def word_freqs(self) -> List[Tuple[str, int]]:
+        """
+        Get unigram word frequencies.
+
+        :return: list of (word, count) of words with positive count
+        :rtype: list[tuple[str, int]]
+        """
+        return [
+            (self.words[i], int(self._unigram_counts[i]))
+            for i in np.flatnonzero(self._unigram_counts > 0)
+        ]
+
+
+def _encode(ids: List[int], base: int) -> int:
+    key = 0
+    for word_id in ids:
+        key = key * base + word_id
+    return key
+
+
+def get_ngram_store(name: str = "tnc", order: int = 1) -> NgramStore:
+    """
+    Get the n-gram store of a corpus, up to an order.
+
+    The store is converted from the corpus frequency files on the first
+    call and saved in the PyThaiNLP data directory (under
+    `ngram_store`). Later calls, also in other processes, memory-map the
+    saved store. The saved store is converted again if the version of
+    PyThaiNLP, or the path, size, or modification time of any of the
+    corpus frequency files, is changed. Within a process, a store is
+    loaded only once. In read-only mode
+    (:envvar:`PYTHAINLP_READ_MODE` = 1), a store that is not saved yet
+    is kept in memory only.
+
+    :param str name: corpus name
+        * *tnc* - Thai National Corpus (default), up to trigram
+        * *ttc* - Thai Textbook Corpus (TTC), unigram only
+        * *oscar* - OSCAR Corpus, unigram only
+    :param int order: highest order of n-grams in the store
+    :return: n-gram store
+    :rtype: NgramStore
+
+    :Example:
+    ::
+
+        from pythainlp.corpus.ngram import get_ngram_store
+
+        store = get_ngram_store("tnc", order=2)
+
+        store.count("กิน", "ข้าว")
+        # output: count of the bigram ('กิน', 'ข้าว')
+
+        store.prob("กิน", "ข้าว")
+        # output: count of ('กิน', 'ข้าว') / count of 'กิน'
+    """
+    if name not in _SOURCES:
+        raise ValueError(f"Corpus not supported: {name}")
+    freqs, source_paths, max_order = _SOURCES[name]
+    if not 1 <= order <= max_order:
+        raise ValueError(
+            f"Order of {name} n-grams must be between 1 and {max_order}"
+        )
+
+    if (name, order) in _STORES:
+        return _STORES[(name, order)]
+
+    path = get_full_data_path(
+        os.path.join(_STORE_DIRNAME, f"{name}_{order}")
+    )
+    store = None
+    meta_path = os.path.join(path, _META_FILENAME)
+    sources_path = os.path.join(path, _SOURCES_FILENAME)
+    if os.path.exists(meta_path):
+        with open(meta_path, encoding="utf-8") as f:
+            version = json.load(f).get("version")
+        signature = None
+        if os.path.exists(sources_path):
+            with open(sources_path, encoding="utf-8") as f:
+                signature = json.load(f)
+        if version == __version__ and signature == _signature(
+            source_paths(order)
+        ):
+            store = NgramStore.load(path)
+        elif _CHECK_MODE != "1":
+            shutil.rmtree(path, ignore_errors=True)
+
+    if store is None:
+        store = NgramStore.from_counts(freqs(order))
+        if _CHECK_MODE != "1":
+            # save to a temporary directory first, so a concurrent process
+            # never loads a partly written store
+            tmp_path = f"{path}.tmp{os.getpid()}"
+            store.save(tmp_path)
+            # the source files exist now, they are read by freqs()
+            tmp_sources_path = os.path.join(tmp_path, _SOURCES_FILENAME)
+            with open(tmp_sources_path, "w", encoding="utf-8") as f:
+                json.dump(_signature(source_paths(order)), f)
+            try:
+                os.rename(tmp_path, path)
+            except OSError:  # already saved by another process
+                shutil.rmtree(tmp_path, ignore_errors=True)
+            store = NgramStore.load(path)
+
+    _STORES[(name, order)] = store
+    return store
@@ -8,14 +8,173 @@ codes are from
 https://towardsdatascience.com/understanding-word-n-grams-and-n-gram-probability-in-natural-language-processing-9d9eef0fa058
 """
 import random
-from typing import List, Union
-from pythainlp.corpus.tnc import unigram_word_freqs as tnc_word_freqs_unigram
-from pythainlp.corpus.tnc import bigram_word_freqs as tnc_word_freqs_bigram
-from pythainlp.corpus.tnc import trigram_word_freqs as tnc_word_freqs_trigram
-from pythainlp.corpus.ttc import unigram_word_freqs as ttc_word_freqs_unigram
-from pythainlp.corpus.oscar import (
-    unigram_word_freqs as oscar_word_freqs_unigram,
-)
+from bisect import bisect_right
+from types import MappingProxyType
+from typing import Callable, Dict, List, Tuple, Union
+
+
+_MAX_TRIES = 8  # random draws before filtering candidates one by one
+
+
+def _word_freqs(name: str, order: int) -> List[dict]:
+    # n-gram counts of a corpus, from its text frequency files
+    if name == "tnc":
+        from pythainlp.corpus import tnc
+
+        freqs = [
+            tnc.unigram_word_freqs,
+            tnc.bigram_word_freqs,
+            tnc.trigram_word_freqs,
+        ]
+    elif name == "ttc":
+        from pythainlp.corpus import ttc
+
+        freqs = [ttc.unigram_word_freqs]
+    elif name == "oscar":
+        from pythainlp.corpus import oscar
+
+        freqs = [oscar.unigram_word_freqs]
+    else:
+        raise ValueError(f"Corpus not supported: {name}")
+    if not 1 <= order <= len(freqs):
+        raise ValueError(
+            f"Order of {name} n-grams must be between 1 and {len(freqs)}"
+        )
+    return [f() for f in freqs[:order]]
+
+
+class _DictNgrams:
+    """
+    N-gram counts in dictionaries, with the methods of
+    :class:`pythainlp.corpus.ngram.NgramStore` used by the generators,
+    for when NumPy is not installed.
+
+    :param list[dict] freqs: counts of the unigrams (by word), and of
+                             the n-grams of each higher order (by tuple)
+    """
+
+    def __init__(self, freqs: List[dict]):
+        self._freqs = [dict(f) for f in freqs]
+        self._keys = [list(f) for f in self._freqs]
+        self.total = sum(self._freqs[0].values())
+        # order: {context: [(word, count), ...]}, built on first use
+        self._next: Dict[int, Dict[tuple, List[Tuple[str, int]]]] = {}
+
+    def count(self, *words: str) -> int:
+        if not words:
+            return self.total
+        if len(words) > len(self._freqs):
+            return 0
+        key = words[0] if len(words) == 1 else words
+        return self._freqs[len(words) - 1].get(key, 0)
+
+    def prob(self, *words: str) -> float:
+        context_count = self.count(*words[:-1])
+        if not context_count:
+            return 0.0
+        return self.count(*words) / context_count
+
+    def continuations(self, *context: str) -> List[Tuple[str, int]]:
+        order = len(context) + 1
+        if order > len(self._freqs):
+            return []
+        if order not in self._next:
+            table = {}
+            for ngram, count in self._freqs[order - 1].items():
+                table.setdefault(ngram[:-1], []).append((ngram[-1], count))
+            for words in table.values():
+                words.sort(key=lambda x: -x[1])
+            self._next[order] = table
+        return self._next[order].get(context, [])
+
+    def ngram_count(self, order: int) -> int:
+        if order > len(self._freqs):
+            return 0
+        return len(self._keys[order - 1])
+
+    def ngram(self, order: int, i: int) -> Tuple[str, ...]:
+        key = self._keys[order - 1][i]
+        return (key,) if order == 1 else key
+
+    def ngram_freqs(
+        self, order: int
+    ) -> Dict[Union[str, Tuple[str, ...]], int]:
+        if order > len(self._freqs):
+            return {}
+        return dict(self._freqs[order - 1])
+
+    def word_freqs(self) -> List[Tuple[str, int]]:
+        return [
+            (word, count)
+            for word, count in self._freqs[0].items()
+            if count > 0
+        ]
+
+
+def _get_store(name: str, order: int):
+    try:
+        from pythainlp.corpus.ngram import get_ngram_store
+    except ImportError:  # NumPy is not installed
+        return _DictNgrams(_word_freqs(name, order))
+    return get_ngram_store(name, order=order)
+
+
+class _NextWordIndex:
+    """
+    N-grams of a store indexed by their context (all words but the last).
+
+    The n-grams of each context are sorted by descending probability,
+    so the n-grams with probability of at least a threshold are a prefix
+    of the list, found by a binary search. A context is indexed the
+    first time it is used.
+
+    :param NgramStore store: n-gram store
+    """
+
+    def __init__(self, store):
+        self._store = store
+        self._table = {}
+
+    def _ngrams(self, context: Tuple[str, ...]) -> Tuple[list, list]:
+        if context not in self._table:
+            context_count = self._store.count(*context)
+            neg_probs = []
+            ngrams = []
+            for word, count in self._store.continuations(*context):
+                neg_probs.append(
+                    -(count / context_count) if context_count else 0.0
+                )
+                ngrams.append(context + (word,))
+            self._table[context] = (neg_probs, ngrams)
+        return self._table[context]
+
+    def choice(
+        self,
+        context: Tuple[str, ...],
+        prob: float,
+        accept: Callable[[tuple], bool] = None,
+    ) -> Union[tuple, None]:
+        """
+        Randomly choose an n-gram of a context, with probability of at
+        least `prob` and accepted by `accept` (if given).
+
+        :return: n-gram or **None** if there is no such n-gram
+        """
+        neg_probs, ngrams = self._ngrams(context)
+        end = bisect_right(neg_probs, -prob)
+        if not end:
+            return None
+        if accept is None:
+            return ngrams[random.randrange(end)]
+
+        for _ in range(_MAX_TRIES):
+            ngram = ngrams[random.randrange(end)]
+            if accept(ngram):
+                return ngram
+        candidates = [ngram for ngram in ngrams[:end] if accept(ngram)]
+        if not candidates:
+            return None
+        return random.choice(candidates)
 
 
 class Unigram:
@@ -29,12 +188,7 @@ class Unigram:
     """
 
     def __init__(self, name: str = "tnc"):
-        if name == "tnc":
-            self.counts = tnc_word_freqs_unigram()
-        elif name == "ttc":
-            self.counts = ttc_word_freqs_unigram()
-        elif name == "oscar":
-            self.counts = oscar_word_freqs_unigram()
+        self.counts = dict(_get_store(name, 1).word_freqs())
         self.word = list(self.counts.keys())
         self.n = 0
         for i in self.word:
@@ -106,21 +260,63 @@ class Unigram:
         return self.words
 
 
-class Bigram:
+class _NgramCounts:
+    """
+    Read-only n-gram count attributes of the generators, built from
+    their store on first access. The counts are read-only mappings,
+    use *get(ngram, 0)* for an n-gram that may be missing.
+    """
+
+    def _freqs(self, order: int) -> MappingProxyType:
+        if order not in self._ngram_freqs:
+            self._ngram_freqs[order] = MappingProxyType(
+                self.store.ngram_freqs(order)
+            )
+        return self._ngram_freqs[order]
+
+    @property
+    def uni(self) -> MappingProxyType:
+        """Unigram counts, by word."""
+        return self._freqs(1)
+
+    @property
+    def bi(self) -> MappingProxyType:
+        """Bigram counts, by tuple of words."""
+        return self._freqs(2)
+
+    @property
+    def uni_keys(self) -> List[str]:
+        """Words of :attr:`uni`."""
+        return list(self.uni.keys())
+
+    @property
+    def bi_keys(self) -> List[Tuple[str, str]]:
+        """Bigrams of :attr:`bi`."""
+        return list(self.bi.keys())
+
+    @property
+    def words(self) -> List[str]:
+        """Last word of each bigram of :attr:`bi_keys`."""
+        return [i[-1] for i in self.bi_keys]
+
+
+class Bigram(_NgramCounts):
     """
     Text generator using Bigram
 
+    The n-gram counts are kept in a compact store (see
+    :mod:`pythainlp.corpus.ngram`). The attributes *uni*, *bi*,
+    *uni_keys*, *bi_keys*, and *words* are read-only, and built from
+    the store when first accessed.
+
     :param str name: corpus name
         * *tnc* - Thai National Corpus (default)
     """
 
     def __init__(self, name: str = "tnc"):
-        if name == "tnc":
-            self.uni = tnc_word_freqs_unigram()
-            self.bi = tnc_word_freqs_bigram()
-        self.uni_keys = list(self.uni.keys())
-        self.bi_keys = list(self.bi.keys())
-        self.words = [i[-1] for i in self.bi_keys]
+        self.store = _get_store(name, 2)
+        self._index = _NextWordIndex(self.store)
+        self._ngram_freqs = {}
 
     def prob(self, t1: str, t2: str) -> float:
         """
@@ -132,11 +328,7 @@ class Bigram:
         :return: probability value
         :rtype: float
         """
-        try:
-            v = self.bi[(t1, t2)] / self.uni[t1]
-        except ZeroDivisionError:
-            v = 0.0
-        return v
+        return self.store.prob(t1, t2)
 
     def gen_sentence(
         self,
@@ -166,30 +358,20 @@ class Bigram:
             # output: 'แมวไม่ได้รับเชื้อมัน'
         """
         if start_seq is None:
-            start_seq = random.choice(self.words)
+            start_seq = self.store.ngram(
+                2, random.randrange(self.store.ngram_count(2))
+            )[-1]
         self.late_word = start_seq
         self.list_word = []
         self.list_word.append(start_seq)
 
+        def accept(ngram: tuple) -> bool:
+            return duplicate or ngram[1] not in self.list_word
+
         for _ in range(N):
-            if duplicate:
-                self._temp = [
-                    j for j in self.bi_keys if j[0] == self.late_word
-                ]
-            else:
-                self._temp = [
-                    j
-                    for j in self.bi_keys
-                    if j[0] == self.late_word and j[1] not in self.list_word
-                ]
-            self._probs = [
-                self.prob(self.late_word, next_word[-1])
-                for next_word in self._temp
-            ]
-            self._p2 = [j for j in self._probs if j >= prob]
-            if len(self._p2) == 0:
+            self.items = self._index.choice((self.late_word,), prob, accept)
+            if self.items is None:
                 break
-            self.items = self._temp[self._probs.index(random.choice(self._p2))]
             self.late_word = self.items[-1]
             self.list_word.append(self.late_word)
         if output_str:
@@ -197,23 +379,33 @@ class Bigram:
         return self.list_word
 
 
-class Trigram:
+class Trigram(_NgramCounts):
     """
     Text generator using Trigram
 
+    The n-gram counts are kept in a compact store (see
+    :mod:`pythainlp.corpus.ngram`). The attributes *uni*, *bi*, *ti*,
+    *uni_keys*, *bi_keys*, *ti_keys*, and *words* are read-only, and
+    built from the store when first accessed.
+
     :param str name: corpus name
         * *tnc* - Thai National Corpus (default)
     """
 
     def __init__(self, name: str = "tnc"):
-        if name == "tnc":
-            self.uni = tnc_word_freqs_unigram()
-            self.bi = tnc_word_freqs_bigram()
-            self.ti = tnc_word_freqs_trigram()
-        self.uni_keys = list(self.uni.keys())
-        self.bi_keys = list(self.bi.keys())
-        self.ti_keys = list(self.ti.keys())
-        self.words = [i[-1] for i in self.bi_keys]
+        self.store = _get_store(name, 3)
+        self._index = _NextWordIndex(self.store)
+        self._ngram_freqs = {}
+
+    @property
+    def ti(self) -> MappingProxyType:
+        """Trigram counts, by tuple of words."""
+        return self._freqs(3)
+
+    @property
+    def ti_keys(self) -> List[Tuple[str, str, str]]:
+        """Trigrams of :attr:`ti`."""
+        return list(self.ti.keys())
 
     def prob(self, t1: str, t2: str, t3: str) -> float:
         """
@@ -226,12 +418,7 @@ class Trigram:
         :return: probability value
         :rtype: float
         """
-        try:
-            v = self.ti[(t1, t2, t3)] / self.bi[(t1, t2)]
-        except ZeroDivisionError:
-            v = 0.0
-
-        return v
+        return self.store.prob(t1, t2, t3)
 
     def gen_sentence(
         self,
@@ -261,29 +448,22 @@ class Trigram:
             # output: 'ยังทำตัวเป็นเซิร์ฟเวอร์คือ'
         """
         if start_seq is None:
-            start_seq = random.choice(self.bi_keys)
+            start_seq = self.store.ngram(
+                2, random.randrange(self.store.ngram_count(2))
+            )
         self.late_word = start_seq
         self.list_word = []
         self.list_word.append(start_seq)
 
+        def accept(ngram: tuple) -> bool:
+            return duplicate or ngram[1:] not in self.list_word
+
         for i in range(N):
-            if duplicate:
-                self._temp = [
-                    j for j in self.ti_keys if j[:2] == self.late_word
-                ]
-            else:
-                self._temp = [
-                    j
-                    for j in self.ti_keys
-                    if j[:2] == self.late_word and j[1:] not in self.list_word
-                ]
-            self._probs = [
-                self.prob(word[0], word[1], word[2]) for word in self._temp
-            ]
-            self._p2 = [j for j in self._probs if j >= prob]
-            if len(self._p2) == 0:
+            if not isinstance(self.late_word, tuple):
+                break
+            self.items = self._index.choice(self.late_word, prob, accept)
+            if self.items is None:
                 break
-            self.items = self._temp[self._probs.index(random.choice(self._p2))]
             self.late_word = self.items[1:]
             self.list_word.append(self.late_word)
         self.listdata = []
@@ -3,10 +3,11 @@
 # SPDX-License-Identifier: Apache-2.0
 # ruff: noqa: C901
 
-from typing import List, Union
+from typing import List, Tuple, Union
 
 from pythainlp.tokenize import subword_tokenize
-from pythainlp.util import remove_tonemark, sound_syllable
+from pythainlp.util import sound_syllable, syllable_info
+from pythainlp.util.syllable import _remove_karun_silenced
 
 
 class KhaveeVerifier:
@@ -33,176 +34,7 @@ class KhaveeVerifier:
             print(kv.check_sara("เริง"))
             # output: 'เออ'
         """
-        sara = []
-        countoa = 0
-
-        # In case of การันย์
-        if "์" in word[-1]:
-            word = word[:-2]
-
-        # In case of สระเดี่ยว
-        for i in word:
-            if i in ("ะ", "ั"):
-                sara.append("อะ")
-            elif i == "ิ":
-                sara.append("อิ")
-            elif i == "ุ":
-                sara.append("อุ")
-            elif i == "ึ":
-                sara.append("อึ")
-            elif i == "ี":
-                sara.append("อี")
-            elif i == "ู":
-                sara.append("อู")
-            elif i == "ื":
-                sara.append("อือ")
-            elif i == "เ":
-                sara.append("เอ")
-            elif i == "แ":
-                sara.append("แอ")
-            elif i == "า":
-                sara.append("อา")
-            elif i == "โ":
-                sara.append("โอ")
-            elif i == "ำ":
-                sara.append("อำ")
-            elif i == "อ":
-                countoa += 1
-                sara.append("ออ")
-            elif i == "ั" and "ว" in word:
-                sara.append("อัว")
-            elif i in ("ไ", "ใ"):
-                sara.append("ไอ")
-            elif i == "็":
-                sara.append("ออ")
-            elif "รร" in word:
-                if self.check_marttra(word) == "กม":
-                    sara.append("อำ")
-                else:
-                    sara.append("อะ")
-
-        # In case of ออ
-        if countoa == 1 and "อ" in word[-1] and "เ" not in word:
-            sara.remove("ออ")
-
-        # In case of เอ เอ
-        countA = 0
-        for i in sara:
-            if i == "เอ":
-                countA = countA + 1
-            if countA > 1:
-                sara.remove("เอ")
-                sara.remove("เอ")
-                sara.append("แ")
-
-        # In case of สระประสม
-        if "เอ" in sara and "อะ" in sara:
-            sara.remove("เอ")
-            sara.remove("อะ")
-            sara.append("เอะ")
-        elif "แอ" in sara and "อะ" in sara:
-            sara.remove("แอ")
-            sara.remove("อะ")
-            sara.append("แอะ")
-
-        if "เอะ" in sara and "ออ" in sara:
-            sara.remove("เอะ")
-            sara.remove("ออ")
-            sara.append("เออะ")
-        elif "เอ" in sara and "อิ" in sara:
-            sara.remove("เอ")
-            sara.remove("อิ")
-            sara.append("เออ")
-        elif "เอ" in sara and "ออ" in sara and "อ" in word[-1]:
-            sara.remove("เอ")
-            sara.remove("ออ")
-            sara.append("เออ")
-        elif "โอ" in sara and "อะ" in sara:
-            sara.remove("โอ")
-            sara.remove("อะ")
-            sara.append("โอะ")
-        elif "เอ" in sara and "อี" in sara:
-            sara.remove("เอ")
-            sara.remove("อี")
-            sara.append("เอีย")
-        elif "เอ" in sara and "อือ" in sara:
-            sara.remove("เอ")
-            sara.remove("อือ")
-            sara.append("อัว")
-        elif "เอ" in sara and "อา" in sara:
-            sara.remove("เอ")
-            sara.remove("อา")
-            sara.append("เอา")
-        elif "เ" in word and "า" in word and "ะ" in word:
-            sara = []
-            sara.append("เอาะ")
-
-        if "อือ" in sara and "เออ" in sara:
-            sara.remove("เออ")
-            sara.remove("อือ")
-            sara.append("เอือ")
-        elif "ออ" in sara and len(sara) > 1:
-            sara.remove("ออ")
-        elif "ว" in word and len(sara) == 0:
-            sara.append("อัว")
-
-        if "ั" in word and self.check_marttra(word) == "กา":
-            sara = []
-            sara.append("ไอ")
-
-        # In case of อ
-        if word == "เออะ":
-            sara = []
-            sara.append("เออะ")
-        elif word == "เออ":
-            sara = []
-            sara.append("เออ")
-        elif word == "เอ":
-            sara = []
-            sara.append("เอ")
-        elif word == "เอะ":
-            sara = []
-            sara.append("เอะ")
-        elif word == "เอา":
-            sara = []
-            sara.append("เอา")
-        elif word == "เอาะ":
-            sara = []
-            sara.append("เอาะ")
-
-        if "ฤา" in word or "ฦา" in word:
-            sara = []
-            sara.append("อือ")
-        elif "ฤ" in word or "ฦ" in word:
-            sara = []
-            sara.append("อึ")
-
-        # In case of กน
-        if not sara and len(word) == 2:
-            if word[-1] != "ร":
-                sara.append("โอะ")
-            else:
-                sara.append("ออ")
-        elif not sara and len(word) == 3:
-            sara.append("ออ")
-
-        # In case of บ่
-        if word == "บ่":
-            sara = []
-            sara.append("ออ")
-
-        if "ํ" in word:
-            sara = []
-            sara.append("อำ")
-
-        if "เ" in word and "ื" in word and "อ" in word:
-            sara = []
-            sara.append("เอือ")
-
-        if not sara:
-            return "Can't find Sara in this word"
-
-        return sara[0]
+        return syllable_info(word).vowel
 
     def check_marttra(self, word: str) -> str:
         """
@@ -222,64 +54,7 @@ class KhaveeVerifier:
             print(kv.check_marttra('สาว'))
             # output: 'เกอว'
         """
-        if word[-1] == "ร" and word[-2] in ["ต", "ท"]:
-            word = word[:-1]
-        word = self.handle_karun_sound_silence(word)
-        word = remove_tonemark(word)
-        if (
-            "ำ" in word
-            or ("ํ" in word and "า" in word)
-            or "ไ" in word
-            or "ใ" in word
-        ):
-            return "กา"
-        elif (
-            word[-1] in ["า", "ะ", "ิ", "ี", "ุ", "ู", "อ"]
-            or ("ี" in word and "ย" in word[-1])
-            or ("ื" in word and "อ" in word[-1])
-        ):
-            return "กา"
-        elif word[-1] in ["ง"]:
-            return "กง"
-        elif word[-1] in ["ม"]:
-            return "กม"
-        elif word[-1] in ["ย"]:
-            if "ั" in word:
-                return "กา"
-            else:
-                return "เกย"
-        elif word[-1] in ["ว"]:
-            return "เกอว"
-        elif word[-1] in ["ก", "ข", "ค", "ฆ"]:
-            return "กก"
-        elif word[-1] in [
-            "จ",
-            "ช",
-            "ซ",
-            "ฎ",
-            "ฏ",
-            "ฐ",
-            "ฑ",
-            "ฒ",
-            "ด",
-            "ต",
-            "ถ",
-            "ท",
-            "ธ",
-            "ศ",
-            "ษ",
-            "ส",
-        ]:
-            return "กด"
-        elif word[-1] in ["ญ", ", ณ", "น", "ร", "ล", "ฬ"]:
-            return "กน"
-        elif word[-1] in ["บ", "ป", "พ", "ฟ", "ภ"]:
-            return "กบ"
-        else:
-            if "็" in word:
-                return "กา"
-            else:
-                return "Cant find Marttra in this word"
+        return syllable_info(word).marttra
 
     def is_sumpus(self, word1: str, word2: str) -> bool:
         """
@@ -303,30 +78,43 @@ class KhaveeVerifier:
             print(kv.is_sumpus('สรร', 'แมว'))
             # output: False
         """
-        marttra1 = self.check_marttra(word1)
-        marttra2 = self.check_marttra(word2)
-        sara1 = self.check_sara(word1)
-        sara2 = self.check_sara(word2)
-        if sara1 == "อะ" and marttra1 == "เกย":
-            sara1 = "ไอ"
-            marttra1 = "กา"
-        elif sara2 == "อะ" and marttra2 == "เกย":
-            sara2 = "ไอ"
-            marttra2 = "กา"
-        if sara1 == "อำ" and marttra1 == "กม":
-            sara1 = "อำ"
-            marttra1 = "กา"
-        elif sara2 == "อำ" and marttra2 == "กม":
-            sara2 = "อำ"
-            marttra2 = "กา"
-        return bool(marttra1 == marttra2 and sara1 == sara2)
+        return self.rhyme_key(word1) == self.rhyme_key(word2)
+
+    def rhyme_key(self, word: str) -> Tuple[str, str]:
+        """
+        Get the vowel and the spelling section that decide the rhyme
+        of a Thai word. Two words rhyme if they have the same key.
+
+        :param str word: Thai word
+        :return: (vowel name, name of spelling section) of the word
+        :rtype: Tuple[str, str]
+
+        :Example:
+        ::
+
+            from pythainlp.khavee import KhaveeVerifier
+
+            kv = KhaveeVerifier()
+
+            print(kv.rhyme_key('สาว'))
+            # output: ('อา', 'เกอว')
+        """
+        sara = self.check_sara(word)
+        marttra = self.check_marttra(word)
+        if sara == "อะ" and marttra == "เกย":
+            return ("ไอ", "กา")
+        if sara == "อำ" and marttra == "กม":
+            return ("อำ", "กา")
+        return (sara, marttra)
 
     def check_karu_lahu(self, text):
+        marttra = self.check_marttra(text)
+        sara = self.check_sara(text)
         if (
-            self.check_marttra(text) != "กา"
+            marttra != "กา"
             or (
-                self.check_marttra(text) == "กา"
-                and self.check_sara(text)
+                marttra == "กา"
+                and sara
                 in [
                     "อา",
                     "อี",
@@ -342,7 +130,7 @@ class KhaveeVerifier:
                     "อัว",
                 ]
             )
-            or self.check_sara(text) in ["อำ", "ไอ", "เอา"]
+            or sara in ["อำ", "ไอ", "เอา"]
         ) and text not in ["บ่", "ณ", "ธ", "ก็"]:
             return "karu"
         else:
@@ -641,12 +429,4 @@ class KhaveeVerifier:
         :return: Thai word with silent words stripped
         :rtype: str
         """
-        sound_silenced = word.endswith("์")
-        if not sound_silenced:
-            return word
-        thai_consonants = "กขฃคฅฆงจฉชซฌญฎฏฐฑฒณดตถทธนบปผฝพฟภมยรลวศษสหฬอฮ"
-        locate_silenced = word.rfind("์") - 1
-        can_silence_two = word[locate_silenced - 2] in thai_consonants
-        cut_off = 2 if can_silence_two else 1
-        word = word[: locate_silenced + 1 - cut_off]
-        return word
+        return _remove_karun_silenced(word)
@@ -35,6 +35,8 @@ def dependency_parsing(
             `GitHub <https://github.com/KoichiYasuoka/spacy-thai>`_
         * *transformers_ud* - TransformersUD \
             `GitHub <https://github.com/KoichiYasuoka/>`_
+        * *transformers_ud-onnx* - TransformersUD run with ONNX Runtime \
+            and int8-quantized weights (requires `optimum[onnxruntime]`)
         * *ud_goeswith* - POS tagging and dependency parsing \
             using `goeswith` for subwords
 
@@ -106,6 +108,10 @@ def dependency_parsing(
             from pythainlp.parse.transformers_ud import Parse
 
             _tagger = Parse(model=model)
+        elif engine == "transformers_ud-onnx":
+            from pythainlp.parse.transformers_ud import Parse
+
+            _tagger = Parse(model=model, onnx=True)
         elif engine == "spacy_thai":
             from pythainlp.parse.spacy_thai_engine import Parse
 
@@ -28,27 +28,41 @@ from transformers.utils import cached_file
 
 class Parse:
     def __init__(
-        self, model: str = "KoichiYasuoka/deberta-base-thai-ud-head"
+        self,
+        model: str = "KoichiYasuoka/deberta-base-thai-ud-head",
+        onnx: bool = False,
+        quantize: bool = True,
     ) -> None:
         if model is None:
             model = "KoichiYasuoka/deberta-base-thai-ud-head"
         self.tokenizer = AutoTokenizer.from_pretrained(model)
-        self.model = AutoModelForQuestionAnswering.from_pretrained(model)
-        x = AutoModelForTokenClassification.from_pretrained
-        if os.path.isdir(model):
+        if onnx:
+            from pythainlp.tools.onnx_model import load_onnx_model
+
+            self.model = load_onnx_model(
+                model, task="question-answering", quantize=quantize
+            )
             d, t = (
-                x(os.path.join(model, "deprel")),
-                x(os.path.join(model, "tagger")),
+                load_onnx_model(model, subfolder="deprel", quantize=quantize),
+                load_onnx_model(model, subfolder="tagger", quantize=quantize),
             )
         else:
-            c = AutoConfig.from_pretrained(
-                cached_file(model, "deprel/config.json")
-            )
-            d = x(cached_file(model, "deprel/pytorch_model.bin"), config=c)
-            s = AutoConfig.from_pretrained(
-                cached_file(model, "tagger/config.json")
-            )
-            t = x(cached_file(model, "tagger/pytorch_model.bin"), config=s)
+            self.model = AutoModelForQuestionAnswering.from_pretrained(model)
+            x = AutoModelForTokenClassification.from_pretrained
+            if os.path.isdir(model):
+                d, t = (
+                    x(os.path.join(model, "deprel")),
+                    x(os.path.join(model, "tagger")),
+                )
+            else:
+                c = AutoConfig.from_pretrained(
+                    cached_file(model, "deprel/config.json")
+                )
+                d = x(cached_file(model, "deprel/pytorch_model.bin"), config=c)
+                s = AutoConfig.from_pretrained(
+                    cached_file(model, "tagger/config.json")
+                )
+                t = x(cached_file(model, "tagger/pytorch_model.bin"), config=s)
         self.deprel = TokenClassificationPipeline(
             model=d, tokenizer=self.tokenizer, aggregation_strategy="simple"
         )
@@ -8,6 +8,7 @@ import re
 import warnings
 
 from pythainlp.tokenize import word_tokenize
+from pythainlp.wangchanberta.core import _max_length, _text_windows
 from transformers import (
     CamembertTokenizer,
 )
@@ -16,7 +17,15 @@ from transformers import (
 _PAT_URL = r"(http|ftp|https)://([\w_-]+(?:(?:\.[\w_-]+)+))([\w.,@?^=%&:/~+#-]*[\w@?^=%&/~+#-])?"
 
 _model_name = "clicknext/phayathaibert"
-_tokenizer = CamembertTokenizer.from_pretrained(_model_name)
+_tokenizer = None
+
+
+def _get_tokenizer() -> CamembertTokenizer:
+    # load on first use, so importing this module needs no download
+    global _tokenizer
+    if _tokenizer is None:
+        _tokenizer = CamembertTokenizer.from_pretrained(_model_name)
+    return _tokenizer
 
 
 class ThaiTextProcessor:
@@ -347,14 +356,47 @@ class PartOfSpeechTagger:
 
 
 class NamedEntityTagger:
-    def __init__(self, model: str = "Pavarissy/phayathaibert-thainer") -> None:
+    def __init__(
+        self,
+        model: str = "Pavarissy/phayathaibert-thainer",
+        max_length: int = None,
+        stride: int = 128,
+        onnx: bool = False,
+        quantize: bool = True,
+    ) -> None:
+        """
+        Named-entity tagger powered by PhayaThaiBERT.
+
+        Texts longer than the model input are split at word boundaries
+        into overlapping windows. An entity is taken from the window
+        where it starts farthest from the edge.
+
+        :param str model: model name or path
+        :param int max_length: maximum number of subwords in a window,
+                               default is the input size of the model
+        :param int stride: number of subwords shared by two
+                           consecutive windows
+        :param bool onnx: run the model with ONNX Runtime
+                          (requires `optimum[onnxruntime]`)
+        :param bool quantize: use int8-quantized weights with ONNX Runtime
+        """
         from transformers import (
             AutoTokenizer,
             AutoModelForTokenClassification,
         )
 
         self.tokenizer = AutoTokenizer.from_pretrained(model)
-        self.model = AutoModelForTokenClassification.from_pretrained(model)
+        if onnx:
+            from pythainlp.tools.onnx_model import load_onnx_model
+
+            self.model = load_onnx_model(model, quantize=quantize)
+        else:
+            self.model = AutoModelForTokenClassification.from_pretrained(
+                model
+            )
+        self.max_length = max_length or _max_length(self.tokenizer, self.model)
+        self.stride = stride
+        self._pipelines = {}
 
     def get_ner(
         self,
@@ -389,23 +431,87 @@ class NamedEntityTagger:
             'ทดสอบ<PERSON>นายปวริศ เรืองจุติโพธิ์พาน</PERSON>\
                 <LOCATION>จาก</LOCATION><LOCATION>ประเทศไทย</LOCATION>'
         """
-        from transformers import TokenClassificationPipeline
+        return self.get_ner_batch(
+            [text], tag=tag, pos=pos, strategy=strategy
+        )[0]
 
+    def get_ner_batch(
+        self,
+        texts: List[str],
+        tag: bool = False,
+        pos: bool = False,
+        strategy: str = "simple",
+        batch_size: int = 8,
+    ) -> List[Union[List[Tuple[str, str]], str]]:
+        """
+        This function tags named entities in many texts in IOB format,
+        running the model on batches of texts.
+
+        :param list texts: texts in Thai to be tagged
+        :param bool tag: output HTML-like tags.
+        :param str strategy: aggregation strategy of the pipeline
+        :param int batch_size: number of texts in a batch
+        :return: a list of outputs of :meth:`get_ner`, one for each text
+        :rtype: list[Union[list[tuple[str, str]], str]]
+        """
         if pos:
             warnings.warn(
                 "This model doesn't support output \
                           postag and It doesn't output the postag."
             )
+        if not texts:
+            return []
+        chunks = []
+        text_windows = []
+        for text in texts:
+            windows = _text_windows(
+                text, self.tokenizer, self.max_length, self.stride
+            )
+            chunks.extend(text[start:end] for start, end, _, _ in windows)
+            text_windows.append(windows)
 
+        outputs = iter(
+            self._get_pipeline(strategy)(chunks, batch_size=batch_size)
+        )
+        results = []
+        for text, windows in zip(texts, text_windows):
+            merged = []
+            last_end = 0
+            for start, _, lo, hi in windows:
+                for token in next(outputs):
+                    token = dict(
+                        token,
+                        start=token["start"] + start,
+                        end=token["end"] + start,
+                    )
+                    # keep entities that start in the kept part of the
+                    # window and do not overlap a kept entity
+                    if lo <= token["start"] < hi and token["start"] >= last_end:
+                        merged.append(token)
+                        last_end = token["end"]
+            results.append(self._postprocess(text, merged, tag=tag))
+
+        return results
+
+    def _get_pipeline(self, strategy: str):
+        # a pipeline is reused for every call with the same strategy
+        from transformers import TokenClassificationPipeline
+
+        if strategy not in self._pipelines:
+            self._pipelines[strategy] = TokenClassificationPipeline(
+                model=self.model,
+                tokenizer=self.tokenizer,
+                aggregation_strategy=strategy,
+            )
+        return self._pipelines[strategy]
+
+    @staticmethod
+    def _postprocess(
+        text: str, outputs: List[dict], tag: bool = False
+    ) -> Union[List[Tuple[str, str]], str]:
         sample_output = []
         tag_text_list = []
         current_pos = 0
-        pipeline = TokenClassificationPipeline(
-            model=self.model,
-            tokenizer=self.tokenizer,
-            aggregation_strategy=strategy,
-        )
-        outputs = pipeline(text)
 
         for token in outputs:
             ner_tag = token["entity_group"]
@@ -446,4 +552,4 @@ def segment(sentence: str) -> List[str]:
     if not sentence or not isinstance(sentence, str):
         return []
 
-    return _tokenizer.tokenize(sentence)
+    return _get_tokenizer().tokenize(sentence)
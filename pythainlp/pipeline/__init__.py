@@ -0,0 +1,10 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2016-2024 PyThaiNLP Project
+# SPDX-License-Identifier: Apache-2.0
+"""
+Processing pipeline with shared intermediate results
+"""
+
+__all__ = ["Doc", "Pipeline"]
+
+from pythainlp.pipeline.core import Doc, Pipeline
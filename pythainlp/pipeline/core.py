@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2016-2024 PyThaiNLP Project
+# SPDX-License-Identifier: Apache-2.0
+"""
+Processing pipeline with shared intermediate results
+"""
+from typing import Iterable, Iterator, List, Tuple, Union
+
+from pythainlp.tag import pos_tag
+from pythainlp.tokenize import (
+    DEFAULT_SENT_TOKENIZE_ENGINE,
+    DEFAULT_WORD_TOKENIZE_ENGINE,
+    sent_tokenize,
+    word_tokenize,
+)
+
+LAYERS = ("words", "pos_tags", "sentences", "clauses", "entities", "chunks")
+
+# POS tag corpora that the models of other layers are trained with
+_CLAUSE_POS_CORPUS = "blackboard"
+_CHUNK_POS_CORPUS = "orchid"
+
+
+class Doc:
+    """
+    A text with its annotations (layers), created by :class:`Pipeline`.
+
+    Each layer is computed on first access and kept in the document,
+    and layers share the results of the layers that they are built on,
+    e.g. the words are tokenized once for POS tags, sentences,
+    clauses, and named entities.
+
+    :param str text: text
+    :param Pipeline pipeline: pipeline that computes the layers
+    """
+
+    def __init__(self, text: str, pipeline: "Pipeline") -> None:
+        self.text = text
+        self.pipeline = pipeline
+        self._layers = {}
+
+    def __repr__(self) -> str:
+        return f"Doc({self.text!r})"
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.words)
+
+    def _get(self, layer: str):
+        if layer not in self._layers:
+            self.pipeline._annotate([self], layer)
+        return self._layers[layer]
+
+    def pos(self, corpus: str) -> List[Tuple[str, str]]:
+        """
+        Get POS tags of the words from a corpus.
+
+        :param str corpus: POS tag corpus,
+                           see :func:`pythainlp.tag.pos_tag`
+        :return: a list of tuples (word, POS tag)
+        :rtype: list[tuple[str, str]]
+        """
+        return self._get(("pos_tags", corpus))
+
+    @property
+    def words(self) -> List[str]:
+        """Words, see :func:`pythainlp.tokenize.word_tokenize`"""
+        return self._get("words")
+
+    @property
+    def pos_tags(self) -> List[Tuple[str, str]]:
+        """(word, POS tag) of the words, see :func:`pythainlp.tag.pos_tag`"""
+        return self.pos(self.pipeline.pos_corpus)
+
+    @property
+    def sentences(self) -> List[str]:
+        """Sentences, see :func:`pythainlp.tokenize.sent_tokenize`"""
+        return self._get("sentences")
+
+    @property
+    def clauses(self) -> List[List[str]]:
+        """Clauses, see :func:`pythainlp.tokenize.clause_tokenize`"""
+        return self._get("clauses")
+
+    @property
+    def entities(self) -> List[Tuple[str, str]]:
+        """(word, IOB named-entity tag), see :class:`pythainlp.tag.NER`"""
+        return self._get("entities")
+
+    @property
+    def chunks(self) -> List[str]:
+        """IOB phrase structure tags of the words,
+        see :func:`pythainlp.tag.chunk_parse`"""
+        return self._get("chunks")
+
+
+class Pipeline:
+    """
+    Pipeline of Thai text processing.
+
+    Calling a pipeline on a text returns a :class:`Doc`, whose layers
+    (words, POS tags, sentences, clauses, named entities, and chunks)
+    are computed lazily, once, and reuse each other, instead of
+    tokenizing and tagging the text again for each function.
+
+    :param str word_engine: word tokenizer engine,
+                            see :func:`pythainlp.tokenize.word_tokenize`
+    :param str pos_engine: POS tagger engine,
+                           see :func:`pythainlp.tag.pos_tag`
+    :param str pos_corpus: POS tag corpus of the `pos_tags` layer
+    :param str sent_engine: sentence tokenizer engine,
+                            see :func:`pythainlp.tokenize.sent_tokenize`
+    :param str ner_engine: named-entity recognizer engine,
+                           see :class:`pythainlp.tag.NER`
+    :param str ner_corpus: named-entity recognizer corpus
+    :param list layers: layers computed when the pipeline is called,
+                        in batch for :meth:`pipe`.
+                        Other layers are computed on first access.
+
+    **Notes**
+        * The *thainer* (CRF) named-entity recognizer and the *crfcut*
+          sentence tokenizer use the words of the document, instead of
+          tokenizing the text again with their own tokenizer.
+        * The clauses and the chunks use POS tags from the corpora that
+          their models are trained with (*blackboard* and *orchid*),
+          which are tagged once from the same words.
+
+    :Example:
+    ::
+
+        from pythainlp import Pipeline
+
+        nlp = Pipeline(layers=["words", "entities"])
+        doc = nlp("วันที่ 15 ก.ย. 61 ทดสอบระบบเวลา 14:49 น.")
+
+        doc.words
+        # output: ['วันที่', ' ', '15', ' ', 'ก.ย.', ...]
+
+        doc.entities
+        # output: [('วันที่', 'O'), (' ', 'O'), ('15', 'B-DATE'), ...]
+
+        doc.sentences  # reuses doc.words
+
+        # tag named entities of many texts in batch
+        docs = list(nlp.pipe(["ไปเชียงใหม่", "นายกรัฐมนตรีไปกรุงเทพ"]))
+    """
+
+    def __init__(
+        self,
+        word_engine: str = DEFAULT_WORD_TOKENIZE_ENGINE,
+        pos_engine: str = "perceptron",
+        pos_corpus: str = "orchid_ud",
+        sent_engine: str = DEFAULT_SENT_TOKENIZE_ENGINE,
+        ner_engine: str = "thainer",
+        ner_corpus: str = "thainer",
+        layers: Union[List[str], None] = None,
+    ) -> None:
+        layers = list(layers or [])
+        for layer in layers:
+            if layer not in LAYERS:
+                raise ValueError(
+                    f"""Layer '{layer}' is not supported.
+                    It must be one of {list(LAYERS)}."""
+                )
+        self.word_engine = word_engine
+        self.pos_engine = pos_engine
+        self.pos_corpus = pos_corpus
+        self.sent_engine = sent_engine
+        self.ner_engine = ner_engine
+        self.ner_corpus = ner_corpus
+        self.layers = layers
+        self._ner = None
+        self._chunker = None
+
+    def __call__(self, text: str) -> Doc:
+        """
+        Process a text.
+
+        :param str text: text
+        :return: document with the layers in `layers` computed
+        :rtype: Doc
+        """
+        return next(self.pipe([text]))
+
+    def pipe(self, texts: Iterable[str], batch_size: int = 64) -> Iterator[Doc]:
+        """
+        Process many texts, computing the layers in `layers`
+        for a batch of texts at a time.
+
+        :param Iterable[str] texts: texts
+        :param int batch_size: number of texts in a batch
+        :return: documents, in the order of `texts`
+        :rtype: Iterator[Doc]
+        """
+        batch = []
+        for text in texts:
+            batch.append(Doc(text, self))
+            if len(batch) >= batch_size:
+                yield from self._process(batch)
+                batch = []
+        if batch:
+            yield from self._process(batch)
+
+    def _process(self, docs: List[Doc]) -> List[Doc]:
+        for layer in self.layers:
+            if layer == "pos_tags":
+                layer = ("pos_tags", self.pos_corpus)
+            self._annotate(docs, layer)
+        return docs
+
+    def _annotate(self, docs: List[Doc], layer) -> None:
+        # compute a layer of the documents that do not have it yet
+        docs = [doc for doc in docs if layer not in doc._layers]
+        if not docs:
+            return
+        if isinstance(layer, tuple):
+            values = [
+                pos_tag(doc.words, engine=self.pos_engine, corpus=layer[1])
+                for doc in docs
+            ]
+        else:
+            values = getattr(self, "_" + layer)(docs)
+        for doc, value in zip(docs, values):
+            doc._layers[layer] = value
+
+    def _words(self, docs: List[Doc]) -> List[List[str]]:
+        return [
+            word_tokenize(doc.text, engine=self.word_engine) for doc in docs
+        ]
+
+    def _sentences(self, docs: List[Doc]) -> List[List[str]]:
+        if self.sent_engine != "crfcut":
+            return [
+                sent_tokenize(doc.text, engine=self.sent_engine)
+                for doc in docs
+            ]
+        from pythainlp.tokenize.crfcut import segment
+
+        return [segment(doc.words) if doc.words else [] for doc in docs]
+
+    def _clauses(self, docs: List[Doc]) -> List[List[List[str]]]:
+        from pythainlp.tokenize.crfcls import segment
+
+        return [
+            segment(doc.words, word_tags=doc.pos(_CLAUSE_POS_CORPUS))
+            for doc in docs
+        ]
+
+    def _entities(self, docs: List[Doc]) -> List[List[Tuple[str, str]]]:
+        if self._ner is None:
+            from pythainlp.tag import NER
+
+            self._ner = NER(engine=self.ner_engine, corpus=self.ner_corpus)
+        if self.ner_engine == "thainer":
+            # tag the words of the document with the POS corpus of the model
+            engine = self._ner.engine
+            return engine.get_ner_batch(
+                [doc.pos(engine.pos_tag_name) for doc in docs], pos=False
+            )
+        return self._ner.tag_batch([doc.text for doc in docs])
+
+    def _chunks(self, docs: List[Doc]) -> List[List[str]]:
+        if self._chunker is None:
+            from pythainlp.tag.crfchunk import CRFchunk
+
+            self._chunker = CRFchunk()
+        return [
+            self._chunker.parse(doc.pos(_CHUNK_POS_CORPUS)) for doc in docs
+        ]
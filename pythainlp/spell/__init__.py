@@ -14,8 +14,19 @@ __all__ = [
     "correct_sent",
 ]
 
+from pythainlp.corpus import get_derived
 from pythainlp.spell.pn import NorvigSpellChecker
 
-DEFAULT_SPELL_CHECKER = NorvigSpellChecker()
+
+def _get_default_spell_checker() -> NorvigSpellChecker:
+    return get_derived("tnc", "norvig_spell_checker", NorvigSpellChecker)
+
+
+def __getattr__(name: str):
+    # DEFAULT_SPELL_CHECKER is built on first access
+    if name == "DEFAULT_SPELL_CHECKER":
+        return _get_default_spell_checker()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 from pythainlp.spell.core import correct, spell, correct_sent, spell_sent
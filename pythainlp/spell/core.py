@@ -8,9 +8,11 @@ Spell checking functions
 import itertools
 from typing import List
 
-from pythainlp.spell import DEFAULT_SPELL_CHECKER
+from pythainlp.spell import _get_default_spell_checker
+from pythainlp.tools import profiling
 
 
+@profiling.timed("spell.spell", engine_arg="engine")
 def spell(word: str, engine: str = "pn") -> List[str]:
     """
     Provides a list of possible correct spellings of the given word.
@@ -71,11 +73,12 @@ def spell(word: str, engine: str = "pn") -> List[str]:
 
         text_correct = SPELL_CHECKER(word)
     else:
-        text_correct = DEFAULT_SPELL_CHECKER.spell(word)
+        text_correct = _get_default_spell_checker().spell(word)
 
     return text_correct
 
 
+@profiling.timed("spell.correct", engine_arg="engine")
 def correct(word: str, engine: str = "pn") -> str:
     """
     Corrects the spelling of the given word by returning
@@ -124,7 +127,7 @@ def correct(word: str, engine: str = "pn") -> str:
         text_correct = SPELL_CHECKER(word)
 
     else:
-        text_correct = DEFAULT_SPELL_CHECKER.correct(word)
+        text_correct = _get_default_spell_checker().correct(word)
 
     return text_correct
 
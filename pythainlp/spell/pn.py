@@ -25,6 +25,14 @@ from pythainlp.corpus import tnc
 from pythainlp.util import isthaichar
 
 
+def _tnc_word_freqs() -> List[Tuple[str, int]]:
+    try:
+        from pythainlp.corpus.ngram import get_ngram_store
+    except ImportError:  # NumPy is not installed
+        return tnc.word_freqs()
+    return get_ngram_store("tnc").word_freqs()
+
+
 def _no_filter(word: str) -> bool:
     return True
 
@@ -166,7 +174,7 @@ class NorvigSpellChecker:
         """
         if not custom_dict:  # default, use Thai National Corpus
             # TODO: #680 change the dict
-            custom_dict = [(i, j) for i, j in tnc.word_freqs()]
+            custom_dict = _tnc_word_freqs()
 
         if not dict_filter:
             dict_filter = _no_filter
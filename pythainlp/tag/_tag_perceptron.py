@@ -20,6 +20,8 @@ import json
 from collections import defaultdict
 from typing import Dict, Iterable, List, Tuple, Union
 
+from pythainlp.tools import profiling
+
 
 class AveragedPerceptron():
     """
@@ -132,12 +134,18 @@ class PerceptronTagger:
         prev, prev2 = self.START
         output = []
 
+        # the stages are timed only if profiling is enabled
+        get_features = profiling.wrap(
+            self._get_features, "tag.perceptron.features"
+        )
+        predict = profiling.wrap(self.model.predict, "tag.perceptron.predict")
+
         context = self.START + [self._normalize(w) for w in tokens] + self.END
         for i, word in enumerate(tokens):
             tag = self.tagdict.get(word)
             if not tag:
-                features = self._get_features(i, word, context, prev, prev2)
-                tag = self.model.predict(features)
+                features = get_features(i, word, context, prev, prev2)
+                tag = predict(features)
             output.append((word, tag))
             prev2 = prev
             prev = tag
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2016-2024 PyThaiNLP Project
+# SPDX-License-Identifier: Apache-2.0
+"""
+Helpers shared by the named-entity taggers
+"""
+from typing import List, Tuple
+
+
+def iob_to_html(sent_ner: List[Tuple[str, str]]) -> str:
+    """
+    Join words and their IOB tags into text with HTML-like entity tags.
+
+    :param list sent_ner: list of (word, IOB tag)
+    :return: text with the entities in HTML-like tags
+    :rtype: str
+
+    :Example:
+    ::
+
+        from pythainlp.tag._utils import iob_to_html
+
+        iob_to_html([("ไป", "O"), ("เชียง", "B-LOC"), ("ใหม่", "I-LOC")])
+        # output: 'ไป<LOC>เชียงใหม่</LOC>'
+    """
+    temp = ""
+    sent = ""
+    for idx, (word, ner) in enumerate(sent_ner):
+        if ner.startswith("B-") and temp != "":
+            sent += "</" + temp + ">"
+            temp = ner[2:]
+            sent += "<" + temp + ">"
+        elif ner.startswith("B-"):
+            temp = ner[2:]
+            sent += "<" + temp + ">"
+        elif ner == "O" and temp != "":
+            sent += "</" + temp + ">"
+            temp = ""
+        sent += word
+
+        if idx == len(sent_ner) - 1 and temp != "":
+            sent += "</" + temp + ">"
+
+    return sent
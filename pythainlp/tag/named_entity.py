@@ -18,6 +18,14 @@ class NER:
         * *thainer-v2* - Thai NER engine v2.0 for Thai NER 2.0 (default)
         * *thainer* - Thai NER engine
         * *tltk* - wrapper for `TLTK <https://pypi.org/project/tltk/>`_.
+        * *wangchanberta* - Thai NER engine powered by WangchanBERTa
+        * *phayathaibert* - Thai NER engine powered by PhayaThaiBERT \
+            (corpus *thainer-v2*)
+        * *thainer-v2-onnx*, *wangchanberta-onnx*, and \
+            *phayathaibert-onnx* - the same transformer-based engines, \
+            run with ONNX Runtime and int8-quantized weights \
+            (requires `optimum[onnxruntime]`). The model is exported \
+            to ONNX on first use and kept in the PyThaiNLP data directory.
 
     **Options for corpus**
         * *thainer* - Thai NER corpus (default)
@@ -31,13 +39,22 @@ class NER:
     def load_engine(self, engine: str, corpus: str) -> None:
         self.name_engine = engine
         self.engine = None
+        onnx = engine in (
+            "thainer-v2-onnx",
+            "wangchanberta-onnx",
+            "phayathaibert-onnx",
+        )
+        if onnx:
+            engine = engine[: -len("-onnx")]
         if engine == "thainer" and corpus == "thainer":
             from pythainlp.tag.thainer import ThaiNameTagger
 
             self.engine = ThaiNameTagger()
         elif engine == "thainer-v2" and corpus == "thainer":
             from pythainlp.wangchanberta import NamedEntityRecognition
-            self.engine = NamedEntityRecognition(model="pythainlp/thainer-corpus-v2-base-model")
+            self.engine = NamedEntityRecognition(
+                model="pythainlp/thainer-corpus-v2-base-model", onnx=onnx
+            )
         elif engine == "tltk":
             from pythainlp.tag import tltk
 
@@ -45,15 +62,15 @@ class NER:
         elif engine == "wangchanberta" and corpus == "thainer":
             from pythainlp.wangchanberta import ThaiNameTagger
 
-            self.engine = ThaiNameTagger(dataset_name=corpus)
+            self.engine = ThaiNameTagger(dataset_name=corpus, onnx=onnx)
         elif engine == "phayathaibert" and corpus == "thainer-v2":
             from pythainlp.phayathaibert.core import NamedEntityTagger
 
-            self.engine = NamedEntityTagger()
+            self.engine = NamedEntityTagger(onnx=onnx)
         else:
             raise ValueError(
                 "NER class not support {0} engine or {1} corpus.".format(
-                    engine, corpus
+                    self.name_engine, corpus
                 )
             )
 
@@ -94,6 +111,42 @@ class NER:
         """
         return self.engine.get_ner(text, tag=tag, pos=pos)
 
+    def tag_batch(
+        self,
+        texts: List[str],
+        pos: bool = False,
+        tag: bool = False,
+        batch_size: int = 8,
+    ) -> List[Union[List[Tuple[str, str]], List[Tuple[str, str, str]], str]]:
+        """
+        This function tags named entities in many texts in IOB format.
+
+        Transformer-based engines (*thainer-v2*, *wangchanberta*, and
+        *phayathaibert*) run the model on batches of texts, which is much
+        faster than calling :meth:`tag` for each text. Other engines tag
+        the texts one by one.
+
+        :param list texts: texts in Thai to be tagged
+        :param bool pos: output with part-of-speech tags.\
+            (wangchanberta is not supported)
+        :param bool tag: output HTML-like tags.
+        :param int batch_size: number of texts in a batch
+        :return: a list of outputs of :meth:`tag`, one for each text
+        :rtype: list[Union[List[Tuple[str, str]], List[Tuple[str, str, str]], str]]
+        :Example:
+
+            >>> from pythainlp.tag import NER
+            >>>
+            >>> ner = NER("thainer-v2")
+            >>> ner.tag_batch(["ทดสอบนายวรรณพงษ์", "ไปเชียงใหม่"], tag=True)
+            ['ทดสอบ<PERSON>นายวรรณพงษ์</PERSON>', 'ไป<LOCATION>เชียงใหม่</LOCATION>']
+        """
+        if hasattr(self.engine, "get_ner_batch"):
+            return self.engine.get_ner_batch(
+                texts, tag=tag, pos=pos, batch_size=batch_size
+            )
+        return [self.engine.get_ner(text, tag=tag, pos=pos) for text in texts]
+
 
 class NNER:
     """
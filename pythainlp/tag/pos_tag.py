@@ -3,7 +3,10 @@
 # SPDX-License-Identifier: Apache-2.0
 from typing import List, Tuple
 
+from pythainlp.tools import profiling
 
+
+@profiling.timed("tag.pos_tag", engine_arg="engine")
 def pos_tag(
     words: List[str], engine: str = "perceptron", corpus: str = "orchid"
 ) -> List[Tuple[str, str]]:
@@ -7,71 +7,93 @@ Named-entity recognizer
 
 __all__ = ["ThaiNameTagger"]
 
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from typing import Dict, List, Tuple, Union
 
 from pythainlp.corpus import get_corpus_path, thai_stopwords
 from pythainlp.tag import pos_tag
+from pythainlp.tag._utils import iob_to_html
 from pythainlp.tokenize import word_tokenize
+from pythainlp.tools import profiling
 from pythainlp.util import isthai
 
 _TOKENIZER_ENGINE = "mm"
 
+# ThaiNameTagger of each version, in a worker process of get_ner_batch
+_WORKER_TAGGERS = {}
+
 
 def _is_stopword(word: str) -> bool:  # เช็คว่าเป็นคำฟุ่มเฟือย
     return word in thai_stopwords()
 
 
-def _doc2features(doc, i) -> Dict:
-    word = doc[i][0]
-    postag = doc[i][1]
-
-    # Features from current word
-    features = {
-        "word.word": word,
-        "word.stopword": _is_stopword(word),
-        "word.isthai": isthai(word),
-        "word.isspace": word.isspace(),
-        "postag": postag,
-        "word.isdigit": word.isdigit(),
-    }
-    if word.isdigit() and len(word) == 5:
-        features["word.islen5"] = True
-
-    # Features from previous word
-    if i > 0:
-        prevword = doc[i - 1][0]
-        prevpostag = doc[i - 1][1]
-        prev_features = {
-            "word.prevword": prevword,
-            "word.previsspace": prevword.isspace(),
-            "word.previsthai": isthai(prevword),
-            "word.prevstopword": _is_stopword(prevword),
-            "word.prevpostag": prevpostag,
-            "word.prevwordisdigit": prevword.isdigit(),
-        }
-        features.update(prev_features)
-    else:
-        features["BOS"] = True  # Special "Beginning of Sequence" tag
-
-    # Features from next word
-    if i < len(doc) - 1:
-        nextword = doc[i + 1][0]
-        nextpostag = doc[i + 1][1]
-        next_features = {
-            "word.nextword": nextword,
-            "word.nextisspace": nextword.isspace(),
-            "word.nextpostag": nextpostag,
-            "word.nextisthai": isthai(nextword),
-            "word.nextstopword": _is_stopword(nextword),
-            "word.nextwordisdigit": nextword.isdigit(),
+@lru_cache(maxsize=65536)
+def _word_features(word: str) -> Tuple[bool, bool, bool, bool]:
+    # features of a word that do not depend on its context:
+    # stopword, isthai, isspace, isdigit
+    return (_is_stopword(word), isthai(word), word.isspace(), word.isdigit())
+
+
+def _extract_features(doc: List[Tuple[str, str]]) -> List[Dict]:
+    # features of each word are computed once, and reused
+    # as the previous and the next word of its neighbours
+    words = [
+        (word, postag) + _word_features(word) for word, postag in doc
+    ]
+    last = len(words) - 1
+    features = []
+    for i, (word, postag, stopword, thai, space, digit) in enumerate(words):
+        # Features from current word
+        word_features = {
+            "word.word": word,
+            "word.stopword": stopword,
+            "word.isthai": thai,
+            "word.isspace": space,
+            "postag": postag,
+            "word.isdigit": digit,
         }
-        features.update(next_features)
-    else:
-        features["EOS"] = True  # Special "End of Sequence" tag
+        if digit and len(word) == 5:
+            word_features["word.islen5"] = True
+
+        # Features from previous word
+        if i > 0:
+            prevword, prevpostag, stopword, thai, space, digit = words[i - 1]
+            word_features["word.prevword"] = prevword
+            word_features["word.previsspace"] = space
+            word_features["word.previsthai"] = thai
+            word_features["word.prevstopword"] = stopword
+            word_features["word.prevpostag"] = prevpostag
+            word_features["word.prevwordisdigit"] = digit
+        else:
+            word_features["BOS"] = True  # Special "Beginning of Sequence" tag
+
+        # Features from next word
+        if i < last:
+            nextword, nextpostag, stopword, thai, space, digit = words[i + 1]
+            word_features["word.nextword"] = nextword
+            word_features["word.nextisspace"] = space
+            word_features["word.nextpostag"] = nextpostag
+            word_features["word.nextisthai"] = thai
+            word_features["word.nextstopword"] = stopword
+            word_features["word.nextwordisdigit"] = digit
+        else:
+            word_features["EOS"] = True  # Special "End of Sequence" tag
+
+        features.append(word_features)
 
     return features
 
 
+def _get_ner_chunk(version: str, texts: list, pos: bool, tag: bool) -> list:
+    # run in a worker process, which loads the model once
+    if version not in _WORKER_TAGGERS:
+        _WORKER_TAGGERS[version] = ThaiNameTagger(version=version)
+    return _WORKER_TAGGERS[version].get_ner_batch(texts, pos=pos, tag=tag)
+
+
 class ThaiNameTagger:
     """
     Thai named-entity recognizer or Thai NER.
@@ -100,6 +122,11 @@ class ThaiNameTagger:
         from pycrfsuite import Tagger as CRFTagger
 
         self.crf = CRFTagger()
+        self.version = version
+        # worker processes of get_ner_batch, kept between calls
+        self._executor = None
+        self._executor_jobs = 0
+        self._executor_lock = threading.Lock()
 
         if version == "1.4":
             self.crf.open(get_corpus_path("thainer-1.4", version="1.4"))
@@ -163,44 +190,132 @@ class ThaiNameTagger:
             'วันที่ <DATE>15 ก.ย. 61</DATE> ทดสอบระบบเวลา <TIME>
             14:49 น.</TIME>'
         """
-        tokens = word_tokenize(text, engine=_TOKENIZER_ENGINE)
-        pos_tags = pos_tag(
-            tokens, engine="perceptron", corpus=self.pos_tag_name
-        )
-        x_test = ThaiNameTagger.__extract_features(pos_tags)
-        y = self.crf.tag(x_test)
-
-        sent_ner = [(pos_tags[i][0], data) for i, data in enumerate(y)]
-
-        if tag:
-            temp = ""
-            sent = ""
-            for idx, (word, ner) in enumerate(sent_ner):
-                if ner.startswith("B-") and temp != "":
-                    sent += "</" + temp + ">"
-                    temp = ner[2:]
-                    sent += "<" + temp + ">"
-                elif ner.startswith("B-"):
-                    temp = ner[2:]
-                    sent += "<" + temp + ">"
-                elif ner == "O" and temp != "":
-                    sent += "</" + temp + ">"
-                    temp = ""
-                sent += word
-
-                if idx == len(sent_ner) - 1 and temp != "":
-                    sent += "</" + temp + ">"
-
-            return sent
-
-        if pos:
-            return [
-                (pos_tags[i][0], pos_tags[i][1], data)
-                for i, data in enumerate(y)
-            ]
+        return self.get_ner_batch([text], pos=pos, tag=tag)[0]
+
+    def get_ner_batch(
+        self,
+        texts: List[Union[str, List[str], List[Tuple[str, str]]]],
+        pos: bool = True,
+        tag: bool = False,
+        n_jobs: int = 1,
+        batch_size: Union[int, None] = None,
+    ) -> List[
+        Union[List[Tuple[str, str]], List[Tuple[str, str, str]], str]
+    ]:
+        """
+        This function tags named-entities in many texts in IOB format.
 
-        return sent_ner
+        Each item of `texts` can be a text, a list of words that is
+        already tokenized, or a list of (word, POS tag) that is already
+        POS-tagged with the corpus of this version of Thai NER
+        (`orchid_ud` for 1.4 and `blackboard` for 1.5).
+        Already done steps are not run again.
 
-    @staticmethod
-    def __extract_features(doc):
-        return [_doc2features(doc, i) for i in range(len(doc))]
+        :param list texts: texts, lists of words,
+                           or lists of (word, POS tag)
+        :param bool pos: To include POS tags in the results (`True`) or
+                            exclude (`False`). The default value is `True`
+        :param bool tag: output HTML-like tags.
+        :param int n_jobs: number of worker processes, -1 to use all CPUs.
+                           The processes are started on the first call,
+                           each loads its own model, and they are kept
+                           for the next calls with the same `n_jobs`,
+                           until :meth:`close`.
+        :param int batch_size: number of texts sent to a worker process
+                               at a time (default: the texts are split
+                               evenly between the processes). The CRF
+                               model (pycrfsuite) has no batch API, so
+                               it tags one text at a time in any case.
+        :return: a list of outputs of :meth:`get_ner`, one for each item
+        :rtype: list[Union[list[tuple[str, str]], list[tuple[str, str, str]], str]]
+
+        :Example:
+        ::
+
+            from pythainlp.tag.thainer import ThaiNameTagger
+
+            ner = ThaiNameTagger(version="1.5")
+            ner.get_ner_batch(
+                [
+                    "วันที่ 15 ก.ย. 61 ทดสอบระบบเวลา 14:49 น.",
+                    ["ไป", "เชียงใหม่"],
+                    [("ไป", "VV"), ("เชียงใหม่", "NN")],
+                ],
+                pos=False,
+                n_jobs=2,
+            )
+        """
+        if n_jobs < 0:
+            n_jobs = os.cpu_count() or 1
+        if n_jobs > 1 and len(texts) > 1:
+            size = batch_size or -(-len(texts) // n_jobs)
+            chunks = [
+                texts[i : i + size] for i in range(0, len(texts), size)
+            ]
+            results = self._get_executor(n_jobs).map(
+                _get_ner_chunk,
+                [self.version] * len(chunks),
+                chunks,
+                [pos] * len(chunks),
+                [tag] * len(chunks),
+            )
+            return [ner for chunk in results for ner in chunk]
+
+        # the stages are timed only if profiling is enabled
+        extract_features = profiling.wrap(
+            _extract_features, "tag.thainer.features"
+        )
+        crf_tag = profiling.wrap(self.crf.tag, "tag.thainer.crf")
+
+        results = []
+        for text in texts:
+            if isinstance(text, str):
+                text = word_tokenize(text, engine=_TOKENIZER_ENGINE)
+            if text and isinstance(text[0], str):
+                pos_tags = pos_tag(
+                    text, engine="perceptron", corpus=self.pos_tag_name
+                )
+            else:
+                pos_tags = [tuple(word_pos) for word_pos in text]
+            y = crf_tag(extract_features(pos_tags))
+
+            if tag:
+                results.append(
+                    iob_to_html(
+                        [(pos_tags[i][0], data) for i, data in enumerate(y)]
+                    )
+                )
+            elif pos:
+                results.append(
+                    [
+                        (pos_tags[i][0], pos_tags[i][1], data)
+                        for i, data in enumerate(y)
+                    ]
+                )
+            else:
+                results.append(
+                    [(pos_tags[i][0], data) for i, data in enumerate(y)]
+                )
+
+        return results
+
+    def _get_executor(self, n_jobs: int) -> ProcessPoolExecutor:
+        # worker processes keep their model, so the pool is kept too
+        with self._executor_lock:
+            if self._executor is None or self._executor_jobs != n_jobs:
+                if self._executor is not None:
+                    self._executor.shutdown(wait=False)
+                self._executor = ProcessPoolExecutor(max_workers=n_jobs)
+                self._executor_jobs = n_jobs
+            return self._executor
+
+    def close(self) -> None:
+        """
+        Stop the worker processes of :meth:`get_ner_batch`, if any.
+        They are started again if needed.
+        """
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+                self._executor_jobs = 0
@@ -18,7 +18,7 @@ __all__ = [
     "word_tokenize",
 ]
 
-from pythainlp.corpus import thai_syllables, thai_words
+from pythainlp.corpus import get_derived, thai_syllables, thai_words
 from pythainlp.util.trie import Trie
 
 DEFAULT_WORD_TOKENIZE_ENGINE = "newmm"
@@ -26,9 +26,18 @@ DEFAULT_SENT_TOKENIZE_ENGINE = "crfcut"
 DEFAULT_SUBWORD_TOKENIZE_ENGINE = "tcc"
 DEFAULT_SYLLABLE_TOKENIZE_ENGINE = "han_solo"
 
-DEFAULT_WORD_DICT_TRIE = Trie(thai_words())
-DEFAULT_SYLLABLE_DICT_TRIE = Trie(thai_syllables())
-DEFAULT_DICT_TRIE = DEFAULT_WORD_DICT_TRIE
+
+# The default dictionaries are built on first use, and shared with
+# other modules through pythainlp.corpus.get_derived()
+def _get_word_dict_trie() -> Trie:
+    return get_derived("thai_words", "trie", lambda: Trie(thai_words()))
+
+
+def _get_syllable_dict_trie() -> Trie:
+    return get_derived(
+        "thai_syllables", "trie", lambda: Trie(thai_syllables())
+    )
+
 
 from pythainlp.tokenize.core import (
     Tokenizer,
@@ -43,6 +52,29 @@ from pythainlp.tokenize.core import (
 
 from pythainlp.corpus import get_corpus as _get_corpus
 
-THAI2FIT_TOKENIZER = Tokenizer(
-    custom_dict=_get_corpus("words_th_thai2fit_201810.txt"), engine="mm"
-)
+
+def _get_thai2fit_tokenizer() -> Tokenizer:
+    return get_derived(
+        "words_th_thai2fit_201810",
+        "tokenizer_mm",
+        lambda: Tokenizer(
+            custom_dict=_get_corpus("words_th_thai2fit_201810.txt"),
+            engine="mm",
+        ),
+    )
+
+
+_LAZY_ATTRIBUTES = {
+    "DEFAULT_WORD_DICT_TRIE": _get_word_dict_trie,
+    "DEFAULT_SYLLABLE_DICT_TRIE": _get_syllable_dict_trie,
+    "DEFAULT_DICT_TRIE": _get_word_dict_trie,
+    "THAI2FIT_TOKENIZER": _get_thai2fit_tokenizer,
+}
+
+
+def __getattr__(name: str):
+    # DEFAULT_WORD_DICT_TRIE, DEFAULT_SYLLABLE_DICT_TRIE,
+    # DEFAULT_DICT_TRIE, and THAI2FIT_TOKENIZER are built on first access
+    if name in _LAZY_ATTRIBUTES:
+        return _LAZY_ATTRIBUTES[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
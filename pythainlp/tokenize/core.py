@@ -10,16 +10,17 @@ from typing import Iterable, List, Union
 from pythainlp.tokenize import (
     DEFAULT_SENT_TOKENIZE_ENGINE,
     DEFAULT_SUBWORD_TOKENIZE_ENGINE,
-    DEFAULT_SYLLABLE_DICT_TRIE,
     DEFAULT_SYLLABLE_TOKENIZE_ENGINE,
-    DEFAULT_WORD_DICT_TRIE,
     DEFAULT_WORD_TOKENIZE_ENGINE,
+    _get_syllable_dict_trie,
+    _get_word_dict_trie,
 )
 from pythainlp.tokenize._utils import (
     apply_postprocessors,
     rejoin_formatted_num,
     strip_whitespace,
 )
+from pythainlp.tools import profiling
 from pythainlp.util.trie import Trie, dict_trie
 
 
@@ -114,6 +115,7 @@ def word_detokenize(
     return " ".join(text)
 
 
+@profiling.timed("tokenize.word_tokenize", engine_arg="engine")
 def word_tokenize(
     text: str,
     custom_dict: Trie = Trie([]),
@@ -312,7 +314,11 @@ def word_tokenize(
 
     postprocessors = []
     if join_broken_num:
-        postprocessors.append(rejoin_formatted_num)
+        postprocessors.append(
+            profiling.wrap(
+                rejoin_formatted_num, "tokenize.rejoin_formatted_num"
+            )
+        )
 
     if not keep_whitespace:
         postprocessors.append(strip_whitespace)
@@ -322,6 +328,7 @@ def word_tokenize(
     return segments
 
 
+@profiling.timed("tokenize.sent_tokenize", engine_arg="engine")
 def sent_tokenize(
     text: str,
     engine: str = DEFAULT_SENT_TOKENIZE_ENGINE,
@@ -507,6 +514,7 @@ def paragraph_tokenize(
     return segments
 
 
+@profiling.timed("tokenize.subword_tokenize", engine_arg="engine")
 def subword_tokenize(
     text: str,
     engine: str = DEFAULT_SUBWORD_TOKENIZE_ENGINE,
@@ -604,7 +612,7 @@ def subword_tokenize(
         for word in words:
             segments.extend(
                 word_tokenize(
-                    text=word, custom_dict=DEFAULT_SYLLABLE_DICT_TRIE
+                    text=word, custom_dict=_get_syllable_dict_trie()
                 )
             )
     elif engine == "ssg":
@@ -755,7 +763,7 @@ class Tokenizer:
         if custom_dict:
             self.__trie_dict = dict_trie(custom_dict)
         else:
-            self.__trie_dict = DEFAULT_WORD_DICT_TRIE
+            self.__trie_dict = _get_word_dict_trie()
         self.__engine = engine
         if self.__engine not in ["newmm", "mm", "longest", "deepcut"]:
             raise NotImplementedError(
@@ -4,7 +4,7 @@
 """
 Clause segmenter
 """
-from typing import List
+from typing import List, Tuple
 
 import pycrfsuite
 from pythainlp.tag import pos_tag
@@ -56,8 +56,12 @@ tagger = pycrfsuite.Tagger()
 tagger.open(path_pythainlp_corpus(_CORPUS_NAME))
 
 
-def segment(doc: List[str]) -> List[List[str]]:
-    word_tags = pos_tag(doc, corpus="blackboard")
+def segment(
+    doc: List[str], word_tags: List[Tuple[str, str]] = None
+) -> List[List[str]]:
+    # word_tags, if given, are POS tags of doc from the blackboard corpus
+    if word_tags is None:
+        word_tags = pos_tag(doc, corpus="blackboard")
     features = _extract_features(word_tags)
     word_markers = list(zip(doc, tagger.tag(features)))
 
@@ -14,7 +14,7 @@ import re
 from typing import List, Union
 
 from pythainlp import thai_tonemarks
-from pythainlp.tokenize import DEFAULT_WORD_DICT_TRIE
+from pythainlp.tokenize import _get_word_dict_trie
 from pythainlp.util import Trie
 
 _FRONT_DEP_CHAR = [
@@ -141,7 +141,7 @@ class LongestMatchTokenizer:
 
 
 def segment(
-    text: str, custom_dict: Trie = DEFAULT_WORD_DICT_TRIE
+    text: str, custom_dict: Trie = None
 ) -> List[str]:
     """
     Dictionary-based longest matching word segmentation.
@@ -154,6 +154,6 @@ def segment(
         return []
 
     if not custom_dict:
-        custom_dict = DEFAULT_WORD_DICT_TRIE
+        custom_dict = _get_word_dict_trie()
 
     return LongestMatchTokenizer(custom_dict).tokenize(text)
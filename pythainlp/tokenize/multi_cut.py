@@ -16,7 +16,7 @@ import re
 from collections import defaultdict
 from typing import Iterator, List
 
-from pythainlp.tokenize import DEFAULT_WORD_DICT_TRIE
+from pythainlp.tokenize import _get_word_dict_trie
 from pythainlp.util import Trie
 
 
@@ -47,11 +47,11 @@ _PAT_NONTHAI = re.compile(_RE_NONTHAI)
 
 
 def _multicut(
-    text: str, custom_dict: Trie = DEFAULT_WORD_DICT_TRIE
+    text: str, custom_dict: Trie = None
 ) -> Iterator[LatticeString]:
     """Return LatticeString"""
     if not custom_dict:
-        custom_dict = DEFAULT_WORD_DICT_TRIE
+        custom_dict = _get_word_dict_trie()
 
     len_text = len(text)
     words_at = defaultdict(list)  # main data structure
@@ -122,7 +122,7 @@ def _combine(ww: List[LatticeString]) -> Iterator[str]:
 
 
 def segment(
-    text: str, custom_dict: Trie = DEFAULT_WORD_DICT_TRIE
+    text: str, custom_dict: Trie = None
 ) -> List[str]:
     """Dictionary-based maximum matching word segmentation.
 
@@ -141,7 +141,7 @@ def segment(
 
 
 def find_all_segment(
-    text: str, custom_dict: Trie = DEFAULT_WORD_DICT_TRIE
+    text: str, custom_dict: Trie = None
 ) -> List[str]:
     """Get all possible segment variations.
 
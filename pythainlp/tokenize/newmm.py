@@ -19,7 +19,8 @@ from collections import defaultdict
 from heapq import heappop, heappush
 from typing import Generator, List
 
-from pythainlp.tokenize import DEFAULT_WORD_DICT_TRIE
+from pythainlp.tokenize import _get_word_dict_trie
+from pythainlp.tools import profiling
 from pythainlp.util import Trie
 
 from pythainlp.tokenize.tcc_p import tcc_pos
@@ -68,7 +69,17 @@ def _bfs_paths_graph(
                 queue.append((pos, path + [pos]))
 
 
+def _first_path(graph: defaultdict, start: int, goal: int) -> List[int]:
+    return next(_bfs_paths_graph(graph, start, goal))
+
+
 def _onecut(text: str, custom_dict: Trie) -> Generator[str, None, None]:
+    # the stages are timed only if profiling is enabled
+    prefixes = profiling.wrap(
+        custom_dict.prefixes, "tokenize.newmm.trie_prefixes"
+    )
+    first_path = profiling.wrap(_first_path, "tokenize.newmm.bfs")
+
     # main data structure:
     # - key is beginning position (int)
     # - value is possible ending positions (List[int])
@@ -77,14 +88,15 @@ def _onecut(text: str, custom_dict: Trie) -> Generator[str, None, None]:
 
     graph_size = 0  # keep track of graph size, if too big, force cutoff
 
-    valid_poss = tcc_pos(text)  # breaking positions that are TCC-valid
+    # breaking positions that are TCC-valid
+    valid_poss = profiling.wrap(tcc_pos, "tokenize.newmm.tcc_pos")(text)
 
     len_text = len(text)
     pos_list = [0]  # priority queue of possible breaking positions
     end_pos = 0
     while pos_list[0] < len_text:
         begin_pos = heappop(pos_list)
-        for word in custom_dict.prefixes(text[begin_pos:]):
+        for word in prefixes(text[begin_pos:]):
             end_pos_candidate = begin_pos + len(word)
             if end_pos_candidate in valid_poss:
                 graph[begin_pos].append(end_pos_candidate)
@@ -98,9 +110,7 @@ def _onecut(text: str, custom_dict: Trie) -> Generator[str, None, None]:
 
         len_pos_list = len(pos_list)
         if len_pos_list == 1:  # one candidate, no longer ambiguous
-            end_pos_candidates = next(
-                _bfs_paths_graph(graph, end_pos, pos_list[0])
-            )
+            end_pos_candidates = first_path(graph, end_pos, pos_list[0])
             graph_size = 0
             for pos in end_pos_candidates[1:]:
                 yield text[end_pos:pos]
@@ -115,7 +125,7 @@ def _onecut(text: str, custom_dict: Trie) -> Generator[str, None, None]:
                         prefix = text[pos:]
                         words = [
                             word
-                            for word in custom_dict.prefixes(prefix)
+                            for word in prefixes(prefix)
                             if (
                                 (pos + len(word) in valid_poss)
                                 and not _PAT_THAI_TWOCHARS.match(word)
@@ -140,7 +150,7 @@ def _onecut(text: str, custom_dict: Trie) -> Generator[str, None, None]:
 
 def segment(
     text: str,
-    custom_dict: Trie = DEFAULT_WORD_DICT_TRIE,
+    custom_dict: Trie = None,
     safe_mode: bool = False,
 ) -> List[str]:
     """Maximal-matching word segmentation constrained by Thai Character Cluster.
@@ -165,7 +175,7 @@ def segment(
         return []
 
     if not custom_dict:
-        custom_dict = DEFAULT_WORD_DICT_TRIE
+        custom_dict = _get_word_dict_trie()
 
     if not safe_mode or len(text) < _TEXT_SCAN_END:
         return list(_onecut(text, custom_dict))
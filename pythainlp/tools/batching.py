@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2016-2024 PyThaiNLP Project
+# SPDX-License-Identifier: Apache-2.0
+"""
+Micro-batching of concurrent requests
+
+Items submitted from many threads within a small time window are
+grouped into one call of a batch function, e.g.
+:meth:`pythainlp.tag.NER.tag_batch`, which is much faster than
+processing the items one by one.
+"""
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Union
+
+_LATENCY_SAMPLES = 10000
+
+
+def _percentile(values: List[float], q: float) -> float:
+    # nearest-rank percentile of sorted values
+    if not values:
+        return 0.0
+    rank = min(len(values) - 1, max(0, int(round(q * len(values))) - 1))
+    return values[rank]
+
+
+class MicroBatcher:
+    """
+    Group items submitted concurrently into batches.
+
+    A worker thread waits for the first item, then collects more items
+    for up to `max_wait` seconds or until `max_batch_size` items are
+    collected, and calls `func` with the list of items. `func` must
+    return a list of results, one for each item, in the same order.
+
+    :param Callable func: batch function, list of items -> list of results
+    :param int max_batch_size: maximum number of items in a batch
+    :param float max_wait: maximum time, in seconds, that the first item
+                           of a batch waits for more items
+
+    :Example:
+    ::
+
+        from pythainlp.tag import NER
+        from pythainlp.tools.batching import MicroBatcher
+
+        ner = NER("thainer")
+        batcher = MicroBatcher(ner.tag_batch, max_batch_size=32)
+
+        # from many threads
+        future = batcher.submit("ไปเชียงใหม่")
+        future.result()
+        # output: [('ไป', 'O'), ('เชียงใหม่', 'B-LOCATION')]
+
+        batcher.stats()
+        # output: {'requests': 1, 'batches': 1, ...}
+    """
+
+    def __init__(
+        self,
+        func: Callable[[list], list],
+        max_batch_size: int = 32,
+        max_wait: float = 0.005,
+    ) -> None:
+        self.func = func
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max_wait
+        self._queue = deque()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._started = time.perf_counter()
+        self._requests = 0
+        self._batches = 0
+        self._errors = 0
+        self._latencies = deque(maxlen=_LATENCY_SAMPLES)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, item) -> Future:
+        """
+        Submit an item.
+
+        :param item: item, passed to `func` in a batch
+        :return: future of the result of the item
+        :rtype: concurrent.futures.Future
+        """
+        future = Future()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("MicroBatcher is closed.")
+            self._queue.append((item, future, time.perf_counter()))
+            self._cond.notify()
+        return future
+
+    def __call__(self, item):
+        """Submit an item and wait for its result."""
+        return self.submit(item).result()
+
+    def close(self) -> None:
+        """Process the submitted items, then stop the worker thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+
+    def _next_batch(self) -> list:
+        with self._cond:
+            while not self._queue and not self._closed:
+                self._cond.wait()
+            if not self._queue:
+                return []
+            deadline = time.perf_counter() + self.max_wait
+            while len(self._queue) < self.max_batch_size and not self._closed:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            size = min(len(self._queue), self.max_batch_size)
+            return [self._queue.popleft() for _ in range(size)]
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if not batch:
+                return
+            try:
+                results = self._call([item for item, _, _ in batch])
+            except Exception as e:
+                if len(batch) == 1:
+                    self._finish(batch, error=e)
+                    continue
+                # process the items one by one, so that an invalid item
+                # fails only its own request
+                for entry in batch:
+                    self._finish([entry])
+                continue
+            self._finish(batch, results=results)
+
+    def _call(self, items: list) -> list:
+        results = self.func(items)
+        if len(results) != len(items):
+            raise ValueError(
+                f"Batch function returned {len(results)} results "
+                f"for {len(items)} items."
+            )
+        return results
+
+    def _finish(
+        self,
+        batch: list,
+        results: Union[list, None] = None,
+        error: Union[Exception, None] = None,
+    ) -> None:
+        # set the results (or the error) of a batch,
+        # calling func first if there are neither
+        if results is None and error is None:
+            try:
+                results = self._call([item for item, _, _ in batch])
+            except Exception as e:
+                error = e
+        now = time.perf_counter()
+        with self._cond:
+            self._batches += 1
+            if error is None:
+                self._requests += len(batch)
+                self._latencies.extend(now - start for _, _, start in batch)
+            else:
+                self._errors += len(batch)
+        if error is not None:
+            for _, future, _ in batch:
+                future.set_exception(error)
+        else:
+            for (_, future, _), result in zip(batch, results):
+                future.set_result(result)
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        """
+        Statistics of the processed items.
+
+        :return: a dictionary of *requests* (items processed), *errors*,
+                 *batches*, *mean_batch_size*, *throughput* (items per
+                 second since the batcher was created), *queued*,
+                 and *latency_p50_ms*, *latency_p99_ms*
+                 (over the last 10,000 items)
+        :rtype: dict[str, Union[int, float]]
+        """
+        with self._cond:
+            requests = self._requests
+            batches = self._batches
+            errors = self._errors
+            queued = len(self._queue)
+            latencies = sorted(self._latencies)
+        elapsed = time.perf_counter() - self._started
+        return {
+            "requests": requests,
+            "errors": errors,
+            "batches": batches,
+            "mean_batch_size": (
+                (requests + errors) / batches if batches else 0.0
+            ),
+            "throughput": requests / elapsed if elapsed > 0 else 0.0,
+            "queued": queued,
+            "latency_p50_ms": _percentile(latencies, 0.50) * 1000,
+            "latency_p99_ms": _percentile(latencies, 0.99) * 1000,
+        }
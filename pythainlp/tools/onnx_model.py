@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2016-2024 PyThaiNLP Project
+# SPDX-License-Identifier: Apache-2.0
+"""
+Export HuggingFace transformers models to ONNX Runtime
+
+The exported (and optionally int8-quantized) models are kept in
+the PyThaiNLP data directory, so a model is converted only once.
+"""
+import atexit
+import hashlib
+import json
+import os
+import platform
+import re
+import shutil
+import tempfile
+import threading
+from typing import List, Union
+
+from pythainlp.tools.path import _set_shared_mode, get_full_data_path
+
+_CHECK_MODE = os.getenv("PYTHAINLP_READ_MODE")
+_ONNX_DIR = "onnx"
+_SOURCE_FILENAME = "source.json"
+_ORT_CLASSES = {
+    "token-classification": "ORTModelForTokenClassification",
+    "question-answering": "ORTModelForQuestionAnswering",
+}
+
+# directory of models exported in read-only mode, removed at exit
+_tmp_dir = None
+_tmp_dir_lock = threading.Lock()
+
+
+def get_onnx_path(
+    model: str,
+    subfolder: str = "",
+    revision: str = None,
+    quantize: bool = True,
+) -> str:
+    """
+    Get the path of the directory of an exported ONNX model.
+
+    :param str model: model name on HuggingFace Hub or a local path
+    :param str subfolder: subfolder of the model
+    :param str revision: revision of the model
+    :param bool quantize: int8-quantized model
+    :return: full path of the directory
+    :rtype: str
+    """
+    name = _onnx_dirname(model, subfolder, revision)
+    if quantize:
+        name += "-int8"
+    return get_full_data_path(os.path.join(_ONNX_DIR, name))
+
+
+def _onnx_dirname(model: str, subfolder: str, revision: str) -> str:
+    # a readable name, made unique by a hash of the original model id,
+    # as the sanitized names of e.g. "a/b" and "a_b" are the same
+    name = "/".join(part for part in (model, subfolder, revision) if part)
+    digest = hashlib.md5(
+        "\n".join((model, subfolder or "", revision or "")).encode("utf-8")
+    ).hexdigest()[:8]
+    return re.sub(r"[^\w.-]+", "_", name).strip("_") + "-" + digest
+
+
+def _source_signature(model: str, subfolder: str) -> Union[List[list], None]:
+    # files of a local model, with their sizes and modification times,
+    # so a changed model is exported again; None for a model on the Hub
+    root = os.path.join(model, subfolder) if subfolder else model
+    if not os.path.isdir(root):
+        return None
+    signature = []
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            file_path = os.path.join(dirpath, filename)
+            stat = os.stat(file_path)
+            signature.append(
+                [
+                    os.path.relpath(file_path, root),
+                    stat.st_size,
+                    stat.st_mtime_ns,
+                ]
+            )
+    return sorted(signature)
+
+
+def _is_exported(path: str, file_name: str, signature) -> bool:
+    if not os.path.exists(os.path.join(path, file_name)):
+        return False
+    if signature is None:
+        return True
+    source_path = os.path.join(path, _SOURCE_FILENAME)
+    if not os.path.exists(source_path):
+        return False
+    with open(source_path, encoding="utf-8") as f:
+        return json.load(f) == signature
+
+
+def _get_tmp_dir() -> str:
+    # one temporary directory per process, for read-only mode
+    global _tmp_dir
+    with _tmp_dir_lock:
+        if _tmp_dir is None:
+            _tmp_dir = tempfile.mkdtemp(prefix="pythainlp-onnx-")
+            atexit.register(shutil.rmtree, _tmp_dir, ignore_errors=True)
+    return _tmp_dir
+
+
+def _export(
+    ort_class,
+    model: str,
+    subfolder: str,
+    revision: str,
+    quantize: bool,
+    path: str,
+    signature: Union[List[list], None] = None,
+) -> None:
+    from optimum.onnxruntime import ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+
+    ort_model = ort_class.from_pretrained(
+        model,
+        subfolder=subfolder,
+        revision=revision,
+        export=True,
+    )
+    ort_model.save_pretrained(path)
+    if quantize:
+        # dynamic quantization, the scales of activations are computed
+        # at run time, so no calibration data is needed
+        if platform.machine().lower() in ("arm64", "aarch64"):
+            qconfig = AutoQuantizationConfig.arm64(is_static=False)
+        else:
+            qconfig = AutoQuantizationConfig.avx2(is_static=False)
+        quantizer = ORTQuantizer.from_pretrained(ort_model)
+        quantizer.quantize(save_dir=path, quantization_config=qconfig)
+    if signature is not None:
+        with open(
+            os.path.join(path, _SOURCE_FILENAME), "w", encoding="utf-8"
+        ) as f:
+            json.dump(signature, f)
+
+
+def load_onnx_model(
+    model: str,
+    task: str = "token-classification",
+    subfolder: str = "",
+    revision: str = None,
+    quantize: bool = True,
+    provider: str = "CPUExecutionProvider",
+):
+    """
+    Load a HuggingFace transformers model with ONNX Runtime.
+
+    The model is exported to ONNX (and quantized to int8 weights with
+    dynamic quantization, if `quantize` is `True`) on first use, and the
+    exported model is kept in the PyThaiNLP data directory. A model
+    from a local path is exported again when any of its files changes.
+    In read-only mode (:envvar:`PYTHAINLP_READ_MODE` = 1), a model that
+    was not exported before is exported to a temporary directory,
+    which is shared by the process and removed when it exits.
+
+    The returned model can be called like a PyTorch model and used in
+    transformers pipelines. It requires `optimum[onnxruntime]`.
+
+    :param str model: model name on HuggingFace Hub or a local path
+    :param str task: *token-classification* (default) or
+                     *question-answering*
+    :param str subfolder: subfolder of the model
+    :param str revision: revision of the model
+    :param bool quantize: use int8-quantized weights
+    :param str provider: ONNX Runtime execution provider
+    :return: ONNX Runtime model
+    :rtype: optimum.onnxruntime.ORTModel
+
+    :Example:
+    ::
+
+        from transformers import AutoTokenizer
+        from pythainlp.tools.onnx_model import load_onnx_model
+
+        name = "pythainlp/thainer-corpus-v2-base-model"
+        tokenizer = AutoTokenizer.from_pretrained(name)
+        model = load_onnx_model(name)
+
+        outputs = model(**tokenizer(["ทดสอบ"], return_tensors="pt"))
+        # outputs.logits has shape (1, number of tokens, number of labels)
+    """
+    if task not in _ORT_CLASSES:
+        raise ValueError(
+            f"""Task '{task}' is not supported.
+            It must be one of {list(_ORT_CLASSES)}."""
+        )
+    try:
+        import optimum.onnxruntime as ort
+    except ImportError:
+        raise ImportError(
+            "Not found optimum! Please install optimum by "
+            "pip install optimum[onnxruntime]"
+        )
+    ort_class = getattr(ort, _ORT_CLASSES[task])
+    file_name = "model_quantized.onnx" if quantize else "model.onnx"
+
+    path = get_onnx_path(model, subfolder, revision, quantize)
+    signature = _source_signature(model, subfolder)
+    if not _is_exported(path, file_name, signature):
+        if _CHECK_MODE == "1":
+            path = os.path.join(_get_tmp_dir(), os.path.basename(path))
+            if not _is_exported(path, file_name, signature):
+                shutil.rmtree(path, ignore_errors=True)
+                _export(
+                    ort_class,
+                    model,
+                    subfolder,
+                    revision,
+                    quantize,
+                    path,
+                    signature,
+                )
+        else:
+            # export to a temporary directory next to the final one,
+            # so an interrupted export leaves no partial model behind
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = tempfile.mkdtemp(dir=os.path.dirname(path))
+            try:
+                _export(
+                    ort_class,
+                    model,
+                    subfolder,
+                    revision,
+                    quantize,
+                    tmp_path,
+                    signature,
+                )
+                _set_shared_mode(tmp_path, path)
+                shutil.rmtree(path, ignore_errors=True)
+                os.rename(tmp_path, path)
+            finally:
+                shutil.rmtree(tmp_path, ignore_errors=True)
+
+    return ort_class.from_pretrained(
+        path, file_name=file_name, provider=provider
+    )
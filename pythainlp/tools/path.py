@@ -7,11 +7,16 @@ PyThaiNLP data tools
 For text processing and text conversion, see pythainlp.util
 """
 import os
+import stat
 
 from pythainlp import __file__ as pythainlp_file
 
 PYTHAINLP_DEFAULT_DATA_DIR = "pythainlp-data"
 
+# umask of the process, read once as it can only be read by setting it
+_UMASK = os.umask(0o022)
+os.umask(_UMASK)
+
 
 def get_full_data_path(path: str) -> str:
     """
@@ -75,3 +80,20 @@ def get_pythainlp_path() -> str:
         # output: '/usr/local/lib/python3.6/dist-packages/pythainlp'
     """
     return os.path.dirname(pythainlp_file)
+
+
+def _set_shared_mode(tmp_path: str, path: str) -> None:
+    """
+    Give a file or directory made by :mod:`tempfile` (mode 0600 or 0700)
+    the mode of the file it replaces, or else the mode of a new file,
+    before it is renamed to `path`, so that other users of a shared data
+    directory can still read it.
+
+    @param: tmp_path temporary file or directory
+    @param: path file or directory that `tmp_path` is renamed to
+    """
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = (0o777 if os.path.isdir(tmp_path) else 0o666) & ~_UMASK
+    os.chmod(tmp_path, mode)
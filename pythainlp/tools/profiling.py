@@ -0,0 +1,274 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2016-2024 PyThaiNLP Project
+# SPDX-License-Identifier: Apache-2.0
+"""
+Opt-in timing of the stages of PyThaiNLP engines
+
+The wall time and the number of calls of each stage, e.g. the whole
+:func:`pythainlp.tokenize.word_tokenize` call with an engine, or the
+TCC and dictionary lookups inside *newmm*, are recorded while
+profiling is enabled, by :func:`profile` or by the environment
+variable :envvar:`PYTHAINLP_PROFILE` = 1.
+
+When profiling is disabled, a timed function costs one check of a
+flag per call, and the stages inside loops are not wrapped at all.
+"""
+import inspect
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+from typing import Callable, Dict, Iterator, Union
+
+_enabled = os.getenv("PYTHAINLP_PROFILE") == "1"
+# stage name: [calls, seconds]
+_stats = {}
+_lock = threading.Lock()
+_NULL_STAGE = nullcontext()
+
+
+def is_enabled() -> bool:
+    """Whether profiling is enabled."""
+    return _enabled
+
+
+def enable() -> None:
+    """Enable profiling, in every thread."""
+    global _enabled
+    _enabled = True
+
+
+def disable() -> None:
+    """Disable profiling."""
+    global _enabled
+    _enabled = False
+
+
+def reset() -> None:
+    """Remove the recorded statistics."""
+    with _lock:
+        _stats.clear()
+
+
+def _record(name: str, seconds: float) -> None:
+    with _lock:
+        entry = _stats.get(name)
+        if entry is None:
+            _stats[name] = [1, seconds]
+        else:
+            entry[0] += 1
+            entry[1] += seconds
+
+
+def _stage_name(name: str, engine) -> str:
+    return name if engine is None else f"{name}.{engine}"
+
+
+class _Stage:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc) -> None:
+        _record(self.name, time.perf_counter() - self.start)
+
+
+def stage(name: str, engine: Union[str, None] = None):
+    """
+    Context manager that times a stage, if profiling is enabled.
+
+    :param str name: name of the stage, e.g. *tokenize.newmm.tcc_pos*
+    :param str engine: engine, appended to the name of the stage
+
+    :Example:
+    ::
+
+        from pythainlp.tools import profiling
+
+        with profiling.stage("mymodule.cleaning"):
+            ...
+    """
+    if not _enabled:
+        return _NULL_STAGE
+    return _Stage(_stage_name(name, engine))
+
+
+def timed(name: str, engine_arg: Union[str, None] = None) -> Callable:
+    """
+    Decorator that times every call of a function,
+    if profiling is enabled.
+
+    :param str name: name of the stage
+    :param str engine_arg: name of the argument of the function
+                           that is the engine, appended to the name
+                           of the stage, e.g. *engine*
+    """
+
+    def decorator(func: Callable) -> Callable:
+        index = default = None
+        if engine_arg is not None:
+            parameters = list(inspect.signature(func).parameters.values())
+            index = [p.name for p in parameters].index(engine_arg)
+            default = parameters[index].default
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            engine = None
+            if engine_arg is not None:
+                if engine_arg in kwargs:
+                    engine = kwargs[engine_arg]
+                elif len(args) > index:
+                    engine = args[index]
+                else:
+                    engine = default
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _record(
+                    _stage_name(name, engine), time.perf_counter() - start
+                )
+
+        return wrapper
+
+    return decorator
+
+
+def wrap(func: Callable, name: str) -> Callable:
+    """
+    Get a timed version of a function if profiling is enabled,
+    or the function itself.
+
+    For functions called in a loop, e.g. a dictionary lookup for each
+    character, get the function once, before the loop, so that the
+    loop does not pay for the check when profiling is disabled.
+
+    :param Callable func: function
+    :param str name: name of the stage
+    :return: `func`, timed if profiling is enabled
+    :rtype: Callable
+    """
+    if not _enabled:
+        return func
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _record(name, time.perf_counter() - start)
+
+    return wrapper
+
+
+def get_stats() -> Dict[str, Dict[str, Union[int, float]]]:
+    """
+    Statistics of the stages.
+
+    Times of nested stages are included in the times of their outer
+    stages, e.g. *tokenize.newmm.tcc_pos* in
+    *tokenize.word_tokenize.newmm*.
+
+    :return: a dictionary of stage name to *calls* and *seconds*
+             (total wall time)
+    :rtype: dict[str, dict[str, Union[int, float]]]
+    """
+    with _lock:
+        return {
+            name: {"calls": calls, "seconds": seconds}
+            for name, (calls, seconds) in sorted(_stats.items())
+        }
+
+
+@contextmanager
+def profile() -> Iterator[Dict[str, Dict[str, Union[int, float]]]]:
+    """
+    Enable profiling within a block, and get the statistics of
+    the stages that ran in the block.
+
+    Profiling is enabled for every thread, so the statistics include
+    the stages that other threads run during the block.
+
+    :return: a dictionary, filled at the end of the block with the
+             statistics of :func:`get_stats` recorded during the block
+
+    :Example:
+    ::
+
+        from pythainlp.tokenize import word_tokenize
+        from pythainlp.tools.profiling import profile, to_openmetrics
+
+        with profile() as stats:
+            word_tokenize("ฉันรักภาษาไทยเพราะฉันเป็นคนไทย")
+
+        stats
+        # output:
+        # {'tokenize.newmm.bfs': {'calls': 2, 'seconds': 1.1e-05},
+        #  'tokenize.newmm.tcc_pos': {'calls': 1, 'seconds': 4.6e-05},
+        #  'tokenize.newmm.trie_prefixes': {'calls': 9, 'seconds': ...},
+        #  'tokenize.rejoin_formatted_num': {'calls': 1, ...},
+        #  'tokenize.word_tokenize.newmm': {'calls': 1, ...}}
+
+        print(to_openmetrics(stats))
+    """
+    global _enabled
+    before = get_stats()
+    previous = _enabled
+    _enabled = True
+    result = {}
+    try:
+        yield result
+    finally:
+        _enabled = previous
+        for name, after in get_stats().items():
+            start = before.get(name, {"calls": 0, "seconds": 0.0})
+            if after["calls"] > start["calls"]:
+                result[name] = {
+                    "calls": after["calls"] - start["calls"],
+                    "seconds": after["seconds"] - start["seconds"],
+                }
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def to_openmetrics(
+    stats: Union[Dict[str, Dict[str, Union[int, float]]], None] = None,
+    prefix: str = "pythainlp",
+) -> str:
+    """
+    Format the statistics of the stages in the OpenMetrics
+    (Prometheus) text format.
+
+    :param dict stats: statistics from :func:`get_stats` or
+                       :func:`profile` (default: :func:`get_stats`)
+    :param str prefix: prefix of the metric names
+    :return: two counters, `<prefix>_stage_seconds` and
+             `<prefix>_stage_calls`, with a `stage` label
+    :rtype: str
+    """
+    if stats is None:
+        stats = get_stats()
+    lines = []
+    for metric, key, help_text in (
+        ("stage_seconds", "seconds", "Wall time of the stage, in seconds."),
+        ("stage_calls", "calls", "Number of calls of the stage."),
+    ):
+        metric = f"{prefix}_{metric}"
+        lines.append(f"# TYPE {metric} counter")
+        lines.append(f"# HELP {metric} {help_text}")
+        for name, values in stats.items():
+            lines.append(
+                f'{metric}_total{{stage="{_escape(name)}"}} {values[key]}'
+            )
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
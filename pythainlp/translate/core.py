@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # SPDX-FileCopyrightText: 2016-2024 PyThaiNLP Project
 # SPDX-License-Identifier: Apache-2.0
+from typing import List
 
 
 class Translate:
@@ -89,3 +90,24 @@ class Translate:
         if self.engine == "small100":
             return self.model.translate(text, tgt_lang=self.target_lang)
         return self.model.translate(text)
+
+    def translate_batch(self, texts: List[str]) -> List[str]:
+        """
+        Translate many texts, running the model on them in one batch
+
+        :param list texts: input texts in source language
+        :return: translated texts in target language, one for each text
+        :rtype: list[str]
+
+        :Example:
+        ::
+
+            from pythainlp.translate import Translate
+            th2en = Translate('th', 'en')
+
+            th2en.translate_batch(["ฉันรักแมว", "ฉันรักหมา"])
+            # output: ['I love cat.', 'I love dog.']
+        """
+        if self.engine == "small100":
+            return self.model.translate_batch(texts, tgt_lang=self.target_lang)
+        return self.model.translate_batch(texts)
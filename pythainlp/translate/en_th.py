@@ -9,6 +9,7 @@ from VISTEC-depa Thailand Artificial Intelligence Research Institute
 Website: https://airesearch.in.th/releases/machine-translation-models/
 """
 import os
+from typing import List
 
 from fairseq.models.transformer import TransformerModel
 from sacremoses import MosesTokenizer
@@ -95,9 +96,23 @@ class EnThTranslator:
             # output: ฉันรักแมว
 
         """
-        tokens = " ".join(self._tokenizer.tokenize(text))
-        translated = self._model.translate(tokens)
-        return translated.replace(" ", "").replace("▁", " ").strip()
+        return self.translate_batch([text])[0]
+
+    def translate_batch(self, texts: List[str]) -> List[str]:
+        """
+        Translate many texts from English to Thai, in one batch
+
+        :param list texts: input texts in source language
+        :return: translated texts in target language
+        :rtype: list[str]
+        """
+        if not texts:
+            return []
+        tokens = [" ".join(self._tokenizer.tokenize(text)) for text in texts]
+        return [
+            translated.replace(" ", "").replace("▁", " ").strip()
+            for translated in self._model.translate(tokens)
+        ]
 
 
 class ThEnTranslator:
@@ -159,3 +174,15 @@ class ThEnTranslator:
 
         """
         return self._model.translate(text)
+
+    def translate_batch(self, texts: List[str]) -> List[str]:
+        """
+        Translate many texts from Thai to English, in one batch
+
+        :param list texts: input texts in source language
+        :return: translated texts in target language
+        :rtype: list[str]
+        """
+        if not texts:
+            return []
+        return self._model.translate(texts)
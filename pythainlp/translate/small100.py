@@ -1,3 +1,5 @@
+from typing import List
+
 from transformers import M2M100ForConditionalGeneration
 from .tokenization_small100 import SMALL100Tokenizer
 
@@ -18,10 +20,11 @@ class Small100Translator:
         self.pretrained = pretrained
         self.model = M2M100ForConditionalGeneration.from_pretrained(self.pretrained)
         self.tgt_lang = None
+        self._tokenizers = {}
         if use_gpu:
             self.model = self.model.cuda()
 
-    def translate(self, text: str, tgt_lang: str="en") -> str:
+    def translate(self, text: str, tgt_lang: str = "en") -> str:
         """
         Translate text from X to X
 
@@ -51,10 +54,29 @@ class Small100Translator:
             # output: 'Test du système'
 
         """
-        if tgt_lang!=self.tgt_lang:
-            self.tokenizer = SMALL100Tokenizer.from_pretrained(self.pretrained, tgt_lang=tgt_lang)
-            self.tgt_lang = tgt_lang
-        self.translated = self.model.generate(
-            **self.tokenizer(text, return_tensors="pt")
+        return self.translate_batch([text], tgt_lang=tgt_lang)[0]
+
+    def translate_batch(
+        self, texts: List[str], tgt_lang: str = "en"
+    ) -> List[str]:
+        """
+        Translate many texts from X to X, in one batch
+
+        :param list texts: input texts in source language
+        :param str tgt_lang: target language
+        :return: translated texts in target language
+        :rtype: list[str]
+        """
+        if not texts:
+            return []
+        # a tokenizer for each target language, instead of replacing
+        # a shared one, so concurrent calls do not affect each other
+        if tgt_lang not in self._tokenizers:
+            self._tokenizers[tgt_lang] = SMALL100Tokenizer.from_pretrained(
+                self.pretrained, tgt_lang=tgt_lang
+            )
+        tokenizer = self._tokenizers[tgt_lang]
+        translated = self.model.generate(
+            **tokenizer(texts, return_tensors="pt", padding=True)
         )
-        return self.tokenizer.batch_decode(self.translated, skip_special_tokens=True)[0]
+        return tokenizer.batch_decode(translated, skip_special_tokens=True)
@@ -12,6 +12,8 @@ BLEU 20.4
 
 - Huggingface https://huggingface.co/Helsinki-NLP/opus-mt-th-fr
 """
+from typing import List
+
 from transformers import AutoTokenizer, AutoModelForSeq2SeqLM
 
 
@@ -60,10 +62,22 @@ class ThFrTranslator:
             # output: "Test du système."
 
         """
-        self.translated = self.model_thzh.generate(
-            **self.tokenizer_thzh(text, return_tensors="pt", padding=True)
+        return self.translate_batch([text])[0]
+
+    def translate_batch(self, texts: List[str]) -> List[str]:
+        """
+        Translate many texts from Thai to French, in one batch
+
+        :param list texts: input texts in source language
+        :return: translated texts in target language
+        :rtype: list[str]
+        """
+        if not texts:
+            return []
+        translated = self.model_thzh.generate(
+            **self.tokenizer_thzh(texts, return_tensors="pt", padding=True)
         )
         return [
             self.tokenizer_thzh.decode(t, skip_special_tokens=True)
-            for t in self.translated
-        ][0]
+            for t in translated
+        ]
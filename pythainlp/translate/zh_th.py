@@ -9,6 +9,8 @@ from AI builder
 - GitHub: https://github.com/LalitaDeelert/lalita-mt-zhth
 - Facebook post https://web.facebook.com/aibuildersx/posts/166736255494822
 """
+from typing import List
+
 from transformers import AutoTokenizer, AutoModelForSeq2SeqLM
 
 
@@ -54,13 +56,25 @@ class ThZhTranslator:
             # output: 我爱你
 
         """
-        self.translated = self.model_thzh.generate(
-            **self.tokenizer_thzh(text, return_tensors="pt", padding=True)
+        return self.translate_batch([text])[0]
+
+    def translate_batch(self, texts: List[str]) -> List[str]:
+        """
+        Translate many texts from Thai to Chinese, in one batch
+
+        :param list texts: input texts in source language
+        :return: translated texts in target language
+        :rtype: list[str]
+        """
+        if not texts:
+            return []
+        translated = self.model_thzh.generate(
+            **self.tokenizer_thzh(texts, return_tensors="pt", padding=True)
         )
         return [
             self.tokenizer_thzh.decode(t, skip_special_tokens=True)
-            for t in self.translated
-        ][0]
+            for t in translated
+        ]
 
 
 class ZhThTranslator:
@@ -105,10 +119,22 @@ class ZhThTranslator:
             # output: ผมรักคุณนะ
 
         """
-        self.translated = self.model_zhth.generate(
-            **self.tokenizer_zhth(text, return_tensors="pt", padding=True)
+        return self.translate_batch([text])[0]
+
+    def translate_batch(self, texts: List[str]) -> List[str]:
+        """
+        Translate many texts from Chinese to Thai, in one batch
+
+        :param list texts: input texts in source language
+        :return: translated texts in target language
+        :rtype: list[str]
+        """
+        if not texts:
+            return []
+        translated = self.model_zhth.generate(
+            **self.tokenizer_zhth(texts, return_tensors="pt", padding=True)
         )
         return [
             self.tokenizer_zhth.decode(t, skip_special_tokens=True)
-            for t in self.translated
-        ][0]
+            for t in translated
+        ]
@@ -5,7 +5,20 @@
 Transliteration.
 """
 
-__all__ = ["romanize", "transliterate", "pronunciate", "puan"]
+__all__ = [
+    "cache_info",
+    "romanize",
+    "romanize_many",
+    "transliterate",
+    "pronunciate",
+    "puan",
+]
 
-from pythainlp.transliterate.core import romanize, transliterate, pronunciate
+from pythainlp.transliterate.cache import cache_info
+from pythainlp.transliterate.core import (
+    romanize,
+    romanize_many,
+    transliterate,
+    pronunciate,
+)
 from pythainlp.transliterate.spoonerism import puan
@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2016-2024 PyThaiNLP Project
+# SPDX-License-Identifier: Apache-2.0
+"""
+Bounded word cache for transliteration engines
+
+Each engine keeps its results in a named cache. The statistics of the
+caches, e.g. the hit rate, can be read with :func:`cache_info`, to
+size the caches with :func:`get_cache`.
+"""
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, Union
+
+DEFAULT_CACHE_SIZE = 10000
+
+_CACHES = {}
+_CACHES_LOCK = threading.Lock()
+
+
+class WordCache:
+    """
+    Thread-safe least-recently-used (LRU) cache of word → result,
+    which counts its hits and misses.
+
+    :param int maxsize: maximum number of words kept in the cache,
+                        0 to disable the cache
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, word: Hashable) -> bool:
+        return word in self._data
+
+    def get(self, word: Hashable, default=None):
+        """
+        Get the result of a word, and count a hit or a miss.
+
+        :param word: word
+        :param default: value returned if the word is not in the cache
+        :return: the cached result, or `default`
+        """
+        with self._lock:
+            try:
+                value = self._data[word]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(word)
+            self.hits += 1
+            return value
+
+    def put(self, word: Hashable, value) -> None:
+        """
+        Put the result of a word, evicting the least recently used word
+        if the cache is full.
+
+        :param word: word
+        :param value: result
+        """
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[word] = value
+            self._data.move_to_end(word)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove every word and reset the counters."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> Dict[str, Union[int, float]]:
+        """
+        Statistics of the cache.
+
+        :return: a dictionary of *hits*, *misses*, *hit_rate*
+                 (hits / lookups, 0.0 if no lookups), *size*,
+                 and *maxsize*
+        :rtype: dict[str, Union[int, float]]
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+        }
+
+
+def get_cache(name: str) -> WordCache:
+    """
+    Get the cache of an engine, creating it if it does not exist.
+
+    :param str name: name of the engine, e.g. *royin*
+    :return: the cache of the engine
+    :rtype: WordCache
+
+    :Example:
+    ::
+
+        from pythainlp.transliterate.cache import get_cache
+
+        # keep up to 50,000 words romanized by royin
+        get_cache("royin").maxsize = 50000
+    """
+    with _CACHES_LOCK:
+        if name not in _CACHES:
+            _CACHES[name] = WordCache()
+        return _CACHES[name]
+
+
+def cache_info(
+    name: Union[str, None] = None
+) -> Union[Dict[str, Union[int, float]], Dict[str, Dict]]:
+    """
+    Statistics of the cache of an engine, or of every engine.
+
+    :param str name: name of the engine, or `None` for every engine
+    :return: statistics from :meth:`WordCache.info`, or a dictionary
+             of engine name to its statistics if `name` is `None`
+    :rtype: dict
+
+    :Example:
+    ::
+
+        from pythainlp.transliterate import cache_info, romanize
+
+        romanize("แมว", engine="royin")
+        romanize("แมว", engine="royin")
+        cache_info("royin")
+        # output: {'hits': 1, 'misses': 1, 'hit_rate': 0.5,
+        #          'size': 1, 'maxsize': 10000}
+    """
+    if name is not None:
+        return get_cache(name).info()
+    with _CACHES_LOCK:
+        caches = dict(_CACHES)
+    return {name: cache.info() for name, cache in caches.items()}
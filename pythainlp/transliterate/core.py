@@ -1,12 +1,16 @@
 # -*- coding: utf-8 -*-
 # SPDX-FileCopyrightText: 2016-2024 PyThaiNLP Project
 # SPDX-License-Identifier: Apache-2.0
+from typing import List
+
+from pythainlp.tools import profiling
 
 DEFAULT_ROMANIZE_ENGINE = "royin"
 DEFAULT_TRANSLITERATE_ENGINE = "thaig2p"
 DEFAULT_PRONUNCIATE_ENGINE = "w2p"
 
 
+@profiling.timed("transliterate.romanize", engine_arg="engine")
 def romanize(
     text: str,
     engine: str = DEFAULT_ROMANIZE_ENGINE,
@@ -87,6 +91,58 @@ def romanize(
         return select_romanize_engine(engine)(text)
 
 
+@profiling.timed("transliterate.romanize_many", engine_arg="engine")
+def romanize_many(
+    texts: List[str],
+    engine: str = DEFAULT_ROMANIZE_ENGINE,
+    fallback_engine: str = DEFAULT_ROMANIZE_ENGINE,
+) -> List[str]:
+    """
+    This function renders many Thai texts in the Latin alphabet,
+    see :func:`romanize`.
+
+    Each distinct text is romanized once, and the engines keep the
+    romanized words in a bounded cache, so repeated words are not
+    romanized again. The *thai2rom_onnx* engine romanizes the texts
+    in batches. The hit rate of the caches can be read with
+    :func:`pythainlp.transliterate.cache_info`.
+
+    :param list texts: Thai texts to be romanized
+    :param str engine: engine, see :func:`romanize`
+    :param str fallback_engine: fallback engine of the *lookup* engine,
+                                see :func:`romanize`
+    :return: romanized texts, in the order of `texts`
+    :rtype: list[str]
+
+    :Example:
+    ::
+
+        from pythainlp.transliterate import romanize_many
+
+        romanize_many(["แมว", "หมา", "แมว"], engine="royin")
+        # output: ['maeo', 'ma', 'maeo']
+    """
+    distinct = list(
+        dict.fromkeys(text for text in texts if text and isinstance(text, str))
+    )
+    if engine == "thai2rom_onnx":
+        from pythainlp.transliterate.thai2rom_onnx import (
+            romanize_many as _romanize_many,
+        )
+
+        results = dict(zip(distinct, _romanize_many(distinct)))
+    else:
+        results = {
+            text: romanize(text, engine=engine, fallback_engine=fallback_engine)
+            for text in distinct
+        }
+    return [
+        results[text] if text and isinstance(text, str) else ""
+        for text in texts
+    ]
+
+
+@profiling.timed("transliterate.transliterate", engine_arg="engine")
 def transliterate(
     text: str, engine: str = DEFAULT_TRANSLITERATE_ENGINE
 ) -> str:
@@ -165,6 +221,7 @@ def transliterate(
     return transliterate(text)
 
 
+@profiling.timed("transliterate.pronunciate", engine_arg="engine")
 def pronunciate(word: str, engine: str = DEFAULT_PRONUNCIATE_ENGINE) -> str:
     """
     This function pronunciates Thai word.
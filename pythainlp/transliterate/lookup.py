@@ -42,18 +42,29 @@ def _romanize(text: str, fallback_func: Callable[[str], str]) -> str:
     """
     Romanize one word. Look up first, call `fallback_func` if not found.
     """
+    # check first, as looking up a missing word in the defaultdict
+    # would add an empty entry for it.
+    # results of fallback_func are cached by the fallback engine.
+    if text not in TRANSLITERATE_DICT:
+        return _fallback(text, fallback_func)
     try:
         # try to get 0-th idx of look up result, simply ignore other possible variations.
         # not found means no mapping.
         lookup = TRANSLITERATE_DICT[text][TRANSLITERATE_EN][_TRANSLITERATE_IDX]
     except IndexError:
-        return fallback_func(text)
-    except TypeError as e:
-        raise TypeError(f"`fallback_engine` is not callable. {e}")
+        return _fallback(text, fallback_func)
     else:
         return lookup
 
 
+def _fallback(text: str, fallback_func: Callable[[str], str]) -> str:
+    if not callable(fallback_func):
+        raise TypeError(
+            f"`fallback_engine` is not callable. {fallback_func!r}"
+        )
+    return fallback_func(text)
+
+
 def romanize(text: str, fallback_func: Callable[[str], str]) -> str:
     """
     Render Thai words in Latin alphabet by looking up
@@ -12,6 +12,9 @@ It was published by the Royal Institute of Thailand.
 import re
 
 from pythainlp import thai_consonants, word_tokenize
+from pythainlp.transliterate.cache import get_cache
+
+_CACHE = get_cache("royin")
 
 # vowel
 _vowel_patterns = """เ*ียว,\\1iao
@@ -215,6 +218,12 @@ def romanize(text: str) -> str:
     :rtype: str
     """
     words = word_tokenize(text)
-    romanized_words = [_romanize(word) for word in words]
+    romanized_words = []
+    for word in words:
+        romanized = _CACHE.get(word)
+        if romanized is None:
+            romanized = _romanize(word)
+            _CACHE.put(word, romanized)
+        romanized_words.append(romanized)
 
     return "".join(romanized_words)
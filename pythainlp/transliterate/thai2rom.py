@@ -10,6 +10,7 @@ import torch
 from torch import nn
 import torch.nn.functional as F
 from pythainlp.corpus import get_corpus_path
+from pythainlp.transliterate.cache import get_cache
 
 device = torch.device("cuda:0" if torch.cuda.is_available() else "cpu")
 
@@ -352,7 +353,12 @@ class Seq2Seq(nn.Module):
 
 
 _THAI_TO_ROM = ThaiTransliterator()
+_CACHE = get_cache("thai2rom")
 
 
 def romanize(text: str) -> str:
-    return _THAI_TO_ROM.romanize(text)
+    romanized = _CACHE.get(text)
+    if romanized is None:
+        romanized = _THAI_TO_ROM.romanize(text)
+        _CACHE.put(text, romanized)
+    return romanized
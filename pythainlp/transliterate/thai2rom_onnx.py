@@ -5,9 +5,14 @@
 Romanization of Thai words based on machine-learnt engine in ONNX runtime ("thai2rom")
 """
 import json
+import threading
+from typing import List
+
 import numpy as np
 from onnxruntime import InferenceSession
+from onnxruntime.capi.onnxruntime_pybind11_state import InvalidArgument
 from pythainlp.corpus import get_corpus_path
+from pythainlp.transliterate.cache import get_cache
 
 
 _MODEL_ENCODER_NAME = "thai2rom_encoder_onnx"
@@ -54,6 +59,9 @@ class ThaiTransliterator_ONNX:
             self._maxlength,
             target_vocab_size=OUTPUT_DIM,
         )
+        self.cache = get_cache("thai2rom_onnx")
+        # False once the model rejects a batch of more than one word
+        self._batchable = True
 
     def _prepare_sequence_in(self, text: str):
         """
@@ -74,19 +82,70 @@ class ThaiTransliterator_ONNX:
         :return: English (more or less) text that spells out how the Thai text
                  should be pronounced.
         """
-        input_tensor = self._prepare_sequence_in(text).reshape(1, -1)
-        input_length = [len(text) + 1]
-        target_tensor_logits = self._network.run(input_tensor, input_length)
+        return self.romanize_many([text])[0]
+
+    def romanize_many(
+        self, words: List[str], batch_size: int = 64
+    ) -> List[str]:
+        """
+        Romanize many words.
 
-        # Seq2seq model returns <END> as the first token,
-        # As a result, target_tensor_logits.size() is torch.Size([0])
-        if target_tensor_logits.shape[0] == 0:
-            target = ["<PAD>"]
-        else:
-            target_tensor = np.argmax(target_tensor_logits.squeeze(1), 1)
-            target = [self._ix_to_target_char[str(t)] for t in target_tensor]
+        Words that are not in the cache are sorted by length, longest
+        first as the encoder expects, padded, and run through the model
+        in batches.
 
-        return "".join(target)
+        :param list words: Thai words to be romanized
+        :param int batch_size: number of words in a batch
+        :return: romanized words, in the order of `words`
+        :rtype: list[str]
+        """
+        results = [self.cache.get(word) for word in words]
+        missing = sorted(
+            {word for word, result in zip(words, results) if result is None},
+            key=len,
+            reverse=True,
+        )
+        romanized = {}
+        for i in range(0, len(missing), batch_size):
+            batch = missing[i : i + batch_size]
+            for word, result in zip(batch, self._romanize_batch(batch)):
+                romanized[word] = result
+                self.cache.put(word, result)
+
+        return [
+            romanized[word] if result is None else result
+            for word, result in zip(words, results)
+        ]
+
+    def _romanize_batch(self, words: List[str]) -> List[str]:
+        if len(words) > 1 and not self._batchable:
+            return [self._romanize_batch([word])[0] for word in words]
+        max_len = max(len(word) for word in words) + 1
+        input_tensor = np.zeros((len(words), max_len), dtype=np.int64)
+        for i, word in enumerate(words):
+            idxs = self._prepare_sequence_in(word)
+            input_tensor[i, : len(idxs)] = idxs
+        input_length = [len(word) + 1 for word in words]
+        try:
+            targets = self._network.run_batch(input_tensor, input_length)
+        except InvalidArgument:
+            # a model exported with a fixed batch size of one
+            # can only run one word at a time
+            if len(words) == 1:
+                raise
+            self._batchable = False
+            return [self._romanize_batch([word])[0] for word in words]
+
+        results = []
+        for target in targets:
+            # Seq2seq model returns <END> as the first token
+            if not target:
+                results.append("<PAD>")
+            else:
+                results.append(
+                    "".join(self._ix_to_target_char[str(t)] for t in target)
+                )
+        return results
 
 
 class Seq2Seq_ONNX:
@@ -178,9 +237,90 @@ class Seq2Seq_ONNX:
 
         return outputs
 
+    def run_batch(self, source_seq, source_seq_len) -> List[List[int]]:
+        """
+        Greedy decoding of a batch of padded sequences.
+
+        All sequences are decoded in lock-step, until every sequence
+        has emitted the end token or the maximum length is reached.
+
+        :return: output token ids of each sequence, without the end token
+        """
+        batch_size = source_seq.shape[0]
+        end_token = self.target_end_token
+
+        expected_encoder_outputs = [
+            output.name for output in self.encoder.get_outputs()
+        ]
+        encoder_outputs, encoder_hidden, _ = self.encoder.run(
+            input_feed={
+                "input_tensor": source_seq,
+                "input_lengths": source_seq_len,
+            },
+            output_names=expected_encoder_outputs,
+        )
+
+        decoder_input = np.full(
+            (batch_size, 1), self.target_start_token, dtype=np.int32
+        )
+        decoder_hidden = np.expand_dims(
+            np.concatenate((encoder_hidden[0], encoder_hidden[1]), axis=1),
+            axis=0,
+        )
+        mask = self.create_mask(source_seq[:, 0 : encoder_outputs.shape[1]])
+        output_names = [output.name for output in self.decoder.get_outputs()]
+
+        tokens = np.zeros((self.max_length, batch_size), dtype=np.int64)
+        done = np.zeros(batch_size, dtype=bool)
+        lengths = np.full(batch_size, self.max_length)
+        for di in range(self.max_length):
+            decoder_output, decoder_hidden = self.decoder.run(
+                input_feed={
+                    "decoder_input": decoder_input,
+                    "decoder_hidden_1": decoder_hidden,
+                    "encoder_outputs": encoder_outputs,
+                    "mask": mask.tolist(),
+                },
+                output_names=output_names[:2],
+            )
+            topi = np.argmax(decoder_output, axis=1)
+            tokens[di] = topi
+            ended = (topi == end_token) & ~done
+            lengths[ended] = di
+            done |= ended
+            if done.all():
+                break
+            decoder_input = topi.reshape(batch_size, 1).astype(np.int32)
+
+        return [
+            tokens[:length, i].tolist() for i, length in enumerate(lengths)
+        ]
+
 
-_THAI_TO_ROM_ONNX = ThaiTransliterator_ONNX()
+_THAI_TO_ROM_ONNX = None
+_LOCK = threading.Lock()
+
+
+def _get_transliterator() -> ThaiTransliterator_ONNX:
+    # load the model on first use
+    global _THAI_TO_ROM_ONNX
+    with _LOCK:
+        if _THAI_TO_ROM_ONNX is None:
+            _THAI_TO_ROM_ONNX = ThaiTransliterator_ONNX()
+    return _THAI_TO_ROM_ONNX
 
 
 def romanize(text: str) -> str:
-    return _THAI_TO_ROM_ONNX.romanize(text)
+    return _get_transliterator().romanize(text)
+
+
+def romanize_many(words: List[str], batch_size: int = 64) -> List[str]:
+    """
+    Romanize many words, in batches, with a cache of romanized words.
+
+    :param list words: Thai words to be romanized
+    :param int batch_size: number of words in a batch
+    :return: romanized words, in the order of `words`
+    :rtype: list[str]
+    """
+    return _get_transliterator().romanize_many(words, batch_size=batch_size)
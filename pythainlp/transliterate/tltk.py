@@ -1,11 +1,15 @@
 # -*- coding: utf-8 -*-
 # SPDX-FileCopyrightText: 2016-2024 PyThaiNLP Project
 # SPDX-License-Identifier: Apache-2.0
+from pythainlp.transliterate.cache import get_cache
+
 try:
     from tltk.nlp import g2p, th2ipa, th2roman
 except ImportError:
     raise ImportError("Not found tltk! Please install tltk by pip install tltk")
 
+_CACHE = get_cache("tltk")
+
 
 def romanize(text: str) -> str:
     """
@@ -15,8 +19,12 @@ def romanize(text: str) -> str:
     :return: A string of Thai words rendered in the Latin alphabet.
     :rtype: str
     """
-    _temp = th2roman(text)
-    return _temp[: _temp.rfind(" <s/>")].replace("<s/>", "")
+    romanized = _CACHE.get(text)
+    if romanized is None:
+        _temp = th2roman(text)
+        romanized = _temp[: _temp.rfind(" <s/>")].replace("<s/>", "")
+        _CACHE.put(text, romanized)
+    return romanized
 
 
 def tltk_g2p(text: str) -> str:
@@ -6,10 +6,12 @@ Thai Word-to-Phoneme (Thai W2P)
 GitHub : https://github.com/wannaphong/Thai_W2P
 """
 
-from typing import Union
+import threading
+from typing import List, Union
 
 import numpy as np
 from pythainlp.corpus import download, get_corpus_path
+from pythainlp.transliterate.cache import get_cache
 
 _GRAPHEMES = list(
     "พจใงต้ืฮแาฐฒฤๅูศฅถฺฎหคสุขเึดฟำฝยลอ็ม"
@@ -59,6 +61,7 @@ class Thai_W2P():
             download(_MODEL_NAME, version="0.2")
             self.checkpoint = get_corpus_path(_MODEL_NAME)
         self._load_variables()
+        self.cache = get_cache("w2p")
 
     def _load_variables(self):
         self.variables = np.load(self.checkpoint, allow_pickle=True)
@@ -132,36 +135,50 @@ class Thai_W2P():
         return x
 
     def _short_word(self, word: str) -> Union[str, None]:
-        self.word = word
-        if self.word.endswith("."):
-            self.word = self.word.replace(".", "")
-            self.word = "-".join([i + "อ" for i in list(self.word)])
-            return self.word
+        if word.endswith("."):
+            word = word.replace(".", "")
+            return "-".join([i + "อ" for i in list(word)])
         return None
 
     def _predict(self, word: str) -> str:
-        short_word = self._short_word(word)
-        if short_word is not None:
-            return short_word
+        return self._predict_batch([word])[0]
+
+    def _predict_batch(self, words: List[str]) -> List[List[str]]:
+        # run the encoder and the decoder on a batch of words,
+        # padded to the longest word
+        results = [self._short_word(word) for word in words]
+        batch = [i for i, result in enumerate(results) if result is None]
+        if not batch:
+            return results
+
+        lengths = np.array([len(words[i]) + 1 for i in batch])
+        x = np.full(
+            (len(batch), lengths.max()), self.g2idx["<pad>"], dtype=np.int64
+        )
+        for row, i in enumerate(batch):
+            chars = list(words[i]) + ["</s>"]
+            x[row, : len(chars)] = [
+                self.g2idx.get(char, self.g2idx["<unk>"]) for char in chars
+            ]
 
         # encoder
-        enc = self._encode(word)
         enc = self._gru(
-            enc,
-            len(word) + 1,
+            np.take(self.enc_emb, x, axis=0),
+            lengths.max(),
             self.enc_w_ih,
             self.enc_w_hh,
             self.enc_b_ih,
             self.enc_b_hh,
-            h0=np.zeros((1, self.enc_w_hh.shape[-1]), np.float32),
+            h0=np.zeros((len(batch), self.enc_w_hh.shape[-1]), np.float32),
         )
-        last_hidden = enc[:, -1, :]
-
-        # decoder
-        dec = np.take(self.dec_emb, [2], axis=0)  # 2: <s>
-        h = last_hidden
-
-        preds = []
+        # the hidden state after the last character of each word,
+        # as padding comes after it
+        h = enc[np.arange(len(batch)), lengths - 1, :]
+
+        # decoder, stops when every word has emitted </s>
+        dec = np.take(self.dec_emb, np.full(len(batch), 2), axis=0)  # <s>
+        preds = [[] for _ in batch]
+        done = np.zeros(len(batch), dtype=bool)
         for _ in range(20):
             h = self._grucell(
                 dec,
@@ -172,26 +189,73 @@ class Thai_W2P():
                 self.dec_b_hh,
             )  # (b, h)
             logits = np.matmul(h, self.fc_w.T) + self.fc_b
-            pred = logits.argmax()
-            if pred == 3:
+            pred = logits.argmax(axis=-1)
+            done |= pred == 3
+            if done.all():
                 break
-            preds.append(pred)
-            dec = np.take(self.dec_emb, [pred], axis=0)
+            for row in np.flatnonzero(~done):
+                preds[row].append(pred[row])
+            dec = np.take(self.dec_emb, pred, axis=0)
 
-        preds = [self.idx2p.get(idx, "<unk>") for idx in preds]
+        for row, i in enumerate(batch):
+            results[i] = [self.idx2p.get(idx, "<unk>") for idx in preds[row]]
 
-        return preds
+        return results
 
     def __call__(self, word: str) -> str:
-        if not any(letter in word for letter in self.graphemes):
-            pron = [word]
-        else:  # predict for oov
-            pron = self._predict(word)
-
-        return "".join(pron)
-
-
-_THAI_W2P = Thai_W2P()
+        return self.pronunciate_many([word])[0]
+
+    def pronunciate_many(
+        self, words: List[str], batch_size: int = 256
+    ) -> List[str]:
+        """
+        Convert many Thai words to their pronunciations in Thai letters.
+
+        Words that are not in the cache are predicted in batches.
+        This method is thread-safe.
+
+        :param list words: Thai words to be pronunciated
+        :param int batch_size: number of words in a batch
+        :return: pronunciations, in the order of `words`
+        :rtype: list[str]
+        """
+        results = [self.cache.get(word) for word in words]
+        missing = sorted(
+            {word for word, result in zip(words, results) if result is None},
+            key=len,
+        )
+        predicted = {}
+        for i in range(0, len(missing), batch_size):
+            batch = missing[i : i + batch_size]
+            # words without any known letter are kept as they are
+            oov = [
+                word
+                for word in batch
+                if any(letter in word for letter in self.graphemes)
+            ]
+            prons = dict(zip(oov, self._predict_batch(oov)))
+            for word in batch:
+                pron = "".join(prons.get(word, [word]))
+                predicted[word] = pron
+                self.cache.put(word, pron)
+
+        return [
+            predicted[word] if result is None else result
+            for word, result in zip(words, results)
+        ]
+
+
+_THAI_W2P = None
+_LOCK = threading.Lock()
+
+
+def _get_w2p() -> Thai_W2P:
+    # load the model on first use
+    global _THAI_W2P
+    with _LOCK:
+        if _THAI_W2P is None:
+            _THAI_W2P = Thai_W2P()
+    return _THAI_W2P
 
 
 def pronunciate(text: str) -> str:
@@ -205,4 +269,19 @@ def pronunciate(text: str) -> str:
     :return: A string of Thai letters indicating
              how the input text should be pronounced.
     """
-    return _THAI_W2P(text)
+    return _get_w2p()(text)
+
+
+def pronunciate_many(words: List[str], batch_size: int = 256) -> List[str]:
+    """
+    Convert many Thai words to their pronunciations in Thai letters.
+
+    Words are predicted in batches, and the pronunciations are cached.
+    This function is thread-safe.
+
+    :param list words: Thai words to be pronunciated
+    :param int batch_size: number of words in a batch
+    :return: pronunciations, in the order of `words`
+    :rtype: list[str]
+    """
+    return _get_w2p().pronunciate_many(words, batch_size=batch_size)
@@ -5,12 +5,12 @@
 Universal Language Model Fine-tuning for Text Classification (ULMFiT).
 """
 import collections
-from typing import Callable, Collection
+from typing import Callable, Collection, Union
 
 import numpy as np
 import torch
 from pythainlp.corpus import get_corpus_path
-from pythainlp.tokenize import THAI2FIT_TOKENIZER
+from pythainlp.tokenize import _get_thai2fit_tokenizer
 from pythainlp.ulmfit.preprocess import (
     fix_html,
     lowercase_all,
@@ -65,7 +65,7 @@ post_rules_th_sparse = post_rules_th[1:] + [
 def process_thai(
     text: str,
     pre_rules: Collection = pre_rules_th_sparse,
-    tok_func: Callable = THAI2FIT_TOKENIZER.word_tokenize,
+    tok_func: Union[Callable, None] = None,
     post_rules: Collection = post_rules_th_sparse,
 ) -> Collection[str]:
     """
@@ -74,7 +74,8 @@ def process_thai(
     :param str text: text to be cleaned
     :param list[func] pre_rules: rules to apply before tokenization.
     :param func tok_func: tokenization function (by default, **tok_func** is
-                          :func:`pythainlp.tokenize.word_tokenize`)
+                          the *word_tokenize* method of
+                          :data:`pythainlp.tokenize.THAI2FIT_TOKENIZER`)
 
     :param list[func]  post_rules: rules to apply after tokenizations
 
@@ -128,6 +129,8 @@ def process_thai(
 
 
     """
+    if tok_func is None:
+        tok_func = _get_thai2fit_tokenizer().word_tokenize
     res = text
 
     for rule in pre_rules:
@@ -181,7 +184,7 @@ def document_vector(text: str, learn, data, agg: str = "mean"):
 
     """
 
-    s = THAI2FIT_TOKENIZER.word_tokenize(text)
+    s = _get_thai2fit_tokenizer().word_tokenize(text)
     t = torch.tensor(data.vocab.numericalize(s), requires_grad=False).to(
         device
     )
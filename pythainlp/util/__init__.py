@@ -6,6 +6,7 @@ Utility functions, like date conversion and digit conversion
 """
 
 __all__ = [
+    "SyllableInfo",
     "Trie",
     "abbreviation_to_full_text",
     "arabic_digit_to_thai_digit",
@@ -41,6 +42,7 @@ __all__ = [
     "rhyme",
     "sound_syllable",
     "spell_words",
+    "syllable_info",
     "syllable_length",
     "syllable_open_close_detector",
     "text_to_arabic_digit",
@@ -112,7 +114,9 @@ from pythainlp.util.time import thaiword_to_time, time_to_thaiword
 from pythainlp.util.trie import Trie, dict_trie
 from pythainlp.util.wordtonum import thaiword_to_num, text_to_num, words_to_num
 from pythainlp.util.syllable import (
+    SyllableInfo,
     sound_syllable,
+    syllable_info,
     tone_detector,
     syllable_length,
     syllable_open_close_detector,
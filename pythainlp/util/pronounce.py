@@ -1,15 +1,96 @@
 # -*- coding: utf-8 -*-
 # SPDX-FileCopyrightText: 2016-2024 PyThaiNLP Project
 # SPDX-License-Identifier: Apache-2.0
-from typing import List
+import hashlib
+import json
+import os
+import tempfile
+from typing import Dict, List, Tuple
 
-from pythainlp.corpus import thai_words
+from pythainlp.corpus import get_derived, thai_words
 from pythainlp.tokenize import syllable_tokenize
 from pythainlp.khavee import KhaveeVerifier
+from pythainlp.tools import get_full_data_path
+from pythainlp.tools.path import _set_shared_mode
 
+_CHECK_MODE = os.getenv("PYTHAINLP_READ_MODE")
+# change the version if the rules of KhaveeVerifier change,
+# to rebuild the persisted index
+_RHYME_INDEX_VERSION = "1"
+_RHYME_INDEX_FILENAME = "rhyme_index.json"
 
 kv = KhaveeVerifier()
-all_thai_words_dict = None
+
+
+def _words_signature(words: List[str]) -> str:
+    text = _RHYME_INDEX_VERSION + "\n" + "\n".join(words)
+    return hashlib.md5(text.encode("utf-8")).hexdigest()
+
+
+def _build_rhyme_index(words: List[str]) -> Dict[Tuple[str, str], List[str]]:
+    index = {}
+    for word in words:
+        if len(syllable_tokenize(word)) == 1:
+            index.setdefault(kv.rhyme_key(word), []).append(word)
+    return index
+
+
+def _load_rhyme_index(path: str, signature: str):
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if data.get("signature") != signature:
+        return None
+    return {
+        (sara, marttra): words
+        for sara, marttra, words in data.get("index", [])
+    }
+
+
+def _save_rhyme_index(path: str, signature: str, index) -> None:
+    data = {
+        "signature": signature,
+        "index": [
+            [sara, marttra, words] for (sara, marttra), words in index.items()
+        ],
+    }
+    # write to a temporary file and rename it,
+    # so other processes never read a partial index
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        _set_shared_mode(tmp_path, path)
+        os.replace(tmp_path, path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _get_rhyme_index() -> Dict[Tuple[str, str], List[str]]:
+    """
+    Index of single-syllable words in the dictionary,
+    by their rhyme key (vowel, spelling section).
+
+    Built once from :func:`pythainlp.corpus.thai_words`, and kept in
+    the PyThaiNLP data directory, so later processes only load it.
+    The index is rebuilt if the dictionary changes.
+    """
+    return get_derived("thai_words", "rhyme_index", _load_or_build_rhyme_index)
+
+
+def _load_or_build_rhyme_index() -> Dict[Tuple[str, str], List[str]]:
+    words = sorted(thai_words())
+    signature = _words_signature(words)
+    path = get_full_data_path(_RHYME_INDEX_FILENAME)
+    index = _load_rhyme_index(path, signature)
+    if index is None:
+        index = _build_rhyme_index(words)
+        if _CHECK_MODE != "1":
+            _save_rhyme_index(path, signature, index)
+    return index
 
 
 def rhyme(word: str) -> List[str]:
@@ -27,13 +108,5 @@ def rhyme(word: str) -> List[str]:
         print(rhyme("จีบ"))
         # output: ['กลีบ', 'กีบ', 'ครีบ', ...]
     """
-    global all_thai_words_dict
-    list_sumpus = []
-    if all_thai_words_dict == None:
-        all_thai_words_dict = [
-            i for i in list(thai_words()) if len(syllable_tokenize(i)) == 1
-        ]
-    for i in all_thai_words_dict:
-        if kv.is_sumpus(word, i) and i != word:
-            list_sumpus.append(i)
-    return sorted(list_sumpus)
+    words = _get_rhyme_index().get(kv.rhyme_key(word), [])
+    return [i for i in words if i != word]
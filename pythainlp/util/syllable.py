@@ -3,9 +3,18 @@
 # SPDX-License-Identifier: Apache-2.0
 """
 Syllable tools
+
+The analysis of a syllable (onset, vowel, spelling section, tone, length,
+and live/dead and open/close sound) is kept in a :class:`SyllableInfo`
+record, which is computed once per distinct syllable and shared by the
+functions of this module and by :class:`pythainlp.khavee.KhaveeVerifier`.
 """
 import re
+from functools import lru_cache
+from typing import Callable, List, Tuple
+
 from pythainlp import thai_consonants, thai_tonemarks
+from pythainlp.util.normalize import remove_tonemark
 
 spelling_class = {
     "กง": list("ง"),
@@ -56,6 +65,107 @@ for k, v in thai_initial_consonant_type.items():
     for i in v:
         thai_initial_consonant_to_type[i] = k
 
+_CONSONANTS = frozenset(thai_consonants)
+_CONSONANTS_NO_O = frozenset(thai_consonants_all)
+_TONEMARKS = frozenset(thai_tonemarks)
+_SYLLABLE_CACHE_SIZE = 65536
+
+
+class SyllableInfo:
+    """
+    Analysis of a Thai syllable, created by :func:`syllable_info`.
+
+    Each attribute is computed on first access and kept in the record.
+
+    :param str syllable: Thai syllable
+    """
+
+    __slots__ = ("syllable", "_values")
+
+    def __init__(self, syllable: str) -> None:
+        self.syllable = syllable
+        self._values = {}
+
+    def __repr__(self) -> str:
+        return f"SyllableInfo({self.syllable!r})"
+
+    def _get(self, name: str, func: Callable[[str], str]):
+        if name not in self._values:
+            self._values[name] = func(self.syllable)
+        return self._values[name]
+
+    @property
+    def consonants(self) -> Tuple[str, ...]:
+        """Consonants of the syllable, in order"""
+        return self._get(
+            "consonants",
+            lambda syllable: tuple(i for i in syllable if i in _CONSONANTS),
+        )
+
+    @property
+    def onset(self) -> str:
+        """Initial consonant, empty if there is no consonant"""
+        return self.consonants[0] if self.consonants else ""
+
+    @property
+    def vowel(self) -> str:
+        """Vowel name (Thai: สระ), see
+        :meth:`pythainlp.khavee.KhaveeVerifier.check_sara`"""
+        return self._get("vowel", _check_sara)
+
+    @property
+    def marttra(self) -> str:
+        """Spelling section (Thai: มาตรา), see
+        :meth:`pythainlp.khavee.KhaveeVerifier.check_marttra`"""
+        return self._get("marttra", _check_marttra)
+
+    @property
+    def tone(self) -> str:
+        """Tone, see :func:`tone_detector`"""
+        return self._get("tone", _tone)
+
+    @property
+    def length(self) -> str:
+        """*long* or *short*, see :func:`syllable_length`"""
+        return self._get("length", _length)
+
+    @property
+    def sound(self) -> str:
+        """*live* or *dead*, see :func:`sound_syllable`"""
+        return self._get("sound", _sound)
+
+    @property
+    def open_close(self) -> str:
+        """*open* or *close*, see :func:`syllable_open_close_detector`"""
+        return self._get("open_close", _open_close)
+
+
+@lru_cache(maxsize=_SYLLABLE_CACHE_SIZE)
+def syllable_info(syllable: str) -> SyllableInfo:
+    """
+    Analysis of a Thai syllable
+
+    The record of a syllable is cached, so each attribute is computed
+    once per distinct syllable, whichever function asks for it.
+
+    :param str syllable: Thai syllable
+    :return: analysis of the syllable
+    :rtype: SyllableInfo
+
+    :Example:
+    ::
+
+        from pythainlp.util import syllable_info
+
+        info = syllable_info("มาก")
+        print(info.onset, info.vowel, info.marttra, info.tone)
+        # output: ม อา กก f
+
+        print(info.length, info.sound, info.open_close)
+        # output: long dead close
+    """
+    return SyllableInfo(syllable)
+
 
 def sound_syllable(syllable: str) -> str:
     """
@@ -79,56 +189,7 @@ def sound_syllable(syllable: str) -> str:
         print(sound_syllable("เลข"))
         # output: dead
     """
-    # get consonants
-    consonants = [i for i in syllable if i in list(thai_consonants_all)]
-    # get spelling consonants
-    spelling_consonant = consonants[-1]
-    # if len of syllable < 2
-    if len(syllable) < 2:
-        return "dead"
-    elif (spelling_consonant in _check_2) and (
-        any((c in set("าีืแูาเโ")) for c in syllable) is False
-        and any((c in set("ำใไ")) for c in syllable) is False
-        and bool(pattern.search(syllable)) is not True
-    ):
-        return "dead"
-    elif any((c in set("าีืแูาโ")) for c in syllable):  # in syllable:
-        if (
-            spelling_consonant in _check_1
-            and bool(re_short.search(syllable)) is not True
-        ):
-            return "live"
-        elif (
-            spelling_consonant != syllable[-1]
-            and bool(re_short.search(syllable)) is not True
-        ):
-            return "live"
-        elif spelling_consonant in _check_2:
-            return "dead"
-        elif bool(re_short.search(syllable)) or any(
-            (c in set(short)) for c in syllable
-        ):
-            return "dead"
-        return "live"
-    elif any((c in set("ำใไ")) for c in syllable):
-        return "live"  # if these vowel's long sounds are live syllables
-    elif bool(pattern.search(syllable)):  # if it is เ-า
-        return "live"
-    elif spelling_consonant in _check_1:
-        if (
-            bool(re_short.search(syllable))
-            or any((c in set(short)) for c in syllable)
-        ) and len(consonants) < 2:
-            return "dead"
-        return "live"
-    elif bool(
-        re_short.search(syllable)
-    ) or any(  # if vowel's short sound is found
-        (c in set(short)) for c in syllable
-    ):  # consonant in short
-        return "dead"
-    else:
-        return "dead"
+    return syllable_info(syllable).sound
 
 
 def syllable_open_close_detector(syllable: str) -> str:
@@ -152,12 +213,7 @@ def syllable_open_close_detector(syllable: str) -> str:
         print(syllable_open_close_detector("คะ"))
         # output: open
     """
-    consonants = [i for i in syllable if i in list(thai_consonants)]
-    if len(consonants) < 2:
-        return "open"
-    elif len(consonants) == 2 and consonants[-1] == "อ":
-        return "open"
-    return "close"
+    return syllable_info(syllable).open_close
 
 
 def syllable_length(syllable: str) -> str:
@@ -181,17 +237,11 @@ def syllable_length(syllable: str) -> str:
         print(syllable_length("คะ"))
         # output: short
     """
-    consonants = [i for i in syllable if i in list(thai_consonants)]
-    if len(consonants) < 3 and any((c in set(short)) for c in syllable):
-        return "short"
-    elif bool(re_short.search(syllable)):
-        return "short"
-    else:
-        return "long"
+    return syllable_info(syllable).length
 
 
 def _tone_mark_detector(syllable: str) -> str:
-    tone_mark = [i for i in syllable if i in list(thai_tonemarks)]
+    tone_mark = [i for i in syllable if i in _TONEMARKS]
     if tone_mark == []:
         return ""
     else:
@@ -200,7 +250,7 @@ def _tone_mark_detector(syllable: str) -> str:
 
 def _check_sonorant_syllable(syllable: str) -> bool:
     _sonorant = [i for i in syllable if i in thai_low_sonorants]
-    consonants = [i for i in syllable if i in list(thai_consonants)]
+    consonants = syllable_info(syllable).consonants
     if _sonorant[-1] == consonants[-2]:
         return True
     elif _sonorant[-1] == consonants[-1]:
@@ -227,13 +277,90 @@ def tone_detector(syllable: str) -> str:
         print(tone_detector("ไม้"))
         # output: h
     """
-    s = sound_syllable(syllable)
+    return syllable_info(syllable).tone
+
+
+def _sound(syllable: str) -> str:
+    # get consonants
+    consonants = [i for i in syllable if i in _CONSONANTS_NO_O]
+    # get spelling consonants
+    spelling_consonant = consonants[-1]
+    # if len of syllable < 2
+    if len(syllable) < 2:
+        return "dead"
+    elif (spelling_consonant in _check_2) and (
+        any((c in set("าีืแูาเโ")) for c in syllable) is False
+        and any((c in set("ำใไ")) for c in syllable) is False
+        and bool(pattern.search(syllable)) is not True
+    ):
+        return "dead"
+    elif any((c in set("าีืแูาโ")) for c in syllable):  # in syllable:
+        if (
+            spelling_consonant in _check_1
+            and bool(re_short.search(syllable)) is not True
+        ):
+            return "live"
+        elif (
+            spelling_consonant != syllable[-1]
+            and bool(re_short.search(syllable)) is not True
+        ):
+            return "live"
+        elif spelling_consonant in _check_2:
+            return "dead"
+        elif bool(re_short.search(syllable)) or any(
+            (c in set(short)) for c in syllable
+        ):
+            return "dead"
+        return "live"
+    elif any((c in set("ำใไ")) for c in syllable):
+        return "live"  # if these vowel's long sounds are live syllables
+    elif bool(pattern.search(syllable)):  # if it is เ-า
+        return "live"
+    elif spelling_consonant in _check_1:
+        if (
+            bool(re_short.search(syllable))
+            or any((c in set(short)) for c in syllable)
+        ) and len(consonants) < 2:
+            return "dead"
+        return "live"
+    elif bool(
+        re_short.search(syllable)
+    ) or any(  # if vowel's short sound is found
+        (c in set(short)) for c in syllable
+    ):  # consonant in short
+        return "dead"
+    else:
+        return "dead"
+
+
+def _open_close(syllable: str) -> str:
+    consonants = syllable_info(syllable).consonants
+    if len(consonants) < 2:
+        return "open"
+    elif len(consonants) == 2 and consonants[-1] == "อ":
+        return "open"
+    return "close"
+
+
+def _length(syllable: str) -> str:
+    consonants = syllable_info(syllable).consonants
+    if len(consonants) < 3 and any((c in set(short)) for c in syllable):
+        return "short"
+    elif bool(re_short.search(syllable)):
+        return "short"
+    else:
+        return "long"
+
+
+def _tone(syllable: str) -> str:
+    info = syllable_info(syllable)
+    s = info.sound
     # get consonants
-    consonants = [i for i in syllable if i in list(thai_consonants)]
+    consonants = info.consonants
     initial_consonant = consonants[0]
     tone_mark = _tone_mark_detector(syllable)
-    syllable_check = syllable_open_close_detector(syllable)
-    syllable_check_length = syllable_length(syllable)
+    syllable_check = info.open_close
+    syllable_check_length = info.length
     initial_consonant_type = thai_initial_consonant_to_type[initial_consonant]
     # r for store value
     r = ""
@@ -315,3 +442,266 @@ def tone_detector(syllable: str) -> str:
     elif initial_consonant_type == "high" and s == "live":
         r = "r"
     return r
+
+
+def _remove_karun_silenced(word: str) -> str:
+    # strip the characters silenced by the Karun ("์") at the end of word
+    sound_silenced = word.endswith("์")
+    if not sound_silenced:
+        return word
+    thai_consonants = "กขฃคฅฆงจฉชซฌญฎฏฐฑฒณดตถทธนบปผฝพฟภมยรลวศษสหฬอฮ"
+    locate_silenced = word.rfind("์") - 1
+    can_silence_two = word[locate_silenced - 2] in thai_consonants
+    cut_off = 2 if can_silence_two else 1
+    word = word[: locate_silenced + 1 - cut_off]
+    return word
+
+
+def _check_sara(word: str) -> str:
+    # In case of การันย์
+    if "์" in word[-1]:
+        word = word[:-2]
+
+    sara = _single_sara(word)
+    sara = _compound_sara(word, sara)
+    sara = _special_sara(word, sara)
+
+    if not sara:
+        return "Can't find Sara in this word"
+
+    return sara[0]
+
+
+def _single_sara(word: str) -> List[str]:
+    sara = []
+    countoa = 0
+
+    # In case of สระเดี่ยว
+    for i in word:
+        if i in ("ะ", "ั"):
+            sara.append("อะ")
+        elif i == "ิ":
+            sara.append("อิ")
+        elif i == "ุ":
+            sara.append("อุ")
+        elif i == "ึ":
+            sara.append("อึ")
+        elif i == "ี":
+            sara.append("อี")
+        elif i == "ู":
+            sara.append("อู")
+        elif i == "ื":
+            sara.append("อือ")
+        elif i == "เ":
+            sara.append("เอ")
+        elif i == "แ":
+            sara.append("แอ")
+        elif i == "า":
+            sara.append("อา")
+        elif i == "โ":
+            sara.append("โอ")
+        elif i == "ำ":
+            sara.append("อำ")
+        elif i == "อ":
+            countoa += 1
+            sara.append("ออ")
+        elif i == "ั" and "ว" in word:
+            sara.append("อัว")
+        elif i in ("ไ", "ใ"):
+            sara.append("ไอ")
+        elif i == "็":
+            sara.append("ออ")
+        elif "รร" in word:
+            if _check_marttra(word) == "กม":
+                sara.append("อำ")
+            else:
+                sara.append("อะ")
+
+    # In case of ออ
+    if countoa == 1 and "อ" in word[-1] and "เ" not in word:
+        sara.remove("ออ")
+
+    # In case of เอ เอ
+    countA = 0
+    for i in sara:
+        if i == "เอ":
+            countA = countA + 1
+        if countA > 1:
+            sara.remove("เอ")
+            sara.remove("เอ")
+            sara.append("แ")
+
+    return sara
+
+
+def _compound_sara(word: str, sara: List[str]) -> List[str]:
+    # In case of สระประสม
+    if "เอ" in sara and "อะ" in sara:
+        sara.remove("เอ")
+        sara.remove("อะ")
+        sara.append("เอะ")
+    elif "แอ" in sara and "อะ" in sara:
+        sara.remove("แอ")
+        sara.remove("อะ")
+        sara.append("แอะ")
+
+    if "เอะ" in sara and "ออ" in sara:
+        sara.remove("เอะ")
+        sara.remove("ออ")
+        sara.append("เออะ")
+    elif "เอ" in sara and "อิ" in sara:
+        sara.remove("เอ")
+        sara.remove("อิ")
+        sara.append("เออ")
+    elif "เอ" in sara and "ออ" in sara and "อ" in word[-1]:
+        sara.remove("เอ")
+        sara.remove("ออ")
+        sara.append("เออ")
+    elif "โอ" in sara and "อะ" in sara:
+        sara.remove("โอ")
+        sara.remove("อะ")
+        sara.append("โอะ")
+    elif "เอ" in sara and "อี" in sara:
+        sara.remove("เอ")
+        sara.remove("อี")
+        sara.append("เอีย")
+    elif "เอ" in sara and "อือ" in sara:
+        sara.remove("เอ")
+        sara.remove("อือ")
+        sara.append("อัว")
+    elif "เอ" in sara and "อา" in sara:
+        sara.remove("เอ")
+        sara.remove("อา")
+        sara.append("เอา")
+    elif "เ" in word and "า" in word and "ะ" in word:
+        sara = []
+        sara.append("เอาะ")
+
+    if "อือ" in sara and "เออ" in sara:
+        sara.remove("เออ")
+        sara.remove("อือ")
+        sara.append("เอือ")
+    elif "ออ" in sara and len(sara) > 1:
+        sara.remove("ออ")
+    elif "ว" in word and len(sara) == 0:
+        sara.append("อัว")
+
+    if "ั" in word and _check_marttra(word) == "กา":
+        sara = []
+        sara.append("ไอ")
+
+    return sara
+
+
+def _special_sara(word: str, sara: List[str]) -> List[str]:
+    # In case of อ
+    if word == "เออะ":
+        sara = []
+        sara.append("เออะ")
+    elif word == "เออ":
+        sara = []
+        sara.append("เออ")
+    elif word == "เอ":
+        sara = []
+        sara.append("เอ")
+    elif word == "เอะ":
+        sara = []
+        sara.append("เอะ")
+    elif word == "เอา":
+        sara = []
+        sara.append("เอา")
+    elif word == "เอาะ":
+        sara = []
+        sara.append("เอาะ")
+
+    if "ฤา" in word or "ฦา" in word:
+        sara = []
+        sara.append("อือ")
+    elif "ฤ" in word or "ฦ" in word:
+        sara = []
+        sara.append("อึ")
+
+    # In case of กน
+    if not sara and len(word) == 2:
+        if word[-1] != "ร":
+            sara.append("โอะ")
+        else:
+            sara.append("ออ")
+    elif not sara and len(word) == 3:
+        sara.append("ออ")
+
+    # In case of บ่
+    if word == "บ่":
+        sara = []
+        sara.append("ออ")
+
+    if "ํ" in word:
+        sara = []
+        sara.append("อำ")
+
+    if "เ" in word and "ื" in word and "อ" in word:
+        sara = []
+        sara.append("เอือ")
+
+    return sara
+
+
+def _check_marttra(word: str) -> str:
+    if word[-1] == "ร" and word[-2] in ["ต", "ท"]:
+        word = word[:-1]
+    word = _remove_karun_silenced(word)
+    word = remove_tonemark(word)
+    if (
+        "ำ" in word
+        or ("ํ" in word and "า" in word)
+        or "ไ" in word
+        or "ใ" in word
+    ):
+        return "กา"
+    elif (
+        word[-1] in ["า", "ะ", "ิ", "ี", "ุ", "ู", "อ"]
+        or ("ี" in word and "ย" in word[-1])
+        or ("ื" in word and "อ" in word[-1])
+    ):
+        return "กา"
+    elif word[-1] in ["ง"]:
+        return "กง"
+    elif word[-1] in ["ม"]:
+        return "กม"
+    elif word[-1] in ["ย"]:
+        if "ั" in word:
+            return "กา"
+        else:
+            return "เกย"
+    elif word[-1] in ["ว"]:
+        return "เกอว"
+    elif word[-1] in ["ก", "ข", "ค", "ฆ"]:
+        return "กก"
+    elif word[-1] in [
+        "จ",
+        "ช",
+        "ซ",
+        "ฎ",
+        "ฏ",
+        "ฐ",
+        "ฑ",
+        "ฒ",
+        "ด",
+        "ต",
+        "ถ",
+        "ท",
+        "ธ",
+        "ศ",
+        "ษ",
+        "ส",
+    ]:
+        return "กด"
+    elif word[-1] in ["ญ", ", ณ", "น", "ร", "ล", "ฬ"]:
+        return "กน"
+    elif word[-1] in ["บ", "ป", "พ", "ฟ", "ภ"]:
+        return "กบ"
+    else:
+        if "็" in word:
+            return "กา"
+        else:
+            return "Cant find Marttra in this word"
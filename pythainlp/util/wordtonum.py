@@ -11,7 +11,7 @@ import re
 from typing import List
 
 from pythainlp.tokenize import Tokenizer
-from pythainlp.corpus import thai_words
+from pythainlp.corpus import get_derived, thai_words
 
 _ptn_digits = r"(|หนึ่ง|เอ็ด|สอง|ยี่|สาม|สี่|ห้า|หก|เจ็ด|แปด|เก้า)"
 _ptn_six_figures = (
@@ -59,11 +59,18 @@ def _check_is_thainum(word: str):
     return (False, None)
 
 
-_dict_words = [i for i in list(thai_words()) if not _check_is_thainum(i)[0]]
-_dict_words += list(_digits.keys())
-_dict_words += ["สิบ", "ร้อย", "พัน", "หมื่น", "แสน", "ล้าน", "จุด"]
+def _build_tokenizer_thaiwords() -> Tokenizer:
+    # dictionary words that are not numerals, and the numerals by digit
+    dict_words = [i for i in thai_words() if not _check_is_thainum(i)[0]]
+    dict_words += list(_digits.keys())
+    dict_words += ["สิบ", "ร้อย", "พัน", "หมื่น", "แสน", "ล้าน", "จุด"]
+    return Tokenizer(dict_words)
 
-_tokenizer_thaiwords = Tokenizer(_dict_words)
+
+def _get_tokenizer_thaiwords() -> Tokenizer:
+    return get_derived(
+        "thai_words", "wordtonum_tokenizer", _build_tokenizer_thaiwords
+    )
 
 
 def thaiword_to_num(word: str) -> int:
@@ -184,7 +191,7 @@ def text_to_num(text: str) -> List[str]:
         # output: ['10021889', 'บาท']
 
     """
-    _temp = _tokenizer_thaiwords.word_tokenize(text)
+    _temp = _get_tokenizer_thaiwords().word_tokenize(text)
     thainum = []
     last_index = -1
     list_word_new = []
@@ -8,19 +8,138 @@ from transformers import (
     CamembertTokenizer,
     pipeline,
 )
+from pythainlp.tag._utils import iob_to_html
 from pythainlp.tokenize import word_tokenize
 
 _model_name = "wangchanberta-base-att-spm-uncased"
-_tokenizer = CamembertTokenizer.from_pretrained(
-    f"airesearch/{_model_name}", revision="main"
-)
-if _model_name == "wangchanberta-base-att-spm-uncased":
-    _tokenizer.additional_special_tokens = ["<s>NOTUSED", "</s>NOTUSED", "<_>"]
+_tokenizer = None
+
+
+def _get_tokenizer() -> CamembertTokenizer:
+    # load on first use, so importing this module needs no download
+    global _tokenizer
+    if _tokenizer is None:
+        _tokenizer = CamembertTokenizer.from_pretrained(
+            f"airesearch/{_model_name}", revision="main"
+        )
+        if _model_name == "wangchanberta-base-att-spm-uncased":
+            _tokenizer.additional_special_tokens = [
+                "<s>NOTUSED",
+                "</s>NOTUSED",
+                "<_>",
+            ]
+    return _tokenizer
+
+
+def _max_length(tokenizer, model) -> int:
+    # longest input, in tokens, that the model accepts
+    limits = [tokenizer.model_max_length, 512]
+    n_positions = getattr(model.config, "max_position_embeddings", None)
+    if n_positions:
+        # RoBERTa-style position ids start after the padding index
+        limits.append(n_positions - 2)
+    return min(limits)
+
+
+def _windows(
+    lengths: List[int], max_length: int, stride: int
+) -> List[Tuple[int, int, int, int]]:
+    """
+    Split a sequence of items into overlapping windows.
+
+    :param list lengths: number of tokens of each item
+    :param int max_length: maximum number of tokens in a window
+    :param int stride: number of tokens shared by consecutive windows
+    :return: a list of (start, end, keep_start, keep_end) item indices.
+             A window covers items start..end, and the prediction for an
+             item is taken from the window that keeps it, so that items
+             near the edge of a window are taken from its neighbour.
+    :rtype: list[tuple[int, int, int, int]]
+    """
+    n = len(lengths)
+    spans = []
+    start = 0
+    while True:
+        end = start
+        total = 0
+        while end < n and (end == start or total + lengths[end] <= max_length):
+            total += lengths[end]
+            end += 1
+        spans.append((start, end))
+        if end >= n:
+            break
+        # step back from the end to overlap by at most `stride` tokens
+        next_start = end
+        overlap = 0
+        while (
+            next_start - 1 > start
+            and overlap + lengths[next_start - 1] <= stride
+        ):
+            next_start -= 1
+            overlap += lengths[next_start]
+        start = next_start
+
+    # cut each overlap in the middle
+    seams = [0]
+    for (_, end), (next_start, _) in zip(spans, spans[1:]):
+        seams.append((next_start + end) // 2)
+    seams.append(n)
+
+    return [
+        (start, end, seams[i], seams[i + 1])
+        for i, (start, end) in enumerate(spans)
+    ]
+
+
+def _text_windows(
+    text: str,
+    tokenizer,
+    max_length: int,
+    stride: int,
+    space_token: str = None,
+) -> List[Tuple[int, int, int, int]]:
+    # character offsets of windows of text, cut at word boundaries
+    max_length -= tokenizer.num_special_tokens_to_add()
+    # a subword has at least one character, apart from a leading "▁"
+    if len(text) + 1 <= max_length:
+        return [(0, len(text), 0, len(text))]
+
+    words = []
+    for word in word_tokenize(text):
+        # hard-split a word too long for a window on its own
+        if len(word) + 1 > max_length:
+            step = max_length - 1
+            words.extend(
+                word[i : i + step] for i in range(0, len(word), step)
+            )
+        else:
+            words.append(word)
+    if space_token:
+        pieces = [word.replace(" ", space_token) for word in words]
+    else:
+        pieces = words
+    lengths = [
+        len(ids)
+        for ids in tokenizer(pieces, add_special_tokens=False)["input_ids"]
+    ]
+    offsets = [0]
+    for word in words:
+        offsets.append(offsets[-1] + len(word))
+
+    return [
+        (offsets[start], offsets[end], offsets[lo], offsets[hi])
+        for start, end, lo, hi in _windows(lengths, max_length, stride)
+    ]
 
 
 class ThaiNameTagger:
     def __init__(
-        self, dataset_name: str = "thainer", grouped_entities: bool = True
+        self,
+        dataset_name: str = "thainer",
+        grouped_entities: bool = True,
+        max_length: int = None,
+        onnx: bool = False,
+        quantize: bool = True,
     ):
         """
         This function tags named entities in text in IOB format.
@@ -28,20 +147,39 @@ class ThaiNameTagger:
         Powered by wangchanberta from VISTEC-depa\
              AI Research Institute of Thailand
 
+        Texts longer than the model input are split at word boundaries
+        into windows, which are tagged separately and joined back.
+
         :param str dataset_name:
             * *thainer* - ThaiNER dataset
         :param bool grouped_entities: grouped entities
+        :param int max_length: maximum number of subwords in a window,
+                               default is the input size of the model
+        :param bool onnx: run the model with ONNX Runtime
+                          (requires `optimum[onnxruntime]`)
+        :param bool quantize: use int8-quantized weights with ONNX Runtime
         """
         self.dataset_name = dataset_name
         self.grouped_entities = grouped_entities
+        model = f"airesearch/{_model_name}"
+        revision = f"finetuned@{self.dataset_name}-ner"
+        if onnx:
+            from pythainlp.tools.onnx_model import load_onnx_model
+
+            model = load_onnx_model(
+                model, revision=revision, quantize=quantize
+            )
         self.classify_tokens = pipeline(
             task="ner",
-            tokenizer=_tokenizer,
-            model=f"airesearch/{_model_name}",
-            revision=f"finetuned@{self.dataset_name}-ner",
+            tokenizer=_get_tokenizer(),
+            model=model,
+            revision=revision,
             ignore_labels=[],
             grouped_entities=self.grouped_entities,
         )
+        self.max_length = max_length or _max_length(
+            self.classify_tokens.tokenizer, self.classify_tokens.model
+        )
 
     def _IOB(self, tag):
         if tag != "O":
@@ -72,86 +210,152 @@ class ThaiNameTagger:
             warnings.warn(
                 "This model doesn't support output of POS tags and it doesn't output the POS tags."
             )
-        text = re.sub(" ", "<_>", text)
-        self.json_ner = self.classify_tokens(text)
-        self.output = ""
+        return self.get_ner_batch([text], tag=tag)[0]
+
+    def get_ner_batch(
+        self,
+        texts: List[str],
+        pos: bool = False,
+        tag: bool = False,
+        batch_size: int = 8,
+    ) -> List[Union[List[Tuple[str, str]], str]]:
+        """
+        This function tags named entities in many texts in IOB format,
+        running the model on batches of texts.
+
+        :param list texts: texts in Thai to be tagged
+        :param bool tag: output HTML-like tags.
+        :param int batch_size: number of texts in a batch
+        :return: a list of outputs of :meth:`get_ner`, one for each text
+        :rtype: list[Union[list[tuple[str, str]], str]]
+        """
+        if pos:
+            warnings.warn(
+                "This model doesn't support output of POS tags and it doesn't output the POS tags."
+            )
+        if not texts:
+            return []
+        # windows do not overlap, as the tokenizer gives no offsets
+        # to align the predictions of overlapping windows
+        chunks = []
+        n_chunks = []
+        for text in texts:
+            windows = _text_windows(
+                text,
+                self.classify_tokens.tokenizer,
+                self.max_length,
+                stride=0,
+                space_token="<_>",
+            )
+            chunks.extend(
+                re.sub(" ", "<_>", text[start:end])
+                for start, end, _, _ in windows
+            )
+            n_chunks.append(len(windows))
+
+        outputs = iter(self.classify_tokens(chunks, batch_size=batch_size))
+        results = []
+        for n in n_chunks:
+            merged = list(next(outputs))
+            for _ in range(n - 1):
+                json_ner = list(next(outputs))
+                # drop the word boundary marker that starts a window
+                while json_ner and json_ner[0]["word"] == "▁":
+                    json_ner.pop(0)
+                merged.extend(json_ner)
+            results.append(self._postprocess(merged, tag=tag))
+
+        return results
+
+    def _postprocess(
+        self, json_ner: List[dict], tag: bool = False
+    ) -> Union[List[Tuple[str, str]], str]:
         if self.grouped_entities and self.dataset_name == "thainer":
-            self.sent_ner = [
+            sent_ner = [
                 (
                     i["word"].replace("<_>", " ").replace("▁", ""),
                     self._IOB(i["entity_group"]),
                 )
-                for i in self.json_ner
+                for i in json_ner
             ]
         elif self.dataset_name == "thainer":
-            self.sent_ner = [
+            sent_ner = [
                 (i["word"].replace("<_>", " ").replace("▁", ""), i["entity"])
-                for i in self.json_ner
+                for i in json_ner
                 if i["word"] != "▁"
             ]
         else:
-            self.sent_ner = [
+            sent_ner = [
                 (
                     i["word"].replace("<_>", " ").replace("▁", ""),
                     i["entity"].replace("_", "-").replace("E-", "I-"),
                 )
-                for i in self.json_ner
+                for i in json_ner
             ]
-        if self.sent_ner[0][0] == "" and len(self.sent_ner) > 1:
-            self.sent_ner = self.sent_ner[1:]
-        for idx, (word, ner) in enumerate(self.sent_ner):
+        if sent_ner[0][0] == "" and len(sent_ner) > 1:
+            sent_ner = sent_ner[1:]
+        for idx, (word, ner) in enumerate(sent_ner):
             if idx > 0 and ner.startswith("B-"):
                 if self._clear_tag(ner) == self._clear_tag(
-                    self.sent_ner[idx - 1][1]
+                    sent_ner[idx - 1][1]
                 ):
-                    self.sent_ner[idx] = (word, ner.replace("B-", "I-"))
+                    sent_ner[idx] = (word, ner.replace("B-", "I-"))
         if tag:
-            temp = ""
-            sent = ""
-            for idx, (word, ner) in enumerate(self.sent_ner):
-                if ner.startswith("B-") and temp != "":
-                    sent += "</" + temp + ">"
-                    temp = ner[2:]
-                    sent += "<" + temp + ">"
-                elif ner.startswith("B-"):
-                    temp = ner[2:]
-                    sent += "<" + temp + ">"
-                elif ner == "O" and temp != "":
-                    sent += "</" + temp + ">"
-                    temp = ""
-                sent += word
-
-                if idx == len(self.sent_ner) - 1 and temp != "":
-                    sent += "</" + temp + ">"
-
-            return sent
+            return iob_to_html(sent_ner)
         else:
-            return self.sent_ner
+            return sent_ner
 
 
 class NamedEntityRecognition:
     def __init__(
-        self, model: str = "pythainlp/thainer-corpus-v2-base-model"
+        self,
+        model: str = "pythainlp/thainer-corpus-v2-base-model",
+        max_length: int = None,
+        stride: int = 128,
+        onnx: bool = False,
+        quantize: bool = True,
     ) -> None:
         """
         This function tags named entities in text in IOB format.
 
         Powered by wangchanberta from VISTEC-depa\
              AI Research Institute of Thailand
+
+        Texts longer than the model input are split into overlapping
+        windows of subwords. The tag of a subword is taken from the
+        window where it is farthest from the edge.
+
         :param str model: The model that use wangchanberta pretrained.
+        :param int max_length: maximum number of subwords in a window,
+                               default is the input size of the model
+        :param int stride: number of subwords shared by two
+                           consecutive windows
+        :param bool onnx: run the model with ONNX Runtime
+                          (requires `optimum[onnxruntime]`)
+        :param bool quantize: use int8-quantized weights with ONNX Runtime
         """
         from transformers import AutoTokenizer
         from transformers import AutoModelForTokenClassification
 
         self.tokenizer = AutoTokenizer.from_pretrained(model)
-        self.model = AutoModelForTokenClassification.from_pretrained(model)
+        if onnx:
+            from pythainlp.tools.onnx_model import load_onnx_model
+
+            self.model = load_onnx_model(model, quantize=quantize)
+        else:
+            self.model = AutoModelForTokenClassification.from_pretrained(
+                model
+            )
+        self.max_length = max_length or _max_length(self.tokenizer, self.model)
+        self.stride = stride
 
     def _fix_span_error(self, words, ner):
         _ner = []
         _ner = ner
         _new_tag = []
-        for i, j in zip(words, _ner):
-            i = self.tokenizer.decode(i)
+        # decode every token id on its own, in one call
+        decoded = self.tokenizer.batch_decode([[i] for i in words])
+        for i, j in zip(decoded, _ner):
             if i.isspace() and j.startswith("B-"):
                 j = "O"
             if i in ("", "<s>", "</s>"):
@@ -178,49 +382,105 @@ class NamedEntityRecognition:
                  words and NER tags
         :rtype: Union[list[tuple[str, str]]], str
         """
+        return self.get_ner_batch([text], pos=pos, tag=tag)[0]
+
+    def get_ner_batch(
+        self,
+        texts: List[str],
+        pos: bool = False,
+        tag: bool = False,
+        batch_size: int = 8,
+    ) -> List[Union[List[Tuple[str, str]], str]]:
+        """
+        This function tags named entities in many texts in IOB format.
+
+        Texts, or windows of long texts, are sorted by length and grouped
+        into batches, each padded only to its longest text, and run
+        through the model without keeping autograd state.
+
+        :param list texts: texts in Thai to be tagged
+        :param bool tag: output HTML-like tags.
+        :param int batch_size: number of texts in a batch
+        :return: a list of outputs of :meth:`get_ner`, one for each text
+        :rtype: list[Union[list[tuple[str, str]], str]]
+
+        :Example:
+        ::
+
+            from pythainlp.wangchanberta import NamedEntityRecognition
+
+            ner = NamedEntityRecognition()
+            ner.get_ner_batch(["ทดสอบนายวรรณพงษ์", "ไปเที่ยวเชียงใหม่"])
+            # output: [[('ทดสอบ', 'O'), ('นาย', 'B-PERSON'), ...],
+            #          [('ไป', 'O'), ('เที่ยว', 'O'), ...]]
+        """
         import torch
 
         if pos:
             warnings.warn(
                 "This model doesn't support output postag and It doesn't output the postag."
             )
-        words_token = word_tokenize(text.replace(" ", "<_>"))
-        inputs = self.tokenizer(
-            words_token, is_split_into_words=True, return_tensors="pt"
-        )
-        ids = inputs["input_ids"]
-        mask = inputs["attention_mask"]
-        # forward pass
-        outputs = self.model(ids, attention_mask=mask)
-        logits = outputs[0]
-        predictions = torch.argmax(logits, dim=2)
-        predicted_token_class = [
-            self.model.config.id2label[t.item()] for t in predictions[0]
+        if not texts:
+            return []
+        words_tokens = [
+            word_tokenize(text.replace(" ", "<_>")) for text in texts
         ]
-        ner_tag = self._fix_span_error(
-            inputs["input_ids"][0], predicted_token_class
+        input_ids = self.tokenizer(
+            words_tokens, is_split_into_words=True, add_special_tokens=False
+        )["input_ids"]
+
+        # split long texts into windows, then batch windows of all texts
+        window_size = (
+            self.max_length - self.tokenizer.num_special_tokens_to_add()
         )
+        windows = []
+        for i, ids in enumerate(input_ids):
+            for start, end, lo, hi in _windows(
+                [1] * len(ids), window_size, self.stride
+            ):
+                windows.append((i, start, ids[start:end], lo, hi))
+        order = sorted(range(len(windows)), key=lambda w: len(windows[w][2]))
+
+        labels = [[None] * len(ids) for ids in input_ids]
+        for batch_start in range(0, len(order), batch_size):
+            batch = [
+                windows[w] for w in order[batch_start : batch_start + batch_size]
+            ]
+            inputs = self.tokenizer.pad(
+                {
+                    "input_ids": [
+                        self.tokenizer.build_inputs_with_special_tokens(ids)
+                        for _, _, ids, _, _ in batch
+                    ]
+                },
+                return_tensors="pt",
+            )
+            # forward pass
+            with torch.inference_mode():
+                outputs = self.model(
+                    inputs["input_ids"],
+                    attention_mask=inputs["attention_mask"],
+                )
+            predictions = torch.argmax(outputs[0], dim=2).tolist()
+            for (i, start, ids, lo, hi), prediction in zip(batch, predictions):
+                special = self.tokenizer.get_special_tokens_mask(ids)
+                content = [
+                    t for t, is_special in zip(prediction, special)
+                    if not is_special
+                ]
+                for j in range(lo, hi):
+                    labels[i][j] = self.model.config.id2label[
+                        content[j - start]
+                    ]
+
+        ner_tags = [
+            self._fix_span_error(ids, predicted_token_class)
+            for ids, predicted_token_class in zip(input_ids, labels)
+        ]
+
         if tag:
-            temp = ""
-            sent = ""
-            for idx, (word, ner) in enumerate(ner_tag):
-                if ner.startswith("B-") and temp != "":
-                    sent += "</" + temp + ">"
-                    temp = ner[2:]
-                    sent += "<" + temp + ">"
-                elif ner.startswith("B-"):
-                    temp = ner[2:]
-                    sent += "<" + temp + ">"
-                elif ner == "O" and temp != "":
-                    sent += "</" + temp + ">"
-                    temp = ""
-                sent += word
-
-                if idx == len(ner_tag) - 1 and temp != "":
-                    sent += "</" + temp + ">"
-
-            return sent
-        return ner_tag
+            return [iob_to_html(ner_tag) for ner_tag in ner_tags]
+        return ner_tags
 
 
 def segment(text: str) -> List[str]:
@@ -234,4 +494,4 @@ def segment(text: str) -> List[str]:
     if not text or not isinstance(text, str):
         return []
 
-    return _tokenizer.tokenize(text)
+    return _get_tokenizer().tokenize(text)
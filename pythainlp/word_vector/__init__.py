@@ -7,9 +7,13 @@ thai2fit - Thai word vector.
 Initial code from https://github.com/cstorm125/thai2fit
 """
 __all__ = [
+    "IVFIndex",
     "WordVector",
+    "load_keyedvectors",
 ]
 
+from pythainlp.word_vector.ivf import IVFIndex
 from pythainlp.word_vector.core import (
     WordVector,
+    load_keyedvectors,
 )
@@ -1,13 +1,19 @@
 # -*- coding: utf-8 -*-
 # SPDX-FileCopyrightText: 2016-2024 PyThaiNLP Project
 # SPDX-License-Identifier: Apache-2.0
-from typing import List, Tuple
+import hashlib
+import os
+import tempfile
+from typing import List, Tuple, Union
 
 from gensim.models import KeyedVectors
 from gensim.models.keyedvectors import Word2VecKeyedVectors
 from numpy import ndarray, zeros
 from pythainlp.corpus import get_corpus_path
-from pythainlp.tokenize import THAI2FIT_TOKENIZER, word_tokenize
+from pythainlp.tokenize import _get_thai2fit_tokenizer, word_tokenize
+from pythainlp.tools import get_full_data_path
+from pythainlp.tools.path import _set_shared_mode
+from pythainlp.word_vector.ivf import IVFIndex, most_similar_batch
 
 WV_DIM = 300  # word vector dimension
 
@@ -16,6 +22,94 @@ _MODEL_NAME = "thai2fit_wv"
 _TK_SP = "xxspace"
 _TK_EOL = "xxeol"
 
+_KV_SUFFIX = ".kv"  # suffix of the converted (native gensim) model file
+_CHECK_MODE = os.getenv("PYTHAINLP_READ_MODE")
+
+
+def _kv_path(path: str) -> str:
+    # The converted file is keyed on the absolute path, size, and
+    # modification time of the original file, so models with the same
+    # file name do not collide and a changed model is converted again.
+    stat = os.stat(path)
+    key = f"{os.path.abspath(path)}:{stat.st_size}:{stat.st_mtime_ns}"
+    digest = hashlib.md5(key.encode("utf-8")).hexdigest()[:16]
+    return get_full_data_path(
+        f"{os.path.basename(path)}.{digest}{_KV_SUFFIX}"
+    )
+
+
+def load_keyedvectors(
+    path: str,
+    binary: bool = True,
+    mmap: Union[str, None] = "r",
+) -> KeyedVectors:
+    """
+    Load a word2vec-format model as :class:`gensim.models.KeyedVectors`.
+
+    The first time a model is loaded, it is converted to gensim's native
+    format (the vector matrix is stored as a separate `.npy` file)
+    and saved in the PyThaiNLP data directory. Subsequent loads read
+    the converted file with `mmap`, so the start-up is near-instant and
+    every process loading the same model shares one physical copy of
+    the vector matrix.
+
+    The converted file is identified by the absolute path, size,
+    and modification time of the original file, so it is rebuilt
+    if the original file changes.
+    In read-only mode (:envvar:`PYTHAINLP_READ_MODE` = 1),
+    nothing is written and a model without a converted file
+    is parsed from the original file.
+
+    :param str path: path to the model in word2vec format
+    :param bool binary: `True` if the model is in binary word2vec format
+    :param str mmap: memory-map mode of the vector matrix, for example
+                     `"r"` (default) for read-only. `None` to load
+                     the matrix into memory.
+    :return: word vector model
+    :rtype: gensim.models.KeyedVectors
+
+    :Example:
+    ::
+
+        from pythainlp.corpus import get_corpus_path
+        from pythainlp.word_vector import load_keyedvectors
+
+        model = load_keyedvectors(get_corpus_path("thai2fit_wv"))
+        model.most_similar("แม่น้ำ", topn=1)
+        # output: [('ลำน้ำ', 0.8206598162651062)]
+    """
+    kv_path = _kv_path(path)
+    if os.path.exists(kv_path):
+        return KeyedVectors.load(kv_path, mmap=mmap)
+
+    model = KeyedVectors.load_word2vec_format(
+        path,
+        binary=binary,
+        unicode_errors="ignore",
+    )
+    if _CHECK_MODE == "1":
+        return model
+
+    # Save the vector matrix separately (as .npy), so it can be memory-mapped.
+    # The main file is moved into place last, it marks a complete conversion.
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(kv_path), suffix=".tmp"
+    )
+    os.close(fd)
+    try:
+        model.save(tmp_path, separately=["vectors"], ignore=["norms"])
+        os.replace(tmp_path + ".vectors.npy", kv_path + ".vectors.npy")
+        _set_shared_mode(tmp_path, kv_path)
+        os.replace(tmp_path, kv_path)
+    finally:
+        for leftover in (tmp_path, tmp_path + ".vectors.npy"):
+            if os.path.exists(leftover):
+                os.remove(leftover)
+
+    if mmap:
+        return KeyedVectors.load(kv_path, mmap=mmap)
+    return model
+
 
 class WordVector:
     """
@@ -30,11 +124,15 @@ class WordVector:
         * *ltw2v_v1.0_5_window* - word vector from LTW2V v1.0 and 5 window
     """
 
-    def __init__(self, model_name: str = "thai2fit_wv") -> None:
+    def __init__(
+        self, model_name: str = "thai2fit_wv", mmap: Union[str, None] = "r"
+    ) -> None:
         """
         Word Vector class
 
         :param str model_name: model name
+        :param str mmap: memory-map mode of the vector matrix
+                         (see :func:`load_keyedvectors`)
 
         **Options for model_name**
             * *thai2fit_wv* (default) - word vector from thai2fit
@@ -42,24 +140,27 @@ class WordVector:
             * *ltw2v_v1.0_15_window* - word2vec from LTW2V 1.0 and 15 window
             * *ltw2v_v1.0_5_window* - word2vec from LTW2V v1.0 and 5 window
         """
-        self.load_wordvector(model_name)
+        self.load_wordvector(model_name, mmap=mmap)
 
-    def load_wordvector(self, model_name: str):
+    def load_wordvector(
+        self, model_name: str, mmap: Union[str, None] = "r"
+    ):
         """
         Load word vector model.
 
         :param str model_name: model name
+        :param str mmap: memory-map mode of the vector matrix
+                         (see :func:`load_keyedvectors`)
         """
         self.model_name = model_name
-        self.model = KeyedVectors.load_word2vec_format(
-            get_corpus_path(self.model_name),
-            binary=True,
-            unicode_errors="ignore",
+        self.model = load_keyedvectors(
+            get_corpus_path(self.model_name), binary=True, mmap=mmap
         )
         self.WV_DIM = self.model.vector_size
+        self.index = None
 
         if self.model_name == "thai2fit_wv":
-            self.tokenize = THAI2FIT_TOKENIZER.word_tokenize
+            self.tokenize = _get_thai2fit_tokenizer().word_tokenize
         else:
             self.tokenize = word_tokenize
 
@@ -72,6 +173,116 @@ class WordVector:
         """
         return self.model
 
+    def build_index(self, **kwargs) -> IVFIndex:
+        """
+        Build an approximate nearest-neighbour index over the word vectors.
+
+        The index is used by :meth:`most_similar` and
+        :meth:`most_similar_batch` when `approximate` is `True`.
+        It is built automatically with default parameters on the first
+        approximate query, if not built before.
+
+        :param kwargs: parameters of :class:`IVFIndex`
+                       (`n_lists`, `n_probe`, `n_iter`, `seed`)
+        :return: the index
+        :rtype: IVFIndex
+        """
+        self.index = IVFIndex(self.model.vectors, **kwargs)
+        return self.index
+
+    def _get_index(self, approximate: bool) -> Union[IVFIndex, None]:
+        if not approximate:
+            return None
+        if self.index is None:
+            self.build_index()
+        return self.index
+
+    def most_similar(
+        self,
+        positive: List[str],
+        negative: Union[List[str], None] = None,
+        topn: int = 10,
+        approximate: bool = False,
+    ) -> List[Tuple[str, float]]:
+        """
+        This function finds the `topn` words that are most similar by
+        cosine similarity to the mean of the words in `positive`
+        minus the words in `negative`.
+
+        With `approximate=True`, the words are searched in an approximate
+        nearest-neighbour index (see :meth:`build_index`), which is much
+        faster than comparing with every word in the vocabulary, but may
+        miss some of the most similar words.
+
+        :param list positive: a list of words to add
+        :param list negative: a list of words to subtract
+        :param int topn: number of similar words
+        :param bool approximate: use approximate nearest-neighbour search
+
+        :raises KeyError: if there is any word in `positive` or `negative`
+                          that is not in the vocabulary of the model.
+        :return: list of `topn` most similar words and its similarity score
+        :rtype: list[tuple[str, float]]
+
+        :Example:
+        ::
+
+            from pythainlp.word_vector import WordVector
+
+            wv = WordVector()
+            wv.most_similar(["แม่น้ำ"], topn=3, approximate=True)
+            # output: [('ลำน้ำ', ...), ('ทะเลสาบ', ...), ('ลุ่มน้ำ', ...)]
+        """
+        negative = negative or []
+        index = self._get_index(approximate)
+        if index is None:
+            return self.model.most_similar(
+                positive=positive, negative=negative, topn=topn
+            )
+
+        query = zeros(self.WV_DIM)
+        for words, weight in ((positive, 1.0), (negative, -1.0)):
+            for word in words:
+                query += weight * self.model.get_vector(word, norm=True)
+        excluded = set(positive) | set(negative)
+        ids, scores = index.search(query, topn=topn + len(excluded))
+        return [
+            (self.model.index_to_key[i], float(score))
+            for i, score in zip(ids[0], scores[0])
+            if i >= 0 and self.model.index_to_key[i] not in excluded
+        ][:topn]
+
+    def most_similar_batch(
+        self, words: List[str], topn: int = 10, approximate: bool = False
+    ) -> List[List[Tuple[str, float]]]:
+        """
+        This function finds the `topn` most similar words for each word
+        in a list. All words are queried together, which is faster than
+        calling :meth:`most_similar` for each word.
+
+        :param list words: a list of words
+        :param int topn: number of similar words per word
+        :param bool approximate: use approximate nearest-neighbour search
+
+        :raises KeyError: if there is any word in `words` that is not
+                          in the vocabulary of the model.
+        :return: list of `topn` most similar words and its similarity
+                 score, for each word
+        :rtype: list[list[tuple[str, float]]]
+
+        :Example:
+        ::
+
+            from pythainlp.word_vector import WordVector
+
+            wv = WordVector()
+            wv.most_similar_batch(["แม่น้ำ", "ทะเล"], topn=1)
+            # output: [[('ลำน้ำ', ...)], [('ทะเลสาบ', ...)]]
+        """
+        return most_similar_batch(
+            self.model, words, topn=topn, index=self._get_index(approximate)
+        )
+
     def doesnt_match(self, words: List[str]) -> str:
         """
         This function returns one word that is mostly unrelated to other words
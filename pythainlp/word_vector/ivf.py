@@ -0,0 +1,284 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2016-2024 PyThaiNLP Project
+# SPDX-License-Identifier: Apache-2.0
+"""
+Approximate nearest-neighbour search over word vectors
+"""
+from typing import List, Tuple, Union
+
+import numpy as np
+from gensim.models import KeyedVectors
+
+_CHUNK_SIZE = 1024  # number of rows multiplied at once
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+    return (vectors / norms).astype(np.float32)
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    # indices of the k highest scores, sorted in descending order
+    k = min(k, scores.shape[-1])
+    top = np.argpartition(-scores, k - 1, axis=-1)[..., :k]
+    order = np.argsort(
+        -np.take_along_axis(scores, top, axis=-1), axis=-1, kind="stable"
+    )
+    return np.take_along_axis(top, order, axis=-1)
+
+
+def _assign(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    # the nearest centroid does not depend on the norm of the vector,
+    # so the vectors need not be normalized
+    assign = np.empty(len(vectors), dtype=np.int64)
+    for i in range(0, len(vectors), _CHUNK_SIZE):
+        chunk = np.asarray(vectors[i : i + _CHUNK_SIZE], dtype=np.float32)
+        assign[i : i + _CHUNK_SIZE] = np.argmax(chunk @ centroids.T, axis=1)
+    return assign
+
+
+def _norms(vectors: np.ndarray) -> np.ndarray:
+    norms = np.empty(len(vectors), dtype=np.float32)
+    for i in range(0, len(vectors), _CHUNK_SIZE):
+        norms[i : i + _CHUNK_SIZE] = np.linalg.norm(
+            np.asarray(vectors[i : i + _CHUNK_SIZE], dtype=np.float32),
+            axis=1,
+        )
+    norms[norms == 0] = 1
+    return norms
+
+
+class IVFIndex:
+    """
+    Inverted file (IVF) index for approximate cosine similarity search.
+
+    The vectors are clustered with spherical k-means into `n_lists` lists.
+    A query is compared only with the vectors in the `n_probe` lists
+    whose centroids are the most similar to it, instead of with every
+    vector. The index does not copy the vectors, it keeps a reference
+    to `vectors` (e.g. a memory-mapped matrix of
+    :func:`load_keyedvectors`), the norm of each vector, and the list
+    of each vector. Do not modify `vectors` while the index is in use.
+
+    :param numpy.ndarray vectors: 2-D array of vectors, one vector per row
+    :param int n_lists: number of lists (clusters),
+                        default is the square root of the number of vectors
+    :param int n_probe: number of lists searched per query
+    :param int n_iter: number of k-means iterations
+    :param int seed: random seed for k-means initialization
+
+    :Example:
+    ::
+
+        import numpy as np
+        from pythainlp.word_vector import IVFIndex
+
+        vectors = np.random.rand(10000, 300)
+        index = IVFIndex(vectors, n_probe=8)
+
+        ids, scores = index.search(vectors[:2], topn=3)
+        # ids[0][0] == 0, ids[1][0] == 1
+
+        index.recall(vectors[:100], topn=10)
+        # output: 0.9...
+    """
+
+    def __init__(
+        self,
+        vectors: np.ndarray,
+        n_lists: Union[int, None] = None,
+        n_probe: int = 8,
+        n_iter: int = 10,
+        seed: int = 0,
+    ) -> None:
+        vectors = np.asarray(vectors)
+        n_vectors = len(vectors)
+        if not n_lists:
+            n_lists = int(np.sqrt(n_vectors))
+        n_lists = max(1, min(n_lists, n_vectors))
+        self.n_probe = n_probe
+
+        # train centroids on a sample, at most 64 vectors per list
+        rng = np.random.default_rng(seed)
+        sample_ids = rng.choice(
+            n_vectors, min(n_vectors, 64 * n_lists), replace=False
+        )
+        sample = _normalize(
+            np.asarray(vectors[np.sort(sample_ids)], dtype=np.float32)
+        )
+        centroids = sample[rng.choice(len(sample), n_lists, replace=False)]
+        for _ in range(n_iter):
+            assign = _assign(sample, centroids)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assign, sample)
+            non_empty = np.bincount(assign, minlength=n_lists) > 0
+            centroids[non_empty] = _normalize(sums[non_empty])
+        self.centroids = centroids
+
+        # row numbers of the same list are stored contiguously
+        assign = _assign(vectors, centroids)
+        self._vectors = vectors
+        self._norms = _norms(vectors)
+        self._ids = np.argsort(assign, kind="stable")
+        self._offsets = np.concatenate(
+            ([0], np.cumsum(np.bincount(assign, minlength=n_lists)))
+        )
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def search(
+        self,
+        queries: np.ndarray,
+        topn: int = 10,
+        n_probe: Union[int, None] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the approximate `topn` most similar vectors for each query.
+
+        :param numpy.ndarray queries: 1-D query vector,
+                                      or 2-D array of query vectors
+        :param int topn: number of results per query
+        :param int n_probe: number of lists searched per query,
+                            default is the `n_probe` of the index
+        :return: arrays of row numbers (in the original `vectors`) and
+                 cosine similarities, each of shape (number of queries,
+                 `topn`), sorted by similarity. Missing results, if fewer
+                 than `topn` vectors are found, have row number -1.
+        :rtype: tuple[numpy.ndarray, numpy.ndarray]
+        """
+        queries = _normalize(np.atleast_2d(np.asarray(queries, np.float32)))
+        if n_probe is None:
+            n_probe = self.n_probe
+        n_probe = max(1, min(n_probe, len(self.centroids)))
+
+        ids = np.full((len(queries), topn), -1, dtype=np.int64)
+        scores = np.full((len(queries), topn), -np.inf, dtype=np.float32)
+        probes = _top_k(queries @ self.centroids.T, n_probe)
+        for i, (query, lists) in enumerate(zip(queries, probes)):
+            rows = np.concatenate(
+                [
+                    self._ids[self._offsets[j] : self._offsets[j + 1]]
+                    for j in lists
+                ]
+            )
+            if not len(rows):
+                continue
+            # read the rows in storage order, which is faster on a memory map
+            rows.sort()
+            row_scores = (
+                np.asarray(self._vectors[rows], dtype=np.float32) @ query
+            ) / self._norms[rows]
+            top = _top_k(row_scores, topn)
+            ids[i, : len(top)] = rows[top]
+            scores[i, : len(top)] = row_scores[top]
+
+        return ids, scores
+
+    def recall(
+        self,
+        queries: np.ndarray,
+        topn: int = 10,
+        n_probe: Union[int, None] = None,
+    ) -> float:
+        """
+        Measure recall of :meth:`search` against exact (brute-force) search.
+
+        :param numpy.ndarray queries: 2-D array of query vectors
+        :param int topn: number of results per query
+        :param int n_probe: number of lists searched per query
+        :return: fraction of the exact `topn` results that are found
+        :rtype: float
+        """
+        queries = np.atleast_2d(queries)
+        found, _ = self.search(queries, topn=topn, n_probe=n_probe)
+        normalized = _normalize(np.asarray(queries, dtype=np.float32))
+        exact_scores = np.empty((len(queries), len(self)), dtype=np.float32)
+        for i in range(0, len(self), _CHUNK_SIZE):
+            chunk = np.asarray(
+                self._vectors[i : i + _CHUNK_SIZE], dtype=np.float32
+            )
+            exact_scores[:, i : i + _CHUNK_SIZE] = (
+                normalized @ chunk.T
+            ) / self._norms[i : i + _CHUNK_SIZE]
+        exact = _top_k(exact_scores, topn)
+        hits = sum(
+            len(np.intersect1d(f, e)) for f, e in zip(found, exact)
+        )
+        return hits / exact.size
+
+
+def exact_search(
+    model: KeyedVectors, queries: np.ndarray, topn: int = 10
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find the exact `topn` most similar words for each query vector.
+
+    This is a brute-force search like :meth:`gensim.models.KeyedVectors.
+    most_similar`, but many queries are computed in one matrix product.
+
+    :param gensim.models.KeyedVectors model: word vector model
+    :param numpy.ndarray queries: 2-D array of query vectors
+    :param int topn: number of results per query
+    :return: arrays of word indices and cosine similarities,
+             in the same format as :meth:`IVFIndex.search`
+    :rtype: tuple[numpy.ndarray, numpy.ndarray]
+    """
+    model.fill_norms()
+    queries = _normalize(np.atleast_2d(np.asarray(queries, np.float32)))
+    topn = min(topn, len(model))
+    ids = np.empty((len(queries), topn), dtype=np.int64)
+    scores = np.empty((len(queries), topn), dtype=np.float32)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for i in range(0, len(queries), _CHUNK_SIZE):
+            chunk = (queries[i : i + _CHUNK_SIZE] @ model.vectors.T) / (
+                model.norms
+            )
+            chunk = np.nan_to_num(chunk, nan=-np.inf)
+            top = _top_k(chunk, topn)
+            ids[i : i + _CHUNK_SIZE] = top
+            scores[i : i + _CHUNK_SIZE] = np.take_along_axis(
+                chunk, top, axis=1
+            )
+
+    return ids, scores
+
+
+def most_similar_batch(
+    model: KeyedVectors,
+    words: List[str],
+    topn: int = 10,
+    index: Union[IVFIndex, None] = None,
+) -> List[List[Tuple[str, float]]]:
+    """
+    Find the `topn` most similar words for each word in a list.
+
+    :param gensim.models.KeyedVectors model: word vector model
+    :param list words: a list of words
+    :param int topn: number of similar words per word
+    :param IVFIndex index: index built over `model.vectors`
+                           for approximate search, or `None` for
+                           exact search
+    :raises KeyError: if any word is not in the vocabulary of the model.
+    :return: a list of (word, cosine similarity) pairs for each word,
+             excluding the word itself
+    :rtype: list[list[tuple[str, float]]]
+    """
+    if not words:
+        return []
+    word_ids = [model.get_index(word) for word in words]
+    queries = model.vectors[word_ids]
+    if index is None:
+        found, scores = exact_search(model, queries, topn + 1)
+    else:
+        found, scores = index.search(queries, topn + 1)
+
+    return [
+        [
+            (model.index_to_key[j], float(score))
+            for j, score in zip(row_ids, row_scores)
+            if j >= 0 and j != word_id
+        ][:topn]
+        for word_id, row_ids, row_scores in zip(word_ids, found, scores)
+    ]
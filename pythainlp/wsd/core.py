@@ -5,17 +5,25 @@ from typing import List, Tuple, Union
 
 from pythainlp.tokenize import Tokenizer
 from pythainlp.util.trie import Trie
-from pythainlp.corpus import thai_wsd_dict
+from pythainlp.corpus import get_derived, thai_wsd_dict
 
-_wsd_dict = thai_wsd_dict()
-_mean_all = {}
 
-for i, j in zip(_wsd_dict["word"], _wsd_dict["meaning"]):
-    _mean_all[i] = j
+def _build_mean_all() -> dict:
+    _wsd_dict = thai_wsd_dict()
+    return dict(zip(_wsd_dict["word"], _wsd_dict["meaning"]))
+
+
+def _get_mean_all() -> dict:
+    return get_derived("thai_wsd_dict", "meanings", _build_mean_all)
+
+
+def _get_word_cut() -> Tokenizer:
+    return get_derived(
+        "thai_wsd_dict",
+        "tokenizer",
+        lambda: Tokenizer(custom_dict=Trie(list(_get_mean_all()))),
+    )
 
-_all_word = set(list(_mean_all.keys()))
-_TRIE = Trie(list(_all_word))
-_word_cut = Tokenizer(custom_dict=_TRIE)
 
 _MODEL = None
 
@@ -51,7 +59,7 @@ def get_sense(
     word: str,
     device: str = "cpu",
     custom_dict: dict = dict(),
-    custom_tokenizer: Tokenizer = _word_cut,
+    custom_tokenizer: Tokenizer = None,
 ) -> List[Tuple[str, float]]:
     """
     Get word sense from the sentence.
@@ -62,7 +70,7 @@ def get_sense(
     :param str device: device for running model on.
     :param dict custom_dict: Thai dictionary {"word":["definition",..]}
     :param Tokenizer custom_tokenizer: Tokenizer used to tokenize words in \
-        sentence.
+        sentence (default: a tokenizer of the words in the dictionary).
     :return: a list of definitions and distances (1 - cos_sim) or \
         an empty list (if word is not in the dictionary)
     :rtype: List[Tuple[str, float]]
@@ -99,7 +107,9 @@ def get_sense(
     """
     global _MODEL
     if not custom_dict:
-        custom_dict = _mean_all
+        custom_dict = _get_mean_all()
+    if custom_tokenizer is None:
+        custom_tokenizer = _get_word_cut()
 
     w = custom_tokenizer.word_tokenize(sentence)
     if word not in set(custom_dict.keys()) or word not in sentence:
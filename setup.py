@@ -84,6 +84,10 @@ extras = {
         "numpy>=1.22",
         "onnxruntime>=1.10.0"
     ],
+    "onnx_export": [
+        "optimum[onnxruntime]>=1.14.0",
+        "transformers>=4.22.1",
+    ],
     "thai_nner": ["thai_nner"],
     "esupar": [
         "esupar>=1.3.8",
@@ -146,6 +150,7 @@ extras = {
         "oskut>=1.3",
         "nlpo3>=1.2.2",
         "onnxruntime>=1.10.0",
+        "optimum[onnxruntime]>=1.14.0",
         "thai_nner",
         "wunsen>=0.0.3",
         "wtpsplit>=1.0.1",
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2016-2024 PyThaiNLP Project
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import unittest
+
+from pythainlp import aio
+from pythainlp.tokenize import sent_tokenize, word_tokenize
+from pythainlp.transliterate import romanize
+
+TEXT = "ผมไปตลาด แล้วก็ซื้อผลไม้ ฉันชอบกินมะม่วง"
+
+
+class TestAioPackage(unittest.TestCase):
+    def tearDown(self):
+        aio.shutdown()
+
+    def test_tokenize(self):
+        self.assertEqual(
+            asyncio.run(aio.word_tokenize(TEXT)), word_tokenize(TEXT)
+        )
+        self.assertEqual(
+            asyncio.run(aio.word_tokenize(TEXT, keep_whitespace=False)),
+            word_tokenize(TEXT, keep_whitespace=False),
+        )
+        self.assertEqual(
+            asyncio.run(aio.sent_tokenize(TEXT)), sent_tokenize(TEXT)
+        )
+
+    def test_romanize(self):
+        words = ["แมว", "หมา", "ภาษาไทย", "แมว"] * 10
+
+        async def main():
+            return await asyncio.gather(
+                *[aio.romanize(word, engine="royin") for word in words]
+            )
+
+        self.assertEqual(
+            asyncio.run(main()),
+            [romanize(word, engine="royin") for word in words],
+        )
+        stats = aio.batcher_stats()["romanize/royin"]
+        self.assertEqual(stats["requests"], len(words))
+        # concurrent calls are romanized in batches
+        self.assertLess(stats["batches"], len(words))
+
+    def test_executor(self):
+        executor = aio.get_executor()
+        self.assertIs(aio.get_executor(), executor)
+        aio.shutdown()
+        self.assertIsNot(aio.get_executor(), executor)
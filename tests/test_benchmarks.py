@@ -2,11 +2,14 @@
 # SPDX-FileCopyrightText: 2016-2024 PyThaiNLP Project
 # SPDX-License-Identifier: Apache-2.0
 
+import json
+import os
+import tempfile
 import unittest
 
 import numpy as np
 import yaml
-from pythainlp.benchmarks import word_tokenization
+from pythainlp.benchmarks import speed, word_tokenization
 
 with open("./tests/data/sentences.yml", "r", encoding="utf8") as stream:
     TEST_DATA = yaml.safe_load(stream)
@@ -58,6 +61,35 @@ class TestBenchmarksPackage(unittest.TestCase):
 
         self.assertIsNotNone(df)
 
+    def test_evaluate(self):
+        expected = []
+        actual = []
+        for pair in TEST_DATA["sentences"]:
+            expected.append(pair["expected"])
+            actual.append(pair["actual"])
+
+        df = word_tokenization.benchmark(expected, actual)
+        for jobs in (1, 2):
+            with tempfile.TemporaryDirectory() as tmpdir:
+                details_file = os.path.join(tmpdir, "details.json")
+                statistics = word_tokenization.evaluate(
+                    iter(expected),
+                    iter(actual),
+                    chunk_size=2,
+                    jobs=jobs,
+                    details_file=details_file,
+                )
+                with open(details_file, encoding="utf-8") as f:
+                    details = json.load(f)
+            for column in word_tokenization.COUNT_COLUMNS:
+                self.assertEqual(statistics[column], float(df[column].sum()))
+            self.assertEqual(details["metrics"], statistics)
+            self.assertEqual(len(details["samples"]), len(df))
+            self.assertEqual(details["samples"][0]["expected"], df["expected"][0])
+
+        with self.assertRaises(ValueError):
+            word_tokenization.evaluate(expected, actual[:-1])
+
     def test_count_correctly_tokenised_words(self):
         for d in TEST_DATA["binary_sentences"]:
             sample = np.array(list(d["actual"])).astype(int)
@@ -89,3 +121,37 @@ class TestBenchmarksPackage(unittest.TestCase):
 
         actual = word_tokenization._flatten_result(result)
         self.assertEqual(actual, {"key1:v1": 6, "key2:v2": 7})
+
+    def test_speed_benchmark(self):
+        report = speed.speed_benchmark(
+            tasks=["word", "subword"],
+            engines=["newmm", "tcc", "NOT_EXIST"],
+            samples=["short"],
+            min_time=0.01,
+            isolate=False,
+        )
+        self.assertEqual(
+            [(r["task"], r["engine"]) for r in report["results"]],
+            [("word", "newmm"), ("subword", "tcc")],
+        )
+        for result in report["results"]:
+            self.assertEqual(result["status"], "ok")
+            stats = result["samples"]["short"]
+            self.assertGreaterEqual(stats["runs"], 3)
+            self.assertGreater(stats["chars_per_sec"], 0)
+            self.assertLessEqual(
+                stats["latency_p50_ms"], stats["latency_p99_ms"]
+            )
+
+        rows = speed.compare(report, report)
+        self.assertEqual(len(rows), 2)
+        self.assertTrue(all(row["status"] == "same" for row in rows))
+
+        baseline = json.loads(json.dumps(report))
+        for result in baseline["results"]:
+            result["samples"]["short"]["chars_per_sec"] *= 2
+        rows = speed.compare(report, baseline)
+        self.assertTrue(all(row["status"] == "regression" for row in rows))
+
+        with self.assertRaises(ValueError):
+            speed.speed_benchmark(tasks=["NOT_EXIST"])
@@ -21,3 +21,36 @@ class TestClsPackage(unittest.TestCase):
         ]
         model = GzipModel(training_data)
         self.assertEqual(model.predict("ฉันดีใจ", k=1), "Positive")
+        self.assertEqual(
+            model.predict_many(["ฉันดีใจ", "ขับรถแย่มาก"], k=1, n_jobs=2),
+            ["Positive", "Negative"],
+        )
+        self.assertEqual(
+            model.predict_many(
+                ["ฉันดีใจ", "ขับรถแย่มาก"], n_jobs=2, prefer="processes"
+            ),
+            ["Positive", "Negative"],
+        )
+        self.assertEqual(model.predict_many([]), [])
+        self.assertEqual(
+            model.training_data.tolist(), [list(x) for x in training_data]
+        )
+        with self.assertRaises(ValueError):
+            model.predict_many(["ฉันดีใจ"], prefer="thread")
+        for compressor in ["zlib", "zlib_dict"]:
+            model = GzipModel(training_data, compressor=compressor, level=6)
+            self.assertEqual(model.predict("ขับรถแย่มาก"), "Negative")
+        # primed compressors are copied, not used up, by each prediction
+        long_data = [(text * 100, label) for text, label in training_data]
+        model = GzipModel(long_data, compressor="zlib_dict", level=6)
+        self.assertTrue(all(model._primed))
+        self.assertEqual(model.predict("ขับรถแย่มาก"), "Negative")
+        self.assertEqual(model.predict("ขับรถแย่มาก"), "Negative")
+        self.assertEqual(
+            model.predict_many(
+                ["ฉันดีใจ", "ขับรถแย่มาก"], n_jobs=2, prefer="processes"
+            ),
+            [model.predict("ฉันดีใจ"), "Negative"],
+        )
+        with self.assertRaises(ValueError):
+            GzipModel(training_data, compressor="rar")
@@ -2,11 +2,17 @@
 # SPDX-FileCopyrightText: 2016-2024 PyThaiNLP Project
 # SPDX-License-Identifier: Apache-2.0
 
+import json
+import os
+import tempfile
+import threading
 import unittest
+import urllib.request
 from argparse import ArgumentError
 from types import ModuleType
 
 from pythainlp import __main__, cli
+from pythainlp.cli.serve import BatchingService, make_server
 
 
 class TestMainPackage(unittest.TestCase):
@@ -177,3 +183,94 @@ class TestMainPackage(unittest.TestCase):
                 ]
             )
         )
+
+    def test_cli_tokenize_bulk(self):
+        lines = ["ถ้าฉันยิงกระต่ายได้", "", "ฉันก็ยิงฟาสซิสต์ได้"] * 3
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_file = os.path.join(tmpdir, "input.txt")
+            output_file = os.path.join(tmpdir, "output.jsonl")
+            with open(input_file, "w", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+
+            for jobs in (1, 2):
+                cli.tokenize.App(
+                    [
+                        "thainlp",
+                        "tokenize",
+                        "word",
+                        "-i",
+                        input_file,
+                        "-o",
+                        output_file,
+                        "-f",
+                        "jsonl",
+                        "-j",
+                        str(jobs),
+                        "-b",
+                        "2",
+                    ]
+                )
+                with open(output_file, encoding="utf-8") as f:
+                    results = [json.loads(line) for line in f]
+                self.assertEqual(len(results), len(lines))
+                self.assertEqual(results[0], ["ถ้า", "ฉัน", "ยิง", "กระต่าย", "ได้"])
+                self.assertEqual(results[1], [])
+                self.assertEqual(results[3], results[0])
+
+            cli.tokenize.App(
+                [
+                    "thainlp",
+                    "tokenize",
+                    "word",
+                    "-s",
+                    "|",
+                    "-i",
+                    input_file,
+                    "-o",
+                    output_file,
+                ]
+            )
+            with open(output_file, encoding="utf-8") as f:
+                self.assertEqual(f.readline(), "ถ้า|ฉัน|ยิง|กระต่าย|ได้|\n")
+
+    def test_cli_serve(self):
+        self.assertIsInstance(getattr(cli, "serve"), ModuleType)
+
+        service = BatchingService(max_batch_size=4, max_wait=0.01)
+        self.assertEqual(
+            service.handle("tokenize", {"texts": ["สวัสดีครับ", "ทดสอบ"]}),
+            {"results": [["สวัสดี", "ครับ"], ["ทดสอบ"]]},
+        )
+        with self.assertRaises(ValueError):
+            service.handle("tokenize", {"txt": "ทดสอบ"})
+        # an unknown option creates no batcher
+        for engine in ["no-such-engine", ["newmm"], 1]:
+            with self.assertRaises(ValueError):
+                service.handle("tokenize", {"text": "ทดสอบ", "engine": engine})
+        self.assertEqual(len(service.stats()["tasks"]), 1)
+
+        # a path that is not a socket is never removed
+        with tempfile.NamedTemporaryFile() as f:
+            with self.assertRaises(ValueError):
+                make_server(service, unix_socket=f.name)
+            self.assertTrue(os.path.exists(f.name))
+
+        server = make_server(service, port=0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_address[1]}"
+        request = urllib.request.Request(
+            url + "/tokenize",
+            data=json.dumps({"text": "สวัสดีครับ"}).encode("utf-8"),
+            method="POST",
+        )
+        with urllib.request.urlopen(request) as response:
+            self.assertEqual(
+                json.loads(response.read()), {"result": ["สวัสดี", "ครับ"]}
+            )
+        with urllib.request.urlopen(url + "/stats") as response:
+            stats = json.loads(response.read())
+        task = stats["tasks"]["tokenize(engine=newmm, keep_whitespace=True)"]
+        self.assertEqual(task["requests"], 3)
+        server.shutdown()
+        server.server_close()
+        service.close()
@@ -2,25 +2,38 @@
 # SPDX-FileCopyrightText: 2016-2024 PyThaiNLP Project
 # SPDX-License-Identifier: Apache-2.0
 
+import hashlib
+import json
 import os
+import stat
+import tarfile
+import tempfile
+import threading
 import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
 
 import nltk
 from nltk.corpus import wordnet as wn
 from requests import Response
 
 from pythainlp.corpus import (
+    clear_derived,
     conceptnet,
     countries,
+    derived_resources,
     download,
+    download_many,
     find_synonyms,
     get_corpus_db,
     get_corpus_db_detail,
     get_corpus_default_db,
     get_corpus_path,
+    get_derived,
     oscar,
     provinces,
     remove,
+    resolve_paths,
     thai_family_names,
     thai_female_names,
     thai_icu_words,
@@ -37,7 +50,48 @@ from pythainlp.corpus import (
     ttc,
     wordnet,
 )
+from pythainlp.corpus import corpus_db_path
+from pythainlp.corpus.core import _download
+from pythainlp.corpus.bundle import CorpusBundle, install, pack
+from pythainlp.corpus import bundle as corpus_bundle
+from pythainlp.corpus import core as corpus_core
+from pythainlp.corpus import ngram
+from pythainlp.corpus.ngram import NgramStore, get_ngram_store
 from pythainlp.corpus.util import revise_newmm_default_wordset
+from pythainlp.tools import get_full_data_path
+
+
+class _RangeRequestHandler(BaseHTTPRequestHandler):
+    # files: path -> content, ranges: Range headers of the requests
+    files = {}
+    ranges = []
+
+    def do_GET(self):
+        content = self.files.get(self.path)
+        if content is None:
+            self.send_error(404)
+            return
+        start = 0
+        header = self.headers.get("Range")
+        if header:
+            self.ranges.append(header)
+            start = int(header[len("bytes="):].split("-")[0])
+            if start >= len(content):
+                self.send_error(416)
+                return
+            self.send_response(206)
+            self.send_header(
+                "Content-Range",
+                f"bytes {start}-{len(content) - 1}/{len(content)}",
+            )
+        else:
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(content) - start))
+        self.end_headers()
+        self.wfile.write(content[start:])
+
+    def log_message(self, format, *args):
+        pass
 
 
 class TestCorpusPackage(unittest.TestCase):
@@ -145,6 +199,325 @@ class TestCorpusPackage(unittest.TestCase):
         self.assertIsNotNone(remove("test"))
         # END - Need to clean up this section
 
+    def test_download_local_server(self):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _RangeRequestHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+        contents = {name: os.urandom(300000) for name in ("a", "b", "c")}
+        catalog = {}
+        for name, content in contents.items():
+            md5 = hashlib.md5(content).hexdigest()
+            catalog[f"test_local_{name}"] = {
+                "name": f"test_local_{name}",
+                "latest_version": "0.1",
+                "versions": {
+                    "0.1": {
+                        "filename": f"test_local_{name}.bin",
+                        "download_url": f"{base_url}/{name}.bin",
+                        "md5": md5 if name != "c" else "0" * 32,
+                        "pythainlp_version": ">=2.0",
+                        "is_tar_gz": "False",
+                        "is_zip": "False",
+                    }
+                },
+            }
+        _RangeRequestHandler.files = {
+            "/db.json": json.dumps(catalog).encode("utf-8"),
+            **{f"/{name}.bin": content for name, content in contents.items()},
+        }
+        _RangeRequestHandler.ranges = []
+        try:
+            # an interrupted download of "a"
+            with open(get_full_data_path("test_local_a.bin.part"), "wb") as f:
+                f.write(contents["a"][:100000])
+            results = download_many(
+                ["test_local_a", "test_local_b", "test_local_c", "XxxXX"],
+                url=f"{base_url}/db.json",
+                jobs=3,
+            )
+            self.assertEqual(
+                results,
+                {
+                    "test_local_a": True,
+                    "test_local_b": True,
+                    "test_local_c": False,  # hash does not match
+                    "XxxXX": False,
+                },
+            )
+            self.assertEqual(_RangeRequestHandler.ranges, ["bytes=100000-"])
+            for name in ("a", "b"):
+                with open(get_corpus_path(f"test_local_{name}"), "rb") as f:
+                    self.assertEqual(f.read(), contents[name])
+            self.assertEqual(get_corpus_db_detail("test_local_c"), {})
+            self.assertFalse(
+                os.path.exists(get_full_data_path("test_local_c.bin.part"))
+            )
+            self.assertFalse(
+                os.path.exists(get_full_data_path("test_local_a.bin.part"))
+            )
+
+            # downloads of the same file wait for each other, instead of
+            # writing to the same .part file
+            _RangeRequestHandler.ranges = []
+            md5 = hashlib.md5(contents["b"]).hexdigest()
+            threads = [
+                threading.Thread(
+                    target=_download,
+                    args=(f"{base_url}/b.bin", "test_local_lock.bin", md5),
+                )
+                for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            lock_path = get_full_data_path("test_local_lock.bin")
+            with open(lock_path, "rb") as f:
+                self.assertEqual(f.read(), contents["b"])
+            self.assertEqual(_RangeRequestHandler.ranges, [])
+            os.remove(lock_path)
+            os.remove(lock_path + ".part.lock")
+        finally:
+            server.shutdown()
+            server.server_close()
+            self.assertTrue(remove("test_local_a"))
+            self.assertTrue(remove("test_local_b"))
+        self.assertEqual(get_corpus_db_detail("test_local_a"), {})
+
+    def test_catalog_index(self):
+        with open(corpus_db_path(), "rb") as f:
+            original = f.read()
+        entry = {
+            "name": "test_catalog",
+            "version": "0.1",
+            "filename": "corpus_db_test_catalog.txt",
+            "is_folder": False,
+            "foldername": None,
+        }
+        try:
+            self.assertEqual(get_corpus_db_detail("test_catalog"), {})
+            # changes of the catalog by other processes are seen
+            db = {"_default": {"1": entry, "2": {**entry, "version": "0.2"}}}
+            with open(corpus_db_path(), "w", encoding="utf-8") as f:
+                json.dump(db, f)
+            self.assertEqual(get_corpus_db_detail("test_catalog"), entry)
+            self.assertEqual(
+                get_corpus_db_detail("test_catalog", version="0.2")["version"],
+                "0.2",
+            )
+            self.assertEqual(
+                get_corpus_db_detail("test_catalog", version="0.3"), {}
+            )
+            # returned details are copies
+            get_corpus_db_detail("test_catalog")["version"] = "9.9"
+            self.assertEqual(
+                get_corpus_db_detail("test_catalog")["version"], "0.1"
+            )
+
+            path = get_full_data_path(entry["filename"])
+            self.assertEqual(
+                resolve_paths(["test_catalog", "thainer", "XxxXX"]),
+                {
+                    "test_catalog": None,  # file does not exist
+                    "thainer": get_corpus_default_db("thainer"),
+                    "XxxXX": None,
+                },
+            )
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("test")
+            self.assertEqual(
+                resolve_paths(["test_catalog"]), {"test_catalog": path}
+            )
+            self.assertEqual(get_corpus_path("test_catalog"), path)
+            # the rewritten catalog keeps its mode, e.g. readable by others
+            os.chmod(corpus_db_path(), 0o644)
+            self.assertTrue(remove("test_catalog"))
+            self.assertEqual(
+                stat.S_IMODE(os.stat(corpus_db_path()).st_mode), 0o644
+            )
+            self.assertFalse(os.path.exists(path))
+            self.assertEqual(get_corpus_db_detail("test_catalog"), {})
+        finally:
+            with open(corpus_db_path(), "wb") as f:
+                f.write(original)
+
+    def test_bundle(self):
+        with open(corpus_db_path(), "rb") as f:
+            original = f.read()
+        contents = {
+            "test_bundle_file.txt": "ไฟล์ทดสอบ\n" * 1000,
+            "test_bundle_folder_0.1/a.txt": "a" * 513,
+            "test_bundle_folder_0.1/sub/b.txt": "",
+        }
+        db = {
+            "_default": {
+                "1": {
+                    "name": "test_bundle_file",
+                    "version": "0.1",
+                    "filename": "test_bundle_file.txt",
+                    "is_folder": False,
+                    "foldername": None,
+                },
+                "2": {
+                    "name": "test_bundle_folder",
+                    "version": "0.1",
+                    "filename": "test_bundle_folder.tar.gz",
+                    "is_folder": True,
+                    "foldername": "test_bundle_folder_0.1",
+                },
+            }
+        }
+        names = ["test_bundle_file", "test_bundle_folder"]
+        tmp_dir = tempfile.mkdtemp()
+        bundle_path = os.path.join(tmp_dir, "bundle.tar")
+        try:
+            with open(corpus_db_path(), "w", encoding="utf-8") as f:
+                json.dump(db, f)
+            for filename, content in contents.items():
+                path = get_full_data_path(filename)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write(content)
+
+            self.assertEqual(pack(names + ["thainer"], bundle_path), names)
+            with self.assertRaises(ValueError):
+                pack(["XxxXX"], bundle_path)
+            with self.assertRaises(ValueError):
+                CorpusBundle(__file__)
+
+            with CorpusBundle(bundle_path) as bundle:
+                self.assertEqual(bundle.names(), names)
+                self.assertEqual(
+                    bundle.detail("test_bundle_folder"), db["_default"]["2"]
+                )
+                self.assertEqual(bundle.detail("XxxXX"), {})
+                self.assertEqual(
+                    sorted(bundle.files("test_bundle_folder")),
+                    sorted(list(contents)[1:]),
+                )
+                # files are addressable by offset in the uncompressed tar
+                offsets = {
+                    filename: member["offset"]
+                    for corpus in bundle.index["corpora"].values()
+                    for filename, member in corpus["files"].items()
+                }
+                with tarfile.open(bundle_path) as tar:
+                    members = tar.getmembers()[:-1]  # last one is the index
+                    self.assertEqual(len(members), len(offsets))
+                    for member in members:
+                        self.assertEqual(
+                            offsets[member.name], member.offset_data
+                        )
+                with bundle.memoryview("test_bundle_file") as view:
+                    self.assertEqual(
+                        bytes(view),
+                        contents["test_bundle_file.txt"].encode("utf-8"),
+                    )
+                with bundle.open(
+                    "test_bundle_folder", "test_bundle_folder_0.1/a.txt"
+                ) as f:
+                    self.assertEqual(f.read(3), b"aaa")
+                    f.seek(-2, os.SEEK_END)
+                    self.assertEqual(f.read(), b"aa")
+                with self.assertRaises(ValueError):
+                    bundle.memoryview("test_bundle_folder")
+
+            for name in names:
+                self.assertTrue(remove(name))
+            self.assertEqual(
+                resolve_paths(names), {name: None for name in names}
+            )
+            self.assertEqual(install(bundle_path), names)
+            self.assertEqual(install(bundle_path), [])  # up to date
+            umask = os.umask(0o022)
+            os.umask(umask)
+            for filename, content in contents.items():
+                with open(get_full_data_path(filename), encoding="utf-8") as f:
+                    self.assertEqual(f.read(), content)
+                # installed files get the mode of new files, not 0600
+                self.assertEqual(
+                    stat.S_IMODE(os.stat(get_full_data_path(filename)).st_mode),
+                    0o666 & ~umask,
+                )
+            self.assertEqual(
+                stat.S_IMODE(os.stat(bundle_path).st_mode), 0o666 & ~umask
+            )
+            self.assertEqual(
+                get_corpus_db_detail("test_bundle_folder"), db["_default"]["2"]
+            )
+
+            # corpora are installed from PYTHAINLP_BUNDLE, not downloaded
+            self.assertTrue(remove("test_bundle_file"))
+            os.environ["PYTHAINLP_BUNDLE"] = bundle_path
+            try:
+                self.assertEqual(
+                    get_corpus_path("test_bundle_file"),
+                    get_full_data_path("test_bundle_file.txt"),
+                )
+
+                # read-only, the data directory is not written to
+                self.assertTrue(remove("test_bundle_file"))
+                self.assertTrue(remove("test_bundle_folder"))
+                with patch.object(
+                    corpus_core, "_CHECK_MODE", "1"
+                ), patch.object(corpus_bundle, "_CHECK_MODE", "1"):
+                    path = get_corpus_path("test_bundle_file")
+                    self.assertNotEqual(
+                        path, get_full_data_path("test_bundle_file.txt")
+                    )
+                    with open(path, encoding="utf-8") as f:
+                        self.assertEqual(
+                            f.read(), contents["test_bundle_file.txt"]
+                        )
+                    self.assertEqual(get_corpus_path("test_bundle_file"), path)
+                    folder = get_corpus_path("test_bundle_folder")
+                    with open(
+                        os.path.join(folder, "a.txt"), encoding="utf-8"
+                    ) as f:
+                        self.assertEqual(f.read(), "a" * 513)
+                    self.assertIsNone(get_corpus_path("test_bundle_file", "9"))
+                self.assertFalse(
+                    os.path.exists(get_full_data_path("test_bundle_file.txt"))
+                )
+                self.assertEqual(
+                    resolve_paths(names), {name: None for name in names}
+                )
+            finally:
+                del os.environ["PYTHAINLP_BUNDLE"]
+        finally:
+            for name in names:
+                remove(name)
+            with open(corpus_db_path(), "wb") as f:
+                f.write(original)
+            if os.path.exists(bundle_path):
+                os.remove(bundle_path)
+            os.rmdir(tmp_dir)
+
+    def test_derived(self):
+        calls = []
+
+        def build():
+            calls.append(1)
+            return frozenset(calls)
+
+        resource = get_derived("test_derived", "set", build)
+        self.assertIs(get_derived("test_derived", "set", build), resource)
+        self.assertEqual(len(calls), 1)
+        self.assertIn(("test_derived", "set"), derived_resources())
+        clear_derived("test_derived")
+        self.assertNotIn(("test_derived", "set"), derived_resources())
+        get_derived("test_derived", "set", build)
+        self.assertEqual(len(calls), 2)
+        clear_derived("test_derived")
+
+        # the default dictionary trie is shared by the tokenizers
+        from pythainlp.tokenize import DEFAULT_WORD_DICT_TRIE
+
+        self.assertIs(
+            get_derived("thai_words", "trie", lambda: None),
+            DEFAULT_WORD_DICT_TRIE,
+        )
+
     def test_oscar(self):
         self.assertIsNotNone(oscar.word_freqs())
         self.assertIsNotNone(oscar.unigram_word_freqs())
@@ -155,6 +528,70 @@ class TestCorpusPackage(unittest.TestCase):
         self.assertIsNotNone(tnc.bigram_word_freqs())
         self.assertIsNotNone(tnc.trigram_word_freqs())
 
+    def test_ngram_store(self):
+        store = NgramStore.from_counts(
+            [
+                {"ผม": 10, "รัก": 5, "คุณ": 4},
+                {("ผม", "รัก"): 5, ("ผม", "คุณ"): 1, ("รัก", "คุณ"): 3},
+                {("ผม", "รัก", "คุณ"): 3},
+            ]
+        )
+        self.assertEqual(store.order, 3)
+        self.assertEqual(store.total, 19)
+        self.assertEqual(store.count("ผม", "รัก"), 5)
+        self.assertEqual(store.count("รัก", "ผม"), 0)
+        self.assertEqual(store.count("ไม่มี"), 0)
+        self.assertEqual(store.prob("ผม", "รัก"), 0.5)
+        self.assertEqual(store.prob("ผม", "รัก", "คุณ"), 0.6)
+        self.assertEqual(store.prob("ไม่มี", "คุณ"), 0.0)
+        self.assertEqual(
+            store.continuations("ผม"), [("รัก", 5), ("คุณ", 1)]
+        )
+        self.assertEqual(store.continuations("คุณ"), [])
+        self.assertEqual(store.ngram_count(2), 3)
+        self.assertEqual(store.ngram(3, 0), ("ผม", "รัก", "คุณ"))
+
+        tnc_store = get_ngram_store("tnc")
+        self.assertEqual(
+            tnc_store.count("ที่"), tnc.unigram_word_freqs()["ที่"]
+        )
+        self.assertIs(get_ngram_store("tnc"), tnc_store)
+        with self.assertRaises(ValueError):
+            get_ngram_store("ttc", order=2)
+
+    def test_ngram_store_rebuild(self):
+        # a saved store is converted again when its source file changes
+        data_dir = os.environ.get("PYTHAINLP_DATA_DIR")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            os.environ["PYTHAINLP_DATA_DIR"] = tmp_dir
+            source = os.path.join(tmp_dir, "freq.txt")
+
+            def freqs(order):
+                with open(source, encoding="utf-8") as f:
+                    return [
+                        {w: int(c) for w, c in (ln.split() for ln in f)}
+                    ]
+
+            ngram._SOURCES["test"] = (freqs, lambda order: [source], 1)
+            try:
+                with open(source, "w", encoding="utf-8") as f:
+                    f.write("ผม 1\n")
+                self.assertEqual(get_ngram_store("test").count("ผม"), 1)
+                del ngram._STORES[("test", 1)]
+                self.assertEqual(get_ngram_store("test").count("ผม"), 1)
+
+                del ngram._STORES[("test", 1)]
+                with open(source, "w", encoding="utf-8") as f:
+                    f.write("ผม 10\n")
+                self.assertEqual(get_ngram_store("test").count("ผม"), 10)
+            finally:
+                del ngram._SOURCES["test"]
+                ngram._STORES.pop(("test", 1), None)
+                if data_dir is None:
+                    del os.environ["PYTHAINLP_DATA_DIR"]
+                else:
+                    os.environ["PYTHAINLP_DATA_DIR"] = data_dir
+
     def test_ttc(self):
         self.assertIsNotNone(ttc.word_freqs())
         self.assertIsNotNone(ttc.unigram_word_freqs())
@@ -2,9 +2,13 @@
 # SPDX-FileCopyrightText: 2016-2024 PyThaiNLP Project
 # SPDX-License-Identifier: Apache-2.0
 
+import sys
 import unittest
+from unittest.mock import patch
 
 from pythainlp.generate import Unigram, Bigram, Trigram
+from pythainlp.corpus.ngram import NgramStore
+from pythainlp.generate.core import _DictNgrams, _get_store, _word_freqs
 from pythainlp.generate.thai2fit import gen_sentence
 
 
@@ -44,6 +48,89 @@ class TestGeneratePackage(unittest.TestCase):
         self.assertIsNotNone(_trigram.gen_sentence())
         self.assertIsNotNone(_trigram.gen_sentence(duplicate=True))
 
+    def test_without_numpy(self):
+        # n-gram counts are read from dictionaries if NumPy is missing
+        freqs = [
+            {"ผม": 4, "กิน": 3, "ข้าว": 2, "น้ำ": 1},
+            {("ผม", "กิน"): 3, ("กิน", "ข้าว"): 2, ("กิน", "น้ำ"): 1},
+            {("ผม", "กิน", "ข้าว"): 2, ("ผม", "กิน", "น้ำ"): 1},
+        ]
+        no_numpy = {"numpy": None, "pythainlp.corpus.ngram": None}
+        with patch.dict(sys.modules, no_numpy):
+            self.assertIsInstance(_get_store("ttc", 1), _DictNgrams)
+            with patch(
+                "pythainlp.generate.core._word_freqs",
+                lambda name, order: freqs[:order],
+            ):
+                _bigram = Bigram()
+                _trigram = Trigram()
+        self.assertIsInstance(_bigram.store, _DictNgrams)
+        self.assertEqual(
+            _bigram.gen_sentence("ผม", N=2, prob=0.5), "ผมกินข้าว"
+        )
+        self.assertEqual(
+            _trigram.gen_sentence(("ผม", "กิน"), N=1, prob=0.5), "ผมกินข้าว"
+        )
+
+        store = _DictNgrams(freqs)
+        numpy_store = NgramStore.from_counts(freqs)
+        for words in [
+            (),
+            ("ผม",),
+            ("กิน", "น้ำ"),
+            ("ผม", "กิน", "ข้าว"),
+            ("XxxXX",),
+            ("ผม", "ข้าว"),
+        ]:
+            self.assertEqual(store.count(*words), numpy_store.count(*words))
+            self.assertEqual(store.prob(*words), numpy_store.prob(*words))
+        for context in [("กิน",), ("ผม", "กิน"), ("น้ำ",), ("XxxXX",)]:
+            self.assertEqual(
+                store.continuations(*context),
+                numpy_store.continuations(*context),
+            )
+        for order in range(1, 4):
+            n = store.ngram_count(order)
+            self.assertEqual(n, numpy_store.ngram_count(order))
+            self.assertEqual(
+                sorted(store.ngram(order, i) for i in range(n)),
+                sorted(numpy_store.ngram(order, i) for i in range(n)),
+            )
+            self.assertEqual(
+                store.ngram_freqs(order), numpy_store.ngram_freqs(order)
+            )
+        self.assertEqual(
+            sorted(store.word_freqs()), sorted(numpy_store.word_freqs())
+        )
+        with self.assertRaises(ValueError):
+            _word_freqs("ttc", 2)
+
+    def test_ngram_counts(self):
+        freqs = [
+            {"ผม": 4, "กิน": 3, "ข้าว": 2},
+            {("ผม", "กิน"): 3, ("กิน", "ข้าว"): 2},
+            {("ผม", "กิน", "ข้าว"): 2},
+        ]
+        with patch(
+            "pythainlp.generate.core._get_store",
+            lambda name, order: NgramStore.from_counts(freqs[:order]),
+        ):
+            _bigram = Bigram()
+            _trigram = Trigram()
+        for gen in (_bigram, _trigram):
+            self.assertEqual(gen.uni, freqs[0])
+            self.assertEqual(gen.uni.get("XxxXX", 0), 0)
+            self.assertEqual(gen.bi, freqs[1])
+            self.assertEqual(sorted(gen.uni_keys), sorted(freqs[0]))
+            self.assertEqual(sorted(gen.bi_keys), sorted(freqs[1]))
+            self.assertEqual(sorted(gen.words), ["กิน", "ข้าว"])
+            with self.assertRaises(AttributeError):
+                gen.uni = {}
+            with self.assertRaises(TypeError):
+                gen.uni["XxxXX"] = 1
+        self.assertEqual(_trigram.ti, freqs[2])
+        self.assertEqual(_trigram.ti_keys, list(freqs[2]))
+
     # def test_thai2fit(self):
     #     self.assertIsNotNone(gen_sentence("กาลครั้งหนึ่งนานมาแล้ว"))
     #     self.assertIsNotNone(gen_sentence("กาลครั้งหนึ่งนานมาแล้ว", output_str=False))
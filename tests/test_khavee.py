@@ -4,9 +4,35 @@
 
 import unittest
 from pythainlp.khavee import KhaveeVerifier
+from pythainlp.util import syllable_info
 
 kv = KhaveeVerifier()
 
+# klon 8 poems of pythainlp/khavee/example.py, one that follows the
+# principle and one that does not
+POEMS = [
+    """ณรงค์วุฒิผู้เปี่ยมวุฒิสมสง่า มากวิชาหาความรู้ไปสู่ผล
+เรื่องฟิสิกส์คณิตศาสตร์เอิร์นอดทน เล่นเกมเก่งลำดับต้นของโรงเรียน
+ต่อมาหยกธนัชพรชอบนอนหลับ แต่ผลลัพธ์คือฉลาดเรื่องอ่านเขียน
+เหมือนจะเล่นแต่เขายังพากเพียร ในการเรียนการเล่นบ้างคละกันไป
+นรภัทรพุกกะมานป่านจอมแก่น ทั่วแว่นแคว้นโดนเขาแกล้งไม่สงสัย
+เรื่องวิศวะเก่งกาจประหลาดใจ เรื่องฟิสิกส์ไร้ผู้ใดมาต่อกร
+นริศราอีฟเก่งกว่าใครเพื่อน คอยช่วยเตือนเรื่องงานคอยสั่งสอน
+อ่านตำราหาความรู้ไม่ละทอน เป็นคนดีศรีนครของจิตรลดา
+ภัสนันท์นาคลออหรือมีมี่ เรื่องเกมนี้เก่งกาจไม่กังขา
+เกมอะไรก็เล่นได้ไม่ลดวา สุดฉลาดมากปัญญามาครบครัน""",
+    """ณรงค์วุฒิผู้เปี่ยมวุฒิสมสง่า มากวิชาหาความรู้ไปสู่ผล
+เรื่องฟิสิกส์คณิตศาสตร์เอิร์นอดทน เล่นเกมเก่งลำดับต้นของโรงเรียน
+ต่อมาหยกธนัชพรชอบนอนหลับ แต่ผลลัพธ์คือฉลาดเรื่องอ่านเขียน
+เหมือนจะเล่นแต่เขายังพากเพียร ในการเรียนการเล่นบ้างคละกันไป
+นรภัทรพุกกะมานป่านจอมแก่น ทั่วแว่นแคว้นโดนเขาแกล้งไม่สงสัย
+เรื่องวิศวะเก่งกาจประหลาดใจ เรื่องฟิสิกส์ไร้ผู้ใดมาต่อไป
+นริศราอีฟเก่งกว่าใครเพื่อน คอยช่วยเตือนเรื่องงานคอยสั่งสอน
+อ่านตำราหาความรู้ไม่ละทอน เป็นคนดีศรีนครของจิตรลดา
+ภัสนันท์นาคลออหรือมีมี่ เรื่องเกมเอ่อเก่งกาจไม่กังขา
+เกมอะไรก็เล่นได้ไม่ลดวา สุดฉลาดมากปัญญามาครบครัน""",
+]
+
 
 class TestKhaveePackage(unittest.TestCase):
     def test_check_sara(self):
@@ -19,6 +45,21 @@ class TestKhaveePackage(unittest.TestCase):
         self.assertTrue(kv.is_sumpus("สรร", "อัน"))
         self.assertFalse(kv.is_sumpus("สรร", "แมว"))
 
+    def test_rhyme_key(self):
+        self.assertEqual(kv.rhyme_key("สาว"), ("อา", "เกอว"))
+        self.assertEqual(kv.rhyme_key("สรร"), kv.rhyme_key("อัน"))
+        self.assertNotEqual(kv.rhyme_key("สรร"), kv.rhyme_key("แมว"))
+
+    def test_shared_analysis(self):
+        # verifiers keep no cache of their own, the analysis of a word is
+        # shared by every instance through syllable_info
+        kv.check_sara("เริง")
+        misses = syllable_info.cache_info().misses
+        other = KhaveeVerifier()
+        self.assertEqual(other.rhyme_key("เริง"), kv.rhyme_key("เริง"))
+        self.assertEqual(syllable_info.cache_info().misses, misses)
+        self.assertEqual(vars(other), {})
+
     def test_check_klon(self):
         self.assertEqual(
             kv.check_klon(
@@ -40,6 +81,23 @@ class TestKhaveePackage(unittest.TestCase):
             ],
         )
 
+    def test_check_klon_poems(self):
+        # the analysis of each distinct syllable is computed once and
+        # shared, so checking the poems again gives the same results
+        # without analysing any syllable again
+        syllable_info.cache_clear()
+        results = [kv.check_klon(poem, k_type=8) for poem in POEMS]
+        self.assertEqual(
+            results[0], "The poem is correct according to the principle."
+        )
+        self.assertIsInstance(results[1], list)
+        misses = syllable_info.cache_info().misses
+        self.assertGreater(misses, 0)
+        self.assertEqual(
+            [kv.check_klon(poem, k_type=8) for poem in POEMS], results
+        )
+        self.assertEqual(syllable_info.cache_info().misses, misses)
+
     def test_check_aek_too(self):
         self.assertEqual(kv.check_aek_too("ไกด์"), False)
         self.assertEqual(kv.check_aek_too("ไก่"), "aek")
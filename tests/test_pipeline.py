@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2016-2024 PyThaiNLP Project
+# SPDX-License-Identifier: Apache-2.0
+
+import unittest
+
+from pythainlp import Pipeline
+from pythainlp.tag import NER, chunk_parse, pos_tag
+from pythainlp.tokenize import clause_tokenize, sent_tokenize, word_tokenize
+
+TEXT = "ผมไปตลาด แล้วก็ซื้อผลไม้ ฉันชอบกินมะม่วง"
+
+
+class TestPipelinePackage(unittest.TestCase):
+    def test_words_sentences(self):
+        nlp = Pipeline(layers=["words", "sentences"])
+        doc = nlp(TEXT)
+        self.assertEqual(doc.words, word_tokenize(TEXT))
+        self.assertEqual(doc.sentences, sent_tokenize(TEXT))
+        self.assertEqual(len(doc), len(doc.words))
+        self.assertEqual(list(doc), doc.words)
+
+        docs = list(nlp.pipe([TEXT, "", "ไปเที่ยว"] * 3, batch_size=2))
+        self.assertEqual(len(docs), 9)
+        self.assertEqual(docs[0].words, doc.words)
+        self.assertEqual(docs[1].words, [])
+        self.assertEqual(docs[1].sentences, [])
+
+        with self.assertRaises(ValueError):
+            Pipeline(layers=["lemma"])
+
+    def test_tags(self):
+        nlp = Pipeline(layers=["pos_tags", "entities"])
+        doc = nlp(TEXT)
+        self.assertEqual(doc.pos_tags, pos_tag(doc.words, corpus="orchid_ud"))
+        self.assertEqual(doc.clauses, clause_tokenize(doc.words))
+        self.assertEqual(
+            doc.chunks, chunk_parse(pos_tag(doc.words, corpus="orchid"))
+        )
+        self.assertEqual([word for word, _ in doc.entities], doc.words)
+        self.assertEqual(
+            NER("thainer").engine.get_ner_batch([doc.words], pos=False),
+            [doc.entities],
+        )
@@ -218,6 +218,40 @@ class TestTagPackage(unittest.TestCase):
             ner.get_ner("วันที่ 15 ก.ย. 61 ทดสอบระบบเวลา 14:49 น.", tag=True)
         )
 
+        # batch of texts, tokenized texts, and POS-tagged texts
+        texts = ["วันที่ 15 ก.ย. 61 ทดสอบระบบเวลา 14:49 น.", "", "ไทย"]
+        expected = [ner.get_ner(text) for text in texts]
+        self.assertEqual(ner.get_ner_batch(texts), expected)
+        self.assertEqual(ner.get_ner_batch(texts, n_jobs=2), expected)
+        # the worker processes are kept for the next calls
+        executor = ner._executor
+        self.assertEqual(
+            ner.get_ner_batch(texts, n_jobs=2, batch_size=1), expected
+        )
+        self.assertIs(ner._executor, executor)
+        ner.close()
+        self.assertIsNone(ner._executor)
+        self.assertEqual(
+            ner.get_ner_batch(
+                [[word for word, _, _ in ner_tags] for ner_tags in expected]
+            ),
+            expected,
+        )
+        self.assertEqual(
+            ner.get_ner_batch(
+                [
+                    [(word, pos) for word, pos, _ in ner_tags]
+                    for ner_tags in expected
+                ],
+                pos=False,
+            ),
+            [ner.get_ner(text, pos=False) for text in texts],
+        )
+        self.assertEqual(
+            ner.get_ner_batch(texts, tag=True),
+            [ner.get_ner(text, tag=True) for text in texts],
+        )
+
         ner = ThaiNameTagger(version="1.4")
         self.assertEqual(ner.get_ner(""), [])
         self.assertIsNotNone(ner.get_ner("แมวทำอะไรตอนห้าโมงเช้า"))
@@ -343,6 +377,11 @@ class TestTagPackage(unittest.TestCase):
         self.assertIsNotNone(ner.tag("แมวทำอะไรตอนห้าโมงเช้า"))
         self.assertIsNotNone(ner.tag("แมวทำอะไรตอนห้าโมงเช้า", pos=False))
         self.assertIsNotNone(ner.tag("แมวทำอะไรตอนห้าโมงเช้า", tag=True))
+        texts = ["แมวทำอะไรตอนห้าโมงเช้า", "ไปเชียงใหม่"]
+        self.assertEqual(
+            ner.tag_batch(texts, tag=True, batch_size=1),
+            [ner.tag(text, tag=True) for text in texts],
+        )
         # ner = NER(engine="wangchanberta")
         # self.assertIsNotNone(ner.tag("แมวทำอะไรตอนห้าโมงเช้า"))
         # self.assertIsNotNone(ner.tag("แมวทำอะไรตอนห้าโมงเช้า", pos=False))
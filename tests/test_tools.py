@@ -2,13 +2,20 @@
 # SPDX-FileCopyrightText: 2016-2024 PyThaiNLP Project
 # SPDX-License-Identifier: Apache-2.0
 
+import importlib.util
+import os
+import tempfile
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
 from pythainlp.tools import (
     get_full_data_path,
     get_pythainlp_data_path,
     get_pythainlp_path,
 )
+from pythainlp.tools import profiling
+from pythainlp.tools.batching import MicroBatcher
+from pythainlp.tools.onnx_model import get_onnx_path, load_onnx_model
 
 
 class TestToolsPackage(unittest.TestCase):
@@ -19,3 +26,140 @@ class TestToolsPackage(unittest.TestCase):
         )
         self.assertIsInstance(get_pythainlp_data_path(), str)
         self.assertIsInstance(get_pythainlp_path(), str)
+
+    def test_onnx_path(self):
+        path = get_onnx_path("pythainlp/thainer-corpus-v2-base-model")
+        self.assertTrue(path.startswith(get_pythainlp_data_path()))
+        self.assertTrue(path.endswith("-int8"))
+        self.assertNotEqual(
+            path,
+            get_onnx_path(
+                "pythainlp/thainer-corpus-v2-base-model", quantize=False
+            ),
+        )
+        self.assertNotEqual(
+            get_onnx_path("a/b", subfolder="deprel"),
+            get_onnx_path("a/b", subfolder="tagger"),
+        )
+        self.assertNotEqual(get_onnx_path("a/b"), get_onnx_path("a_b"))
+        with self.assertRaises(ValueError):
+            load_onnx_model("a/b", task="text-generation")
+
+    @unittest.skipUnless(
+        importlib.util.find_spec("optimum"), "optimum is not installed"
+    )
+    def test_onnx_export(self):
+        import torch
+        from transformers import BertConfig, BertForTokenClassification
+
+        def save_model(path, seed):
+            torch.manual_seed(seed)
+            model = BertForTokenClassification(
+                BertConfig(
+                    vocab_size=32,
+                    hidden_size=16,
+                    num_hidden_layers=1,
+                    num_attention_heads=2,
+                    intermediate_size=32,
+                    max_position_embeddings=16,
+                    num_labels=3,
+                )
+            ).eval()
+            model.save_pretrained(path)
+            return model
+
+        data_dir = os.environ.get("PYTHAINLP_DATA_DIR")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            os.environ["PYTHAINLP_DATA_DIR"] = os.path.join(tmp_dir, "data")
+            try:
+                model_path = os.path.join(tmp_dir, "model")
+                input_ids = torch.tensor([[2, 5, 7, 11, 3]])
+                for seed in (0, 1):
+                    # a changed local model is exported again
+                    model = save_model(model_path, seed)
+                    ort_model = load_onnx_model(model_path, quantize=False)
+                    with torch.no_grad():
+                        expected = model(input_ids).logits
+                    logits = ort_model(
+                        input_ids=input_ids,
+                        attention_mask=torch.ones_like(input_ids),
+                        token_type_ids=torch.zeros_like(input_ids),
+                    ).logits
+                    self.assertTrue(
+                        torch.allclose(
+                            torch.as_tensor(logits), expected, atol=1e-4
+                        )
+                    )
+                self.assertTrue(
+                    os.path.isdir(get_onnx_path(model_path, quantize=False))
+                )
+            finally:
+                if data_dir is None:
+                    del os.environ["PYTHAINLP_DATA_DIR"]
+                else:
+                    os.environ["PYTHAINLP_DATA_DIR"] = data_dir
+
+    def test_micro_batcher(self):
+        batch_sizes = []
+
+        def double(items):
+            batch_sizes.append(len(items))
+            if "x" in items:
+                raise ValueError("x")
+            return [item * 2 for item in items]
+
+        batcher = MicroBatcher(double, max_batch_size=8, max_wait=0.05)
+        with ThreadPoolExecutor(16) as executor:
+            results = list(executor.map(batcher, range(32)))
+        self.assertEqual(results, [i * 2 for i in range(32)])
+        self.assertLessEqual(max(batch_sizes), 8)
+        self.assertLess(len(batch_sizes), 32)
+
+        # an invalid item fails only its own request
+        futures = [batcher.submit(item) for item in ["a", "x", "b"]]
+        self.assertEqual(futures[0].result(), "aa")
+        with self.assertRaises(ValueError):
+            futures[1].result()
+        self.assertEqual(futures[2].result(), "bb")
+
+        stats = batcher.stats()
+        self.assertEqual(stats["requests"], 34)
+        self.assertEqual(stats["errors"], 1)
+        self.assertGreater(stats["latency_p99_ms"], 0)
+        batcher.close()
+        with self.assertRaises(RuntimeError):
+            batcher.submit(1)
+
+    def test_profiling(self):
+        from pythainlp.tokenize import word_tokenize
+
+        text = "ฉันรักภาษาไทยเพราะฉันเป็นคนไทย 12,000 บาท"
+        self.assertFalse(profiling.is_enabled())
+        profiling.reset()
+        word_tokenize(text)
+        self.assertEqual(profiling.get_stats(), {})
+
+        with profiling.profile() as stats:
+            self.assertTrue(profiling.is_enabled())
+            words = word_tokenize(text, engine="newmm")
+            word_tokenize(text)
+            with profiling.stage("test.stage"):
+                pass
+        self.assertFalse(profiling.is_enabled())
+        self.assertEqual(words, word_tokenize(text))
+        self.assertEqual(stats["tokenize.word_tokenize.newmm"]["calls"], 2)
+        self.assertEqual(stats["tokenize.newmm.tcc_pos"]["calls"], 2)
+        self.assertEqual(stats["test.stage"]["calls"], 1)
+        self.assertGreater(
+            stats["tokenize.word_tokenize.newmm"]["seconds"],
+            stats["tokenize.newmm.tcc_pos"]["seconds"],
+        )
+        self.assertEqual(profiling.get_stats(), stats)
+
+        text = profiling.to_openmetrics(stats)
+        self.assertIn("# TYPE pythainlp_stage_seconds counter", text)
+        self.assertIn(
+            'pythainlp_stage_calls_total{stage="test.stage"} 1', text
+        )
+        self.assertTrue(text.endswith("# EOF\n"))
+        profiling.reset()
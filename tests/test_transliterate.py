@@ -3,10 +3,20 @@
 import unittest
 
 import torch
-from pythainlp.transliterate import romanize, transliterate, pronunciate, puan
+from pythainlp.transliterate import (
+    cache_info,
+    romanize,
+    romanize_many,
+    transliterate,
+    pronunciate,
+    puan,
+)
 from pythainlp.transliterate.ipa import trans_list, xsampa_list
+from pythainlp.transliterate.lookup import romanize as lookup_romanize
 from pythainlp.transliterate.thai2rom import ThaiTransliterator
 from pythainlp.transliterate.thai2rom_onnx import ThaiTransliterator_ONNX
+from pythainlp.transliterate.cache import WordCache, get_cache
+from pythainlp.transliterate.w2p import pronunciate_many
 from pythainlp.transliterate.wunsen import WunsenTransliterate
 from pythainlp.corpus import remove
 
@@ -103,6 +113,75 @@ class TestTransliteratePackage(unittest.TestCase):
             romanize("ชารินทร์", engine="thai2rom_onnx"), "charin"
         )
 
+    def test_romanize_many_thai2rom_onnx(self):
+        transliterater = ThaiTransliterator_ONNX()
+        transliterater.cache.clear()
+        words = ["แมว", "บ้านไร่", "สุนัข", "นก", "แมว", "ชารินทร์"]
+        self.assertEqual(
+            transliterater.romanize_many(words, batch_size=2),
+            ["maeo", "banrai", "sunak", "nok", "maeo", "charin"],
+        )
+        self.assertEqual(transliterater.cache.info()["size"], 5)
+        self.assertEqual(transliterater.romanize("นก"), "nok")
+        self.assertEqual(transliterater.cache.hits, 1)
+        self.assertEqual(transliterater.romanize_many([]), [])
+
+        # a batch of words of mixed lengths gives the same results
+        # as romanizing each word on its own
+        words = ["นก", "ชารินทร์", "แมว", "ความอิ่ม", "ก", "บ้านไร่", "สุนัข"]
+        transliterater.cache.clear()
+        batched = transliterater.romanize_many(words, batch_size=4)
+        expected = []
+        for word in words:
+            transliterater.cache.clear()
+            expected.append(transliterater.romanize(word))
+        self.assertEqual(batched, expected)
+
+    def test_word_cache(self):
+        cache = WordCache(maxsize=2)
+        self.assertIsNone(cache.get("ก"))
+        cache.put("ก", "k")
+        cache.put("ข", "kh")
+        self.assertEqual(cache.get("ก"), "k")
+        cache.put("ค", "kh")  # evicts "ข", the least recently used
+        self.assertNotIn("ข", cache)
+        self.assertIn("ก", cache)
+        self.assertEqual(
+            cache.info(),
+            {"hits": 1, "misses": 1, "hit_rate": 0.5, "size": 2, "maxsize": 2},
+        )
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.info()["hit_rate"], 0.0)
+
+        cache = WordCache(maxsize=0)
+        cache.put("ก", "k")
+        self.assertEqual(len(cache), 0)
+
+    def test_romanize_many(self):
+        texts = ["แมว", "หมา", None, "แมว", ""]
+        self.assertEqual(
+            romanize_many(texts, engine="royin"),
+            ["maeo", "ma", "", "maeo", ""],
+        )
+        self.assertEqual(
+            romanize_many(texts, engine="thai2rom_onnx"),
+            [romanize(text, engine="thai2rom_onnx") for text in texts],
+        )
+        self.assertEqual(romanize_many([]), [])
+
+        get_cache("royin").clear()
+        romanize("แมว", engine="royin")
+        romanize("แมว", engine="royin")
+        self.assertEqual(cache_info("royin")["hits"], 1)
+        self.assertEqual(cache_info("royin")["misses"], 1)
+        self.assertIn("royin", cache_info())
+        get_cache("thai2rom").clear()
+        romanize_many(["แมว", "หมา"], engine="thai2rom")
+        romanize("แมว", engine="thai2rom")
+        self.assertEqual(cache_info("thai2rom")["hits"], 1)
+        self.assertEqual(cache_info("thai2rom")["misses"], 2)
+
     def test_romanize_lookup(self):
         # found in v1.4
         self.assertEqual(romanize("บอล", engine="lookup"), "ball")
@@ -132,6 +211,15 @@ class TestTransliteratePackage(unittest.TestCase):
             "samat",
         )
 
+        # errors of the fallback are raised as they are
+        def fallback(text: str) -> str:
+            raise TypeError("fallback failed")
+
+        with self.assertRaisesRegex(TypeError, "fallback failed"):
+            lookup_romanize("ภาพยนตร์", fallback_func=fallback)
+        with self.assertRaisesRegex(TypeError, "not callable"):
+            lookup_romanize("ภาพยนตร์", fallback_func="royin")
+
     def test_thai2rom_prepare_sequence(self):
         transliterater = ThaiTransliterator()
 
@@ -269,6 +357,15 @@ class TestTransliteratePackage(unittest.TestCase):
         self.assertIsNotNone(pronunciate("มช.", engine="w2p"))
         self.assertIsNotNone(pronunciate("jks", engine="w2p"))
 
+    def test_pronunciate_many(self):
+        words = ["คน", "แมว", "มข.", "jks", "", "คน"]
+        self.assertEqual(
+            pronunciate_many(words, batch_size=2),
+            [pronunciate(word) for word in words],
+        )
+        self.assertEqual(pronunciate_many(["มข."]), ["มอ-ขอ"])
+        self.assertEqual(pronunciate_many([]), [])
+
     def test_puan(self):
         self.assertEqual(puan("แมว"), "แมว")
         self.assertEqual(puan("นาริน"), "นิน-รา")
@@ -62,6 +62,7 @@ from pythainlp.util import (
     to_idna,
     tone_detector,
     sound_syllable,
+    syllable_info,
     syllable_length,
     syllable_open_close_detector,
     words_to_num,
@@ -730,6 +731,18 @@ class TestUtilPackage(unittest.TestCase):
         self.assertEqual(syllable_open_close_detector("มาก"), "close")
         self.assertEqual(syllable_open_close_detector("คะ"), "open")
 
+    def test_syllable_info(self):
+        info = syllable_info("มาก")
+        self.assertIs(syllable_info("มาก"), info)
+        self.assertEqual(info.onset, "ม")
+        self.assertEqual(info.vowel, "อา")
+        self.assertEqual(info.marttra, "กก")
+        self.assertEqual(info.tone, tone_detector("มาก"))
+        self.assertEqual(info.length, "long")
+        self.assertEqual(info.sound, "dead")
+        self.assertEqual(info.open_close, "close")
+        self.assertEqual(syllable_info("").onset, "")
+
     def test_to_idna(self):
         self.assertEqual(to_idna("คนละครึ่ง.com"), "xn--42caj4e6bk1f5b1j.com")
 
@@ -812,6 +825,8 @@ class TestUtilPackage(unittest.TestCase):
     def test_rhyme(self):
         self.assertIsInstance(rhyme("แมว"), list)
         self.assertTrue(len(rhyme("แมว")) > 2)
+        self.assertIn("แก้ว", rhyme("แมว"))
+        self.assertNotIn("แมว", rhyme("แมว"))
 
     def test_remove_repeat_consonants(self):
         # update of pythainlp.copus.thai_words() able to break this
@@ -1,8 +1,30 @@
 # -*- coding: utf-8 -*-
 
+import os
+import tempfile
 import unittest
 
-from pythainlp.wangchanberta import ThaiNameTagger, segment
+from pythainlp.tag._utils import iob_to_html
+from pythainlp.tokenize import word_tokenize
+from pythainlp.wangchanberta import (
+    NamedEntityRecognition,
+    ThaiNameTagger,
+    segment,
+)
+from pythainlp.wangchanberta.core import _text_windows, _windows
+
+
+def _tiny_tokenizer(tmp_dir, texts):
+    # a character-level tokenizer for the characters of texts
+    from transformers import BertTokenizer
+
+    chars = sorted(set("".join(texts)) | set("<_>"))
+    vocab = ["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]"]
+    vocab += chars + ["##" + c for c in chars]
+    vocab_file = os.path.join(tmp_dir, "vocab.txt")
+    with open(vocab_file, "w", encoding="utf-8") as f:
+        f.write("\n".join(vocab))
+    return BertTokenizer(vocab_file, do_lower_case=False, strip_accents=False)
 
 
 class TestWangchanberta(unittest.TestCase):
@@ -27,6 +49,126 @@ class TestWangchanberta(unittest.TestCase):
             ner.get_ner("I คิด therefore I am ผ็ฎ์", tag=True)
         )
 
+    def test_ner_batch_wangchanberta(self):
+        import torch
+        from transformers import BertConfig, BertForTokenClassification
+
+        texts = [
+            "ทดสอบนายวรรณพงษ์",
+            "ไปเที่ยวเชียงใหม่",
+            "โรงเรียนสวนกุหลาบ เป็นโรงเรียนที่ดี",
+        ]
+        labels = ["O", "B-PERSON", "I-PERSON", "B-LOCATION", "I-LOCATION"]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # a tiny model with random weights, so no download is needed
+            tokenizer = _tiny_tokenizer(tmp_dir, texts)
+            tokenizer.save_pretrained(tmp_dir)
+            torch.manual_seed(0)
+            BertForTokenClassification(
+                BertConfig(
+                    vocab_size=len(tokenizer.vocab),
+                    hidden_size=16,
+                    num_hidden_layers=2,
+                    num_attention_heads=2,
+                    intermediate_size=32,
+                    max_position_embeddings=64,
+                    id2label=dict(enumerate(labels)),
+                    label2id={label: i for i, label in enumerate(labels)},
+                )
+            ).save_pretrained(tmp_dir)
+            ner = NamedEntityRecognition(tmp_dir)
+
+        def unbatched(text):
+            # a forward pass over one text, without padding or windows
+            words = word_tokenize(text.replace(" ", "<_>"))
+            ids = ner.tokenizer(
+                words, is_split_into_words=True, add_special_tokens=False
+            )["input_ids"]
+            inputs = torch.tensor(
+                [ner.tokenizer.build_inputs_with_special_tokens(ids)]
+            )
+            with torch.no_grad():
+                logits = ner.model(inputs)[0][0, 1:-1]
+            return ner._fix_span_error(
+                ids,
+                [labels[i] for i in torch.argmax(logits, dim=1).tolist()],
+            )
+
+        expected = [unbatched(text) for text in texts]
+        self.assertEqual(ner.get_ner_batch(texts, batch_size=2), expected)
+        self.assertEqual(ner.get_ner_batch(texts, batch_size=1), expected)
+        self.assertEqual(ner.get_ner(texts[2]), expected[2])
+        self.assertEqual(
+            ner.get_ner_batch(texts, tag=True),
+            [iob_to_html(ner_tag) for ner_tag in expected],
+        )
+        self.assertEqual(ner.get_ner_batch([]), [])
+
+        # split into overlapping windows, tags the same subwords
+        long_text = " ".join(texts * 5)
+        ids = ner.tokenizer(
+            word_tokenize(long_text.replace(" ", "<_>")),
+            is_split_into_words=True,
+            add_special_tokens=False,
+        )["input_ids"]
+        ner.max_length = 32
+        ner.stride = 8
+        windows = _windows([1] * len(ids), 32 - 2, 8)
+        self.assertGreater(len(windows), 1)
+        # each subword takes the label of the window that owns it,
+        # tagged on its own without padding
+        expected = [None] * len(ids)
+        for start, end, lo, hi in windows:
+            inputs = torch.tensor(
+                [ner.tokenizer.build_inputs_with_special_tokens(
+                    ids[start:end]
+                )]
+            )
+            with torch.no_grad():
+                logits = ner.model(inputs)[0][0, 1:-1]
+            predicted = torch.argmax(logits, dim=1).tolist()
+            for j in range(lo, hi):
+                expected[j] = labels[predicted[j - start]]
+        self.assertEqual(
+            ner.get_ner(long_text), ner._fix_span_error(ids, expected)
+        )
+
+    def test_text_windows(self):
+        # a word longer than a window is split, no window is too long
+        text = "ไปเที่ยว" + "ก" * 100 + "เชียงใหม่ ไปเที่ยวเชียงใหม่"
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tokenizer = _tiny_tokenizer(tmp_dir, [text])
+        windows = _text_windows(text, tokenizer, max_length=16, stride=4)
+        self.assertGreater(len(windows), 1)
+        self.assertEqual(windows[0][0], 0)
+        self.assertEqual(windows[-1][1], len(text))
+        for start, end, lo, hi in windows:
+            n_tokens = len(
+                tokenizer(text[start:end], add_special_tokens=False)[
+                    "input_ids"
+                ]
+            )
+            self.assertLessEqual(n_tokens, 16 - 2)
+        self.assertEqual(
+            [(lo, hi) for _, _, lo, hi in windows],
+            list(
+                zip(
+                    [0] + [hi for _, _, _, hi in windows[:-1]],
+                    [hi for _, _, _, hi in windows],
+                )
+            ),
+        )
+
+        # a long text is tagged in windows of the model input size
+        ner = ThaiNameTagger()
+        long_text = "ไปเที่ยวเชียงใหม่กับนายวรรณพงษ์ " * 60 + "ก" * 1000
+        self.assertEqual(
+            len(ner.get_ner_batch([long_text, "ไปเที่ยวเชียงใหม่"])), 2
+        )
+        ner.max_length = 32
+        self.assertIn("เชียงใหม่", ner.get_ner(long_text, tag=True))
+
     def test_segment_wangchanberta(self):
         self.assertIsNotNone(
             segment("I คิด therefore I am ผ็ฎ์")
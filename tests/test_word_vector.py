@@ -1,8 +1,15 @@
 # -*- coding: utf-8 -*-
 
+import os
+import stat
+import tempfile
 import unittest
 
-from pythainlp.word_vector import WordVector
+import numpy as np
+from gensim.models import KeyedVectors
+
+from pythainlp.word_vector import IVFIndex, WordVector, load_keyedvectors
+from pythainlp.word_vector.ivf import most_similar_batch
 
 
 class TestWordVectorPackage(unittest.TestCase):
@@ -59,3 +66,111 @@ class TestWordVectorPackage(unittest.TestCase):
         self.assertEqual(
             _wv.doesnt_match(["ญี่ปุ่น", "พม่า", "ไอติม"]), "ไอติม"
         )
+
+    def test_load_keyedvectors(self):
+        kv = KeyedVectors(4)
+        kv.add_vectors(
+            ["แม่น้ำ", "ลำน้ำ", "ภูเขา"],
+            np.array(
+                [[1, 0, 0, 0], [0.9, 0.1, 0, 0], [0, 0, 1, 0]],
+                dtype=np.float32,
+            ),
+        )
+        data_dir = os.environ.get("PYTHAINLP_DATA_DIR")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # keep the converted files out of the real data directory
+            os.environ["PYTHAINLP_DATA_DIR"] = os.path.join(tmp_dir, "data")
+            try:
+                path = os.path.join(tmp_dir, "test_load_keyedvectors.bin")
+                kv.save_word2vec_format(path, binary=True)
+                # first load converts, second load uses the converted file
+                for _ in range(2):
+                    model = load_keyedvectors(path)
+                    self.assertIsInstance(model.vectors, np.memmap)
+                    self.assertEqual(
+                        model.most_similar("แม่น้ำ", topn=1)[0][0], "ลำน้ำ"
+                    )
+                model = load_keyedvectors(path, mmap=None)
+                self.assertNotIsInstance(model.vectors, np.memmap)
+                self.assertEqual(len(model), 3)
+
+                # a model with the same file name in another directory
+                # gets its own converted file
+                other_dir = os.path.join(tmp_dir, "other")
+                os.mkdir(other_dir)
+                other_path = os.path.join(
+                    other_dir, "test_load_keyedvectors.bin"
+                )
+                kv2 = KeyedVectors(4)
+                kv2.add_vectors(
+                    ["ภูเขา", "ทะเล"],
+                    np.array([[1, 0, 0, 0], [0, 1, 0, 0]], dtype=np.float32),
+                )
+                kv2.save_word2vec_format(other_path, binary=True)
+                self.assertEqual(len(load_keyedvectors(other_path)), 2)
+                self.assertEqual(len(load_keyedvectors(path)), 3)
+                self.assertEqual(
+                    len(os.listdir(os.environ["PYTHAINLP_DATA_DIR"])), 4
+                )
+                # converted files are readable by other users, not 0600
+                umask = os.umask(0o022)
+                os.umask(umask)
+                for name in os.listdir(os.environ["PYTHAINLP_DATA_DIR"]):
+                    self.assertEqual(
+                        stat.S_IMODE(
+                            os.stat(
+                                os.path.join(
+                                    os.environ["PYTHAINLP_DATA_DIR"], name
+                                )
+                            ).st_mode
+                        ),
+                        0o666 & ~umask,
+                    )
+            finally:
+                if data_dir is None:
+                    del os.environ["PYTHAINLP_DATA_DIR"]
+                else:
+                    os.environ["PYTHAINLP_DATA_DIR"] = data_dir
+
+    def test_ivf_index(self):
+        rng = np.random.default_rng(0)
+        centers = rng.normal(size=(20, 16))
+        vectors = centers[rng.integers(0, 20, 2000)] + 0.3 * rng.normal(
+            size=(2000, 16)
+        )
+        index = IVFIndex(vectors, n_probe=4)
+        self.assertEqual(len(index), 2000)
+        ids, scores = index.search(vectors[:5], topn=3)
+        self.assertEqual(ids.shape, (5, 3))
+        self.assertEqual(list(ids[:, 0]), [0, 1, 2, 3, 4])
+        self.assertTrue(np.all(scores[:, :-1] >= scores[:, 1:]))
+        # searching every list is exact
+        self.assertEqual(
+            index.recall(vectors[:50], n_probe=len(index.centroids)), 1.0
+        )
+        self.assertGreater(index.recall(vectors[:50]), 0.8)
+
+        # a memory-mapped matrix is searched in place, with the same results
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            npy_path = os.path.join(tmp_dir, "vectors.npy")
+            np.save(npy_path, vectors.astype(np.float32))
+            mmap_vectors = np.load(npy_path, mmap_mode="r")
+            mmap_index = IVFIndex(mmap_vectors, n_probe=4)
+            mmap_ids, _ = mmap_index.search(vectors[:5], topn=3)
+            self.assertEqual(mmap_ids.tolist(), ids.tolist())
+            del mmap_index, mmap_vectors
+
+        kv = KeyedVectors(16)
+        kv.add_vectors([str(i) for i in range(2000)], vectors)
+        words = ["0", "1", "0"]
+        exact = most_similar_batch(kv, words, topn=5)
+        self.assertEqual(len(exact), 3)
+        self.assertEqual(
+            [w for w, _ in exact[0]], [w for w, _ in kv.most_similar("0", topn=5)]
+        )
+        approx = most_similar_batch(kv, words, topn=5, index=index)
+        self.assertEqual(len(approx[1]), 5)
+        self.assertNotIn("1", [w for w, _ in approx[1]])
+        self.assertEqual(most_similar_batch(kv, []), [])
+        with self.assertRaises(KeyError):
+            most_similar_batch(kv, ["ไม่มี"])